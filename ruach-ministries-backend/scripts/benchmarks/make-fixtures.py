@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Benchmark Fixtures - small synthetic inputs for the extraction pipelines
+
+Generates, offline and deterministically (seeded text, no third-party packages):
+
+    <dir>/book.pdf         ministry/canon/library-style book: running header, page-number
+                           footer, "Chapter N—Title" headings, indented paragraphs
+    <dir>/book.epub        the same chapters as an EPUB 3 (XHTML + OPF + NCX)
+    <dir>/scripture.pdf    TOC page with dotted leaders, then books with "CHAPTER N"
+                           headings and numbered verse lines
+    <dir>/scripture.bbli   SQLite module (Details + Bible tables, HTML markup in Scripture)
+    <dir>/fixtures.json    spec + generator version + file hashes (the fixture key)
+
+The PDFs use the standard Helvetica fonts (no embedding), so pdfplumber reads real words
+with positions and sizes. Fixtures are only rebuilt when the spec or generator changes.
+
+Usage:
+    python3 make-fixtures.py out/fixtures [--scale 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import random
+import sqlite3
+import textwrap
+import zipfile
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+GENERATOR_VERSION = 1
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+MARGIN_X = 72
+BODY_TOP = 712           # first body baseline (below the 8% header zone)
+BODY_BOTTOM = 90         # last body baseline (above the 8% footer zone)
+BODY_SIZE = 11
+LINE_HEIGHT = 14
+PARAGRAPH_GAP = 10       # extra space before a paragraph (well over 1.5 line heights total)
+INDENT = 24
+WRAP = 84                # characters per body line (Helvetica 11pt over 468pt)
+
+SCRIPTURE_BOOKS = ["Genesis", "Exodus", "Leviticus", "Numbers", "Deuteronomy", "Joshua", "Judges", "Ruth"]
+
+WORDS = (
+    "the of and to in that he for his with as they is be by on not it which all were from this but have "
+    "shall was are their unto them you will one life work health mind body heart truth light spirit "
+    "faith grace law word people house land water bread hand power way day peace labor rest service "
+    "nature healing love mercy strength teaching school home family children mother father city field "
+    "blessing promise covenant kingdom servant prayer praise wisdom knowledge patience character habit "
+    "temperance diet exercise sunshine air gospel ministry physician nurse hospital sabbath garden"
+).split()
+
+
+@dataclass
+class FixtureSpec:
+    """Fixture sizes; --scale multiplies every count"""
+    book_chapters: int = 8
+    book_paragraphs: int = 14          # per chapter (~3 pages per chapter)
+    scripture_books: int = 5
+    scripture_chapters: int = 6        # per book
+    scripture_verses: int = 24         # per chapter
+    bbli_books: int = 12
+    bbli_chapters: int = 20            # per book
+    bbli_verses: int = 30              # per chapter
+    seed: int = 7
+
+    def scaled(self, scale: int) -> "FixtureSpec":
+        return FixtureSpec(
+            book_chapters=self.book_chapters * scale,
+            book_paragraphs=self.book_paragraphs,
+            scripture_books=min(self.scripture_books * scale, len(SCRIPTURE_BOOKS)),
+            scripture_chapters=self.scripture_chapters * scale,
+            scripture_verses=self.scripture_verses,
+            bbli_books=self.bbli_books * scale,
+            bbli_chapters=self.bbli_chapters,
+            bbli_verses=self.bbli_verses,
+            seed=self.seed,
+        )
+
+
+# ============================================================================
+# Text
+# ============================================================================
+
+def sentence(rng: random.Random, lo: int = 8, hi: int = 22) -> str:
+    words = [rng.choice(WORDS) for _ in range(rng.randint(lo, hi))]
+    return words[0].capitalize() + " " + " ".join(words[1:]) + rng.choice("....!?")
+
+
+def paragraph(rng: random.Random, sentences: Tuple[int, int] = (3, 7)) -> str:
+    return " ".join(sentence(rng) for _ in range(rng.randint(*sentences)))
+
+
+def chapter_title(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS).capitalize() for _ in range(rng.randint(2, 4)))
+
+
+def book_chapters(spec: FixtureSpec) -> List[Tuple[str, List[str]]]:
+    """[(chapter title, paragraphs)] shared by book.pdf and book.epub"""
+    rng = random.Random(spec.seed)
+    return [
+        (chapter_title(rng), [paragraph(rng) for _ in range(spec.book_paragraphs)])
+        for _ in range(spec.book_chapters)
+    ]
+
+
+# ============================================================================
+# PDF
+# ============================================================================
+
+def pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+class PdfWriter:
+    """Minimal PDF 1.4 writer: text lines at absolute positions, Helvetica / Helvetica-Bold"""
+
+    def __init__(self):
+        self.pages: List[List[str]] = []
+
+    def new_page(self) -> None:
+        self.pages.append([])
+
+    def text(self, x: float, y: float, text: str, size: float = BODY_SIZE, bold: bool = False) -> None:
+        font = "F2" if bold else "F1"
+        self.pages[-1].append(f"BT /{font} {size:g} Tf 1 0 0 1 {x:g} {y:g} Tm ({pdf_escape(text)}) Tj ET")
+
+    def save(self, path: Path) -> None:
+        objects: List[bytes] = [
+            b"<< /Type /Catalog /Pages 2 0 R >>",
+            b"",  # page tree, filled in once page object numbers are known
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+        ]
+        kids = []
+        for ops in self.pages:
+            content = "\n".join(ops).encode("cp1252")  # WinAnsiEncoding
+            objects.append(b"<< /Length %d >>\nstream\n" % len(content) + content + b"\nendstream")
+            objects.append(
+                b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R "
+                b"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> >>"
+                % (PAGE_WIDTH, PAGE_HEIGHT, len(objects))
+            )
+            kids.append(len(objects))
+        objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+            b" ".join(b"%d 0 R" % k for k in kids), len(kids)
+        )
+
+        out = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        offsets = []
+        for num, body in enumerate(objects, 1):
+            offsets.append(len(out))
+            out += b"%d 0 obj\n" % num + body + b"\nendobj\n"
+        xref = len(out)
+        out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+        out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+        out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%EOF\n" % (len(objects) + 1, xref)
+        write_atomic(path, bytes(out))
+
+
+class PageFlow:
+    """Top-to-bottom body layout with running header and page-number footer"""
+
+    def __init__(self, pdf: PdfWriter, header: str):
+        self.pdf = pdf
+        self.header = header
+        self.y = 0.0
+
+    def page_break(self) -> None:
+        self.pdf.new_page()
+        number = len(self.pdf.pages)
+        self.pdf.text(MARGIN_X, PAGE_HEIGHT - 40, self.header, size=9)
+        self.pdf.text(PAGE_WIDTH / 2, 36, str(number), size=9)
+        self.y = BODY_TOP
+
+    def line(self, text: str, x: float = MARGIN_X, size: float = BODY_SIZE, bold: bool = False,
+             space_before: float = 0) -> None:
+        if self.y - space_before < BODY_BOTTOM:
+            self.page_break()
+        elif self.y != BODY_TOP:
+            self.y -= space_before
+        self.pdf.text(x, self.y, text, size=size, bold=bold)
+        self.y -= max(LINE_HEIGHT, size + 4)
+
+
+def write_book_pdf(path: Path, chapters: List[Tuple[str, List[str]]]) -> int:
+    pdf = PdfWriter()
+    flow = PageFlow(pdf, "Benchmark Fixture Book")
+    for index, (title, paragraphs) in enumerate(chapters, 1):
+        flow.page_break()
+        flow.line(f"Chapter {index}—{title}", size=16, bold=True)
+        for para in paragraphs:
+            lines = textwrap.wrap(para, WRAP - 4)
+            flow.line(lines[0], x=MARGIN_X + INDENT, space_before=PARAGRAPH_GAP)
+            for text in lines[1:]:
+                flow.line(text)
+    pdf.save(path)
+    return len(pdf.pages)
+
+
+def write_scripture_pdf(path: Path, spec: FixtureSpec) -> int:
+    rng = random.Random(spec.seed + 1)
+    books = SCRIPTURE_BOOKS[: spec.scripture_books]
+    body = PdfWriter()
+    flow = PageFlow(body, "Benchmark Scriptures")
+    starts: Dict[str, int] = {}
+    for book in books:
+        flow.page_break()
+        starts[book] = len(body.pages) + 1  # the TOC page comes first
+        flow.line(book.upper(), size=18, bold=True)
+        for chapter in range(1, spec.scripture_chapters + 1):
+            flow.line(f"CHAPTER {chapter}", size=14, bold=True, space_before=PARAGRAPH_GAP)
+            for verse in range(1, spec.scripture_verses + 1):
+                lines = textwrap.wrap(f"{verse} {sentence(rng, 10, 34)}", WRAP)
+                for text in lines:
+                    flow.line(text)
+
+    toc = PdfWriter()
+    toc.new_page()
+    toc.text(MARGIN_X, BODY_TOP, "CONTENTS", size=14, bold=True)
+    for i, book in enumerate(books):
+        toc.text(MARGIN_X, BODY_TOP - 30 - i * 18, f"{book.upper()} {'. ' * 20}{starts[book]}")
+    toc.pages.extend(body.pages)
+    toc.save(path)
+    return len(toc.pages)
+
+
+# ============================================================================
+# EPUB
+# ============================================================================
+
+def write_book_epub(path: Path, chapters: List[Tuple[str, List[str]]]) -> None:
+    names = [f"ch{index:03d}.xhtml" for index in range(1, len(chapters) + 1)]
+    manifest = "\n".join(
+        f'    <item id="c{i}" href="{name}" media-type="application/xhtml+xml"/>' for i, name in enumerate(names, 1)
+    )
+    spine = "\n".join(f'    <itemref idref="c{i}"/>' for i in range(1, len(names) + 1))
+    opf = f"""<?xml version="1.0" encoding="utf-8"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="bookid">
+  <metadata xmlns:dc="http://purl.org/dc/elements/1.1/">
+    <dc:identifier id="bookid">urn:uuid:00000000-0000-4000-8000-000000000050</dc:identifier>
+    <dc:title>Benchmark Fixture Book</dc:title>
+    <dc:language>en</dc:language>
+    <meta property="dcterms:modified">2026-01-01T00:00:00Z</meta>
+  </metadata>
+  <manifest>
+    <item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>
+    <item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
+{manifest}
+  </manifest>
+  <spine toc="ncx">
+{spine}
+  </spine>
+</package>
+"""
+    nav_items = "\n".join(
+        f'      <li><a href="{name}">Chapter {i}</a></li>' for i, name in enumerate(names, 1)
+    )
+    nav = f"""<?xml version="1.0" encoding="utf-8"?>
+<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops">
+<head><title>Contents</title></head>
+<body>
+  <nav epub:type="toc" id="toc">
+    <ol>
+{nav_items}
+    </ol>
+  </nav>
+</body>
+</html>
+"""
+    nav_points = "\n".join(
+        f'    <navPoint id="n{i}" playOrder="{i}"><navLabel><text>Chapter {i}</text></navLabel>'
+        f'<content src="{name}"/></navPoint>'
+        for i, name in enumerate(names, 1)
+    )
+    ncx = f"""<?xml version="1.0" encoding="utf-8"?>
+<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
+  <head><meta name="dtb:uid" content="urn:uuid:00000000-0000-4000-8000-000000000050"/></head>
+  <docTitle><text>Benchmark Fixture Book</text></docTitle>
+  <navMap>
+{nav_points}
+  </navMap>
+</ncx>
+"""
+    container = """<?xml version="1.0" encoding="utf-8"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+  <rootfiles>
+    <rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/>
+  </rootfiles>
+</container>
+"""
+    tmp = path.with_name(path.name + ".tmp")
+    with zipfile.ZipFile(tmp, "w") as zf:
+        # mimetype must be the first entry, stored uncompressed
+        zf.writestr(zipfile.ZipInfo("mimetype"), "application/epub+zip", compress_type=zipfile.ZIP_STORED)
+        zf.writestr("META-INF/container.xml", container, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("OEBPS/content.opf", opf, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("OEBPS/nav.xhtml", nav, compress_type=zipfile.ZIP_DEFLATED)
+        zf.writestr("OEBPS/toc.ncx", ncx, compress_type=zipfile.ZIP_DEFLATED)
+        for i, ((title, paragraphs), name) in enumerate(zip(chapters, names), 1):
+            body = "\n".join(f"  <p>{para}</p>" for para in paragraphs)
+            xhtml = (
+                '<?xml version="1.0" encoding="utf-8"?>\n'
+                '<html xmlns="http://www.w3.org/1999/xhtml">\n'
+                f"<head><title>Chapter {i}</title></head>\n<body>\n"
+                f"  <h1>Chapter {i}—{title}</h1>\n{body}\n</body>\n</html>\n"
+            )
+            zf.writestr(f"OEBPS/{name}", xhtml, compress_type=zipfile.ZIP_DEFLATED)
+    tmp.replace(path)
+
+
+# ============================================================================
+# bbli (SQLite)
+# ============================================================================
+
+def write_bbli(path: Path, spec: FixtureSpec) -> int:
+    rng = random.Random(spec.seed + 2)
+    tmp = path.with_name(path.name + ".tmp")
+    if tmp.exists():
+        tmp.unlink()
+    conn = sqlite3.connect(tmp)
+    conn.execute(
+        "CREATE TABLE Details (Title TEXT, Abbreviation TEXT, Version TEXT, "
+        "OldTestament INTEGER, NewTestament INTEGER, Apocrypha INTEGER)"
+    )
+    conn.execute("INSERT INTO Details VALUES ('Benchmark Scriptures', 'BENCH', '1.0', 1, 1, 0)")
+    conn.execute("CREATE TABLE Bible (Book INTEGER, Chapter INTEGER, Verse INTEGER, Scripture TEXT)")
+    conn.execute("CREATE INDEX BibleIndex ON Bible (Book, Chapter, Verse)")
+
+    rows = []
+    for book in range(1, spec.bbli_books + 1):
+        for chapter in range(1, spec.bbli_chapters + 1):
+            for verse in range(1, spec.bbli_verses + 1):
+                words = sentence(rng, 10, 34).split()
+                # Module markup: divine-name spans, italics, poetry line breaks
+                at = rng.randrange(len(words))
+                words[at] = f'<span style="color:#800000">{words[at]}</span>'
+                if rng.random() < 0.3:
+                    words.insert(rng.randrange(len(words)), "<br />")
+                if rng.random() < 0.3:
+                    at = rng.randrange(len(words))
+                    words[at] = f"<i>{words[at]}</i>"
+                rows.append((book, chapter, verse, " ".join(words)))
+    conn.executemany("INSERT INTO Bible VALUES (?, ?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    tmp.replace(path)
+    return len(rows)
+
+
+# ============================================================================
+# Fixture set
+# ============================================================================
+
+def write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def fixture_key(spec: FixtureSpec) -> str:
+    payload = json.dumps({"generator": GENERATOR_VERSION, "spec": asdict(spec)}, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def ensure_fixtures(fixture_dir: Path, spec: FixtureSpec, force: bool = False) -> Dict:
+    """Build the fixture set unless fixtures.json already matches the spec; returns the manifest"""
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = fixture_dir / "fixtures.json"
+    key = fixture_key(spec)
+    if manifest_path.exists() and not force:
+        try:
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except ValueError:
+            manifest = {}
+        files = manifest.get("files", {})
+        if manifest.get("key") == key and all((fixture_dir / name).exists() for name in files):
+            return manifest
+
+    chapters = book_chapters(spec)
+    counts = {
+        "book.pdf": {"pages": write_book_pdf(fixture_dir / "book.pdf", chapters)},
+        "book.epub": {"chapters": len(chapters)},
+        "scripture.pdf": {"pages": write_scripture_pdf(fixture_dir / "scripture.pdf", spec)},
+        "scripture.bbli": {"verses": write_bbli(fixture_dir / "scripture.bbli", spec)},
+    }
+    write_book_epub(fixture_dir / "book.epub", chapters)
+
+    manifest = {
+        "key": key,
+        "generatorVersion": GENERATOR_VERSION,
+        "spec": asdict(spec),
+        "files": {
+            name: {**info, "sha256": sha256_file(fixture_dir / name)} for name, info in counts.items()
+        },
+    }
+    write_atomic(manifest_path, (json.dumps(manifest, indent=2) + "\n").encode("utf-8"))
+    return manifest
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Generate synthetic benchmark fixtures (PDF, EPUB, bbli)")
+    ap.add_argument("fixture_dir", help="Output directory")
+    ap.add_argument("--scale", type=int, default=1, help="Multiply fixture sizes (default: 1)")
+    ap.add_argument("--force", action="store_true", help="Rebuild even if fixtures.json matches")
+    args = ap.parse_args()
+
+    manifest = ensure_fixtures(Path(args.fixture_dir), FixtureSpec().scaled(args.scale), force=args.force)
+    print(f"✅ Fixtures {manifest['key']} in {args.fixture_dir}")
+    for name, info in manifest["files"].items():
+        detail = ", ".join(f"{k} {v}" for k, v in info.items() if k != "sha256")
+        print(f"   {name}: {detail}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1 @@
+make-fixtures.py
\ No newline at end of file
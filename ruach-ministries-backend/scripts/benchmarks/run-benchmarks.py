@@ -0,0 +1,676 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmarks - per-stage timings for the extractors, with regression thresholds
+
+Runs each extraction pipeline over the synthetic fixtures (make-fixtures.py), offline:
+
+    scripture-pdf    unified-extraction/scripture-extractor.py   (scripture.pdf)
+    scripture-bbli   unified-extraction/export-bbli.py           (scripture.bbli)
+    canon-pdf        canon-parser/ruach_canon_parser.py          (book.pdf)
+    canon-epub       canon-parser/ruach_canon_parser.py          (book.epub)
+    library-pdf      library-parser/ruach_library_parser.py      (book.pdf)
+    library-epub     library-parser/ruach_library_parser.py      (book.epub)
+    ministry-pdf     ministry-extraction/pdf-extractor.py        (book.pdf)
+
+Each pipeline runs in its own child process (so peak RSS is its own), --repeat times;
+a stage's time is the fastest of the repeats (the least disturbed by other load). Stages are timed where the extractor
+draws them (extract, tokenize, assemble, chunk, validate, serialize, plus normalize /
+profile / calibrate where a pipeline has them), with pages/s, blocks/s and the process
+peak RSS after the stage.
+
+Every run is appended to <out>/history.json. The baseline is the last --window recorded
+runs with the same fixtures, --repeat and machine (regressed runs included, so one fast
+outlier cannot ratchet it down), and nothing is gated until there are --min-baseline of
+them. --accept restarts the baseline at the accepted run. A stage regresses when it is slower than the baseline median by more than the
+largest of: the time threshold in thresholds.json, minSeconds, and `mad` × the baseline's
+scaled median absolute deviation (its own run-to-run noise). A pipeline's peak RSS is
+checked the same way. Any regression (or a failing pipeline) exits 1. Pipelines whose dependencies are not
+installed are reported as skipped.
+
+Usage:
+    python3 run-benchmarks.py
+    python3 run-benchmarks.py --only canon-pdf,ministry-pdf --repeat 5
+    python3 run-benchmarks.py --accept        # record a known slowdown as the new baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import resource
+import socket
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+BENCH_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = BENCH_DIR.parent
+UNIFIED_DIR = SCRIPTS_DIR / "unified-extraction"
+
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(UNIFIED_DIR))
+from make_fixtures import FixtureSpec, ensure_fixtures
+
+HISTORY_VERSION = 1
+MAX_HISTORY_RUNS = 200
+CHILD_TIMEOUT = 1800  # seconds per pipeline (all repeats)
+
+
+class MissingDependency(Exception):
+    """A pipeline's extractor cannot be imported here; the pipeline is skipped"""
+
+
+# ============================================================================
+# Stage timing (child process)
+# ============================================================================
+
+class Stage:
+    def __init__(self):
+        self.blocks: Optional[int] = None
+
+
+def peak_rss_mb() -> float:
+    """Process high-water RSS (ru_maxrss is KiB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class StageTimer:
+    """Records seconds, block count and peak RSS per stage, in stage order"""
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[Stage]:
+        handle = Stage()
+        start = time.perf_counter()
+        yield handle
+        seconds = time.perf_counter() - start
+        self.stages[name] = {"seconds": seconds, "blocks": handle.blocks, "peakRssMb": peak_rss_mb()}
+
+
+def load_script(name: str, path: Path):
+    """Import a script by path (hyphenated file names); exits/ImportErrors become MissingDependency"""
+    import importlib.util
+
+    directory = str(path.parent)
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # dataclasses resolve their module through sys.modules
+    captured = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(captured), contextlib.redirect_stderr(captured):
+            spec.loader.exec_module(module)
+    except (ImportError, SystemExit) as e:
+        del sys.modules[name]
+        reason = captured.getvalue().strip().splitlines() or [str(e)]
+        raise MissingDependency(reason[0].lstrip("❌ ").strip()) from None
+    return module
+
+
+def require(module_name: str):
+    import importlib
+
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        raise MissingDependency(f"{module_name} not installed") from None
+
+
+# ============================================================================
+# Pipelines: fn(fixture_dir, work_dir, timer) -> {"pages": int|None, "items": int}
+# ============================================================================
+
+def bench_scripture_pdf(fixtures: Path, work: Path, t: StageTimer) -> Dict[str, Any]:
+    pdfplumber = require("pdfplumber")
+    mod = load_script("scripture_extractor", UNIFIED_DIR / "scripture-extractor.py")
+    from base_extractor import ExtractionMetadata, ExtractionResult
+    from toc_parser import parse_toc
+
+    path = fixtures / "scripture.pdf"
+    ex = mod.ScriptureExtractor(str(path))
+    with pdfplumber.open(path) as pdf:
+        pages = len(pdf.pages)
+        with t.stage("extract") as st:
+            st.blocks = sum(len(page.chars) for page in pdf.pages)
+            page_ranges = parse_toc(pdf)
+
+        # Same steps as ScriptureExtractor._extract_book, one stage at a time over every book
+        with t.stage("tokenize") as st:
+            book_words = {}
+            for book, (start, end) in page_ranges.items():
+                end = pages if end == -1 else min(end, pages)
+                words = []
+                for page_idx in range(start - 1, end):
+                    words.extend(ex._extract_page_blocks(pdf.pages[page_idx], page_idx + 1))
+                book_words[book] = [b for b in words if b.zone == "BODY"]
+            st.blocks = sum(len(w) for w in book_words.values())
+
+    with t.stage("assemble") as st:
+        book_lines = {book: ex._assemble_lines(words) for book, words in book_words.items()}
+        st.blocks = sum(len(w) for w in book_words.values())
+
+    with t.stage("chunk") as st:
+        for book, lines in book_lines.items():
+            ex._register_work(book)
+            ex.current_book = book
+            ex.current_chapter = 0
+            ex._parse_verses_from_blocks(lines)
+        st.blocks = sum(len(lines) for lines in book_lines.values())
+    data = {"works": list(ex.works.values()), "verses": ex.verses}
+
+    with t.stage("validate") as st:
+        is_valid, errors, warnings = ex.validate(data)
+        st.blocks = len(ex.verses)
+    if not is_valid:
+        raise RuntimeError(f"scripture validation failed: {errors[:3]}")
+
+    with t.stage("serialize") as st:
+        metadata = ExtractionMetadata(
+            extractor_version="3.0.0",
+            content_type="scripture",
+            source_file=str(path),
+            source_sha256=ex.source_sha256,
+            extraction_timestamp=datetime.now(timezone.utc).isoformat(),
+            total_pages=pages,
+            total_items=len(data["works"]),
+            validation_status="valid",
+        )
+        ex.save_json(str(work / "scripture"), ExtractionResult(metadata, data, errors, warnings))
+        st.blocks = len(ex.verses)
+    return {"pages": pages, "items": len(ex.verses)}
+
+
+def bench_scripture_bbli(fixtures: Path, work: Path, t: StageTimer) -> Dict[str, Any]:
+    export_bbli = load_script("export_bbli", UNIFIED_DIR / "export-bbli.py")
+
+    conn = sqlite3.connect(fixtures / "scripture.bbli")
+    try:
+        with t.stage("extract") as st:
+            metadata = export_bbli.read_details(conn)
+            records = list(export_bbli.iter_export_records(conn, clean=False))
+            st.blocks = len(records)
+    finally:
+        conn.close()
+
+    # --clean: HTML stripped a batch at a time, as iter_export_records(clean=True) does
+    with t.stage("tokenize") as st:
+        texts = [rec["text"] for rec in records]
+        cleaned: List[str] = []
+        for i in range(0, len(texts), 5000):
+            cleaned.extend(export_bbli.strip_html_batch(texts[i : i + 5000]))
+        for rec, text in zip(records, cleaned):
+            rec["text"] = text
+        st.blocks = len(texts)
+
+    with t.stage("serialize") as st:
+        encode = export_bbli.JSON_ENCODER.encode
+        with open(work / "scripture.jsonl", "w", encoding="utf-8") as f:
+            f.write(encode({"_meta": metadata}) + "\n")
+            for rec in records:
+                f.write(encode(rec) + "\n")
+        st.blocks = len(records)
+    return {"pages": None, "items": len(records)}
+
+
+def bench_canon(fmt: str) -> Callable[[Path, Path, StageTimer], Dict[str, Any]]:
+    def bench(fixtures: Path, work: Path, t: StageTimer) -> Dict[str, Any]:
+        require("pdfplumber" if fmt == "pdf" else "ebooklib")
+        canon = load_script("ruach_canon_parser", SCRIPTS_DIR / "canon-parser" / "ruach_canon_parser.py")
+        path = fixtures / f"book.{fmt}"
+        max_chars, max_tokens = 1200, 500  # CLI defaults
+
+        # Adapters do block extraction, tokenization and line assembly in one pass
+        with t.stage("extract") as st:
+            blocks = list(canon.select_adapter(fmt).extract(path))
+            st.blocks = len(blocks)
+
+        with t.stage("assemble") as st:
+            chapters = canon.build_structure(blocks)
+            st.blocks = len(blocks)
+
+        with t.stage("chunk") as st:
+            nodes = list(canon.iter_chapter_nodes(chapters, fmt, "Benchmark", "", "benchmark", max_chars))
+            st.blocks = sum(len(chapter.items) for chapter in chapters)
+
+        with t.stage("validate") as st:
+            canon.validate_nodes(nodes, max_tokens)
+            st.blocks = len(nodes)
+
+        # Same record shapes as write_bundle_ndjson (header, compact nodes, trailer)
+        with t.stage("serialize") as st:
+            with open(work / f"canon-{fmt}.ndjson", "w", encoding="utf-8") as f:
+                f.write(json.dumps({"kind": canon.NDJSON_HEADER_KIND, "meta": {"format": fmt}}) + "\n")
+                for node in nodes:
+                    f.write(json.dumps(canon.compact_node(node), ensure_ascii=False) + "\n")
+                f.write(json.dumps({"kind": canon.NDJSON_TRAILER_KIND, "nodeCount": len(nodes)}) + "\n")
+            st.blocks = len(nodes)
+
+        pages = max((b.page or 0 for b in blocks), default=0) or None
+        return {"pages": pages, "items": len(nodes)}
+
+    return bench
+
+
+def bench_library(fmt: str) -> Callable[[Path, Path, StageTimer], Dict[str, Any]]:
+    def bench(fixtures: Path, work: Path, t: StageTimer) -> Dict[str, Any]:
+        lib = load_script("ruach_library_parser", SCRIPTS_DIR / "library-parser" / "ruach_library_parser.py")
+        path = fixtures / f"book.{fmt}"
+
+        with t.stage("extract") as st:
+            blocks = lib.extract_from_pdf(path) if fmt == "pdf" else lib.extract_from_epub(path)
+            st.blocks = len(blocks)
+
+        with t.stage("normalize") as st:
+            blocks = lib.normalize_blocks(blocks)
+            st.blocks = len(blocks)
+
+        with t.stage("assemble") as st:
+            anchors = lib.detect_chapters(blocks)
+            st.blocks = len(blocks)
+
+        with t.stage("chunk") as st:
+            chunks = lib.chunk_text(blocks, max_chars=1200, max_tokens=500)
+            st.blocks = len(blocks)
+
+        with t.stage("validate") as st:
+            qa = lib.compute_qa_metrics(blocks, chunks)
+            st.blocks = len(chunks)
+
+        with t.stage("serialize") as st:
+            payload = {
+                "qaMetrics": asdict(qa),
+                "anchors": [asdict(a) for a in anchors],
+                "chunks": [asdict(c) for c in chunks],
+            }
+            with open(work / f"library-{fmt}.json", "w", encoding="utf-8") as f:
+                json.dump(payload, f, ensure_ascii=False)
+            st.blocks = len(chunks)
+
+        pages = max((b.page or 0 for b in blocks), default=0) or None
+        return {"pages": pages, "items": len(chunks)}
+
+    return bench
+
+
+def bench_ministry_pdf(fixtures: Path, work: Path, t: StageTimer) -> Dict[str, Any]:
+    pdfplumber = require("pdfplumber")
+    mod = load_script("ministry_pdf_extractor", SCRIPTS_DIR / "ministry-extraction" / "pdf-extractor.py")
+    from font_profile import FontProfile, build_font_profile
+    from line_assembly import assemble_page_lines
+
+    path = fixtures / "book.pdf"
+    ex = mod.MinistryPDFExtractor(str(path), "BENCH")
+
+    with t.stage("profile") as st:
+        ex.font_profile = FontProfile(build_font_profile(path, workers=1))
+        ex._set_body_font_size()
+        st.blocks = ex.font_profile.page_count
+
+    with pdfplumber.open(path) as pdf:
+        pages = len(pdf.pages)
+        with t.stage("extract") as st:
+            st.blocks = sum(len(page.chars) for page in pdf.pages)
+
+        with t.stage("calibrate") as st:
+            ex.calibrate(pdf)
+            st.blocks = pages
+
+        # iter_body_lines, split into its word and line passes
+        with t.stage("tokenize") as st:
+            body_pages = [
+                (page_num, [b for b in blocks if b.zone == "BODY"])
+                for page_num, blocks in ex.iter_layout_pages(pdf)
+            ]
+            st.blocks = sum(len(blocks) for _, blocks in body_pages)
+
+    with t.stage("assemble") as st:
+        lines = [
+            line
+            for page_num, blocks in body_pages
+            for line in assemble_page_lines(blocks, page=page_num, tolerance=ex.thresholds.line_tolerance)
+        ]
+        st.blocks = sum(len(blocks) for _, blocks in body_pages)
+
+    with t.stage("chunk") as st:
+        paragraphs = list(ex.iter_paragraphs(lines))
+        st.blocks = len(lines)
+
+    with t.stage("validate") as st:
+        stats = mod.ParagraphStats()
+        for para in paragraphs:
+            stats.add(para)
+        is_valid, errors, _ = ex.validate_stats(stats)
+        st.blocks = len(paragraphs)
+    if not is_valid:
+        raise RuntimeError(f"ministry validation failed: {errors[:3]}")
+
+    with t.stage("serialize") as st:
+        with open(work / "ministry.jsonl", "w", encoding="utf-8") as f:
+            for para in paragraphs:
+                f.write(json.dumps(asdict(para)) + "\n")
+        st.blocks = len(paragraphs)
+    return {"pages": pages, "items": len(paragraphs)}
+
+
+PIPELINES: Dict[str, Callable[[Path, Path, StageTimer], Dict[str, Any]]] = {
+    "scripture-pdf": bench_scripture_pdf,
+    "scripture-bbli": bench_scripture_bbli,
+    "canon-pdf": bench_canon("pdf"),
+    "canon-epub": bench_canon("epub"),
+    "library-pdf": bench_library("pdf"),
+    "library-epub": bench_library("epub"),
+    "ministry-pdf": bench_ministry_pdf,
+}
+
+
+def run_child(name: str, fixtures: Path, repeat: int) -> Dict[str, Any]:
+    """Run one pipeline `repeat` times in this process; extractor output is discarded"""
+    runs: List[Dict[str, Dict[str, Any]]] = []
+    counts: Dict[str, Any] = {}
+    try:
+        for _ in range(repeat):
+            timer = StageTimer()
+            with tempfile.TemporaryDirectory(prefix=f"bench-{name}-") as work, \
+                    open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                counts = PIPELINES[name](fixtures, Path(work), timer)
+            runs.append(timer.stages)
+            gc.collect()
+    except MissingDependency as e:
+        return {"status": "skipped", "reason": str(e)}
+    except Exception as e:
+        return {"status": "error", "reason": f"{type(e).__name__}: {e}", "traceback": traceback.format_exc()}
+
+    stages = {}
+    for stage, first in runs[0].items():
+        samples = [run[stage]["seconds"] for run in runs]
+        stages[stage] = {
+            "seconds": round(min(samples), 6),
+            "samples": [round(s, 6) for s in samples],
+            "blocks": first["blocks"],
+            "peakRssMb": first["peakRssMb"],  # first (cold) run: where the high-water mark was set
+        }
+    return {"status": "ok", **counts, "peakRssMb": peak_rss_mb(), "stages": stages}
+
+
+# ============================================================================
+# Parent: orchestration, history, regression check
+# ============================================================================
+
+def spawn_pipeline(name: str, fixtures: Path, repeat: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="bench-result-") as tmp:
+        result_path = Path(tmp) / "result.json"
+        command = [sys.executable, str(Path(__file__).resolve()), "--child", name,
+                   "--fixtures", str(fixtures), "--repeat", str(repeat), "--result", str(result_path)]
+        try:
+            proc = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                  text=True, timeout=CHILD_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            return {"status": "error", "reason": f"timed out after {CHILD_TIMEOUT}s"}
+        if not result_path.exists():
+            tail = (proc.stdout or "").strip().splitlines()[-5:]
+            return {"status": "error", "reason": f"child exited {proc.returncode}", "output": tail}
+        return json.loads(result_path.read_text(encoding="utf-8"))
+
+
+def add_throughput(result: Dict[str, Any]) -> None:
+    pages = result.get("pages")
+    for stage in result.get("stages", {}).values():
+        seconds = stage["seconds"]
+        stage["pagesPerSec"] = round(pages / seconds, 1) if pages and seconds > 0 else None
+        stage["blocksPerSec"] = round(stage["blocks"] / seconds, 1) if stage["blocks"] and seconds > 0 else None
+
+
+def machine_key() -> Dict[str, str]:
+    return {
+        "host": socket.gethostname(),
+        "platform": f"{platform.system()}-{platform.machine()}",
+        "python": platform.python_version(),
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=SCRIPTS_DIR,
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if out.returncode != 0:
+        return None
+    return out.stdout.strip() or None
+
+
+def load_history(path: Path) -> Dict[str, Any]:
+    if path.exists():
+        try:
+            history = json.loads(path.read_text(encoding="utf-8"))
+            if history.get("version") == HISTORY_VERSION:
+                return history
+        except ValueError:
+            pass
+        print(f"⚠️  {path} unreadable or from another version; starting a new history")
+    return {"version": HISTORY_VERSION, "runs": []}
+
+
+def save_history(path: Path, history: Dict[str, Any]) -> None:
+    history["runs"] = history["runs"][-MAX_HISTORY_RUNS:]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(history, indent=1) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def load_thresholds(path: Path, time_override: Optional[float]) -> Dict[str, Any]:
+    thresholds = {"time": 0.25, "rss": 0.2, "minSeconds": 0.05, "minRssMb": 16, "mad": 3.0, "overrides": {}}
+    if path.exists():
+        thresholds.update(json.loads(path.read_text(encoding="utf-8")))
+    if time_override is not None:
+        thresholds["time"] = time_override
+    return thresholds
+
+
+def threshold_for(thresholds: Dict[str, Any], key: str, metric: str) -> float:
+    """Most specific of "pipeline.stage", "pipeline", then the global value"""
+    overrides = thresholds.get("overrides", {})
+    for candidate in (key, key.split(".")[0]):
+        if metric in overrides.get(candidate, {}):
+            return overrides[candidate][metric]
+    return thresholds[metric]
+
+
+def baseline_runs(history: Dict[str, Any], fixture_key: str, machine: Dict[str, str], repeat: int,
+                  window: int) -> List[Dict]:
+    """Last `window` runs comparable with this one, whatever their status, from the latest --accept on"""
+    matching = [
+        run for run in history["runs"]
+        if run.get("fixtureKey") == fixture_key and run.get("machine") == machine and run.get("repeat") == repeat
+    ]
+    accepted = [i for i, run in enumerate(matching) if run.get("accepted")]
+    if accepted:
+        matching = matching[accepted[-1]:]
+    return matching[-window:]
+
+
+def allowed_increase(samples: List[float], limit: float, floor: float, mad_k: float) -> Tuple[float, float]:
+    """(baseline median, allowed increase): relative limit, absolute floor or k·MAD, whichever is largest"""
+    base = statistics.median(samples)
+    # 1.4826 scales the MAD to a standard deviation for normally distributed noise
+    mad = 1.4826 * statistics.median(abs(x - base) for x in samples)
+    return base, max(base * limit, floor, mad_k * mad)
+
+
+def find_regressions(
+    results: Dict[str, Dict[str, Any]], baseline: List[Dict], thresholds: Dict[str, Any]
+) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+    """Compare against per-stage baseline medians and noise; returns (regressions, {key: baseline value})"""
+    regressions: List[Dict[str, Any]] = []
+    baselines: Dict[str, float] = {}
+    for name, result in results.items():
+        if result.get("status") != "ok":
+            continue
+        past = [run["pipelines"][name] for run in baseline
+                if run["pipelines"].get(name, {}).get("status") == "ok"]
+        if not past:
+            continue
+
+        for stage, current in result["stages"].items():
+            key = f"{name}.{stage}"
+            samples = [p["stages"][stage]["seconds"] for p in past if stage in p["stages"]]
+            if not samples:
+                continue
+            limit = threshold_for(thresholds, key, "time")
+            base, allowed = allowed_increase(samples, limit, thresholds["minSeconds"], thresholds["mad"])
+            baselines[key] = base
+            if current["seconds"] - base > allowed:
+                regressions.append({"key": key, "metric": "seconds", "baseline": round(base, 6),
+                                    "current": current["seconds"], "threshold": limit,
+                                    "allowed": round(allowed, 6)})
+
+        limit = threshold_for(thresholds, name, "rss")
+        base_rss, allowed = allowed_increase([p["peakRssMb"] for p in past], limit,
+                                             thresholds["minRssMb"], thresholds["mad"])
+        baselines[f"{name}.peakRssMb"] = base_rss
+        if result["peakRssMb"] - base_rss > allowed:
+            regressions.append({"key": name, "metric": "peakRssMb", "baseline": base_rss,
+                                "current": result["peakRssMb"], "threshold": limit,
+                                "allowed": round(allowed, 3)})
+    return regressions, baselines
+
+
+def fmt_rate(value: Optional[float]) -> str:
+    return f"{value:,.0f}" if value is not None else "-"
+
+
+def print_results(results: Dict[str, Dict[str, Any]], baselines: Dict[str, float],
+                  regressed: set) -> None:
+    for name, result in results.items():
+        status = result.get("status")
+        if status != "ok":
+            icon = "⏭️ " if status == "skipped" else "❌"
+            print(f"\n{icon} {name}: {status} ({result.get('reason')})")
+            continue
+        pages = f"{result['pages']} pages, " if result.get("pages") else ""
+        print(f"\n📊 {name}: {pages}{result['items']} items, peak RSS {result['peakRssMb']:.1f} MB")
+        print(f"   {'stage':<10} {'seconds':>9} {'pages/s':>9} {'blocks/s':>11} {'RSS MB':>7}  vs baseline")
+        for stage, s in result["stages"].items():
+            key = f"{name}.{stage}"
+            base = baselines.get(key)
+            delta = f"{(s['seconds'] / base - 1) * 100:+.0f}%" if base else "-"
+            mark = "  ⚠️  REGRESSED" if key in regressed else ""
+            print(f"   {stage:<10} {s['seconds']:>9.4f} {fmt_rate(s['pagesPerSec']):>9} "
+                  f"{fmt_rate(s['blocksPerSec']):>11} {s['peakRssMb']:>7.1f}  {delta}{mark}")
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Benchmark extraction pipeline stages on synthetic fixtures")
+    ap.add_argument("--out", default=str(BENCH_DIR / "out"), help="Output directory (fixtures, history.json)")
+    ap.add_argument("--history", help="History file (default: <out>/history.json)")
+    ap.add_argument("--scale", type=int, default=1, help="Fixture size multiplier (default: 1)")
+    ap.add_argument("--repeat", type=int, default=3, help="Runs per pipeline; stage time is the fastest (default: 3)")
+    ap.add_argument("--only", help="Comma-separated pipelines (default: all)")
+    ap.add_argument("--window", type=int, default=5, help="Recent runs in the baseline median (default: 5)")
+    ap.add_argument("--min-baseline", type=int, default=3,
+                    help="Baseline runs needed before regressions are gated (default: 3)")
+    ap.add_argument("--thresholds", default=str(BENCH_DIR / "thresholds.json"), help="Threshold file")
+    ap.add_argument("--threshold", type=float, help="Override the stage time threshold (e.g. 0.25 = +25%%)")
+    ap.add_argument("--accept", action="store_true", help="Record this run as passing even if it regressed")
+    ap.add_argument("--no-record", action="store_true", help="Do not append this run to the history")
+    ap.add_argument("--list", action="store_true", help="List pipelines and exit")
+    ap.add_argument("--child", help=argparse.SUPPRESS)
+    ap.add_argument("--fixtures", help=argparse.SUPPRESS)
+    ap.add_argument("--result", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        result = run_child(args.child, Path(args.fixtures), max(args.repeat, 1))
+        Path(args.result).write_text(json.dumps(result), encoding="utf-8")
+        return 0
+
+    if args.list:
+        for name in PIPELINES:
+            print(name)
+        return 0
+
+    names = list(PIPELINES) if not args.only else [n.strip() for n in args.only.split(",") if n.strip()]
+    unknown = [n for n in names if n not in PIPELINES]
+    if unknown:
+        print(f"❌ Unknown pipeline(s): {', '.join(unknown)} (see --list)")
+        return 2
+
+    out_dir = Path(args.out)
+    history_path = Path(args.history) if args.history else out_dir / "history.json"
+    spec = FixtureSpec().scaled(args.scale)
+    fixtures_dir = out_dir / "fixtures"
+    manifest = ensure_fixtures(fixtures_dir, spec)
+    print(f"🧪 Fixtures {manifest['key']} ({fixtures_dir})")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for name in names:
+        print(f"⏱️  {name} (x{args.repeat})...", flush=True)
+        results[name] = spawn_pipeline(name, fixtures_dir, args.repeat)
+        add_throughput(results[name])
+
+    history = load_history(history_path)
+    machine = machine_key()
+    thresholds = load_thresholds(Path(args.thresholds), args.threshold)
+    baseline = baseline_runs(history, manifest["key"], machine, args.repeat, args.window)
+    gated = len(baseline) >= max(args.min_baseline, 1)
+    regressions, baselines = find_regressions(results, baseline if gated else [], thresholds)
+    failed = [name for name, r in results.items() if r.get("status") == "error"]
+
+    print_results(results, baselines, {r["key"] for r in regressions if r["metric"] == "seconds"})
+
+    passed = not regressions and not failed
+    if not args.no_record:
+        history["runs"].append({
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": git_commit(),
+            "machine": machine,
+            "fixtureKey": manifest["key"],
+            "scale": args.scale,
+            "repeat": args.repeat,
+            "status": "pass" if passed or args.accept else "regressed",
+            "accepted": bool(args.accept and regressions),
+            "regressions": regressions,
+            "pipelines": results,
+        })
+        save_history(history_path, history)
+
+    print()
+    if not gated:
+        print(f"ℹ️  Baseline has {len(baseline)} of {args.min_baseline} runs for these fixtures, --repeat and "
+              f"machine; not gating yet ({history_path})")
+    else:
+        print(f"📈 Baseline: median of {len(baseline)} earlier run(s)")
+    for r in regressions:
+        print(f"⚠️  {r['key']} {r['metric']}: {r['current']} vs baseline {r['baseline']} "
+              f"(allowed +{r['allowed']}, threshold +{r['threshold']:.0%})")
+    for name in failed:
+        print(f"❌ {name} failed: {results[name].get('reason')}")
+    if passed:
+        print("✅ No regressions")
+        return 0
+    if args.accept and not failed:
+        print("✅ Regressions accepted as the new baseline")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
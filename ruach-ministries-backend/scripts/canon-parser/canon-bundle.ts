@@ -0,0 +1,143 @@
+import { createReadStream } from "node:fs";
+import fs from "node:fs/promises";
+import { createInterface } from "node:readline";
+
+// Mirrors ruach_canon_parser.py: NDJSON bundles are a header line, one compact node per
+// line, and a trailer line; a JSON bundle is one object with `meta`, `book` and `nodes`.
+export const NDJSON_HEADER_KIND = "canon-bundle-header";
+export const NDJSON_TRAILER_KIND = "canon-bundle-trailer";
+
+const NDJSON_HEADER_PREFIX_RE = /^\s*\{\s*"kind"\s*:\s*"canon-bundle-header"/;
+const PROBE_BYTES = 4096;
+
+type Json = Record<string, unknown>;
+
+export type OpenedCanonBundle<N> = {
+  format: "json" | "ndjson";
+  meta?: Json;
+  book?: unknown;
+  nodeCount: number;
+  /** Other top-level keys of a JSON bundle (none for NDJSON). */
+  extra: Json;
+  /** Nodes in bundle order, in the full (JSON) node shape; NDJSON is read line by line. */
+  nodes: () => AsyncGenerator<N>;
+};
+
+function isRecord(value: unknown): value is Json {
+  return typeof value === "object" && value !== null && !Array.isArray(value);
+}
+
+async function readHead(file: string): Promise<string> {
+  const handle = await fs.open(file, "r");
+  try {
+    const buffer = Buffer.alloc(PROBE_BYTES);
+    const { bytesRead } = await handle.read(buffer, 0, PROBE_BYTES, 0);
+    return buffer.subarray(0, bytesRead).toString("utf-8");
+  } finally {
+    await handle.close();
+  }
+}
+
+async function readTrailer(file: string): Promise<Json | undefined> {
+  const handle = await fs.open(file, "r");
+  try {
+    const { size } = await handle.stat();
+    const length = Math.min(size, PROBE_BYTES);
+    const buffer = Buffer.alloc(length);
+    await handle.read(buffer, 0, length, size - length);
+    const lines = buffer.toString("utf-8").trimEnd().split("\n");
+    const record = JSON.parse(lines[lines.length - 1]);
+    return isRecord(record) && record.kind === NDJSON_TRAILER_KIND ? record : undefined;
+  } catch {
+    return undefined;
+  } finally {
+    await handle.close();
+  }
+}
+
+async function readFirstLine(file: string): Promise<string> {
+  const input = createReadStream(file, "utf-8");
+  const lines = createInterface({ input, crlfDelay: Infinity });
+  try {
+    for await (const line of lines) return line;
+    return "";
+  } finally {
+    lines.close();
+    input.destroy();
+  }
+}
+
+async function* readLines(file: string): AsyncGenerator<string> {
+  const lines = createInterface({ input: createReadStream(file, "utf-8"), crlfDelay: Infinity });
+  for await (const line of lines) {
+    if (line.trim()) yield line;
+  }
+}
+
+/** Inverse of compact_node(): `sourceSlug` → `source`, header default `authority` restored. */
+export function expandNode(node: Json, header: Json): Json {
+  const sources = isRecord(header.sources) ? header.sources : {};
+  const defaults = isRecord(header.defaults) ? header.defaults : {};
+  const expanded: Json = {};
+  for (const [key, value] of Object.entries(node)) {
+    if (key === "sourceSlug") {
+      const source = sources[String(value)];
+      expanded.source = isRecord(source) ? { ...source } : { slug: value };
+    } else {
+      expanded[key] = value;
+    }
+  }
+  if (!("authority" in expanded) && isRecord(defaults.authority)) {
+    expanded.authority = { ...defaults.authority };
+  }
+  return expanded;
+}
+
+/**
+ * Open a JSON or NDJSON canon bundle. NDJSON nodes are streamed (never held together);
+ * a bundle without its trailer line is rejected up front as truncated.
+ */
+export async function openCanonBundle<N>(file: string): Promise<OpenedCanonBundle<N>> {
+  const head = await readHead(file);
+  if (!NDJSON_HEADER_PREFIX_RE.test(head)) {
+    const { meta, book, nodes: rawNodes, ...extra } = JSON.parse(await fs.readFile(file, "utf-8")) as Json;
+    const nodes = Array.isArray(rawNodes) ? (rawNodes as N[]) : [];
+    return {
+      format: "json",
+      meta: isRecord(meta) ? meta : undefined,
+      book,
+      nodeCount: nodes.length,
+      extra,
+      nodes: async function* () {
+        yield* nodes;
+      },
+    };
+  }
+
+  const header = JSON.parse(await readFirstLine(file)) as Json;
+  const trailer = await readTrailer(file);
+  if (!trailer) {
+    throw new Error(`${file} has no ${NDJSON_TRAILER_KIND} line (truncated NDJSON bundle)`);
+  }
+  const nodeCount = Number(trailer.nodeCount ?? 0);
+
+  return {
+    format: "ndjson",
+    meta: isRecord(header.meta) ? header.meta : undefined,
+    book: header.book,
+    nodeCount,
+    extra: {},
+    nodes: async function* () {
+      let count = 0;
+      for await (const line of readLines(file)) {
+        const record = JSON.parse(line) as Json;
+        if (record.kind === NDJSON_HEADER_KIND || record.kind === NDJSON_TRAILER_KIND) continue;
+        count += 1;
+        yield expandNode(record, header) as N;
+      }
+      if (count !== nodeCount) {
+        throw new Error(`${file}: trailer says ${nodeCount} nodes, read ${count}`);
+      }
+    },
+  };
+}
@@ -2,11 +2,7 @@
 import fs from "node:fs/promises";
 import path from "node:path";
 import { createHash } from "node:crypto";
-
-async function readJson<T>(file: string): Promise<T> {
-  const text = await fs.readFile(file, "utf-8");
-  return JSON.parse(text) as T;
-}
+import { openCanonBundle } from "./canon-bundle";
 
 type CanonNode = {
   canonNodeId: string;
@@ -24,11 +20,6 @@ type CanonNode = {
   [key: string]: unknown;
 };
 
-type CanonBundle = {
-  meta?: Record<string, unknown>;
-  nodes: CanonNode[];
-};
-
 type GuidebookPayload = {
   nodeId: string;
   title: string;
@@ -507,7 +498,8 @@ async function main(): Promise<void> {
     phaseInfo = { id: options.phaseId, documentId };
   }
 
-  const canon = await readJson<CanonBundle>(CANON_PATH);
+  // JSON or NDJSON (parser --jsonl); NDJSON nodes are streamed, not loaded together
+  const canon = await openCanonBundle<CanonNode>(CANON_PATH);
   if (!canon.meta?.textNormalized) {
     throw new Error("Canon must be normalized before importing into Strapi.");
   }
@@ -515,7 +507,8 @@ async function main(): Promise<void> {
   let created = 0;
   let updated = 0;
   let cachedPhaseListings: FormationPhaseListing[] | null = null;
-  const totalNodes = canon.nodes.length;
+  const totalNodes = canon.nodeCount;
+  const importedIds = new Set<string>();
   const startTime = Date.now();
 
   console.log(`\n📦 Importing ${totalNodes} nodes to ${STRAPI_URL}...`);
@@ -523,8 +516,10 @@ async function main(): Promise<void> {
     console.log("🔍 DRY RUN MODE - No changes will be made\n");
   }
 
-  for (let index = 0; index < canon.nodes.length; index += 1) {
-    const node = canon.nodes[index];
+  let index = -1;
+  for await (const node of canon.nodes()) {
+    index += 1;
+    importedIds.add(node.canonNodeId);
     const progress = `[${index + 1}/${totalNodes}]`;
     const rawNode = buildGuidebookRawNode(node, index, allowedFields);
     const extraAllowed = new Set(["phaseId", "canonAxiomIds", "phaseSlug"]);
@@ -657,8 +652,60 @@ async function main(): Promise<void> {
     }
   }
 
+  // Changed-only bundles from diff_canon_bundles.py list deleted/moved-away IDs in meta.diff.removed
+  const diff = isRecord(canon.meta?.diff) ? canon.meta.diff : undefined;
+  const removedIds = Array.isArray(diff?.removed)
+    ? diff.removed.filter(
+        (value): value is string => typeof value === "string" && value.length > 0 && !importedIds.has(value),
+      )
+    : [];
+  let deleted = 0;
+  if (removedIds.length) {
+    console.log(`\n🗑️  Removing ${removedIds.length} nodes listed in meta.diff.removed...`);
+  }
+  for (const nodeId of removedIds) {
+    const filters = new URLSearchParams({
+      "filters[nodeId][$eq]": nodeId,
+      "fields[0]": "id",
+      "fields[1]": "documentId",
+      limit: "1",
+    });
+    const existing = await fetchJson(`${STRAPI_URL}/api/guidebook-nodes?${filters.toString()}`, {
+      headers: {
+        Authorization: `Bearer ${STRAPI_TOKEN}`,
+        "Content-Type": "application/json",
+      },
+      method: "GET",
+    });
+    const existingEntry = Array.isArray(existing?.data) ? existing.data[0] : null;
+    if (!existingEntry) {
+      console.log(`   ${nodeId} not found, nothing to delete`);
+      continue;
+    }
+    if (options.dryRun) {
+      console.log(`[DRY-RUN] DELETE ${nodeId}`);
+      deleted += 1;
+      continue;
+    }
+    const entryKey = existingEntry.documentId ?? existingEntry.id;
+    const res = await fetch(`${STRAPI_URL}/api/guidebook-nodes/${entryKey}`, {
+      method: "DELETE",
+      headers: {
+        Authorization: `Bearer ${STRAPI_TOKEN}`,
+        "Content-Type": "application/json",
+      },
+    });
+    if (!res.ok) {
+      const body = await res.text();
+      throw new Error(`Failed to DELETE ${nodeId} (${res.status})\n${body}`);
+    }
+    deleted += 1;
+  }
+
   const duration = ((Date.now() - startTime) / 1000).toFixed(1);
-  console.log(`\n✅ Canon import complete in ${duration}s (created=${created}, updated=${updated})`);
+  console.log(
+    `\n✅ Canon import complete in ${duration}s (created=${created}, updated=${updated}, deleted=${deleted})`,
+  );
 }
 
 main().catch((error) => {
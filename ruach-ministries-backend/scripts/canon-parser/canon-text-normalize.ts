@@ -2,6 +2,7 @@
 import fs from "node:fs/promises";
 import path from "node:path";
 import { createHash } from "node:crypto";
+import { openCanonBundle } from "./canon-bundle";
 
 type CanonNode = {
   canonNodeId: string;
@@ -222,8 +223,8 @@ function hashNode(node: CanonNode): string {
 }
 
 function buildOutputPath(input: string): string {
-  if (input.endsWith(".canon.json")) {
-    return `${input.replace(/\.canon\.json$/, "")}.canon.clean.json`;
+  if (/\.canon\.(json|jsonl|ndjson)$/.test(input)) {
+    return `${input.replace(/\.canon\.(json|jsonl|ndjson)$/, "")}.canon.clean.json`;
   }
   return `${input}.clean.json`;
 }
@@ -235,8 +236,11 @@ function buildDiffSample(originalText: string, normalizedText: string): string {
 
 async function main(): Promise<void> {
   const options = parseArgs();
-  const source = await fs.readFile(options.input, "utf-8");
-  const bundle: CanonBundle = JSON.parse(source);
+  const opened = await openCanonBundle<CanonNode>(options.input);
+  const bundle: CanonBundle = { meta: opened.meta, book: opened.book, nodes: [], ...opened.extra };
+  for await (const node of opened.nodes()) {
+    bundle.nodes.push(node);
+  }
 
   const diffEntries: Array<{
     canonNodeId: string;
@@ -1,6 +1,9 @@
 #!/usr/bin/env tsx
+import { createWriteStream } from "node:fs";
 import fs from "node:fs/promises";
+import { once } from "node:events";
 import path from "node:path";
+import { openCanonBundle } from "./canon-bundle";
 
 type CanonNode = {
   canonNodeId: string;
@@ -23,10 +26,6 @@ type CanonNode = {
   source?: unknown;
 };
 
-type CanonBundle = {
-  nodes: CanonNode[];
-};
-
 type VectorChunk = {
   id: string;
   text: string;
@@ -77,7 +76,7 @@ function parseArgs(): Options {
   }
 
   if (!options.output) {
-    options.output = `${options.input.replace(/\.canon(\.clean)?\.json$/, "")}.vectors.json`;
+    options.output = `${options.input.replace(/\.canon(\.clean)?\.(json|jsonl|ndjson)$/, "")}.vectors.json`;
   }
 
   return options;
@@ -89,23 +88,28 @@ function printUsage(): void {
   console.log(`
 Usage:
   tsx ${script} --input path/to/ministry-of-healing.canon.clean.json [--output path/to/chunks.vectors.json]
+
+  --input accepts a JSON bundle or an NDJSON bundle (parser --jsonl); NDJSON is streamed.
 `);
 }
 
 async function main(): Promise<void> {
   const options = parseArgs();
-  const bundle = JSON.parse(await fs.readFile(options.input, "utf-8")) as CanonBundle;
-  const chunks: VectorChunk[] = [];
+  const bundle = await openCanonBundle<CanonNode>(options.input);
+  const tmpOutput = `${options.output}.tmp`;
+  const out = createWriteStream(tmpOutput, "utf-8");
+  let written = 0;
 
-  for (let i = 0; i < bundle.nodes.length; i += 1) {
-    const node = bundle.nodes[i];
-    const neighbors = [
-      bundle.nodes[i - 1]?.content.text,
-      node.content.text,
-      bundle.nodes[i + 1]?.content.text,
-    ].filter(Boolean);
+  const write = async (text: string): Promise<void> => {
+    if (!out.write(text)) await once(out, "drain");
+  };
 
-    chunks.push({
+  // Nodes are read in order with a one-node lookahead, so each chunk's context (previous,
+  // current, next text) is available without holding the bundle; the array is written
+  // element by element in the same layout as JSON.stringify(chunks, null, 2).
+  const emit = async (node: CanonNode, previous?: CanonNode, next?: CanonNode): Promise<void> => {
+    const neighbors = [previous?.content.text, node.content.text, next?.content.text].filter(Boolean);
+    const chunk: VectorChunk = {
       id: node.canonNodeId,
       text: node.content.text,
       context: neighbors.join("\n"),
@@ -116,12 +120,26 @@ async function main(): Promise<void> {
         authority: node.authority,
         source: node.source,
       },
-    });
-  }
+    };
+    const body = JSON.stringify(chunk, null, 2).replace(/\n/g, "\n  ");
+    await write(`${written === 0 ? "[\n" : ",\n"}  ${body}`);
+    written += 1;
+  };
 
-  await fs.writeFile(options.output, `${JSON.stringify(chunks, null, 2)}\n`, "utf-8");
+  let previous: CanonNode | undefined;
+  let current: CanonNode | undefined;
+  for await (const node of bundle.nodes()) {
+    if (current) await emit(current, previous, node);
+    previous = current;
+    current = node;
+  }
+  if (current) await emit(current, previous, undefined);
+  await write(written === 0 ? "[]\n" : "\n]\n");
+  out.end();
+  await once(out, "finish");
+  await fs.rename(tmpOutput, options.output);
   // eslint-disable-next-line no-console
-  console.log(`Vector chunks written to ${options.output}`);
+  console.log(`${written} vector chunks written to ${options.output}`);
 }
 
 main().catch((error) => {
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Ruach Canon Bundle Differ
+
+Node-level diff between two canon bundles (e.g. before/after a parser version bump):
+- Nodes are matched by canonNodeId, then by content text hash
+- Emits a compact patch: added / removed / changed / moved
+- Optionally writes a bundle containing only the touched nodes, so Strapi import and
+  vector ingest re-process just what actually changed
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from ruach_canon_parser import load_bundle
+
+
+def sha256_hex(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def node_text(node: Dict[str, Any]) -> str:
+    return ((node.get("content") or {}).get("text") or "").strip()
+
+
+def text_hash(node: Dict[str, Any]) -> str:
+    return sha256_hex(node_text(node).encode("utf-8"))
+
+
+def field_hash(value: Any) -> str:
+    return sha256_hex(json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+
+
+def bundle_ref(bundle: Dict[str, Any]) -> Dict[str, Any]:
+    book = bundle.get("book") or {}
+    meta = bundle.get("meta") or {}
+    return {
+        "slug": book.get("slug"),
+        "sourceSha256": book.get("sourceSha256"),
+        "parserVersion": meta.get("parserVersion"),
+        "determinismKey": meta.get("determinismKey"),
+    }
+
+
+def changed_fields(old: Dict[str, Any], new: Dict[str, Any]) -> List[str]:
+    keys = sorted(set(old.keys()) | set(new.keys()))
+    return [k for k in keys if field_hash(old.get(k)) != field_hash(new.get(k))]
+
+
+def diff_bundles(old_bundle: Dict[str, Any], new_bundle: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns the patch dict. Matching rules:
+    1. Same canonNodeId in both → unchanged, or changed (with the list of differing top-level fields)
+    2. canonNodeId only in new, text hash equals an old-only node → moved (from → to)
+    3. Remaining new-only → added; remaining old-only → removed
+    """
+    old_nodes: List[Dict[str, Any]] = old_bundle.get("nodes") or []
+    new_nodes: List[Dict[str, Any]] = new_bundle.get("nodes") or []
+
+    old_by_id = {n.get("canonNodeId"): n for n in old_nodes}
+    new_ids = {n.get("canonNodeId") for n in new_nodes}
+
+    unchanged = 0
+    changed: List[Dict[str, Any]] = []
+    new_only: List[Dict[str, Any]] = []
+
+    for node in new_nodes:
+        node_id = node.get("canonNodeId")
+        old = old_by_id.get(node_id)
+        if old is None:
+            new_only.append(node)
+            continue
+        fields = changed_fields(old, node)
+        if not fields:
+            unchanged += 1
+            continue
+        changed.append(
+            {
+                "canonNodeId": node_id,
+                "fields": fields,
+                "oldTextSha256": text_hash(old),
+                "newTextSha256": text_hash(node),
+            }
+        )
+
+    # Old-only nodes, bucketed by text hash in original order (deterministic move pairing).
+    old_only_by_hash: Dict[str, List[str]] = defaultdict(list)
+    for node in old_nodes:
+        node_id = node.get("canonNodeId")
+        if node_id not in new_ids:
+            old_only_by_hash[text_hash(node)].append(node_id)
+
+    added: List[str] = []
+    moved: List[Dict[str, Any]] = []
+    for node in new_only:
+        h = text_hash(node)
+        candidates = old_only_by_hash.get(h)
+        if candidates:
+            moved.append({"from": candidates.pop(0), "to": node.get("canonNodeId"), "textSha256": h})
+        else:
+            added.append(node.get("canonNodeId"))
+
+    moved_from = {m["from"] for m in moved}
+    removed = [
+        n.get("canonNodeId")
+        for n in old_nodes
+        if n.get("canonNodeId") not in new_ids and n.get("canonNodeId") not in moved_from
+    ]
+
+    return {
+        "base": bundle_ref(old_bundle),
+        "target": bundle_ref(new_bundle),
+        "summary": {
+            "baseNodes": len(old_nodes),
+            "targetNodes": len(new_nodes),
+            "unchanged": unchanged,
+            "changed": len(changed),
+            "added": len(added),
+            "removed": len(removed),
+            "moved": len(moved),
+        },
+        "changed": changed,
+        "added": added,
+        "removed": removed,
+        "moved": moved,
+    }
+
+
+def touched_ids(patch: Dict[str, Any]) -> List[str]:
+    """IDs in the target bundle that downstream consumers must (re-)write."""
+    ids = [c["canonNodeId"] for c in patch["changed"]]
+    ids.extend(patch["added"])
+    ids.extend(m["to"] for m in patch["moved"])
+    return ids
+
+
+def build_changed_bundle(new_bundle: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Bundle-shaped subset of the target (same book/meta, only touched nodes, target order),
+    consumable by canon-strapi-import.ts as-is. Deletions travel in meta.diff.
+    """
+    wanted = set(touched_ids(patch))
+    nodes = [n for n in new_bundle.get("nodes") or [] if n.get("canonNodeId") in wanted]
+    meta = dict(new_bundle.get("meta") or {})
+    meta["diff"] = {
+        "baseDeterminismKey": patch["base"].get("determinismKey"),
+        "baseParserVersion": patch["base"].get("parserVersion"),
+        "removed": patch["removed"] + [m["from"] for m in patch["moved"]],
+        "summary": patch["summary"],
+    }
+    return {"book": new_bundle.get("book") or {}, "nodes": nodes, "meta": meta}
+
+
+def render_markdown(
+    patch: Dict[str, Any],
+    old_bundle: Dict[str, Any],
+    new_bundle: Dict[str, Any],
+    samples: int,
+) -> str:
+    """Audit summary in the same shape as the hand-written diffs/<book>/*.md archives."""
+    book = new_bundle.get("book") or {}
+    summary = patch["summary"]
+    lines = [
+        "# Canon Bundle Diff",
+        "",
+        f"**Book:** {book.get('title') or book.get('slug')}  ",
+        f"**Parser:** v{patch['base'].get('parserVersion')} → v{patch['target'].get('parserVersion')}  ",
+        f"**Date:** {dt.date.today().isoformat()}",
+        "",
+        "## Summary",
+        f"- Nodes touched: {len(touched_ids(patch)) + len(patch['removed'])} / {summary['targetNodes']}  ",
+        f"- Changed: {summary['changed']}  ",
+        f"- Added: {summary['added']}  ",
+        f"- Removed: {summary['removed']}  ",
+        f"- Moved: {summary['moved']}  ",
+        f"- Unchanged: {summary['unchanged']}",
+        "",
+    ]
+
+    text_changes = [c for c in patch["changed"] if c["oldTextSha256"] != c["newTextSha256"]]
+    if text_changes and samples > 0:
+        old_by_id = {n.get("canonNodeId"): n for n in old_bundle.get("nodes") or []}
+        new_by_id = {n.get("canonNodeId"): n for n in new_bundle.get("nodes") or []}
+        lines.extend(["## Sample Diff Snippets", ""])
+        for change in text_changes[:samples]:
+            node_id = change["canonNodeId"]
+            lines.append(f"### {node_id}")
+            lines.append(f"- {node_text(old_by_id[node_id])[:240]}")
+            lines.append(f"+ {node_text(new_by_id[node_id])[:240]}")
+            lines.append("")
+
+    return "\n".join(lines).rstrip() + "\n"
+
+
+def write_json(path: Path, data: Any, pretty: bool) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(data, handle, ensure_ascii=False, indent=2 if pretty else None)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Node-level diff between two Ruach canon bundles")
+    parser.add_argument("--old", required=True, help="Base canon bundle, JSON or NDJSON (previous parser run)")
+    parser.add_argument("--new", required=True, help="Target canon bundle, JSON or NDJSON (new parser run)")
+    parser.add_argument("--out", help="Write the patch JSON here (default: print summary only)")
+    parser.add_argument(
+        "--changed-out",
+        help="Write a bundle with only changed/added/moved nodes (for Strapi import / vector ingest)",
+    )
+    parser.add_argument("--markdown", help="Write an audit summary (diffs/<book>/*.md format)")
+    parser.add_argument("--samples", type=int, default=20, help="Sample text diffs in --markdown (default: 20)")
+    parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON outputs")
+    parser.add_argument(
+        "--fail-on-diff",
+        action="store_true",
+        help="Exit with status 1 when any node differs (CI guardrail).",
+    )
+    args = parser.parse_args(argv)
+
+    old_path = Path(args.old).expanduser().resolve()
+    new_path = Path(args.new).expanduser().resolve()
+    for path in (old_path, new_path):
+        if not path.exists():
+            print(f"ERROR: Bundle not found: {path}", file=sys.stderr)
+            return 2
+
+    old_bundle = load_bundle(old_path)
+    new_bundle = load_bundle(new_path)
+    patch = diff_bundles(old_bundle, new_bundle)
+    summary = patch["summary"]
+
+    if args.out:
+        write_json(Path(args.out).expanduser().resolve(), patch, args.pretty)
+    if args.changed_out:
+        changed_bundle = build_changed_bundle(new_bundle, patch)
+        write_json(Path(args.changed_out).expanduser().resolve(), changed_bundle, args.pretty)
+        print(f"✅ Wrote {len(changed_bundle['nodes'])} touched nodes → {args.changed_out}")
+    if args.markdown:
+        md_path = Path(args.markdown).expanduser().resolve()
+        md_path.parent.mkdir(parents=True, exist_ok=True)
+        md_path.write_text(render_markdown(patch, old_bundle, new_bundle, args.samples), encoding="utf-8")
+
+    print(
+        f"Diff: changed={summary['changed']} added={summary['added']} removed={summary['removed']} "
+        f"moved={summary['moved']} unchanged={summary['unchanged']}"
+    )
+
+    has_diff = any(summary[k] for k in ("changed", "added", "removed", "moved"))
+    return 1 if (args.fail_on_diff and has_diff) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -8,17 +8,33 @@
  *   OPENAI_API_KEY=sk-... tsx scripts/canon-parser/ingest-vectors-to-db.ts \
  *     --input scripts/canon-parser/out/ministry-of-healing.vectors.json \
  *     [--batch-size 50] \
+ *     [--store out/ministry-of-healing.embeddings] [--reembed] \
  *     [--dry-run]
  *
+ * Embeddings are kept in the shared embedding store (unified-extraction/embedding-store.ts,
+ * default: <input without .vectors.json>.embeddings.{npy,index.json}), keyed by a hash of the
+ * embedded text (chunk.context); chunks whose context is already in the store are not sent
+ * to OpenAI again, and a chunk whose context changed gets a fresh vector.
+ *
  * Environment:
  *   OPENAI_API_KEY - OpenAI API key (required)
  *   DATABASE_* - Database connection variables (uses .env)
  */
 
 import fs from "node:fs/promises";
+import { createHash } from "node:crypto";
 import pkg from "pg";
+import {
+  appendEmbeddings,
+  openEmbeddingStore,
+  storePaths,
+  toPgVector,
+} from "../unified-extraction/embedding-store";
 const { Pool } = pkg;
 
+const EMBEDDING_MODEL = "text-embedding-3-small";
+const EMBEDDING_DIMENSIONS = 1536;
+
 type OpenAIEmbeddingResponse = {
   data: Array<{ embedding?: number[] }>;
 };
@@ -33,8 +49,8 @@ async function createEmbedding(text: string, apiKey: string): Promise<number[]>
     },
     body: JSON.stringify({
       input: text,
-      model: "text-embedding-3-small",
-      dimensions: 1536,
+      model: EMBEDDING_MODEL,
+      dimensions: EMBEDDING_DIMENSIONS,
     }),
   });
 
@@ -72,9 +88,16 @@ type VectorChunk = {
   };
 };
 
+/** Store id of a chunk's embedding (identical context → identical vector), as library-parser's chunk_embedding_key */
+function embeddingKey(chunk: VectorChunk): string {
+  return createHash("sha256").update(chunk.context, "utf8").digest("hex").slice(0, 16);
+}
+
 type Options = {
   input: string;
   batchSize: number;
+  store: string;
+  reembed: boolean;
   dryRun: boolean;
 };
 
@@ -83,6 +106,8 @@ function parseArgs(): Options {
   const options: Options = {
     input: "",
     batchSize: 50,
+    store: "",
+    reembed: false,
     dryRun: false,
   };
 
@@ -99,6 +124,12 @@ function parseArgs(): Options {
           throw new Error("--batch-size must be a positive number.");
         }
         break;
+      case "--store":
+        options.store = args[++i] ?? "";
+        break;
+      case "--reembed":
+        options.reembed = true;
+        break;
       case "--dry-run":
         options.dryRun = true;
         break;
@@ -114,6 +145,9 @@ function parseArgs(): Options {
   if (!options.input) {
     throw new Error("--input is required.");
   }
+  if (!options.store) {
+    options.store = options.input.replace(/(\.vectors)?\.json$/, "") + ".embeddings";
+  }
 
   return options;
 }
@@ -124,11 +158,14 @@ Usage:
   tsx scripts/canon-parser/ingest-vectors-to-db.ts \\
     --input <vectors.json> \\
     [--batch-size 50] \\
+    [--store <base>] [--reembed] \\
     [--dry-run]
 
 Options:
   --input, -i      Path to vectors JSON file (required)
   --batch-size     Number of chunks to process in parallel (default: 50)
+  --store          Embedding store base path (default: <input>.embeddings)
+  --reembed        Rebuild the store, calling OpenAI for every chunk
   --dry-run        Preview without inserting to database
 
 Environment:
@@ -162,11 +199,27 @@ async function main(): Promise<void> {
   const chunks: VectorChunk[] = JSON.parse(fileContent);
   console.log(`✅ Loaded ${chunks.length} chunks`);
 
+  // Embeddings from earlier runs (context unchanged → same vector); --reembed rebuilds the store
+  if (options.reembed && !options.dryRun) {
+    const paths = storePaths(options.store);
+    await Promise.all([fs.rm(paths.npy, { force: true }), fs.rm(paths.index, { force: true })]);
+  }
+  let store = options.reembed ? null : await openEmbeddingStore(options.store);
+  if (store && (store.index.model !== EMBEDDING_MODEL || store.index.dimensions !== EMBEDDING_DIMENSIONS)) {
+    throw new Error(
+      `${options.store} holds ${store.index.model} [${store.index.dimensions}] embeddings; use --reembed or another --store`
+    );
+  }
+  const keys = chunks.map(embeddingKey);
+  const cached = keys.filter((key) => store?.rows.has(key)).length;
+  const missing = new Set(keys.filter((key) => !store?.rows.has(key))).size;
+  console.log(`🧮 Embedding store ${options.store}: ${cached} chunks cached, ${missing} distinct contexts to embed`);
+
   if (options.dryRun) {
     console.log("\n🔍 DRY RUN MODE - No database operations will be performed\n");
     console.log(`Would process ${chunks.length} chunks in batches of ${options.batchSize}`);
-    console.log(`Estimated OpenAI API calls: ${chunks.length}`);
-    console.log(`Estimated cost: ~$${(chunks.length * 0.00002).toFixed(4)} (text-embedding-3-small)`);
+    console.log(`Estimated OpenAI API calls: ${missing}`);
+    console.log(`Estimated cost: ~$${(missing * 0.00002).toFixed(4)} (${EMBEDDING_MODEL})`);
     return;
   }
 
@@ -197,6 +250,18 @@ async function main(): Promise<void> {
   let inserted = 0;
   let updated = 0;
   let errors = 0;
+  let embedded = 0;
+  // Rows written with a vector read from the store (not counted: failed rows, API vectors)
+  let fromStore = 0;
+  // Keys appended during this run; a later chunk with the same context reloads the store once
+  const appended = new Set<string>();
+  const pendingByKey = new Map<string, Promise<number[]>>();
+  const cachedVector = async (key: string): Promise<ArrayLike<number> | undefined> => {
+    const cached = store?.vector(key);
+    if (cached || !appended.has(key)) return cached;
+    store = await openEmbeddingStore(options.store);
+    return store?.vector(key);
+  };
 
   // Process in batches
   for (let i = 0; i < chunks.length; i += options.batchSize) {
@@ -205,13 +270,30 @@ async function main(): Promise<void> {
     const totalBatches = Math.ceil(chunks.length / options.batchSize);
 
     console.log(`📦 Batch ${batchNum}/${totalBatches} (${batch.length} chunks)...`);
+    const fresh: Array<[string, number[]]> = [];
 
     // Process batch in parallel
     const results = await Promise.allSettled(
       batch.map(async (chunk) => {
         try {
-          // Generate embedding
-          const embedding = await createEmbedding(chunk.context, OPENAI_API_KEY);
+          // Stored embedding, or generate (and queue for the store) once per distinct context
+          const key = embeddingKey(chunk);
+          let embedding = await cachedVector(key);
+          const storeHit = embedding !== undefined;
+          if (!embedding) {
+            let pending = pendingByKey.get(key);
+            if (!pending) {
+              pending = createEmbedding(chunk.context, OPENAI_API_KEY);
+              pendingByKey.set(key, pending);
+              try {
+                fresh.push([key, await pending]);
+              } catch (error) {
+                pendingByKey.delete(key);
+                throw error;
+              }
+            }
+            embedding = await pending;
+          }
 
           // Check if exists
           const existing = await pool.query(
@@ -233,17 +315,17 @@ async function main(): Promise<void> {
               `UPDATE content_embeddings
                SET text_content = $1, embedding = $2::vector, metadata = $3::jsonb, updated_at = NOW()
                WHERE content_type = 'canon' AND content_id = $4`,
-              [chunk.text, `[${embedding.join(",")}]`, JSON.stringify(metadata), chunk.id]
+              [chunk.text, toPgVector(embedding), JSON.stringify(metadata), chunk.id]
             );
-            return { action: "updated", id: chunk.id };
+            return { action: "updated", id: chunk.id, storeHit };
           } else {
             // Insert new
             await pool.query(
               `INSERT INTO content_embeddings (content_type, content_id, text_content, embedding, metadata, created_at, updated_at)
                VALUES ($1, $2, $3, $4::vector, $5::jsonb, NOW(), NOW())`,
-              ["canon", chunk.id, chunk.text, `[${embedding.join(",")}]`, JSON.stringify(metadata)]
+              ["canon", chunk.id, chunk.text, toPgVector(embedding), JSON.stringify(metadata)]
             );
-            return { action: "inserted", id: chunk.id };
+            return { action: "inserted", id: chunk.id, storeHit };
           }
         } catch (error) {
           console.error(`   ❌ Failed: ${chunk.id}`);
@@ -257,6 +339,7 @@ async function main(): Promise<void> {
     for (const result of results) {
       processed += 1;
       if (result.status === "fulfilled") {
+        if (result.value.storeHit) fromStore += 1;
         if (result.value.action === "inserted") {
           inserted += 1;
         } else {
@@ -267,6 +350,12 @@ async function main(): Promise<void> {
       }
     }
 
+    // Persist new embeddings per batch, so an interrupted run keeps what it paid for
+    await appendEmbeddings(options.store, EMBEDDING_MODEL, EMBEDDING_DIMENSIONS, fresh);
+    embedded += fresh.length;
+    for (const [key] of fresh) appended.add(key);
+    pendingByKey.clear();
+
     console.log(`   ✓ Processed: ${processed}/${chunks.length} (inserted: ${inserted}, updated: ${updated}, errors: ${errors})`);
 
     // Rate limiting pause (OpenAI has 3000 RPM limit on tier 1)
@@ -276,12 +365,13 @@ async function main(): Promise<void> {
   }
 
   const duration = ((Date.now() - startTime) / 1000).toFixed(1);
-  const cost = (chunks.length * 0.00002).toFixed(4);
+  const cost = (embedded * 0.00002).toFixed(4);
 
   console.log(`\n✅ Vector ingestion complete in ${duration}s`);
   console.log(`   Inserted: ${inserted}`);
   console.log(`   Updated: ${updated}`);
   console.log(`   Errors: ${errors}`);
+  console.log(`   Embedded: ${embedded} new vectors; ${fromStore} rows written from ${options.store}`);
   console.log(`   Estimated cost: $${cost}`);
 
   // Verify
@@ -18,11 +18,27 @@ import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Literal, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Sequence, Tuple
+
+# Shared word → line assembly lives alongside the unified extractors.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "unified-extraction"))
+from line_assembly import assemble_page_lines  # noqa: E402
 
 
 ParserFormat = Literal["auto", "pdf", "md", "markdown", "docx", "epub"]
-PARSER_VERSION = "1.0.2"
+BlockKind = Literal["toc", "chapter", "heading", "paragraph"]
+PARSER_VERSION = "1.0.3"
+
+# Structural patterns are compiled once; classification runs on every block of every book.
+PAGE_MARKER_PREFIX_RE = re.compile(r"^\[\d{1,4}\]\s*")
+CHAPTER_HEADING_RE = re.compile(r"^chapter\s+(\d+)\b", re.IGNORECASE)
+TRAILING_PAGE_NUMBER_RE = re.compile(r"\s\d{1,4}$")
+DOTTED_LEADER_RE = re.compile(r"(?:\.\s){10,}")
+TOC_PAGE_MARKER_RE = re.compile(r"(\b\d{1,4}\b|\b[ivxlcdm]{1,8}\b)\s*$")
+SENTENCE_END_RE = re.compile(r"[.!?]$")
+VERSE_PREFIX_RE = re.compile(r"^\d+:\d+\b")
+VERSE_REF_RE = re.compile(r"\d+:\d+")
+PAGE_NUMBER_ONLY_RE = re.compile(r"\d{1,4}")
 
 
 @dataclass(frozen=True)
@@ -30,6 +46,8 @@ class RawBlock:
     text: str
     page: Optional[int] = None
     style: Optional[Dict[str, Any]] = None
+    # Structural tag cached by iter_classified_blocks(); None until classified (or for empty blocks).
+    kind: Optional[BlockKind] = None
 
 
 @dataclass(frozen=True)
@@ -55,6 +73,73 @@ def read_file_bytes(path: Path) -> bytes:
         return handle.read()
 
 
+def sha256_file(path: Path, chunk_size: int = 1 << 20) -> str:
+    # Streaming hash so large PDFs are never held in memory just to fingerprint them.
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def compute_determinism_key(
+    slug: str,
+    fmt: str,
+    max_chars: int,
+    max_tokens: int,
+    include_toc: bool,
+    source_hash: str,
+    title: str,
+    author: str,
+    output: Literal["json", "ndjson"],
+) -> str:
+    # Everything that ends up in the bundle: nodes embed source{title, author}, and the
+    # output format decides the file layout.
+    fields = [PARSER_VERSION, slug, fmt, max_chars, max_tokens, include_toc, source_hash, title, author, output]
+    return sha256_hex(json.dumps(fields, ensure_ascii=False).encode("utf-8"))[:24]
+
+
+META_READ_LIMIT = 1 << 16  # bundle meta sits at the head of the file; never read further
+BUNDLE_META_PREFIX_RE = re.compile(r'\s*\{\s*"meta"\s*:\s*')
+NDJSON_HEADER_PREFIX_RE = re.compile(r'\s*\{\s*"kind"\s*:\s*"canon-bundle-header"')
+
+
+def read_bundle_meta(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Bundle meta from the head of the file only: the NDJSON header line, or the leading
+    "meta" member of a JSON bundle. None if missing/unreadable (or an older meta-last bundle).
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            head = handle.read(META_READ_LIMIT)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    match = BUNDLE_META_PREFIX_RE.match(head)
+    try:
+        if match:
+            meta, _ = json.JSONDecoder().raw_decode(head, match.end())
+        else:
+            first, newline, _ = head.partition("\n")
+            record = json.loads(first) if newline else None
+            if not isinstance(record, dict) or record.get("kind") != NDJSON_HEADER_KIND:
+                return None
+            meta = record.get("meta")
+    except ValueError:
+        return None
+    return meta if isinstance(meta, dict) else None
+
+
+def read_existing_determinism_key(out_path: Path) -> Optional[str]:
+    """
+    Return meta.determinismKey of a previously written bundle, or None if it is missing/unreadable.
+    """
+    if not out_path.exists():
+        return None
+    key = (read_bundle_meta(out_path) or {}).get("determinismKey")
+    return key if isinstance(key, str) else None
+
+
 def slugify(value: str) -> str:
     value = value.strip().lower()
     value = re.sub(r"[^a-z0-9]+", "-", value)
@@ -177,24 +262,64 @@ def normalize_pdf_text(text: str) -> str:
     return text
 
 
+def strip_page_marker(text: str) -> str:
+    return PAGE_MARKER_PREFIX_RE.sub("", text, count=1)
+
+
 def is_chapter_heading(text: str) -> bool:
     t = text.strip()
     if not t:
         return False
     # Only treat explicit chapter headings as chapters.
     # This avoids false positives like citation fragments (e.g. "A.R.V.; 4:7.").
-    t = re.sub(r"^\[\d{1,4}\]\s*", "", t)
-    return bool(re.match(r"^chapter\s+\d+\b", t, re.IGNORECASE))
+    return bool(CHAPTER_HEADING_RE.match(strip_page_marker(t)))
 
 
-def classify_block(block: RawBlock) -> StructuralItem:
-    t = block.text.strip()
-    if is_chapter_heading(t):
-        return StructuralItem(kind="chapter", text=t, page=block.page)
+def structural_kind(text: str, is_chapter: bool) -> BlockKind:
+    if is_chapter:
+        return "chapter"
     # Heuristic heading: short, not ending in punctuation, and not a verse-like line.
-    if len(t) < 60 and not re.search(r"[.!?]$", t) and not re.match(r"^\d+:\d+\b", t):
-        return StructuralItem(kind="heading", text=t, page=block.page)
-    return StructuralItem(kind="paragraph", text=t, page=block.page)
+    if len(text) < 60 and not SENTENCE_END_RE.search(text) and not VERSE_PREFIX_RE.match(text):
+        return "heading"
+    return "paragraph"
+
+
+def classify_text(text: str) -> Optional[BlockKind]:
+    """
+    One-pass structural tag for a block: toc / chapter / heading / paragraph (None if empty).
+
+    Equivalent to looks_like_toc_line() followed by structural_kind(), but the page
+    marker and chapter patterns are evaluated once per block instead of once per predicate.
+    """
+    t = text.strip()
+    if not t:
+        return None
+
+    marker = PAGE_MARKER_PREFIX_RE.match(t)
+    chapter_match = CHAPTER_HEADING_RE.match(t[marker.end():] if marker else t)
+
+    # TOC chapter entries without dotted leaders (see looks_like_toc_line).
+    if chapter_match and not marker and TRAILING_PAGE_NUMBER_RE.search(t):
+        return "toc"
+    if DOTTED_LEADER_RE.search(t) and TOC_PAGE_MARKER_RE.search(t.lower()):
+        return "toc"
+
+    return structural_kind(t, chapter_match is not None)
+
+
+def iter_classified_blocks(blocks: Iterable[RawBlock]) -> Iterator[RawBlock]:
+    """
+    Tag every block exactly once. Blocks that already carry a kind are passed through untouched,
+    so structure building and any later filtering share the same tags.
+    """
+    for b in blocks:
+        if b.kind is None:
+            kind = classify_text(b.text or "")
+            if kind is not None:
+                # Direct construction; dataclasses.replace() is several times slower per block.
+                b = RawBlock(text=b.text, page=b.page, style=b.style, kind=kind)
+        yield b
+
 
 def looks_like_toc_line(text: str) -> bool:
     """
@@ -213,106 +338,111 @@ def looks_like_toc_line(text: str) -> bool:
     # "Chapter 39—The Knowledge Received Through God’s Word 322"
     # Treat these as TOC if they end with a page number and are not the in-body heading
     # (in-body headings in this PDF are prefixed by bracketed page markers like "[458]").
-    if re.match(r"^chapter\s+\d+\b", t, re.IGNORECASE) and re.search(r"\s\d{1,4}$", t):
-        if not re.match(r"^\[\d{1,4}\]\s*", t):
+    if CHAPTER_HEADING_RE.match(t) and TRAILING_PAGE_NUMBER_RE.search(t):
+        if not PAGE_MARKER_PREFIX_RE.match(t):
             return True
 
     # Spaced dotted leaders (". . . . .") typically used in TOCs.
     # Require a *contiguous* dotted leader run to avoid false positives on normal prose periods.
-    if not re.search(r"(?:\.\s){10,}", t):
+    if not DOTTED_LEADER_RE.search(t):
         return False
 
     # TOC lines often end with a page marker (roman numerals or digits).
-    if not re.search(r"(\b\d{1,4}\b|\b[ivxlcdm]{1,8}\b)\s*$", t.lower()):
+    if not TOC_PAGE_MARKER_RE.search(t.lower()):
         return False
 
     return True
 
 
-def build_structure(blocks: Sequence[RawBlock]) -> List[Chapter]:
-    # Drop TOC-style navigation before structural detection to prevent chapter drift.
-    prefiltered: List[RawBlock] = []
-    for b in blocks:
-        if not b.text or not b.text.strip():
-            continue
-        if looks_like_toc_line(b.text):
-            continue
-        prefiltered.append(b)
-
-    items = [classify_block(b) for b in prefiltered]
-
-    chapters: List[Chapter] = []
-    current: Optional[Chapter] = None
+def iter_chapters(blocks: Iterable[RawBlock]) -> Iterator[Chapter]:
+    """
+    Build chapters from a block stream, yielding each one as soon as the next heading closes it,
+    so only the current chapter's items are held in memory.
+    """
+    # The open chapter: (index, title) plus its items; None until the first item arrives.
+    current: Optional[Tuple[int, str]] = None
+    items: List[StructuralItem] = []
 
     # Chapter indices are assigned from the detected chapter headings (1..N).
     # Any content before the first heading goes into a deterministic "Front Matter" chapter at index 0.
     chapter_index = 0
 
-    def ensure_default_chapter() -> Chapter:
-        nonlocal current, chapter_index
-        if current is None:
-            # If we have no chapter markers yet, create a deterministic default chapter.
-            current = Chapter(index=0, title="Front Matter", items=[])
-            chapters.append(current)
-        return current
+    # Some PDFs split the chapter title across lines; right after a chapter heading we look at the
+    # following headings on the same page for a continuation (e.g., "Chapter 39—... Through" +
+    # "God’s Word"). Blank/page-number headings seen meanwhile are held back: dropped if a
+    # continuation is stitched, otherwise kept as ordinary chapter items.
+    stitch_page: Optional[int] = None
+    stitching = False
+    held: List[StructuralItem] = []
+
+    for b in iter_classified_blocks(blocks):
+        # TOC-style navigation is dropped here to prevent chapter drift.
+        if b.kind is None or b.kind == "toc":
+            continue
+        item = StructuralItem(kind=b.kind, text=b.text.strip(), page=b.page)
+
+        if stitching:
+            if item.kind == "heading" and item.page == stitch_page:
+                continuation = strip_page_marker(item.text).strip()
+                if not continuation or PAGE_NUMBER_ONLY_RE.fullmatch(continuation):
+                    held.append(item)
+                    continue
+                if len(continuation) <= 60 and not VERSE_REF_RE.search(continuation):
+                    assert current is not None
+                    current = (current[0], f"{current[1]} {continuation}".strip())
+                    stitching = False
+                    held.clear()
+                    continue
+            stitching = False
+            items.extend(held)
+            held.clear()
 
-    i = 0
-    while i < len(items):
-        item = items[i]
         if item.kind == "chapter":
-            cleaned_title = re.sub(r"^\[\d{1,4}\]\s*", "", item.text.strip())
-            match = re.match(r"^chapter\s+(\d+)\b", cleaned_title, re.IGNORECASE)
+            cleaned_title = strip_page_marker(item.text)
+            match = CHAPTER_HEADING_RE.match(cleaned_title)
             if match:
                 chapter_index = int(match.group(1))
             else:
                 chapter_index += 1
 
-            # Some PDFs split the chapter title across lines; stitch the next short heading line
-            # if it looks like a continuation (e.g., "Chapter 39—... Through" + "God’s Word").
-            stitched_title = cleaned_title
-            j = i + 1
-            while j < len(items):
-                next_item = items[j]
-                if next_item.kind != "heading" or (next_item.page != item.page):
-                    break
-
-                continuation = re.sub(r"^\[\d{1,4}\]\s*", "", next_item.text.strip()).strip()
-                if not continuation or re.fullmatch(r"\d{1,4}", continuation):
-                    j += 1
-                    continue
-                if len(continuation) > 60 or re.search(r"\d+:\d+", continuation):
-                    break
+            if current is not None:
+                yield Chapter(index=current[0], title=current[1], items=items)
+            current, items = (chapter_index, cleaned_title), []
+            stitching, stitch_page = True, item.page
+            continue
 
-                stitched_title = f"{stitched_title} {continuation}".strip()
-                i = j  # consume up to this heading line
-                break
+        if current is None:
+            # If we have no chapter markers yet, create a deterministic default chapter.
+            current = (0, "Front Matter")
+        items.append(item)
 
-            current = Chapter(index=chapter_index, title=stitched_title, items=[])
-            chapters.append(current)
-            i += 1
-            continue
+    items.extend(held)
+    if current is None:
+        yield Chapter(index=1, title="Chapter 1", items=[])
+    else:
+        yield Chapter(index=current[0], title=current[1], items=items)
 
-        ensure_default_chapter().items.append(item)
-        i += 1
 
-    if not chapters:
-        chapters.append(Chapter(index=1, title="Chapter 1", items=[]))
-    return chapters
+def build_structure(blocks: Iterable[RawBlock]) -> List[Chapter]:
+    return list(iter_chapters(blocks))
 
 
 class FileAdapter:
-    def extract(self, file_path: Path) -> List[RawBlock]:
+    def extract(self, file_path: Path) -> Iterator[RawBlock]:
+        """Yield blocks in document order; callers that need a list wrap this in list()."""
         raise NotImplementedError
 
 
+PDF_LINE_TOLERANCE = 2.0  # points between baselines still considered the same line
+
+
 class PdfAdapter(FileAdapter):
-    def extract(self, file_path: Path) -> List[RawBlock]:
+    def extract(self, file_path: Path) -> Iterator[RawBlock]:
         try:
             import pdfplumber  # type: ignore
         except ImportError as exc:
             raise RuntimeError("Missing dependency: pdfplumber (pip install pdfplumber)") from exc
 
-        blocks: List[RawBlock] = []
         with pdfplumber.open(str(file_path)) as pdf:
             for page_num, page in enumerate(pdf.pages, 1):
                 # Prefer word-based reconstruction; this preserves spaces more reliably than
@@ -324,63 +454,55 @@ class PdfAdapter(FileAdapter):
                     words = page.extract_words()
 
                 if words:
-                    lines: Dict[float, List[Dict[str, Any]]] = {}
-                    for w in words:
-                        top = round(float(w.get("top", 0.0)), 1)
-                        lines.setdefault(top, []).append(w)
-
-                    for top in sorted(lines.keys()):
-                        line_words = sorted(lines[top], key=lambda x: float(x.get("x0", 0.0)))
-                        line = " ".join([str(w.get("text", "")).strip() for w in line_words]).strip()
+                    # Sorted baseline sweep: words whose tops differ slightly (superscripts,
+                    # italics) stay on one line instead of splitting into separate blocks.
+                    for line in assemble_page_lines(words, page=page_num, tolerance=PDF_LINE_TOLERANCE):
+                        if line.text:
+                            yield RawBlock(text=line.text, page=page_num)
+                else:
+                    # Fallback: line-based extraction.
+                    text = page.extract_text() or ""
+                    for line in text.split("\n"):
+                        line = line.strip()
                         if line:
-                            blocks.append(RawBlock(text=line, page=page_num))
-                    continue
-
-                # Fallback: line-based extraction.
-                text = page.extract_text() or ""
-                for line in text.split("\n"):
-                    line = line.strip()
-                    if line:
-                        blocks.append(RawBlock(text=line, page=page_num))
-        return blocks
+                            yield RawBlock(text=line, page=page_num)
+                # Drop the page's parsed layout objects; pdfplumber otherwise keeps every page cached.
+                page.flush_cache()
 
 
 class MarkdownAdapter(FileAdapter):
-    def extract(self, file_path: Path) -> List[RawBlock]:
-        content = file_path.read_text(encoding="utf-8", errors="replace")
-        blocks: List[RawBlock] = []
-        for line in content.splitlines():
-            line = line.rstrip()
-            if not line.strip():
-                continue
-            # Preserve markdown headings as their own blocks.
-            if re.match(r"^#{1,6}\s+", line):
-                blocks.append(RawBlock(text=line.strip(), page=None, style={"mdHeading": True}))
-            else:
-                blocks.append(RawBlock(text=line.strip(), page=None))
-        return blocks
+    def extract(self, file_path: Path) -> Iterator[RawBlock]:
+        with open(file_path, "r", encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                line = line.rstrip()
+                if not line.strip():
+                    continue
+                # Preserve markdown headings as their own blocks.
+                if re.match(r"^#{1,6}\s+", line):
+                    yield RawBlock(text=line.strip(), page=None, style={"mdHeading": True})
+                else:
+                    yield RawBlock(text=line.strip(), page=None)
 
 
 class DocxAdapter(FileAdapter):
-    def extract(self, file_path: Path) -> List[RawBlock]:
+    def extract(self, file_path: Path) -> Iterator[RawBlock]:
         try:
             import docx  # type: ignore
         except ImportError as exc:
             raise RuntimeError("Missing dependency: python-docx (pip install python-docx)") from exc
 
         doc = docx.Document(str(file_path))
-        blocks: List[RawBlock] = []
         for para in doc.paragraphs:
             text = (para.text or "").strip()
             if not text:
                 continue
-            blocks.append(RawBlock(text=text, page=None))
-        return blocks
+            yield RawBlock(text=text, page=None)
 
 
 class EpubAdapter(FileAdapter):
-    def extract(self, file_path: Path) -> List[RawBlock]:
+    def extract(self, file_path: Path) -> Iterator[RawBlock]:
         try:
+            import ebooklib  # type: ignore
             from ebooklib import epub  # type: ignore
         except ImportError as exc:
             raise RuntimeError("Missing dependency: ebooklib (pip install ebooklib)") from exc
@@ -391,11 +513,10 @@ class EpubAdapter(FileAdapter):
             raise RuntimeError("Missing dependency: beautifulsoup4 (pip install beautifulsoup4)") from exc
 
         book = epub.read_epub(str(file_path))
-        blocks: List[RawBlock] = []
 
         for item in book.get_items():
             # Only parse XHTML/HTML documents.
-            if item.get_type() != epub.ITEM_DOCUMENT:
+            if item.get_type() != ebooklib.ITEM_DOCUMENT:
                 continue
             soup = BeautifulSoup(item.get_content(), "html.parser")
             text = soup.get_text("\n")
@@ -403,9 +524,7 @@ class EpubAdapter(FileAdapter):
                 line = line.strip()
                 if not line:
                     continue
-                blocks.append(RawBlock(text=line))
-
-        return blocks
+                yield RawBlock(text=line)
 
 
 def select_adapter(fmt: ParserFormat) -> FileAdapter:
@@ -433,24 +552,33 @@ def detect_format(path: Path) -> ParserFormat:
     return "auto"
 
 
-def validate_nodes(nodes: Sequence[Dict[str, Any]], max_tokens: int) -> None:
+NDJSON_HEADER_KIND = "canon-bundle-header"
+NDJSON_TRAILER_KIND = "canon-bundle-trailer"
+DEFAULT_AUTHORITY: Dict[str, Any] = {"tier": 2, "weight": 0.7}
+
+
+def check_node(node: Dict[str, Any], seen: set, max_tokens: int) -> None:
+    node_id = node.get("canonNodeId")
+    if not node_id:
+        raise ValueError("Node missing canonNodeId")
+    if node_id in seen:
+        raise ValueError(f"Duplicate canonNodeId: {node_id}")
+    seen.add(node_id)
+
+    text = ((node.get("content") or {}).get("text") or "").strip()
+    if not text:
+        raise ValueError(f"Empty node content for {node_id}")
+    if approx_token_count(text) > max_tokens:
+        raise ValueError(f"Node exceeds token limit ({max_tokens}): {node_id}")
+
+
+def validate_nodes(nodes: Iterable[Dict[str, Any]], max_tokens: int) -> None:
     seen: set[str] = set()
     for node in nodes:
-        node_id = node.get("canonNodeId")
-        if not node_id:
-            raise ValueError("Node missing canonNodeId")
-        if node_id in seen:
-            raise ValueError(f"Duplicate canonNodeId: {node_id}")
-        seen.add(node_id)
+        check_node(node, seen, max_tokens)
 
-        text = ((node.get("content") or {}).get("text") or "").strip()
-        if not text:
-            raise ValueError(f"Empty node content for {node_id}")
-        if approx_token_count(text) > max_tokens:
-            raise ValueError(f"Node exceeds token limit ({max_tokens}): {node_id}")
 
-
-def parse_to_bundle(
+def iter_canon_nodes(
     input_path: Path,
     fmt: ParserFormat,
     title: str,
@@ -458,17 +586,34 @@ def parse_to_bundle(
     slug: str,
     max_chars: int,
     max_tokens: int,
-    include_toc: bool,
-) -> Dict[str, Any]:
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield validated canon nodes in document order (chapter by chapter).
+    Blocks and chapters are streamed, so memory is bounded by the largest chapter, and
+    validation runs per node, so a bad node aborts the stream at the point it is produced.
+    """
     adapter = select_adapter(fmt)
-    blocks = adapter.extract(input_path)
-    chapters = build_structure(blocks)
+    chapters = iter_chapters(adapter.extract(input_path))
 
-    nodes: List[Dict[str, Any]] = []
+    seen: set[str] = set()
+    for node in iter_chapter_nodes(chapters, fmt, title, author, slug, max_chars):
+        check_node(node, seen, max_tokens)
+        yield node
+
+
+def iter_chapter_nodes(
+    chapters: Iterable[Chapter],
+    fmt: ParserFormat,
+    title: str,
+    author: str,
+    slug: str,
+    max_chars: int,
+) -> Iterator[Dict[str, Any]]:
+    """Segment built chapters into (unvalidated) canon nodes, in document order."""
     for chapter in chapters:
+        # TOC-tagged blocks never reach chapter.items (iter_chapters drops them), so the
+        # paragraph filter no longer needs to re-run looks_like_toc_line.
         paragraphs = [i for i in chapter.items if i.kind == "paragraph"]
-        if not include_toc:
-            paragraphs = [p for p in paragraphs if not looks_like_toc_line(p.text)]
         if fmt == "pdf":
             normalized: List[StructuralItem] = []
             for p in paragraphs:
@@ -504,45 +649,193 @@ def parse_to_bundle(
                     "scriptureRefs": [],
                     "axioms": [],
                 },
-                "authority": {
-                    "tier": 2,
-                    "weight": 0.7,
-                },
+                "authority": dict(DEFAULT_AUTHORITY),
             }
-            nodes.append(node)
+            yield node
 
-    validate_nodes(nodes, max_tokens=max_tokens)
 
-    source_bytes = read_file_bytes(input_path)
-    source_hash = sha256_hex(source_bytes)
+def bundle_book(input_path: Path, title: str, author: str, slug: str, source_hash: str) -> Dict[str, Any]:
+    return {
+        "slug": slug,
+        "title": title,
+        "author": author,
+        "sourceFile": str(input_path),
+        "sourceSha256": source_hash,
+    }
 
-    determinism_key = sha256_hex(
-        f"{PARSER_VERSION}:{slug}:{fmt}:{max_chars}:{max_tokens}:{include_toc}:{source_hash}".encode(
-            "utf-8"
-        )
-    )[:24]
 
+def bundle_meta(
+    fmt: ParserFormat,
+    max_chars: int,
+    max_tokens: int,
+    include_toc: bool,
+    determinism_key: str,
+) -> Dict[str, Any]:
+    return {
+        "parserVersion": PARSER_VERSION,
+        "format": fmt,
+        "maxChars": max_chars,
+        "maxTokens": max_tokens,
+        "includeToc": include_toc,
+        "createdAt": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "determinismKey": determinism_key,
+    }
+
+
+def parse_to_bundle(
+    input_path: Path,
+    fmt: ParserFormat,
+    title: str,
+    author: str,
+    slug: str,
+    max_chars: int,
+    max_tokens: int,
+    include_toc: bool,
+    source_hash: Optional[str] = None,
+) -> Dict[str, Any]:
+    # Hash first (streaming) so callers can reuse it for the skip-if-unchanged check.
+    if source_hash is None:
+        source_hash = sha256_file(input_path)
+    determinism_key = compute_determinism_key(
+        slug, fmt, max_chars, max_tokens, include_toc, source_hash, title, author, "json"
+    )
+
+    nodes = list(iter_canon_nodes(input_path, fmt, title, author, slug, max_chars, max_tokens))
+
+    # meta first, so the skip-if-unchanged check reads only the head of the file
     return {
-        "book": {
-            "slug": slug,
-            "title": title,
-            "author": author,
-            "sourceFile": str(input_path),
-            "sourceSha256": source_hash,
-        },
+        "meta": bundle_meta(fmt, max_chars, max_tokens, include_toc, determinism_key),
+        "book": bundle_book(input_path, title, author, slug, source_hash),
         "nodes": nodes,
-        "meta": {
-            "parserVersion": PARSER_VERSION,
-            "format": fmt,
-            "maxChars": max_chars,
-            "maxTokens": max_tokens,
-            "includeToc": include_toc,
-            "createdAt": dt.datetime.now(dt.timezone.utc).isoformat(),
-            "determinismKey": determinism_key,
-        },
     }
 
 
+def compact_node(node: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    NDJSON node form: `source` becomes `sourceSlug` (resolved via the header's `sources`),
+    and `authority` is dropped when it equals the header default.
+    """
+    compact: Dict[str, Any] = {}
+    for key, value in node.items():
+        if key == "source":
+            compact["sourceSlug"] = (value or {}).get("slug")
+        elif key == "authority" and value == DEFAULT_AUTHORITY:
+            continue
+        else:
+            compact[key] = value
+    return compact
+
+
+def expand_node(node: Dict[str, Any], header: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of compact_node(): restore the full bundle node shape."""
+    sources = header.get("sources") or {}
+    defaults = header.get("defaults") or {}
+    expanded: Dict[str, Any] = {}
+    for key, value in node.items():
+        if key == "sourceSlug":
+            expanded["source"] = dict(sources.get(value) or {"slug": value})
+        else:
+            expanded[key] = value
+    if "authority" not in expanded:
+        expanded["authority"] = dict(defaults.get("authority") or DEFAULT_AUTHORITY)
+    return expanded
+
+
+def write_bundle_ndjson(
+    out_path: Path,
+    input_path: Path,
+    fmt: ParserFormat,
+    title: str,
+    author: str,
+    slug: str,
+    max_chars: int,
+    max_tokens: int,
+    include_toc: bool,
+    source_hash: str,
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Stream the bundle as NDJSON:
+      line 1   {"kind": "canon-bundle-header", "book", "sources", "defaults", "meta"}
+      lines 2… one compact node per line, written as produced
+      last     {"kind": "canon-bundle-trailer", "nodeCount"}  (absent → truncated file)
+
+    Written to a temp file and renamed, so a failed run never leaves a partial bundle at out_path.
+    Returns (node_count, meta).
+    """
+    determinism_key = compute_determinism_key(
+        slug, fmt, max_chars, max_tokens, include_toc, source_hash, title, author, "ndjson"
+    )
+    meta = bundle_meta(fmt, max_chars, max_tokens, include_toc, determinism_key)
+    header = {
+        "kind": NDJSON_HEADER_KIND,
+        "book": bundle_book(input_path, title, author, slug, source_hash),
+        "sources": {slug: {"slug": slug, "title": title, "author": author}},
+        "defaults": {"authority": DEFAULT_AUTHORITY},
+        "meta": meta,
+    }
+
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    count = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(header, ensure_ascii=False) + "\n")
+            for node in iter_canon_nodes(input_path, fmt, title, author, slug, max_chars, max_tokens):
+                handle.write(json.dumps(compact_node(node), ensure_ascii=False) + "\n")
+                count += 1
+            handle.write(json.dumps({"kind": NDJSON_TRAILER_KIND, "nodeCount": count}) + "\n")
+        os.replace(tmp_path, out_path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return count, meta
+
+
+def read_ndjson_header(path: Path) -> Optional[Dict[str, Any]]:
+    """
+    Return the NDJSON header record, or None if `path` is not an NDJSON canon bundle.
+    Reads at most META_READ_LIMIT characters and only parses a line that starts like a header,
+    so probing a (single-line) compact JSON bundle never reads or decodes the whole file.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            first = handle.readline(META_READ_LIMIT)
+    except (OSError, UnicodeDecodeError):
+        return None
+    if not first.endswith("\n") or not NDJSON_HEADER_PREFIX_RE.match(first):
+        return None
+    try:
+        record = json.loads(first)
+    except ValueError:
+        return None
+    if isinstance(record, dict) and record.get("kind") == NDJSON_HEADER_KIND:
+        return record
+    return None
+
+
+def iter_ndjson_records(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield every record of an NDJSON bundle (header, compact nodes, trailer) one line at a time."""
+    with open(path, "r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def load_bundle(path: Path) -> Dict[str, Any]:
+    """Load a JSON or NDJSON canon bundle into the in-memory bundle shape (nodes fully expanded)."""
+    header = read_ndjson_header(path)
+    if header is None:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+
+    nodes: List[Dict[str, Any]] = []
+    for record in iter_ndjson_records(path):
+        if record.get("kind") in (NDJSON_HEADER_KIND, NDJSON_TRAILER_KIND):
+            continue
+        nodes.append(expand_node(record, header))
+    return {"book": header.get("book") or {}, "nodes": nodes, "meta": header.get("meta") or {}}
+
+
 def main(argv: Optional[Sequence[str]] = None) -> int:
     parser = argparse.ArgumentParser(description="Ruach Canon Parser (deterministic)")
     parser.add_argument("--input", required=True, help="Path to input file (PDF/EPUB/DOCX/MD)")
@@ -550,15 +843,25 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     parser.add_argument("--title", required=True, help="Book title")
     parser.add_argument("--author", default="", help="Book author")
     parser.add_argument("--slug", default="", help="Book slug (defaults to slugified title)")
-    parser.add_argument("--out", required=True, help="Output JSON path")
+    parser.add_argument("--out", required=True, help="Output JSON (or NDJSON with --jsonl) path")
     parser.add_argument("--max-chars", type=int, default=1200, help="Max chars per node (default: 1200)")
     parser.add_argument("--max-tokens", type=int, default=500, help="Max approx tokens per node (default: 500)")
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON")
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help="Stream nodes as NDJSON (header line + one node per line; source referenced by slug).",
+    )
     parser.add_argument(
         "--include-toc",
         action="store_true",
         help="Include table-of-contents style dotted-leader lines (default: filtered).",
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-parse even if --out already holds a bundle with the same determinismKey.",
+    )
 
     args = parser.parse_args(argv)
 
@@ -579,6 +882,33 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     out_path = Path(args.out).expanduser().resolve()
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    source_hash = sha256_file(input_path)
+    determinism_key = compute_determinism_key(
+        slug, fmt, args.max_chars, args.max_tokens, args.include_toc, source_hash,
+        args.title, args.author, "ndjson" if args.jsonl else "json",
+    )
+    if not args.force and read_existing_determinism_key(out_path) == determinism_key:
+        print(f"⏭️  Up to date (determinismKey {determinism_key}) → {out_path}")
+        print("   Use --force to re-parse.")
+        return 0
+
+    if args.jsonl:
+        count, meta = write_bundle_ndjson(
+            out_path=out_path,
+            input_path=input_path,
+            fmt=fmt,
+            title=args.title,
+            author=args.author,
+            slug=slug,
+            max_chars=args.max_chars,
+            max_tokens=args.max_tokens,
+            include_toc=args.include_toc,
+            source_hash=source_hash,
+        )
+        print(f"✅ Streamed {count} nodes → {out_path}")
+        print(f"   determinismKey: {meta['determinismKey']}")
+        return 0
+
     bundle = parse_to_bundle(
         input_path=input_path,
         fmt=fmt,
@@ -588,6 +918,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         max_chars=args.max_chars,
         max_tokens=args.max_tokens,
         include_toc=args.include_toc,
+        source_hash=source_hash,
     )
 
     with open(out_path, "w", encoding="utf-8") as handle:
@@ -8,6 +8,10 @@ Checks:
 - Token/char ceilings
 - TOC dotted-leader lines filtered (unless allowed)
 - Location schema has chapter + order
+- NDJSON bundles: header first, trailer nodeCount matches (detects truncated files)
+
+Nodes are validated one at a time: NDJSON bundles are read line by line, and JSON bundles
+are streamed with ijson when it is installed (falls back to json.load otherwise).
 """
 
 from __future__ import annotations
@@ -16,6 +20,14 @@ import argparse
 import json
 import re
 from pathlib import Path
+from typing import Any, Dict, Iterator
+
+from ruach_canon_parser import (
+    NDJSON_HEADER_KIND,
+    NDJSON_TRAILER_KIND,
+    iter_ndjson_records,
+    read_ndjson_header,
+)
 
 
 def approx_token_count(text: str) -> int:
@@ -32,9 +44,44 @@ def looks_like_toc_line(text: str) -> bool:
     return True
 
 
+def iter_json_bundle_nodes(path: Path) -> Iterator[Dict[str, Any]]:
+    try:
+        import ijson  # type: ignore
+    except ImportError:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        yield from data.get("nodes") or []
+        return
+
+    with open(path, "rb") as handle:
+        yield from ijson.items(handle, "nodes.item")
+
+
+def iter_ndjson_bundle_nodes(path: Path) -> Iterator[Dict[str, Any]]:
+    count = 0
+    trailer = None
+    for idx, record in enumerate(iter_ndjson_records(path)):
+        kind = record.get("kind")
+        if idx == 0:
+            if kind != NDJSON_HEADER_KIND:
+                raise SystemExit("FAIL: NDJSON bundle missing header line")
+            continue
+        if trailer is not None:
+            raise SystemExit("FAIL: NDJSON records found after trailer")
+        if kind == NDJSON_TRAILER_KIND:
+            trailer = record
+            continue
+        count += 1
+        yield record
+
+    if trailer is None:
+        raise SystemExit("FAIL: NDJSON bundle missing trailer (truncated file?)")
+    if trailer.get("nodeCount") != count:
+        raise SystemExit(f"FAIL: trailer nodeCount={trailer.get('nodeCount')} but read {count} nodes")
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Validate Ruach canon JSON bundle")
-    parser.add_argument("--input", required=True, help="Path to canon JSON bundle")
+    parser.add_argument("--input", required=True, help="Path to canon JSON or NDJSON bundle")
     parser.add_argument("--max-tokens", type=int, default=500)
     parser.add_argument("--max-chars", type=int, default=1500)
     parser.add_argument(
@@ -45,13 +92,17 @@ def main() -> int:
     args = parser.parse_args()
 
     path = Path(args.input).expanduser().resolve()
-    data = json.loads(path.read_text(encoding="utf-8"))
+    if read_ndjson_header(path) is not None:
+        nodes = iter_ndjson_bundle_nodes(path)
+    else:
+        nodes = iter_json_bundle_nodes(path)
 
-    nodes = data.get("nodes") or []
     seen = set()
     toc_hits = 0
+    total = 0
 
     for idx, node in enumerate(nodes):
+        total += 1
         node_id = node.get("canonNodeId")
         if not node_id:
             raise SystemExit(f"FAIL: nodes[{idx}] missing canonNodeId")
@@ -82,7 +133,7 @@ def main() -> int:
     if toc_hits and not args.allow_toc:
         raise SystemExit(f"FAIL: found {toc_hits} TOC-like nodes; re-run parser with TOC filtering")
 
-    print(f"OK: nodes={len(nodes)} unique={len(seen)} tocHits={toc_hits}")
+    print(f"OK: nodes={total} unique={len(seen)} tocHits={toc_hits}")
     return 0
 
 
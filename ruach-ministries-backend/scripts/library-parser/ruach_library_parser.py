@@ -9,6 +9,10 @@ Follows canon-parser patterns:
 - SHA256 checksums for determinism
 - JSON artifacts for debugging
 - QA metrics for quality assessment
+
+Embeddings go to the shared embedding store (unified-extraction/embedding-store.py,
+default /tmp/<version-id>.embeddings.{npy,index.json}), keyed by chunk text hash, so
+re-runs only embed new text; library_embeddings is loaded from it with binary COPY.
 """
 
 import argparse
@@ -23,6 +27,9 @@ from typing import List, Dict, Any, Optional, Literal
 from urllib.parse import urlparse
 from urllib.request import urlretrieve
 
+sys.path.insert(0, str(Path(__file__).parent.parent / "unified-extraction"))
+from embedding_store import EmbeddingStore, PgCopyStream, pg_int4, pg_text, pg_vector
+
 # Import extraction libraries
 try:
     import pdfplumber
@@ -37,6 +44,10 @@ except ImportError as e:
     sys.exit(1)
 
 
+EMBEDDING_MODEL = "text-embedding-3-large"
+EMBEDDING_DIMENSIONS = 1536  # Match pgvector schema
+
+
 # ============================================================================
 # Data Models
 # ============================================================================
@@ -283,26 +294,36 @@ def chunk_text(blocks: List[Block], max_chars: int = 1200, max_tokens: int = 500
 # Embeddings
 # ============================================================================
 
-def generate_embeddings(chunks: List[Chunk], api_key: str) -> List[List[float]]:
-    """Generate embeddings using OpenAI text-embedding-3-large"""
+def chunk_embedding_key(chunk: Chunk) -> str:
+    """Store id of a chunk's embedding (identical text → identical vector)"""
+    return hashlib.sha256(chunk.text_content.encode("utf-8")).hexdigest()[:16]
+
+
+def generate_embeddings(chunks: List[Chunk], api_key: str, store: EmbeddingStore) -> int:
+    """Embed chunks missing from the store (OpenAI text-embedding-3-large); returns the number embedded"""
     client = OpenAI(api_key=api_key)
 
-    texts = [chunk.text_content for chunk in chunks]
-    embeddings = []
+    pending: Dict[str, str] = {}
+    for chunk in chunks:
+        key = chunk_embedding_key(chunk)
+        if key not in store:
+            pending.setdefault(key, chunk.text_content)
+    keys = list(pending)
 
     # Batch process (OpenAI supports up to 2048 inputs per request)
     batch_size = 50
-    for i in range(0, len(texts), batch_size):
-        batch = texts[i:i+batch_size]
+    for i in range(0, len(keys), batch_size):
+        batch = keys[i:i+batch_size]
         response = client.embeddings.create(
-            model="text-embedding-3-large",
-            input=batch,
-            dimensions=1536  # Match pgvector schema
+            model=EMBEDDING_MODEL,
+            input=[pending[key] for key in batch],
+            dimensions=EMBEDDING_DIMENSIONS
         )
-        for item in response.data:
-            embeddings.append(item.embedding)
+        for key, item in zip(batch, response.data):
+            store.append(key, item.embedding)
+        store.flush()  # Keep what was paid for if a later batch fails
 
-    return embeddings
+    return len(keys)
 
 
 # ============================================================================
@@ -325,7 +346,7 @@ def insert_to_database(
     version_id: str,
     anchors: List[Anchor],
     chunks: List[Chunk],
-    embeddings: List[List[float]]
+    store: EmbeddingStore
 ) -> None:
     """Insert all data into Postgres"""
     conn = get_db_connection()
@@ -373,17 +394,17 @@ def insert_to_database(
             chunk_db_id = cur.fetchone()[0]
             chunk_db_ids.append(chunk_db_id)
 
-        # Insert embeddings
-        for chunk_db_id, embedding in zip(chunk_db_ids, embeddings):
-            cur.execute("""
-                INSERT INTO library_embeddings (chunk_id, embedding, model_name, model_dimensions)
-                VALUES (%s, %s, %s, %s)
-            """, (
-                chunk_db_id,
-                embedding,  # psycopg2 handles vector type
-                "text-embedding-3-large",
-                1536
-            ))
+        # Stream embeddings from the store (binary COPY, pgvector binary format)
+        model_name, dimensions = pg_text(store.model), pg_int4(store.dimensions)
+        records = (
+            (pg_int4(chunk_db_id), pg_vector(store.vector(chunk_embedding_key(chunk))), model_name, dimensions)
+            for chunk_db_id, chunk in zip(chunk_db_ids, chunks)
+        )
+        cur.copy_expert(
+            "COPY library_embeddings (chunk_id, embedding, model_name, model_dimensions) "
+            "FROM STDIN WITH (FORMAT binary)",
+            PgCopyStream(records)
+        )
 
         conn.commit()
     except Exception as e:
@@ -440,6 +461,8 @@ def main():
     parser.add_argument("--max-chars", type=int, default=1200, help="Max chars per chunk")
     parser.add_argument("--max-tokens", type=int, default=500, help="Max tokens per chunk")
     parser.add_argument("--include-toc", action="store_true", help="Include table of contents")
+    parser.add_argument("--embeddings-store",
+                        help="Embedding store base path (default: /tmp/<version-id>.embeddings)")
 
     args = parser.parse_args()
 
@@ -479,12 +502,14 @@ def main():
     if not api_key:
         raise ValueError("OPENAI_API_KEY environment variable not set")
 
-    embeddings = generate_embeddings(chunks, api_key)
-    print(f"✅ Generated {len(embeddings)} embeddings")
+    store_path = Path(args.embeddings_store or f"/tmp/{args.version_id}.embeddings")
+    with EmbeddingStore.open_or_create(store_path, EMBEDDING_MODEL, EMBEDDING_DIMENSIONS) as store:
+        embedded = generate_embeddings(chunks, api_key, store)
+        print(f"✅ Generated {embedded} embeddings ({len(chunks)} chunks, store: {store_path})")
 
-    # Insert into database
-    print("💾 Inserting into database...")
-    insert_to_database(args.source_id, args.version_id, anchors, chunks, embeddings)
+        # Insert into database
+        print("💾 Inserting into database...")
+        insert_to_database(args.source_id, args.version_id, anchors, chunks, store)
     print("✅ Database insertion complete")
 
     # QA Metrics
@@ -498,7 +523,7 @@ def main():
             "blocks": len(blocks),
             "anchors": len(anchors),
             "chunks": len(chunks),
-            "embeddings": len(embeddings)
+            "embeddings": len(chunks)
         }
     }
 
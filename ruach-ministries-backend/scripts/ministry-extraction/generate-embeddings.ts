@@ -19,6 +19,8 @@
  *   --dimensions 512|1536    Embedding dimensions (default: 512)
  *   --batch-size N           Paragraphs per API call (default: 100)
  *   --skip-existing          Skip paragraphs that already have embeddings
+ *   --duplicates FILE        duplicates.json from near-duplicates.py; near-duplicate
+ *                            paragraphs are not embedded (they share the canonical vector)
  *   --dry-run                Show what would be done without making API calls
  *
  * Environment Variables:
@@ -33,6 +35,7 @@
  */
 
 import { createReadStream, createWriteStream } from 'node:fs';
+import { readFile } from 'node:fs/promises';
 import { createInterface } from 'node:readline';
 import { setTimeout } from 'node:timers/promises';
 
@@ -61,12 +64,14 @@ interface EmbeddingOptions {
   dimensions: 512 | 1536;
   batchSize: number;
   skipExisting: boolean;
+  duplicatesPath?: string;
   dryRun: boolean;
 }
 
 interface EmbeddingStats {
   totalParagraphs: number;
   alreadyEmbedded: number;
+  nearDuplicates: number;
   newEmbeddings: number;
   totalTokens: number;
   estimatedCost: number;
@@ -104,6 +109,7 @@ function parseArgs(): { inputPath: string; outputPath: string; options: Embeddin
     console.error('  --dimensions 512|1536    Embedding dimensions (default: 512)');
     console.error('  --batch-size N           Paragraphs per API call (default: 100)');
     console.error('  --skip-existing          Skip paragraphs that already have embeddings');
+    console.error('  --duplicates FILE        Skip near-duplicate paragraphs listed in duplicates.json');
     console.error('  --dry-run                Show what would be done without making API calls');
     console.error('');
     console.error('Example:');
@@ -139,10 +145,13 @@ function parseArgs(): { inputPath: string; outputPath: string; options: Embeddin
     process.exit(1);
   }
 
+  const duplicatesIdx = args.indexOf('--duplicates');
+
   const options: EmbeddingOptions = {
     dimensions,
     batchSize,
     skipExisting: args.includes('--skip-existing'),
+    duplicatesPath: duplicatesIdx >= 0 ? args[duplicatesIdx + 1] : undefined,
     dryRun: args.includes('--dry-run'),
   };
 
@@ -207,6 +216,7 @@ async function processEmbeddings(
   const stats: EmbeddingStats = {
     totalParagraphs: 0,
     alreadyEmbedded: 0,
+    nearDuplicates: 0,
     newEmbeddings: 0,
     totalTokens: 0,
     estimatedCost: 0,
@@ -238,18 +248,32 @@ async function processEmbeddings(
   console.log(`   Loaded ${stats.totalParagraphs} paragraphs`);
   console.log('');
 
+  // Near-duplicates (textIds as in jsonl-to-strapi.py) reuse their canonical paragraph's vector
+  let duplicateIds = new Set<string>();
+  if (options.duplicatesPath) {
+    const duplicates = JSON.parse(await readFile(options.duplicatesPath, 'utf-8'));
+    duplicateIds = new Set(Object.keys(duplicates.duplicateOf ?? {}));
+  }
+
   // Filter paragraphs that need embeddings
   const needsEmbedding = paragraphs.filter((p) => {
     if (options.skipExisting && p.embedding) {
       stats.alreadyEmbedded++;
       return false;
     }
+    if (duplicateIds.has(`${p.book}-${p.chapter}-${p.paragraph}`)) {
+      stats.nearDuplicates++;
+      return false;
+    }
     return true;
   });
 
   if (stats.alreadyEmbedded > 0) {
     console.log(`   ⏭️  Skipping ${stats.alreadyEmbedded} paragraphs (already embedded)`);
   }
+  if (stats.nearDuplicates > 0) {
+    console.log(`   🔁 Skipping ${stats.nearDuplicates} paragraphs (near-duplicates of another paragraph)`);
+  }
 
   if (needsEmbedding.length === 0) {
     console.log('✅ All paragraphs already have embeddings!');
@@ -387,6 +411,7 @@ async function main() {
     console.log('============================================================');
     console.log(`Total paragraphs:       ${stats.totalParagraphs}`);
     console.log(`Already embedded:       ${stats.alreadyEmbedded}`);
+    console.log(`Near-duplicates:        ${stats.nearDuplicates}`);
     console.log(`New embeddings:         ${stats.newEmbeddings}`);
     console.log(`Total tokens:           ${stats.totalTokens.toLocaleString()}`);
     console.log(`API calls:              ${stats.apiCalls}`);
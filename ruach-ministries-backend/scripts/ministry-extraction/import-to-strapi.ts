@@ -10,6 +10,7 @@
  * - Batch imports texts (100 per batch)
  * - Creates scripture-verse relations (if detectedReferences exists)
  * - Creates scripture-theme relations (if themes exists)
+ * - Attaches embedding vectors from the float32 sidecar (embeddings/embeddings.npy)
  *
  * Usage:
  *   npx tsx scripts/ministry-extraction/import-to-strapi.ts <ingest-dir>
@@ -25,6 +26,7 @@
 import { readFile, readdir } from 'node:fs/promises';
 import { join } from 'node:path';
 import { STRAPI_URL, STRAPI_API_TOKEN } from '../strapi-env';
+import { openEmbeddingStore } from '../unified-extraction/embedding-store';
 
 interface MinistryWork {
   workId: string;
@@ -299,6 +301,72 @@ async function loadTexts(ingestDir: string): Promise<MinistryText[]> {
   return allTexts;
 }
 
+/**
+ * Attach embedding vectors from the embedding store written by jsonl-to-strapi.py
+ * (texts carry `embedding: { model, dimensions, row }`)
+ */
+async function attachEmbeddings(ingestDir: string, texts: MinistryText[]): Promise<number> {
+  const store = await openEmbeddingStore(join(ingestDir, 'embeddings', 'embeddings'));
+  if (!store) return 0;
+  const { model, dimensions: dims } = store.index;
+
+  let attached = 0;
+  for (const text of texts) {
+    const row = text.embedding?.row;
+    if (typeof row !== 'number') continue;
+    // The row must belong to this text (jsonl-to-strapi.py stores it as textId, or textId~n for
+    // duplicate refs); anything else is a reference into a store from another run
+    const storedId = store.index.ids[row];
+    const sameText = storedId === text.textId || storedId?.startsWith(`${text.textId}~`);
+    if (!sameText || text.embedding?.model !== model || text.embedding?.dimensions !== dims) {
+      throw new Error(
+        `Embedding reference for ${text.textId} (row ${row}) does not match the sidecar ` +
+          `(${storedId ?? 'no such row'}, ${model} [${dims}]); re-run jsonl-to-strapi.py`
+      );
+    }
+    text.embedding = {
+      model,
+      dimensions: dims,
+      vector: Array.from(store.row(row)),
+    };
+    attached++;
+  }
+  return attached;
+}
+
+interface NearDuplicate {
+  source: string;
+  id: string;
+  similarity: number;
+}
+
+/**
+ * Point near-duplicate texts at their canonical text (duplicates.json from
+ * unified-extraction/near-duplicates.py): the vector is stored once, on the canonical text
+ */
+async function markNearDuplicates(ingestDir: string, texts: MinistryText[]): Promise<number> {
+  let duplicateOf: Record<string, NearDuplicate>;
+  try {
+    duplicateOf = JSON.parse(await readFile(join(ingestDir, 'duplicates.json'), 'utf-8')).duplicateOf ?? {};
+  } catch {
+    return 0;
+  }
+
+  let marked = 0;
+  for (const text of texts) {
+    const canonical = duplicateOf[text.textId];
+    if (!canonical) continue;
+    text.embedding = {
+      model: text.embedding?.model ?? null,
+      dimensions: text.embedding?.dimensions ?? null,
+      duplicateOf: canonical.id,
+    };
+    text.sourceMetadata = { ...text.sourceMetadata, nearDuplicateOf: canonical };
+    marked++;
+  }
+  return marked;
+}
+
 /**
  * Main import function
  */
@@ -341,6 +409,14 @@ async function importMinistryData(ingestDir: string): Promise<ImportStats> {
     console.log('[3/3] Loading and importing texts...');
     const texts = await loadTexts(ingestDir);
     console.log(`   📝 Loaded ${texts.length} texts from chunks`);
+    const embedded = await attachEmbeddings(ingestDir, texts);
+    if (embedded > 0) {
+      console.log(`   🧮 Attached ${embedded} embeddings from sidecar`);
+    }
+    const duplicates = await markNearDuplicates(ingestDir, texts);
+    if (duplicates > 0) {
+      console.log(`   🔁 ${duplicates} near-duplicate texts reference their canonical text's embedding`);
+    }
     console.log('');
 
     // Step 4: Import texts in batches
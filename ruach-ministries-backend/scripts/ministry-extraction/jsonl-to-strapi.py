@@ -19,12 +19,21 @@ Outputs:
   - out/work.json                      (single work metadata)
   - out/texts/texts.0001.json ...      (chunked paragraph batches)
   - out/meta.json                      (counts + validation stats)
+  - out/embeddings/embeddings.npy      (float32 [paragraphs, dimensions], if any row has
+    out/embeddings/embeddings.index.json  an `embedding`; index = model, dimensions, textIds)
+
+The JSONL is streamed: each chunk file is written as soon as it holds --chunk paragraphs,
+and embedding vectors are appended to the shared embedding store
+(unified-extraction/embedding-store.py) instead of being inlined. A run that writes no
+vectors to the store removes the store left by an earlier run. Text payloads keep
+`"embedding": {"model", "dimensions", "row"}`; import-to-strapi.ts attaches the vector
+from the store (--inline-embeddings keeps the old inline JSON arrays).
 
 Usage:
   python scripts/ministry-extraction/jsonl-to-strapi.py \
     --in ministry-pipeline/exports/egw/ministry-of-healing/v1/paragraphs.jsonl \
     --out ministry-pipeline/ingest/egw/ministry-of-healing/v1 \
-    --chunk 500
+    --chunk 500 [--inline-embeddings]
 """
 
 from __future__ import annotations
@@ -33,9 +42,14 @@ import hashlib
 import json
 import os
 import re
+import sys
 from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, List, Any
+from pathlib import Path
+from typing import Dict, List, Any, Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "unified-extraction"))
+from embedding_store import EmbeddingStore
 
 
 def slugify(s: str) -> str:
@@ -66,6 +80,59 @@ def read_jsonl(path: str):
                 raise RuntimeError(f"Invalid JSON on line {i}: {e}")
 
 
+class EmbeddingSidecar:
+    """
+    Streams embedding vectors into the shared embedding store (unified-extraction/embedding-store.py)
+
+    The store is created on the first vector, since model and dimensions come from the rows.
+    Row order follows the JSONL; the index maps textIds to rows.
+    """
+
+    def __init__(self, out_dir: str, name: str = "embeddings"):
+        self.base = os.path.join(out_dir, name)
+        self.npy_path, self.index_path = (str(p) for p in EmbeddingStore.paths(self.base))
+        self.model: Optional[str] = None
+        self.dimensions: Optional[int] = None
+        self.store: Optional[EmbeddingStore] = None
+
+    def add(self, text_id: str, embedding: Any) -> Dict[str, Any]:
+        """Append one vector; returns the reference stored in the text payload"""
+        if isinstance(embedding, dict):
+            vector = embedding.get("vector") or []
+            model = embedding.get("model")
+        else:
+            vector, model = embedding, None
+
+        if self.store is None:
+            self.model = model
+            self.dimensions = len(vector)
+            self.store = EmbeddingStore.create(self.base, model, self.dimensions)
+        elif len(vector) != self.dimensions or model != self.model:
+            raise RuntimeError(
+                f"Embedding for {text_id} is {model} [{len(vector)}], "
+                f"expected {self.model} [{self.dimensions}]"
+            )
+
+        # Duplicate refs (reported by the validator) still get their own row
+        key = text_id if text_id not in self.store else f"{text_id}~{len(self.store)}"
+        row = self.store.append(key, vector)
+        return {"model": self.model, "dimensions": self.dimensions, "row": row}
+
+    def close(self) -> int:
+        if self.store is None:
+            # No vectors this run: a store left by an earlier run would otherwise still be
+            # picked up by import-to-strapi.ts
+            self.remove_stale()
+            return 0
+        self.store.close()
+        return len(self.store)
+
+    def remove_stale(self):
+        for path in (self.npy_path, self.index_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+
 @dataclass
 class WorkMetadata:
     """Metadata for ministry work"""
@@ -94,6 +161,12 @@ def infer_title_from_code(code: str) -> str:
     return titles.get(code.upper(), f"Ministry Book {code}")
 
 
+def write_chunk(texts_dir: str, chunk_no: int, chunk_data: List[Dict[str, Any]]):
+    chunk_file = os.path.join(texts_dir, f"texts.{chunk_no:04d}.json")
+    with open(chunk_file, "w", encoding="utf-8") as f:
+        json.dump(chunk_data, f, ensure_ascii=False)
+
+
 def main():
     ap = argparse.ArgumentParser(description="Convert ministry JSONL to Strapi JSON")
     ap.add_argument("--in", dest="inp", required=True, help="Input JSONL file")
@@ -105,6 +178,11 @@ def main():
         default=500,
         help="Paragraphs per chunk file (default: 500)",
     )
+    ap.add_argument(
+        "--inline-embeddings",
+        action="store_true",
+        help="Keep embedding vectors inline in texts.*.json instead of the .npy sidecar",
+    )
     args = ap.parse_args()
 
     # Create output directories
@@ -112,8 +190,12 @@ def main():
     texts_dir = os.path.join(args.out, "texts")
     os.makedirs(texts_dir, exist_ok=True)
 
-    # Parse JSONL
-    paragraphs: List[Dict[str, Any]] = []
+    # Stream JSONL → chunk files (only the current chunk is held)
+    chunk_size = max(1, args.chunk)
+    chunk: List[Dict[str, Any]] = []
+    chunk_count = 0
+    paragraph_count = 0
+    sidecar = None if args.inline_embeddings else EmbeddingSidecar(os.path.join(args.out, "embeddings"))
     book_code = None
     chapters_seen = set()
     pages_seen = set()
@@ -203,18 +285,34 @@ def main():
         if detected_references:
             payload["detectedReferences"] = detected_references
         if embedding:
-            payload["embedding"] = embedding
+            payload["embedding"] = embedding if sidecar is None else sidecar.add(text_id, embedding)
         if ai_metadata:
             payload["aiMetadata"] = ai_metadata
         if semantic_summary:
             payload["semanticSummary"] = semantic_summary
 
-        paragraphs.append(payload)
+        chunk.append(payload)
+        paragraph_count += 1
+        if len(chunk) >= chunk_size:
+            chunk_count += 1
+            write_chunk(texts_dir, chunk_count, chunk)
+            chunk = []
 
     if not book_code:
         raise RuntimeError("No paragraphs found in JSONL")
 
-    print(f"✅ Processed {len(paragraphs)} paragraphs from book '{book_code}'")
+    if chunk:
+        chunk_count += 1
+        write_chunk(texts_dir, chunk_count, chunk)
+        chunk = []
+    if sidecar is not None:
+        embedding_count = sidecar.close()
+    else:
+        # Inline vectors live in the text payloads; drop any store from an earlier sidecar run
+        EmbeddingSidecar(os.path.join(args.out, "embeddings")).remove_stale()
+        embedding_count = 0
+
+    print(f"✅ Processed {paragraph_count} paragraphs from book '{book_code}'")
 
     # Build work metadata
     title = infer_title_from_code(book_code)
@@ -225,7 +323,7 @@ def main():
         title=title,
         author="Ellen G. White",
         total_chapters=len(chapters_seen),
-        total_paragraphs=len(paragraphs),
+        total_paragraphs=paragraph_count,
         first_page=min(pages_seen) if pages_seen else 0,
         last_page=max(pages_seen) if pages_seen else 0,
     )
@@ -262,20 +360,9 @@ def main():
         json.dump(work_payload, f, ensure_ascii=False, indent=2)
 
     print(f"📚 Wrote work metadata to {work_path}")
-
-    # Chunk paragraphs into separate files
-    chunk_size = max(1, args.chunk)
-    chunk_count = 0
-
-    for i in range(0, len(paragraphs), chunk_size):
-        chunk_count += 1
-        chunk_data = paragraphs[i : i + chunk_size]
-        chunk_file = os.path.join(texts_dir, f"texts.{chunk_count:04d}.json")
-
-        with open(chunk_file, "w", encoding="utf-8") as f:
-            json.dump(chunk_data, f, ensure_ascii=False)
-
     print(f"📝 Wrote {chunk_count} text chunk files ({chunk_size} paragraphs/chunk)")
+    if embedding_count:
+        print(f"🧮 Wrote {embedding_count} embeddings to {sidecar.npy_path}")
 
     # Write metadata
     meta = {
@@ -285,7 +372,7 @@ def main():
         "book_title": work_metadata.title,
         "author": work_metadata.author,
         "chapters_total": work_metadata.total_chapters,
-        "paragraphs_total": len(paragraphs),
+        "paragraphs_total": paragraph_count,
         "paragraphs_unique": len(seen_refs),
         "duplicates_detected": duplicate_count,
         "chunks_created": chunk_count,
@@ -297,6 +384,13 @@ def main():
         },
         "chapter_distribution": dict(chapter_para_counts),
     }
+    if embedding_count:
+        meta["embeddings"] = {
+            "file": os.path.relpath(sidecar.npy_path, args.out),
+            "model": sidecar.model,
+            "dimensions": sidecar.dimensions,
+            "count": embedding_count,
+        }
 
     meta_path = os.path.join(args.out, "meta.json")
     with open(meta_path, "w", encoding="utf-8") as f:
@@ -310,7 +404,7 @@ def main():
     print("=" * 60)
     print(f"Book:            {work_metadata.title}")
     print(f"Chapters:        {work_metadata.total_chapters}")
-    print(f"Paragraphs:      {len(paragraphs)}")
+    print(f"Paragraphs:      {paragraph_count}")
     print(f"Duplicates:      {duplicate_count}")
     print(f"Chunks:          {chunk_count}")
     print(f"Pages covered:   {work_metadata.first_page}-{work_metadata.last_page}")
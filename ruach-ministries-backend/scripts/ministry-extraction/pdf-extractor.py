@@ -7,17 +7,27 @@ Extends BaseExtractor with ministry-specific logic:
 - Chapter detection (multiple patterns: font size, regex, spacing)
 - Paragraph segmentation (visual spacing + line breaks)
 - Zone filtering (HEADER/FOOTER/MARGIN/BODY)
+
+Extraction streams: pages are read one at a time, each line is summarized once
+(bounding box + font statistics) when it is assembled, and paragraphs are written to
+the JSONL file as they complete. Only the current paragraph's line summaries are held.
+
+Line tolerance, paragraph gap, indent and heading thresholds are calibrated per document
+from a page sample (unified-extraction/layout-calibration.py) and stored in the book's
+run manifest (--manifest), so one pass uses thresholds that fit the book's layout.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
 import sys
 from dataclasses import dataclass, asdict
+from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 # Add parent directory to path for base-extractor import
 sys.path.insert(0, str(Path(__file__).parent.parent / "unified-extraction"))
@@ -26,12 +36,22 @@ try:
     from base_extractor import (
         BaseExtractor,
         LayoutAwareBlock,
+        ExtractionMetadata,
         ExtractionResult,
         classify_zone,
         looks_like_toc_line,
     )
+    from line_assembly import AssembledLine, assemble_lines_by_page, assemble_page_lines
+    from font_profile import FontProfile, load_or_build_profile
+    from layout_calibration import (
+        LayoutThresholds,
+        calibrate_layout,
+        load_calibration,
+        sample_page_numbers,
+        save_calibration,
+    )
 except ImportError:
-    print("ERROR: Could not import base_extractor. Make sure base-extractor.py exists.")
+    print("ERROR: Could not import base_extractor/line_assembly. Make sure base-extractor.py and line-assembly.py exist.")
     sys.exit(1)
 
 try:
@@ -53,6 +73,40 @@ class MinistryParagraph:
     confidence: float = 1.0
 
 
+class LineSummary(NamedTuple):
+    """Per-line geometry and font statistics, computed once when the line is assembled"""
+    text: str
+    page: int
+    x0: float
+    top: float
+    bottom: float
+    mean_font_size: float  # Over all words (section-heading check)
+    font_sq_dev: float  # Sum of squared deviations from the body size (sized words)
+    font_count: int  # Words with a known size
+
+
+class ParagraphStats:
+    """Running validation counters, so streamed paragraphs need not be kept"""
+
+    def __init__(self):
+        self.total = 0
+        self.short = 0
+        self.no_heading = 0
+        self.has_first_para = False
+        self.first_chapter: Optional[int] = None
+
+    def add(self, para: MinistryParagraph):
+        self.total += 1
+        if len(para.text) < 20:
+            self.short += 1
+        if not para.heading:
+            self.no_heading += 1
+        if para.chapter == 1 and para.paragraph == 1:
+            self.has_first_para = True
+        if self.first_chapter is None or para.chapter < self.first_chapter:
+            self.first_chapter = para.chapter
+
+
 class MinistryPDFExtractor(BaseExtractor):
     """Extract ministry texts from PDF"""
 
@@ -63,19 +117,19 @@ class MinistryPDFExtractor(BaseExtractor):
         r"^(\d+|[IVXLCDM]+)\.\s+[A-Z][A-Za-z\s]{3,50}$",  # "1. The Title"
     ]
 
-    # Font size threshold for headings (relative to body text)
-    HEADING_FONT_THRESHOLD = 1.3  # 30% larger than body text
-
     def __init__(self, pdf_path: str, book_code: str):
         super().__init__(pdf_path, "library")  # Use "library" content type
         self.book_code = book_code
         self.pdf = None
         self.avg_body_font_size = 11.0  # Will be updated during extraction
+        self.font_profile: Optional[FontProfile] = None
         self.current_chapter = 0
         self.current_heading = None
+        self.thresholds: Optional[LayoutThresholds] = None  # Defaults unless calibrated
 
     def extract_blocks(self) -> List[LayoutAwareBlock]:
         """Extract layout-aware blocks from PDF"""
+        self.font_profile = load_or_build_profile(str(self.source_path))
         with pdfplumber.open(self.source_path) as pdf:
             self.pdf = pdf
             blocks = self.extract_blocks_with_layout(pdf)
@@ -97,153 +151,151 @@ class MinistryPDFExtractor(BaseExtractor):
         body_blocks = [b for b in blocks if b.zone == "BODY"]
         print(f"   → {len(body_blocks)} body blocks after zone filtering")
 
-        # Step 2: Calculate average body font size
-        font_sizes = [b.font_size for b in body_blocks if b.font_size > 0]
-        if font_sizes:
-            self.avg_body_font_size = sum(font_sizes) / len(font_sizes)
-        print(f"   → Average body font size: {self.avg_body_font_size:.1f}pt")
-
-        # Step 3: Group blocks by page and line
-        page_lines = self._group_blocks_into_lines(body_blocks)
+        # Step 2: Body font size (document font profile; block average as fallback)
+        if self.font_profile is not None and self.font_profile.page_count:
+            self._set_body_font_size()
+        else:
+            font_sizes = [b.font_size for b in body_blocks if b.font_size > 0]
+            if font_sizes:
+                self.avg_body_font_size = sum(font_sizes) / len(font_sizes)
+        print(f"   → Body font size: {self.avg_body_font_size:.1f}pt")
+        if self.thresholds is None:
+            self.thresholds = LayoutThresholds(body_font_size=self.avg_body_font_size)
 
-        # Step 4: Detect chapters and paragraphs
-        paragraphs = self._extract_paragraphs_from_lines(page_lines)
+        # Step 3: Assemble lines and segment paragraphs
+        lines = assemble_lines_by_page(body_blocks, tolerance=self.thresholds.line_tolerance)
+        paragraphs = list(self.iter_paragraphs(lines))
 
         print(f"   → Extracted {len(paragraphs)} paragraphs across {self.current_chapter} chapters")
 
         return paragraphs
 
-    def _group_blocks_into_lines(self, blocks: List[LayoutAwareBlock]) -> dict:
-        """Group blocks into lines by page"""
-        from collections import defaultdict
-
-        page_lines = defaultdict(list)
-
-        # Group by page
-        pages = defaultdict(list)
-        for block in blocks:
-            pages[block.page].append(block)
-
-        # For each page, group into lines (similar y-coordinate)
-        for page_num, page_blocks in sorted(pages.items()):
-            # Sort by top coordinate
-            page_blocks.sort(key=lambda b: (b.top, b.x0))
-
-            current_line = []
-            current_top = None
-            line_tolerance = 3.0  # pixels
-
-            for block in page_blocks:
-                if current_top is None or abs(block.top - current_top) <= line_tolerance:
-                    # Same line
-                    current_line.append(block)
-                    current_top = block.top
-                else:
-                    # New line
-                    if current_line:
-                        page_lines[page_num].append(current_line)
-                    current_line = [block]
-                    current_top = block.top
-
-            # Add last line
-            if current_line:
-                page_lines[page_num].append(current_line)
-
-        return page_lines
-
-    def _extract_paragraphs_from_lines(self, page_lines: dict) -> List[MinistryParagraph]:
-        """Extract paragraphs from grouped lines"""
-        paragraphs = []
-        current_para_lines = []
+    def _set_body_font_size(self):
+        """Body font size from the document font profile (keeps the default without one)"""
+        if self.font_profile is not None and self.font_profile.page_count:
+            self.avg_body_font_size = self.font_profile.modal_body_size(default=self.avg_body_font_size)
+
+    def _sample_body_font_size(self, pdf):
+        """Block-average body font size over the calibration page sample (no font profile)"""
+        font_sizes = [
+            b.font_size
+            for _, page_blocks in self.iter_layout_pages(pdf, sample_page_numbers(len(pdf.pages)))
+            for b in page_blocks
+            if b.zone == "BODY" and b.font_size > 0
+        ]
+        if font_sizes:
+            self.avg_body_font_size = sum(font_sizes) / len(font_sizes)
+
+    def calibrate(self, pdf, manifest_path: Optional[Path] = None, force: bool = False) -> LayoutThresholds:
+        """
+        Fit segmentation thresholds from a page sample
+
+        Reuses the manifest's calibration while the PDF is unchanged; a new fit is
+        written back to the manifest.
+        """
+        if manifest_path is not None and not force:
+            stored = load_calibration(manifest_path, self.source_sha256)
+            if stored is not None:
+                print(f"   → Using calibration from {manifest_path}")
+                self.thresholds = stored
+                return stored
+
+        sample = sample_page_numbers(len(pdf.pages))
+        print(f"   → Calibrating layout thresholds on {len(sample)} sample pages...")
+        pages = (
+            [b for b in page_blocks if b.zone == "BODY"]
+            for _, page_blocks in self.iter_layout_pages(pdf, sample)
+        )
+        self.thresholds = calibrate_layout(pages, self.avg_body_font_size)
+
+        t = self.thresholds
+        fitted = [name for name, ok in t.fitted.items() if ok] or ["none"]
+        print(f"   → Line tolerance {t.line_tolerance:.1f}pt, paragraph gap {t.paragraph_gap:.1f}pt, "
+              f"indent {t.indent:.1f}pt, heading ratio {t.heading_ratio:.2f} (fitted: {', '.join(fitted)})")
+        if manifest_path is not None:
+            save_calibration(manifest_path, self.source_sha256, self.thresholds, sample)
+        return self.thresholds
+
+    def iter_body_lines(self, pdf) -> Iterator[AssembledLine]:
+        """BODY-zone lines, one page at a time"""
+        for page_num, page_blocks in self.iter_layout_pages(pdf):
+            body_blocks = [b for b in page_blocks if b.zone == "BODY"]
+            yield from assemble_page_lines(body_blocks, page=page_num, tolerance=self.thresholds.line_tolerance)
+
+    def _summarize_line(self, line: AssembledLine) -> LineSummary:
+        sizes = [b.font_size for b in line.words]
+        body = self.avg_body_font_size
+        known = [f for f in sizes if f > 0]
+        return LineSummary(
+            text=line.text,
+            page=line.page,
+            x0=line.x0,
+            top=line.top,
+            bottom=line.bottom,
+            mean_font_size=sum(sizes) / len(sizes) if sizes else 0.0,
+            font_sq_dev=sum((f - body) ** 2 for f in known),
+            font_count=len(known),
+        )
+
+    def iter_paragraphs(self, lines: Iterable[AssembledLine]) -> Iterator[MinistryParagraph]:
+        """
+        Segment lines into paragraphs as they arrive
+
+        Holds only the current paragraph's line summaries; each completed paragraph
+        is yielded (numbered) before the next line is read.
+        """
+        current_para_lines: List[LineSummary] = []
         paragraph_num = 0
 
-        for page_num in sorted(page_lines.keys()):
-            lines = page_lines[page_num]
-
-            for line_blocks in lines:
-                # Combine blocks in line to form text
-                line_text = " ".join(b.text for b in line_blocks).strip()
-
-                if not line_text:
-                    # Empty line - potential paragraph break
-                    if current_para_lines:
-                        para = self._create_paragraph(current_para_lines, page_num)
-                        if para:
-                            paragraph_num += 1
-                            para.paragraph = paragraph_num
-                            paragraphs.append(para)
-                        current_para_lines = []
-                    continue
-
-                # Skip Table of Contents lines
-                if looks_like_toc_line(line_text):
-                    continue
-
-                # Check if this is a chapter heading
-                if self._is_chapter_heading(line_blocks, line_text):
-                    # Flush current paragraph
-                    if current_para_lines:
-                        para = self._create_paragraph(current_para_lines, page_num)
-                        if para:
-                            paragraph_num += 1
-                            para.paragraph = paragraph_num
-                            paragraphs.append(para)
-                        current_para_lines = []
-
-                    # Extract chapter number
-                    chapter_num = self._extract_chapter_number(line_text)
-                    if chapter_num > 0:
-                        self.current_chapter = chapter_num
-                        paragraph_num = 0  # Reset paragraph numbering
-                        print(f"   → Detected Chapter {self.current_chapter}: {line_text[:50]}")
-
-                    # Store as current heading
-                    self.current_heading = line_text
-                    continue
-
-                # Check if this is a section heading (larger font but not chapter)
-                if self._is_section_heading(line_blocks, line_text):
-                    # Flush current paragraph
-                    if current_para_lines:
-                        para = self._create_paragraph(current_para_lines, page_num)
-                        if para:
-                            paragraph_num += 1
-                            para.paragraph = paragraph_num
-                            paragraphs.append(para)
-                        current_para_lines = []
-
-                    # Store as current heading
-                    self.current_heading = line_text
-                    continue
-
-                # Skip content before first chapter is detected (front matter)
-                if self.current_chapter == 0:
-                    continue
-
-                # Check for paragraph break (visual spacing)
-                if current_para_lines and self._is_paragraph_break(current_para_lines[-1], line_blocks):
-                    para = self._create_paragraph(current_para_lines, page_num)
-                    if para:
-                        paragraph_num += 1
-                        para.paragraph = paragraph_num
-                        paragraphs.append(para)
-                    current_para_lines = []
-
-                # Add line to current paragraph
-                current_para_lines.append((line_blocks, line_text, page_num))
+        for line in lines:
+            summary = self._summarize_line(line)
+            page_num = summary.page
+
+            if not summary.text:
+                kind = "empty"  # Empty line - potential paragraph break
+            elif looks_like_toc_line(summary.text):
+                continue  # Skip Table of Contents lines
+            elif self._is_chapter_heading(summary):
+                kind = "chapter"
+            elif self._is_section_heading(summary):
+                kind = "section"  # Larger font but not chapter
+            elif self.current_chapter == 0:
+                continue  # Skip content before first chapter is detected (front matter)
+            else:
+                kind = "body"
+
+            # Flush the current paragraph on empty lines, headings and visual breaks
+            if current_para_lines and (kind != "body" or self._is_paragraph_break(current_para_lines[-1], summary)):
+                para = self._create_paragraph(current_para_lines, page_num)
+                if para:
+                    paragraph_num += 1
+                    para.paragraph = paragraph_num
+                    yield para
+                current_para_lines = []
+
+            if kind == "chapter":
+                chapter_num = self._extract_chapter_number(summary.text)
+                if chapter_num > 0:
+                    self.current_chapter = chapter_num
+                    paragraph_num = 0  # Reset paragraph numbering
+                    print(f"   → Detected Chapter {self.current_chapter}: {summary.text[:50]}")
+                self.current_heading = summary.text
+            elif kind == "section":
+                self.current_heading = summary.text
+            elif kind == "body":
+                current_para_lines.append(summary)
 
         # Flush remaining paragraph
         if current_para_lines:
-            para = self._create_paragraph(current_para_lines, current_para_lines[-1][2])
+            para = self._create_paragraph(current_para_lines, current_para_lines[-1].page)
             if para:
                 paragraph_num += 1
                 para.paragraph = paragraph_num
-                paragraphs.append(para)
-
-        return paragraphs
+                yield para
 
-    def _is_chapter_heading(self, line_blocks: List[LayoutAwareBlock], line_text: str) -> bool:
+    def _is_chapter_heading(self, line: LineSummary) -> bool:
         """Detect if line is a chapter heading"""
+        line_text = line.text
         # Skip page markers (numbers in brackets)
         if re.match(r"^\[\s*\d+\s*\]\s*$", line_text.strip()):
             return False
@@ -256,13 +308,12 @@ class MinistryPDFExtractor(BaseExtractor):
 
         return False
 
-    def _is_section_heading(self, line_blocks: List[LayoutAwareBlock], line_text: str) -> bool:
+    def _is_section_heading(self, line: LineSummary) -> bool:
         """Detect if line is a section heading (not chapter-level)"""
         # Font size heuristic (moderately larger)
-        avg_font_size = sum(b.font_size for b in line_blocks) / len(line_blocks)
-        if avg_font_size >= self.avg_body_font_size * self.HEADING_FONT_THRESHOLD:
+        if line.mean_font_size >= self.avg_body_font_size * self.thresholds.heading_ratio:
             # Check if it's short enough to be a heading
-            if len(line_text) < 100:
+            if len(line.text) < 100:
                 return True
 
         return False
@@ -287,53 +338,38 @@ class MinistryPDFExtractor(BaseExtractor):
         # Increment current chapter if no number found
         return self.current_chapter + 1
 
-    def _is_paragraph_break(self, prev_line_data: tuple, curr_line_blocks: List[LayoutAwareBlock]) -> bool:
+    def _is_paragraph_break(self, prev: LineSummary, curr: LineSummary) -> bool:
         """Detect if there's a paragraph break between lines"""
-        prev_blocks, prev_text, prev_page = prev_line_data
-
         # Different pages = paragraph break
-        if curr_line_blocks[0].page != prev_page:
+        if curr.page != prev.page:
             return True
 
-        # Calculate vertical gap
-        prev_bottom = max(b.bottom for b in prev_blocks)
-        curr_top = min(b.top for b in curr_line_blocks)
-        gap = curr_top - prev_bottom
-
-        # Paragraph break if gap > 1.5x line height
-        avg_line_height = self.avg_body_font_size * 1.2
-        if gap > avg_line_height * 1.5:
+        # Paragraph break if the gap exceeds the paragraph spacing (default 1.5x line height)
+        if curr.top - prev.bottom > self.thresholds.paragraph_gap:
             return True
 
-        # Check indentation (first line indented = new paragraph)
-        prev_x0 = min(b.x0 for b in prev_blocks)
-        curr_x0 = min(b.x0 for b in curr_line_blocks)
-        if curr_x0 - prev_x0 > 15:  # Indented by >15 pixels
+        # Check indentation (first line indented = new paragraph; default >15 pixels)
+        if curr.x0 - prev.x0 > self.thresholds.indent:
             return True
 
         return False
 
-    def _create_paragraph(self, lines_data: List[tuple], page_num: int) -> Optional[MinistryParagraph]:
-        """Create MinistryParagraph from accumulated lines"""
-        if not lines_data:
+    def _create_paragraph(self, lines: List[LineSummary], page_num: int) -> Optional[MinistryParagraph]:
+        """Create MinistryParagraph from accumulated line summaries"""
+        if not lines:
             return None
 
-        # Combine all line texts
-        texts = [line_text for _, line_text, _ in lines_data]
-        full_text = " ".join(texts)
-
-        # Normalize text
-        full_text = self.normalize_text(full_text)
+        # Combine and normalize all line texts
+        full_text = self.normalize_text(" ".join(line.text for line in lines))
 
         # Skip if too short (likely artifact)
         if len(full_text) < 10:
             return None
 
-        # Calculate confidence (based on average font size consistency)
-        all_blocks = [block for blocks, _, _ in lines_data for block in blocks]
-        font_sizes = [b.font_size for b in all_blocks if b.font_size > 0]
-        if font_sizes:
-            font_std = (sum((f - self.avg_body_font_size) ** 2 for f in font_sizes) / len(font_sizes)) ** 0.5
+        # Calculate confidence (font size deviation from the body size)
+        font_count = sum(line.font_count for line in lines)
+        if font_count:
+            font_std = (sum(line.font_sq_dev for line in lines) / font_count) ** 0.5
             confidence = max(0.5, 1.0 - (font_std / self.avg_body_font_size))
         else:
             confidence = 0.8
@@ -350,32 +386,35 @@ class MinistryPDFExtractor(BaseExtractor):
 
     def validate(self, structured_data: List[MinistryParagraph]) -> Tuple[bool, List[str], List[str]]:
         """Validate extracted paragraphs"""
+        stats = ParagraphStats()
+        for para in structured_data:
+            stats.add(para)
+        return self.validate_stats(stats)
+
+    def validate_stats(self, stats: ParagraphStats) -> Tuple[bool, List[str], List[str]]:
+        """Validate from running counters (streaming extraction)"""
         errors = []
         warnings = []
 
-        if not structured_data:
+        if not stats.total:
             errors.append("No paragraphs extracted")
             return False, errors, warnings
 
         # Check for first paragraph
-        has_first_para = any(p.chapter == 1 and p.paragraph == 1 for p in structured_data)
-        if not has_first_para:
+        if not stats.has_first_para:
             warnings.append("No paragraph found for Chapter 1, Paragraph 1")
 
         # Check for very short paragraphs
-        short_paras = [p for p in structured_data if len(p.text) < 20]
-        if len(short_paras) > len(structured_data) * 0.1:  # >10% short
-            warnings.append(f"{len(short_paras)} paragraphs are very short (<20 chars)")
+        if stats.short > stats.total * 0.1:  # >10% short
+            warnings.append(f"{stats.short} paragraphs are very short (<20 chars)")
 
         # Check for missing headings
-        no_heading = [p for p in structured_data if not p.heading]
-        if len(no_heading) > len(structured_data) * 0.7:  # >70% missing
-            warnings.append(f"{len(no_heading)} paragraphs have no heading")
+        if stats.no_heading > stats.total * 0.7:  # >70% missing
+            warnings.append(f"{stats.no_heading} paragraphs have no heading")
 
         # Check chapter sequence
-        chapters = sorted(set(p.chapter for p in structured_data))
-        if chapters and chapters[0] != 1:
-            warnings.append(f"First chapter is {chapters[0]}, expected 1")
+        if stats.first_chapter is not None and stats.first_chapter != 1:
+            warnings.append(f"First chapter is {stats.first_chapter}, expected 1")
 
         return True, errors, warnings
 
@@ -387,20 +426,92 @@ class MinistryPDFExtractor(BaseExtractor):
 
         print(f"\n💾 Saved {len(paragraphs)} paragraphs to: {output_path}")
 
+    def extract_to_jsonl(
+        self,
+        output_path: str,
+        manifest_path: Optional[str] = None,
+        calibrate: bool = True,
+        recalibrate: bool = False,
+    ) -> ExtractionResult:
+        """
+        Streaming extraction: (calibration) → pages → lines → paragraphs → JSONL
+
+        Paragraphs are written as they complete (to <out>.tmp, renamed on success);
+        the result carries counts and validation but no items.
+        """
+        print(f"📖 Extracting {self.content_type} from: {self.source_path.name}")
+
+        self.font_profile = load_or_build_profile(str(self.source_path))
+
+        out_path = Path(output_path)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = out_path.with_name(out_path.name + ".tmp")
+
+        stats = ParagraphStats()
+        with pdfplumber.open(self.source_path) as pdf, open(tmp_path, "w", encoding="utf-8") as f:
+            self.pdf = pdf
+            total_pages = len(pdf.pages)
+            if self.font_profile is not None and self.font_profile.page_count:
+                self._set_body_font_size()
+            else:
+                self._sample_body_font_size(pdf)
+            print(f"   → Body font size: {self.avg_body_font_size:.1f}pt")
+            if calibrate:
+                self.calibrate(pdf, Path(manifest_path) if manifest_path else None, force=recalibrate)
+            else:
+                self.thresholds = LayoutThresholds(body_font_size=self.avg_body_font_size)
+            for para in self.iter_paragraphs(self.iter_body_lines(pdf)):
+                f.write(json.dumps(asdict(para)) + "\n")
+                stats.add(para)
+        os.replace(tmp_path, out_path)
+
+        print(f"   → Extracted {stats.total} paragraphs across {self.current_chapter} chapters")
+        print(f"\n💾 Saved {stats.total} paragraphs to: {output_path}")
+
+        is_valid, errors, warnings = self.validate_stats(stats)
+
+        validation_status = "valid" if is_valid else "invalid"
+        if warnings and is_valid:
+            validation_status = "valid_with_warnings"
+
+        metadata = ExtractionMetadata(
+            extractor_version=self.EXTRACTOR_VERSION,
+            content_type=self.content_type,
+            source_file=str(self.source_path),
+            source_sha256=self.source_sha256,
+            extraction_timestamp=datetime.utcnow().isoformat() + "Z",
+            total_pages=total_pages,
+            total_items=stats.total,
+            validation_status=validation_status,
+        )
+
+        print(f"\n✅ Extraction complete!")
+        print(f"   Items: {metadata.total_items}")
+        print(f"   Errors: {len(errors)}")
+        print(f"   Warnings: {len(warnings)}")
+        print(f"   Status: {validation_status}")
+
+        return ExtractionResult(metadata=metadata, items=[], errors=errors, warnings=warnings)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Extract ministry text from PDF")
     parser.add_argument("--pdf", required=True, help="Path to PDF file")
     parser.add_argument("--out", required=True, help="Output JSONL file")
     parser.add_argument("--book-code", required=True, help="Book code (e.g., MOH)")
+    parser.add_argument("--manifest", help="Run manifest to read/store layout calibration (e.g. <out>/run-manifest.json)")
+    parser.add_argument("--no-calibrate", action="store_true", help="Use the fixed default thresholds")
+    parser.add_argument("--recalibrate", action="store_true", help="Re-fit thresholds even if the manifest has them")
     args = parser.parse_args()
 
-    # Run extraction
+    # Run extraction (paragraphs are streamed into the JSONL file)
     extractor = MinistryPDFExtractor(args.pdf, args.book_code)
-    result = extractor.extract()
-
-    # Save JSONL
-    extractor.save_jsonl(args.out, result.items)
+    result = extractor.extract_to_jsonl(
+        args.out,
+        manifest_path=args.manifest,
+        calibrate=not args.no_calibrate,
+        recalibrate=args.recalibrate,
+    )
 
     # Save metadata
     output_dir = Path(args.out).parent
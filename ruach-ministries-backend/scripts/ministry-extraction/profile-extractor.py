@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+Profile-driven ministry book extractor
+
+One line-oriented engine for the library books whose layout needs per-book rules
+(start page, chapter markers, running headers, paragraph breaks). The rules live in
+profiles/<book>.json (or .yaml/.yml when PyYAML is installed); adding a book means
+adding a profile, not another extract-*.py script.
+
+Page text comes from the shared page-text cache (unified-extraction/page-text.py):
+extracted once per PDF on a process pool and reused while the PDF's SHA256 is unchanged.
+
+Per line, in order:
+1. captures   regexes whose groups update state (e.g. running header "L.1, C.18."); line dropped
+2. drop       running headers, page numbers, watermarks
+3. chapters   chapter markers (flush the pending paragraph, start a chapter)
+4. skip       chapter titles and other non-body lines
+5. paragraphs "sentence" (line ends a sentence and the next line starts one),
+              "marker" (a line matching markerPattern starts a paragraph) or
+              "blank" (empty lines / page ends)
+
+Line rules (drop / skip) match when every condition present holds; list values match
+any item. Profile format: README.md (profile-extractor.py).
+
+Usage:
+    python3 profile-extractor.py --profile why-revival-tarries --pdf book.pdf --out paragraphs.jsonl
+    python3 profile-extractor.py --list
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "unified-extraction"))
+from page_text import load_or_extract_page_text  # noqa: E402
+
+try:
+    import yaml
+except ImportError:  # YAML profiles are optional; JSON always works
+    yaml = None
+
+ENGINE_VERSION = "3.0.0"
+PROFILES_DIR = Path(__file__).resolve().parent / "profiles"
+PROFILE_SUFFIXES = (".json", ".yaml", ".yml")
+
+NUMBER_WORDS = {
+    "ONE": 1, "TWO": 2, "THREE": 3, "FOUR": 4, "FIVE": 5, "SIX": 6, "SEVEN": 7,
+    "EIGHT": 8, "NINE": 9, "TEN": 10, "ELEVEN": 11, "TWELVE": 12, "THIRTEEN": 13,
+    "FOURTEEN": 14, "FIFTEEN": 15, "SIXTEEN": 16, "SEVENTEEN": 17, "EIGHTEEN": 18,
+    "NINETEEN": 19, "TWENTY": 20, "THIRTY": 30, "FORTY": 40, "FIFTY": 50,
+}
+
+
+def words_to_int(text: str) -> int:
+    """'Twenty-One' / 'TWELVE' → int (0 when not a number word)"""
+    total = 0
+    for word in re.split(r"[\s\-]+", text.strip().upper()):
+        if word not in NUMBER_WORDS:
+            return 0
+        total += NUMBER_WORDS[word]
+    return total
+
+
+def _as_list(value: Any) -> List[Any]:
+    return value if isinstance(value, list) else [value]
+
+
+class LineRule:
+    """drop/skip rule: all present conditions must hold"""
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.spec = spec
+        self.exact = frozenset(_as_list(spec["exact"])) if "exact" in spec else None
+        self.contains = tuple(_as_list(spec["contains"])) if "contains" in spec else None
+        self.starts_with = tuple(_as_list(spec["startsWith"])) if "startsWith" in spec else None
+        self.not_ending_with = tuple(_as_list(spec["notEndingWith"])) if "notEndingWith" in spec else None
+        self.pattern = re.compile(spec["pattern"]) if "pattern" in spec else None
+        self.upper = spec.get("upper")
+        self.starts_upper = spec.get("startsUpper")
+        self.max_length = spec.get("maxLength")          # len(line) < maxLength
+        self.min_length = spec.get("minLength")          # len(line) >= minLength
+        self.max_line_index = spec.get("maxLineIndex")   # line index on the page < maxLineIndex
+        self.in_chapter = spec.get("inChapter")          # only once a chapter has started
+
+    def matches(self, line: str, index: int, started: bool) -> bool:
+        if self.in_chapter is not None and started != self.in_chapter:
+            return False
+        if self.max_line_index is not None and index >= self.max_line_index:
+            return False
+        if self.max_length is not None and len(line) >= self.max_length:
+            return False
+        if self.min_length is not None and len(line) < self.min_length:
+            return False
+        if self.exact is not None and line not in self.exact:
+            return False
+        if self.starts_with is not None and not line.startswith(self.starts_with):
+            return False
+        if self.not_ending_with is not None and line.endswith(self.not_ending_with):
+            return False
+        if self.contains is not None and not any(s in line for s in self.contains):
+            return False
+        if self.upper is not None and line.isupper() != self.upper:
+            return False
+        if self.starts_upper is not None and line[:1].isupper() != self.starts_upper:
+            return False
+        if self.pattern is not None and not self.pattern.search(line):
+            return False
+        return True
+
+
+class ChapterRule:
+    """
+    Chapter marker. number: "int" / "words" (group `group`), or "captured" (composed
+    from capture state via `compose`: [[name, multiplier], ...]); `value` fixes the number.
+    """
+
+    def __init__(self, spec: Dict[str, Any]):
+        self.pattern = re.compile(spec["pattern"])
+        self.number = spec.get("number", "int")
+        self.group = spec.get("group", 1)
+        self.value = spec.get("value")
+        self.compose: List[Tuple[str, int]] = [tuple(c) for c in spec.get("compose", [])]
+        self.label = spec.get("label", "Chapter")
+        when = spec.get("when", {})
+        self.when_started = when.get("started")
+        self.when_chapter = when.get("chapter")
+
+    def applies(self, started: bool, chapter: int) -> bool:
+        if self.when_started is not None and started != self.when_started:
+            return False
+        if self.when_chapter is not None and chapter != self.when_chapter:
+            return False
+        return True
+
+    def chapter_number(self, match: re.Match, state: Dict[str, int]) -> Tuple[int, Optional[Dict[str, int]]]:
+        """(chapter, metadata); chapter 0 with compose means "not started yet"."""
+        if self.value is not None:
+            return int(self.value), None
+        if self.number == "captured":
+            parts = {name: state.get(name, 0) for name, _ in self.compose}
+            if not all(parts.values()):
+                return 0, None
+            return sum(state[name] * mult for name, mult in self.compose), parts
+        raw = match.group(self.group)
+        if self.number == "words":
+            return words_to_int(raw), None
+        return int(raw), None
+
+
+class BookProfile:
+    """Parsed, precompiled profile"""
+
+    def __init__(self, data: Dict[str, Any], path: Optional[Path] = None):
+        self.data = data
+        self.path = path
+        self.book: str = data["book"]
+        self.title: str = data.get("title", self.book)
+        self.start_page: int = int(data.get("startPage", 1))
+        self.default_chapter: Optional[int] = data.get("defaultChapter")
+
+        self.captures: List[Tuple[Pattern, List[str]]] = [
+            (re.compile(c["pattern"]), c["names"]) for c in data.get("captures", [])
+        ]
+        self.drop = [LineRule(r) for r in data.get("drop", [])]
+        self.chapters = [ChapterRule(r) for r in data.get("chapters", [])]
+        self.skip = [LineRule(r) for r in data.get("skip", [])]
+
+        paragraphs = data.get("paragraphs", {})
+        self.mode: str = paragraphs.get("mode", "sentence")
+        if self.mode not in ("sentence", "marker", "blank"):
+            raise ValueError(f"{self.book}: unknown paragraph mode {self.mode!r}")
+        self.min_chars: int = int(paragraphs.get("minChars", 20))
+        self.endings = tuple(paragraphs.get("endings", [".", "!", "?", '"']))
+        self.marker = re.compile(paragraphs["markerPattern"]) if self.mode == "marker" else None
+        self.page_end_breaks: bool = paragraphs.get("pageEndBreaks", True)
+
+        next_line = paragraphs.get("nextLine", {})
+        self.next_ignore = re.compile(next_line["ignorePattern"]) if "ignorePattern" in next_line else None
+        self.next_min_length: int = int(next_line.get("minLength", 1))
+        self.next_upper: bool = next_line.get("upper", True)
+        self.next_quote: bool = next_line.get("quote", True)
+        self.next_all_upper: bool = next_line.get("allUpper", False)
+        self.next_starts_with = tuple(next_line.get("startsWith", []))
+        self.next_exact = frozenset(next_line.get("exact", []))
+
+        self.cleanup: List[Tuple[Pattern, str]] = [
+            (re.compile(pattern), replacement) for pattern, replacement in data.get("cleanup", [])
+        ]
+
+    @classmethod
+    def load(cls, path: Path) -> "BookProfile":
+        with open(path, "r", encoding="utf-8") as f:
+            if path.suffix in (".yaml", ".yml"):
+                if yaml is None:
+                    raise RuntimeError(f"PyYAML not installed; cannot read {path}")
+                data = yaml.safe_load(f)
+            else:
+                data = json.load(f)
+        return cls(data, path)
+
+    def next_starts_paragraph(self, next_line: str) -> bool:
+        if not next_line or len(next_line) < self.next_min_length:
+            return False
+        if self.next_ignore is not None and self.next_ignore.search(next_line):
+            return False
+        return (
+            (self.next_upper and next_line[0].isupper())
+            or (self.next_quote and next_line[0] == '"')
+            or (self.next_all_upper and next_line.isupper())
+            or (bool(self.next_starts_with) and next_line.startswith(self.next_starts_with))
+            or next_line in self.next_exact
+        )
+
+
+def profile_paths(profiles_dir: Path = PROFILES_DIR) -> List[Path]:
+    return sorted(p for p in profiles_dir.glob("*") if p.suffix in PROFILE_SUFFIXES)
+
+
+def resolve_profile(name: str, profiles_dir: Path = PROFILES_DIR) -> BookProfile:
+    """Profile by path, file stem (why-revival-tarries) or book code (WRT)"""
+    path = Path(name)
+    if path.exists():
+        return BookProfile.load(path)
+    for candidate in profile_paths(profiles_dir):
+        if candidate.stem == name:
+            return BookProfile.load(candidate)
+    for candidate in profile_paths(profiles_dir):
+        profile = BookProfile.load(candidate)
+        if profile.book.upper() == name.upper():
+            return profile
+    raise FileNotFoundError(f"No profile '{name}' in {profiles_dir}")
+
+
+class ProfileExtractor:
+    """Runs one BookProfile over page text"""
+
+    def __init__(self, profile: BookProfile):
+        self.profile = profile
+        self.paragraphs: List[Dict[str, Any]] = []
+        self.state: Dict[str, int] = {}
+        self.started = profile.default_chapter is not None
+        self.chapter = profile.default_chapter or 0
+        self.chapter_meta: Optional[Dict[str, int]] = None
+        self.paragraph_in_chapter = 0
+        self.pending: List[str] = []
+        self.pending_page = 0
+
+    def _flush(self):
+        if not self.pending:
+            return
+        text = " ".join(self.pending)
+        self.pending = []
+        if not self.started:
+            return
+        for pattern, replacement in self.profile.cleanup:
+            text = pattern.sub(replacement, text)
+        if len(text) <= self.profile.min_chars:
+            return
+
+        self.paragraph_in_chapter += 1
+        record: Dict[str, Any] = {
+            "book": self.profile.book,
+            "chapter": self.chapter,
+            "paragraph": self.paragraph_in_chapter,
+            "text": text,
+            "textHash": hashlib.md5(text.encode()).hexdigest()[:16],
+            "pdfPage": self.pending_page,
+            "confidence": 1.0,
+        }
+        if self.chapter_meta is not None:
+            record["metadata"] = dict(self.chapter_meta)
+        self.paragraphs.append(record)
+
+    def _append(self, line: str, page_num: int):
+        self.pending.append(line)
+        self.pending_page = page_num
+
+    def _start_chapter(self, rule: ChapterRule, match: re.Match):
+        self._flush()
+        chapter, meta = rule.chapter_number(match, self.state)
+        self.chapter = chapter
+        self.chapter_meta = meta
+        self.started = not (rule.number == "captured" and chapter == 0)
+        self.paragraph_in_chapter = 0
+        if self.started:
+            print(f"   Found {rule.label} {chapter}")
+
+    def process_page(self, page_num: int, text: str):
+        profile = self.profile
+        lines = text.split("\n")
+        last = len(lines) - 1
+
+        for i, raw in enumerate(lines):
+            line = raw.strip()
+            if not line:
+                if profile.mode == "blank":
+                    self._flush()
+                continue
+
+            captured = False
+            for pattern, names in profile.captures:
+                match = pattern.search(line)
+                if match:
+                    for name, value in zip(names, match.groups()):
+                        self.state[name] = int(value)
+                    captured = True
+                    break
+            if captured:
+                continue
+
+            if any(rule.matches(line, i, self.started) for rule in profile.drop):
+                continue
+
+            chapter_rule = None
+            for rule in profile.chapters:
+                if rule.applies(self.started, self.chapter):
+                    match = rule.pattern.search(line)
+                    if match:
+                        chapter_rule = rule
+                        break
+            if chapter_rule is not None:
+                self._start_chapter(chapter_rule, match)
+                continue
+
+            if any(rule.matches(line, i, self.started) for rule in profile.skip):
+                continue
+
+            if not self.started:
+                continue
+
+            if profile.mode == "marker":
+                if self.pending and profile.marker.search(line):
+                    self._flush()
+                self._append(line, page_num)
+                continue
+
+            self._append(line, page_num)
+            if profile.mode == "blank":
+                continue
+
+            if line.endswith(profile.endings):
+                if i < last:
+                    breaks = profile.next_starts_paragraph(lines[i + 1].strip())
+                else:
+                    breaks = profile.page_end_breaks
+                if breaks:
+                    self._flush()
+
+        if profile.mode == "blank":
+            self._flush()
+
+    def finish(self) -> List[Dict[str, Any]]:
+        self._flush()
+        return self.paragraphs
+
+
+def extract_with_profile(profile: BookProfile, pdf_path: str, workers: Optional[int] = None,
+                         force_cache: bool = False) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Run a profile over a PDF; returns (paragraphs, extraction metadata)."""
+    print(f"📖 Extracting {profile.title} ({profile.book}) from: {pdf_path}")
+    page_text = load_or_extract_page_text(pdf_path, workers=workers, force=force_cache)
+    print(f"   Total pages: {page_text.page_count}")
+
+    extractor = ProfileExtractor(profile)
+    for page_num in range(profile.start_page, page_text.page_count + 1):
+        text = page_text.page(page_num)
+        if text:
+            extractor.process_page(page_num, text)
+    paragraphs = extractor.finish()
+
+    chapters = len({p["chapter"] for p in paragraphs})
+    print(f"\n✅ Extracted {len(paragraphs)} paragraphs across {chapters} chapters")
+
+    metadata = {
+        "extractor_version": ENGINE_VERSION,
+        "content_type": "library",
+        "book_code": profile.book,
+        "profile": str(profile.path) if profile.path else None,
+        "source_file": pdf_path,
+        "source_sha256": page_text.source_sha256,
+        "extraction_timestamp": datetime.now(timezone.utc).isoformat(),
+        "total_pages": page_text.page_count,
+        "total_items": len(paragraphs),
+        "chapters_count": chapters,
+        "validation_status": "valid" if paragraphs else "invalid",
+    }
+    return paragraphs, metadata
+
+
+def write_outputs(output_jsonl: str, paragraphs: List[Dict[str, Any]], metadata: Dict[str, Any]):
+    output_path = Path(output_jsonl)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        for para in paragraphs:
+            f.write(json.dumps(para, ensure_ascii=False) + "\n")
+    print(f"💾 Saved to: {output_jsonl}")
+
+    metadata_path = output_path.parent / "extraction-metadata.json"
+    with open(metadata_path, "w", encoding="utf-8") as f:
+        json.dump(metadata, f, indent=2)
+    print(f"✅ Extraction metadata saved to: {metadata_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract a ministry book with a declarative profile")
+    parser.add_argument("--profile", help="Profile path, name (why-revival-tarries) or book code (WRT)")
+    parser.add_argument("--pdf", help="Path to PDF file")
+    parser.add_argument("--out", help="Output JSONL file")
+    parser.add_argument("--workers", type=int, help="Page-text worker processes (default: CPU count)")
+    parser.add_argument("--force-cache", action="store_true", help="Re-extract page text even if cached")
+    parser.add_argument("--list", action="store_true", help="List available profiles")
+    args = parser.parse_args()
+
+    if args.list:
+        for path in profile_paths():
+            profile = BookProfile.load(path)
+            print(f"{profile.book:14} {path.stem:32} {profile.title} (from page {profile.start_page})")
+        return 0
+
+    if not (args.profile and args.pdf and args.out):
+        parser.error("--profile, --pdf and --out are required")
+    if not Path(args.pdf).exists():
+        print(f"❌ PDF not found: {args.pdf}")
+        return 1
+
+    try:
+        profile = resolve_profile(args.profile)
+    except (FileNotFoundError, RuntimeError, ValueError, KeyError) as e:
+        print(f"❌ Invalid profile: {e}")
+        return 1
+
+    paragraphs, metadata = extract_with_profile(profile, args.pdf, workers=args.workers,
+                                                force_cache=args.force_cache)
+    write_outputs(args.out, paragraphs, metadata)
+    return 0 if paragraphs else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Ministry Library Batch Runner
+
+Runs the ministry pipeline (extract → jsonl-to-strapi → validate) for every book in a
+library file, several books at a time. Each book's stages run in order, as separate
+processes (same scripts and layout as run-ministry-pipeline.sh):
+
+  <out>/exports/v1/paragraphs.jsonl
+  <out>/ingest/v1/{work.json,texts/,meta.json,validation-report.json}
+  <out>/logs/{extract,convert,validate}.log
+  <out>/run-manifest.json          source/profile hashes, stage timings, quality stats,
+                                   layout calibration (pdf-extractor.py)
+
+A book is skipped when its last run passed and neither the PDF (SHA256) nor its
+extraction settings (profile file contents, extractor, chunk size) nor the code of its
+stage scripts (and the unified-extraction helpers they import) have changed.
+
+After the books, near-duplicate paragraphs are detected across the whole library
+(unified-extraction/near-duplicates.py, MinHash/LSH; signatures cached per book in
+<library>.minhash.{json,bin}). Clusters go to <library>.duplicates.json and each book
+gets <out>/ingest/v1/duplicates.json for generate-embeddings.ts / import-to-strapi.ts.
+Library order decides which copy is canonical.
+
+Library file (JSON):
+  {
+    "books": [
+      {"code": "MOH", "pdf": "ministry-pipeline/sources/egw/moh.pdf",
+       "out": "ministry-pipeline/egw/ministry-of-healing"},
+      {"code": "WRT", "pdf": "ministry-pipeline/sources/ravenhill/wrt.pdf",
+       "out": "ministry-pipeline/library/why-revival-tarries", "profile": "why-revival-tarries"}
+    ]
+  }
+Books with a "profile" use profile-extractor.py, others pdf-extractor.py. Relative paths
+are resolved from the current directory, like the other pipeline scripts. Book codes must
+be unique (case-insensitive).
+
+Usage:
+  python3 scripts/ministry-extraction/run-library.py --library ministry-pipeline/library.json \
+    [--workers 4] [--only MOH,WRT] [--force] [--report library-report.json] \
+    [--no-dedupe] [--dedupe-threshold 0.7]
+
+Exit codes:
+  0 = every book passed (or was skipped as unchanged)
+  1 = at least one book failed
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+HELPER_DIR = SCRIPT_DIR.parent / "unified-extraction"
+sys.path.insert(0, str(HELPER_DIR))
+from near_duplicates import DEFAULT_THRESHOLD, detect_corpus_duplicates
+
+MANIFEST_VERSION = 1
+DEFAULT_CHUNK = 500
+IMPORT_RE = re.compile(r"^\s*(?:from|import)\s+([A-Za-z_]\w*)", re.MULTILINE)
+
+
+def sha256_file(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def write_json_atomic(path: Path, data: Any):
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_json(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def resolve_profile_path(profile: str) -> Optional[Path]:
+    """Profile file for a path, profile name or book code (same order as profile-extractor.py)"""
+    path = Path(profile)
+    if path.exists():
+        return path
+    for suffix in (".json", ".yaml", ".yml"):
+        candidate = SCRIPT_DIR / "profiles" / f"{profile}{suffix}"
+        if candidate.exists():
+            return candidate
+    # Book-code lookup; YAML profiles are only searched when PyYAML is installed
+    try:
+        import yaml  # type: ignore
+    except ImportError:
+        yaml = None
+    for candidate in sorted((SCRIPT_DIR / "profiles").glob("*")):
+        if candidate.suffix not in (".json", ".yaml", ".yml"):
+            continue
+        try:
+            with open(candidate, "r", encoding="utf-8") as f:
+                if candidate.suffix == ".json":
+                    data = json.load(f)
+                elif yaml is not None:
+                    data = yaml.safe_load(f)
+                else:
+                    continue
+        except (OSError, ValueError):
+            continue
+        if isinstance(data, dict) and str(data.get("book", "")).upper() == profile.upper():
+            return candidate
+    return None
+
+
+@lru_cache(maxsize=None)
+def code_fingerprint(scripts: Tuple[Path, ...]) -> Dict[str, str]:
+    """
+    SHA256 of each stage script and of every unified-extraction helper it imports
+    (transitively), keyed by file name. Shared by all books, so computed once per run.
+    """
+    hashes: Dict[str, str] = {}
+    pending = list(scripts)
+    while pending:
+        path = pending.pop()
+        if path.name in hashes or not path.exists():
+            continue
+        hashes[path.name] = sha256_file(path)
+        text = path.read_text(encoding="utf-8", errors="replace")
+        for module in IMPORT_RE.findall(text):
+            # Helpers are imported by their underscore symlink; hash the real file
+            helper = HELPER_DIR / f"{module}.py"
+            if helper.exists():
+                pending.append(helper.resolve())
+    return hashes
+
+
+class BookJob:
+    """One library entry and its paths"""
+
+    def __init__(self, entry: Dict[str, Any]):
+        self.code: str = entry["code"]
+        self.pdf = Path(entry["pdf"])
+        self.out = Path(entry["out"])
+        self.profile: Optional[str] = entry.get("profile")
+        self.chunk: int = int(entry.get("chunk", DEFAULT_CHUNK))
+
+        self.paragraphs_jsonl = self.out / "exports" / "v1" / "paragraphs.jsonl"
+        self.ingest_dir = self.out / "ingest" / "v1"
+        self.logs_dir = self.out / "logs"
+        self.manifest_path = self.out / "run-manifest.json"
+
+    def settings_fingerprint(self) -> str:
+        """Hash of everything besides the PDF that determines the output"""
+        settings: Dict[str, Any] = {
+            "extractor": "profile-extractor" if self.profile else "pdf-extractor",
+            "chunk": self.chunk,
+        }
+        if self.profile:
+            profile_path = resolve_profile_path(self.profile)
+            settings["profile"] = self.profile
+            settings["profileSha256"] = sha256_file(profile_path) if profile_path else None
+        settings["code"] = code_fingerprint(tuple(Path(command[0]) for _, command in self.stages()))
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def stages(self) -> List[tuple]:
+        if self.profile:
+            extract = [str(SCRIPT_DIR / "profile-extractor.py"), "--profile", self.profile,
+                       "--pdf", str(self.pdf), "--out", str(self.paragraphs_jsonl)]
+        else:
+            extract = [str(SCRIPT_DIR / "pdf-extractor.py"), "--pdf", str(self.pdf),
+                       "--out", str(self.paragraphs_jsonl), "--book-code", self.code,
+                       "--manifest", str(self.manifest_path)]
+        return [
+            ("extract", extract),
+            ("convert", [str(SCRIPT_DIR / "jsonl-to-strapi.py"), "--in", str(self.paragraphs_jsonl),
+                         "--out", str(self.ingest_dir), "--chunk", str(self.chunk)]),
+            ("validate", [str(SCRIPT_DIR / "validate-ministry-dump.py"), "--dir", str(self.ingest_dir)]),
+        ]
+
+
+def quality_stats(job: BookJob) -> Dict[str, Any]:
+    """Summary of validation-report.json for the consolidated report"""
+    report = load_json(job.ingest_dir / "validation-report.json")
+    if not report:
+        return {}
+    return {
+        "passed": report.get("passed"),
+        **report.get("stats", {}),
+        "warnings": len(report.get("warnings", [])),
+        "errors": len(report.get("errors", [])),
+        "chapterGaps": len(report.get("contentChecks", {}).get("chapterGaps", [])),
+    }
+
+
+def run_book(job: BookJob, force: bool = False) -> Dict[str, Any]:
+    """Run (or skip) one book; returns its manifest"""
+    if not job.pdf.exists():
+        return {"code": job.code, "status": "failed", "error": f"PDF not found: {job.pdf}"}
+
+    started = time.perf_counter()
+    source_sha256 = sha256_file(job.pdf)
+    settings_sha256 = job.settings_fingerprint()
+    hash_seconds = round(time.perf_counter() - started, 3)
+
+    previous = load_json(job.manifest_path)
+    if (not force and previous.get("version") == MANIFEST_VERSION
+            and previous.get("status") == "passed"
+            and previous.get("sourceSha256") == source_sha256
+            and previous.get("settingsSha256") == settings_sha256
+            and (job.ingest_dir / "validation-report.json").exists()):
+        return {**previous, "status": "skipped", "lastStatus": previous.get("status")}
+
+    for directory in (job.paragraphs_jsonl.parent, job.ingest_dir, job.logs_dir):
+        directory.mkdir(parents=True, exist_ok=True)
+
+    manifest: Dict[str, Any] = {
+        "version": MANIFEST_VERSION,
+        "code": job.code,
+        "pdf": str(job.pdf),
+        "profile": job.profile,
+        "sourceSha256": source_sha256,
+        "settingsSha256": settings_sha256,
+        "startedAt": datetime.now(timezone.utc).isoformat(),
+        "timings": {"hash": hash_seconds},
+        "status": "running",
+    }
+    # Each run starts from a fresh manifest on disk, so keys from an earlier run cannot
+    # leak into this one. Only the layout calibration carries over: it is stored with its
+    # source hash and reused by pdf-extractor.py only while the PDF is unchanged.
+    carried = {"calibration": previous["calibration"]} if "calibration" in previous else {}
+    write_json_atomic(job.manifest_path, {**manifest, **carried})
+    (job.ingest_dir / "validation-report.json").unlink(missing_ok=True)
+
+    for stage, command in job.stages():
+        stage_started = time.perf_counter()
+        log_path = job.logs_dir / f"{stage}.log"
+        with open(log_path, "w", encoding="utf-8") as log:
+            result = subprocess.run([sys.executable, *command], stdout=log, stderr=subprocess.STDOUT)
+        manifest["timings"][stage] = round(time.perf_counter() - stage_started, 3)
+        if result.returncode != 0:
+            manifest["status"] = "failed"
+            manifest["failedStage"] = stage
+            manifest["error"] = f"{stage} exited with {result.returncode} (see {log_path})"
+            break
+    else:
+        manifest["status"] = "passed"
+
+    manifest["timings"]["total"] = round(time.perf_counter() - started, 3)
+    manifest["quality"] = quality_stats(job) if "validate" in manifest["timings"] else {}
+    manifest["finishedAt"] = datetime.now(timezone.utc).isoformat()
+
+    # Keys the stages wrote into the manifest during this run are kept
+    for key, value in load_json(job.manifest_path).items():
+        if key not in manifest:
+            manifest[key] = value
+    write_json_atomic(job.manifest_path, manifest)
+    return manifest
+
+
+def detect_library_duplicates(library_path: Path, jobs: List[BookJob], failed: set,
+                              threshold: float) -> Optional[Dict[str, Any]]:
+    """Near-duplicate stage over every book with paragraphs (not only the books run now)"""
+    books = [job for job in jobs if job.code not in failed and job.paragraphs_jsonl.exists()]
+    # An excluded book's previous duplicates.json would point its import at stale canonicals
+    for job in jobs:
+        if job not in books:
+            (job.ingest_dir / "duplicates.json").unlink(missing_ok=True)
+    if not books:
+        return None
+    started = time.perf_counter()
+    result = detect_corpus_duplicates(
+        library_path.with_name(library_path.stem),
+        [(job.code, job.paragraphs_jsonl) for job in books],
+        threshold,
+        {job.code: job.ingest_dir for job in books},
+    )
+    result["seconds"] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def print_report(results: List[Dict[str, Any]], wall_seconds: float):
+    print("\n" + "=" * 88)
+    print("LIBRARY REPORT")
+    print("=" * 88)
+    print(f"{'Book':14} {'Status':8} {'Extract':>8} {'Convert':>8} {'Validate':>8} "
+          f"{'Chapters':>8} {'Paras':>7} {'Dups':>5} {'Warn':>5}")
+    for r in results:
+        timings = r.get("timings", {})
+        quality = r.get("quality", {})
+
+        def seconds(stage: str) -> str:
+            return f"{timings[stage]:.1f}s" if stage in timings and r["status"] != "skipped" else "-"
+
+        print(f"{r['code']:14} {r['status']:8} {seconds('extract'):>8} {seconds('convert'):>8} "
+              f"{seconds('validate'):>8} {quality.get('chapters', '-'):>8} {quality.get('paragraphs', '-'):>7} "
+              f"{quality.get('duplicates', '-'):>5} {quality.get('warnings', '-'):>5}")
+        if r.get("error"):
+            print(f"   ❌ {r['error']}")
+    print("=" * 88)
+    counts = {status: sum(1 for r in results if r["status"] == status) for status in ("passed", "skipped", "failed")}
+    print(f"Passed: {counts['passed']}  Skipped (unchanged): {counts['skipped']}  "
+          f"Failed: {counts['failed']}  Wall time: {wall_seconds:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the ministry pipeline for a whole library")
+    parser.add_argument("--library", required=True, help="Library JSON ({\"books\": [...]})")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Books processed concurrently (default: min(4, CPUs))")
+    parser.add_argument("--only", help="Comma-separated book codes to run")
+    parser.add_argument("--force", action="store_true", help="Re-run books even if unchanged")
+    parser.add_argument("--report", help="Consolidated report path (default: <library>.report.json)")
+    parser.add_argument("--no-dedupe", action="store_true", help="Skip cross-book near-duplicate detection")
+    parser.add_argument("--dedupe-threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Estimated Jaccard for near-duplicates (default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+
+    library_path = Path(args.library)
+    if not library_path.exists():
+        print(f"❌ Library file not found: {library_path}")
+        sys.exit(1)
+
+    entries = load_json(library_path).get("books", [])
+    # Results, manifests and duplicate reports are keyed by code; a repeated code would
+    # silently overwrite another book's result
+    seen_codes: Dict[str, str] = {}
+    for entry in entries:
+        code = str(entry.get("code", ""))
+        if not code:
+            print(f"❌ Library entry without a code: {entry}")
+            sys.exit(1)
+        if code.upper() in seen_codes:
+            print(f"❌ Duplicate book code in {library_path}: {code} (also {seen_codes[code.upper()]})")
+            sys.exit(1)
+        seen_codes[code.upper()] = code
+    library_jobs = [BookJob(entry) for entry in entries]
+    if args.only:
+        wanted = {code.strip().upper() for code in args.only.split(",")}
+        entries = [e for e in entries if e.get("code", "").upper() in wanted]
+    if not entries:
+        print("❌ No books to run")
+        sys.exit(1)
+
+    jobs = [BookJob(entry) for entry in entries]
+    print(f"📚 Running {len(jobs)} book(s) with {args.workers} worker(s)...")
+
+    started = time.perf_counter()
+    results: Dict[str, Dict[str, Any]] = {}
+    # Each stage is its own process; threads only schedule and wait on them
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        futures = {pool.submit(run_book, job, args.force): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:  # keep the rest of the library running
+                result = {"code": job.code, "status": "failed", "error": str(e)}
+            results[job.code] = result
+            icon = {"passed": "✅", "skipped": "⏭️ ", "failed": "❌"}.get(result["status"], "•")
+            print(f"   {icon} {job.code}: {result['status']}")
+    wall_seconds = time.perf_counter() - started
+
+    ordered = [results[job.code] for job in jobs]
+    print_report(ordered, wall_seconds)
+
+    duplicates = None
+    if not args.no_dedupe:
+        failed = {r["code"] for r in ordered if r["status"] == "failed"}
+        duplicates = detect_library_duplicates(library_path, library_jobs, failed, args.dedupe_threshold)
+        if duplicates:
+            print(f"🔁 Near-duplicates: {duplicates['duplicates']} paragraphs in {duplicates['clusters']} clusters "
+                  f"({duplicates['crossSource']} across books, {duplicates['paragraphs']} compared, "
+                  f"{duplicates['seconds']:.1f}s) → {duplicates['report']}")
+
+    report_path = Path(args.report) if args.report else library_path.with_name(library_path.stem + ".report.json")
+    write_json_atomic(report_path, {
+        "library": str(library_path),
+        "generatedAt": datetime.now(timezone.utc).isoformat(),
+        "wallSeconds": round(wall_seconds, 3),
+        "workers": args.workers,
+        "books": ordered,
+        "nearDuplicates": duplicates,
+    })
+    print(f"\n📊 Library report written to {report_path}")
+
+    sys.exit(1 if any(r["status"] == "failed" for r in ordered) else 0)
+
+
+if __name__ == "__main__":
+    main()
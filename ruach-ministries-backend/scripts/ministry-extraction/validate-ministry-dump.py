@@ -15,18 +15,131 @@ Warning Rules (Exit code 0 but logged):
 - Very short paragraphs (<10 chars)
 - Missing page numbers in sourceMetadata
 
+Text chunks are parsed in parallel (one texts.*.json per task) straight into a columnar
+table (chapter, paragraph, text lengths, heading flag, pdfPage, textId hash); every rule
+is evaluated in one pass over that table. Several ingest directories, or every book of a
+run-library.py library file, can be validated in one invocation; each book still gets
+its own validation-report.json.
+
 Usage:
   python scripts/ministry-extraction/validate-ministry-dump.py \
-    --dir ministry-pipeline/ingest/egw/ministry-of-healing/v1
+    --dir ministry-pipeline/ingest/egw/ministry-of-healing/v1 [--dir ...] \
+    [--library ministry-pipeline/library.json] [--workers 4]
 """
 
 from __future__ import annotations
 import argparse
+import hashlib
 import json
+import os
 import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from glob import glob
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Any, Dict, List, Set, Tuple
+
+MISSING = -(1 << 62)  # chapter / paragraph sentinel for null or non-numeric values
+
+
+class BookLoadError(Exception):
+    """work.json / texts chunk missing or unreadable"""
+
+
+def text_id_hash(text_id: Any) -> int:
+    """Stable 64-bit hash of a textId (same in every worker process)"""
+    digest = hashlib.blake2b(repr(text_id).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+def _ref_number(value: Any) -> int:
+    if value is None or isinstance(value, bool):
+        return MISSING
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return MISSING
+
+
+def _show(value: int) -> Any:
+    return None if value == MISSING else value
+
+
+class TextTable:
+    """Columnar view of a dump's paragraphs (one row per text, file order)"""
+
+    def __init__(self):
+        self.chapter = array("q")
+        self.paragraph = array("q")
+        self.text_length = array("q")  # len(text)
+        self.stripped_length = array("q")  # len(text.strip())
+        self.has_heading = bytearray()
+        self.pdf_page = array("q")  # 0 = missing, -1 = present but not numeric
+        self.text_id = array("q")  # text_id_hash(textId)
+        self.missing_ref_ids: List[Tuple[int, Any]] = []  # (row, textId) without chapter/paragraph
+        self.sources: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.chapter)
+
+    def add(self, text: Dict[str, Any]):
+        chapter = text.get("chapterNumber")
+        paragraph = text.get("paragraphNumber")
+        if chapter is None or paragraph is None:
+            self.missing_ref_ids.append((len(self.chapter), text.get("textId")))
+        self.chapter.append(_ref_number(chapter))
+        self.paragraph.append(_ref_number(paragraph))
+
+        content = text.get("text") or ""
+        self.text_length.append(len(content))
+        self.stripped_length.append(len(content.strip()))
+        self.has_heading.append(1 if text.get("heading") else 0)
+
+        page = (text.get("sourceMetadata") or {}).get("pdfPage")
+        self.pdf_page.append(page if isinstance(page, int) and page else (-1 if page else 0))
+        self.text_id.append(text_id_hash(text.get("textId")))
+
+    def extend(self, other: "TextTable"):
+        offset = len(self)
+        self.chapter.extend(other.chapter)
+        self.paragraph.extend(other.paragraph)
+        self.text_length.extend(other.text_length)
+        self.stripped_length.extend(other.stripped_length)
+        self.has_heading.extend(other.has_heading)
+        self.pdf_page.extend(other.pdf_page)
+        self.text_id.extend(other.text_id)
+        self.missing_ref_ids.extend((row + offset, tid) for row, tid in other.missing_ref_ids)
+        self.sources.extend(other.sources)
+
+    def resolve_text_ids(self, hashes: Set[int]) -> Set[Any]:
+        """Original textId values for the given hashes (re-reads the chunks; error path only)"""
+        found = set()
+        for source in self.sources:
+            for text in _load_chunk(source):
+                tid = text.get("textId")
+                if text_id_hash(tid) in hashes:
+                    found.add(tid)
+        return found
+
+
+def _load_chunk(text_file: str) -> List[Dict[str, Any]]:
+    try:
+        with open(text_file, "r", encoding="utf-8") as f:
+            texts = json.load(f)
+    except json.JSONDecodeError as e:
+        raise BookLoadError(f"{text_file} is not valid JSON: {e}")
+    if not isinstance(texts, list):
+        raise BookLoadError(f"{text_file} does not contain a list")
+    return texts
+
+
+def scan_text_file(text_file: str) -> TextTable:
+    """Worker: parse one texts.*.json chunk into a TextTable"""
+    table = TextTable()
+    for text in _load_chunk(text_file):
+        table.add(text)
+    table.sources.append(text_file)
+    return table
 
 
 def load_work(work_path: str) -> Dict[str, Any]:
@@ -35,38 +148,119 @@ def load_work(work_path: str) -> Dict[str, Any]:
         with open(work_path, "r", encoding="utf-8") as f:
             return json.load(f)
     except FileNotFoundError:
-        print(f"❌ ERROR: work.json not found at {work_path}")
-        sys.exit(1)
+        raise BookLoadError(f"work.json not found at {work_path}")
     except json.JSONDecodeError as e:
-        print(f"❌ ERROR: work.json is not valid JSON: {e}")
-        sys.exit(1)
+        raise BookLoadError(f"work.json is not valid JSON: {e}")
 
 
-def load_all_texts(texts_dir: str) -> List[Dict[str, Any]]:
-    """Load all text chunks"""
-    all_texts = []
+def text_files_for(ingest_dir: Path) -> List[str]:
+    texts_dir = ingest_dir / "texts"
     text_files = sorted(glob(f"{texts_dir}/texts.*.json"))
-
     if not text_files:
-        print(f"❌ ERROR: No text files found in {texts_dir}")
-        sys.exit(1)
+        raise BookLoadError(f"No text files found in {texts_dir}")
+    return text_files
 
-    for text_file in text_files:
-        try:
-            with open(text_file, "r", encoding="utf-8") as f:
-                texts = json.load(f)
-                if not isinstance(texts, list):
-                    print(f"❌ ERROR: {text_file} does not contain a list")
-                    sys.exit(1)
-                all_texts.extend(texts)
-        except json.JSONDecodeError as e:
-            print(f"❌ ERROR: {text_file} is not valid JSON: {e}")
-            sys.exit(1)
 
-    return all_texts
+def load_tables(files_by_book: Dict[Path, List[str]], workers: int) -> Dict[Path, Any]:
+    """
+    Parse every book's chunks (one process pool shared by all books)
 
+    Returns {ingest_dir: TextTable | BookLoadError}
+    """
+    tables: Dict[Path, Any] = {}
+    if workers <= 1 or sum(len(files) for files in files_by_book.values()) <= 1:
+        for book, files in files_by_book.items():
+            table = TextTable()
+            try:
+                for text_file in files:
+                    table.extend(scan_text_file(text_file))
+                tables[book] = table
+            except BookLoadError as e:
+                tables[book] = e
+        return tables
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            book: [pool.submit(scan_text_file, text_file) for text_file in files]
+            for book, files in files_by_book.items()
+        }
+        for book, book_futures in futures.items():
+            table = TextTable()
+            try:
+                for future in book_futures:
+                    table.extend(future.result())
+                tables[book] = table
+            except BookLoadError as e:
+                tables[book] = e
+    return tables
+
+
+def summarize_table(table: TextTable) -> Dict[str, Any]:
+    """Single pass over the table: everything the hard-fail, warning and report rules need"""
+    missing_ids = dict(table.missing_ref_ids)
+    ref_errors: List[str] = []
+    empty_errors: List[str] = []
+    seen_refs: Set[Tuple[int, int]] = set()
+    seen_ids: Set[int] = set()
+    duplicate_ids: Set[int] = set()
+    chapters: Set[int] = set()
+    has_first = False
+    duplicates = empty = no_heading = short = missing_pages = total_length = 0
+
+    rows = zip(table.chapter, table.paragraph, table.text_length, table.stripped_length,
+               table.has_heading, table.pdf_page, table.text_id)
+    for row, (chapter, paragraph, length, stripped, heading, page, tid) in enumerate(rows):
+        if chapter == 1 and paragraph == 1:
+            has_first = True
 
-def validate_hard_fail(work: Dict[str, Any], texts: List[Dict[str, Any]]) -> Tuple[bool, List[str]]:
+        ref = (chapter, paragraph)
+        is_duplicate = ref in seen_refs
+        if is_duplicate:
+            duplicates += 1
+        seen_refs.add(ref)
+        if row in missing_ids:
+            ref_errors.append(f"CRITICAL: Text missing chapter/paragraph: textId={missing_ids[row]}")
+        elif is_duplicate:
+            ref_errors.append(f"CRITICAL: Duplicate paragraph found: Chapter {chapter}, Paragraph {paragraph}")
+
+        if not stripped:
+            empty += 1
+            empty_errors.append(
+                f"CRITICAL: Empty text field: Chapter {_show(chapter)}, "
+                f"Paragraph {_show(paragraph)}"
+            )
+        if length and stripped < 10:
+            short += 1
+
+        if tid in seen_ids:
+            duplicate_ids.add(tid)
+        seen_ids.add(tid)
+
+        if chapter != MISSING and chapter:
+            chapters.add(chapter)
+        if not heading:
+            no_heading += 1
+        if not page:
+            missing_pages += 1
+        total_length += length
+
+    return {
+        "paragraphs": len(table),
+        "hasFirst": has_first,
+        "refErrors": ref_errors,
+        "emptyErrors": empty_errors,
+        "duplicateTextIds": table.resolve_text_ids(duplicate_ids) if duplicate_ids else set(),
+        "chapters": sorted(chapters),
+        "duplicates": duplicates,
+        "emptyTexts": empty,
+        "noHeading": no_heading,
+        "short": short,
+        "missingPages": missing_pages,
+        "totalLength": total_length,
+    }
+
+
+def validate_hard_fail(work: Dict[str, Any], summary: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Critical validation rules (MUST pass)
 
@@ -75,85 +269,49 @@ def validate_hard_fail(work: Dict[str, Any], texts: List[Dict[str, Any]]) -> Tup
     errors = []
 
     # 1. First paragraph (Ch1:P1) must exist
-    has_first = any(
-        t.get("chapterNumber") == 1 and t.get("paragraphNumber") == 1 for t in texts
-    )
-    if not has_first:
+    if not summary["hasFirst"]:
         errors.append("CRITICAL: First paragraph (Chapter 1, Paragraph 1) not found")
 
     # 2. No duplicate (chapter, paragraph) tuples
-    seen_refs = set()
-    for text in texts:
-        chapter = text.get("chapterNumber")
-        paragraph = text.get("paragraphNumber")
-
-        if chapter is None or paragraph is None:
-            errors.append(
-                f"CRITICAL: Text missing chapter/paragraph: textId={text.get('textId')}"
-            )
-            continue
-
-        ref = (chapter, paragraph)
-        if ref in seen_refs:
-            errors.append(f"CRITICAL: Duplicate paragraph found: Chapter {chapter}, Paragraph {paragraph}")
-        seen_refs.add(ref)
+    errors.extend(summary["refErrors"])
 
     # 3. No empty text fields
-    for text in texts:
-        text_content = text.get("text", "").strip()
-        if not text_content:
-            errors.append(
-                f"CRITICAL: Empty text field: Chapter {text.get('chapterNumber')}, "
-                f"Paragraph {text.get('paragraphNumber')}"
-            )
+    errors.extend(summary["emptyErrors"])
 
     # 4. JSON integrity (already validated during load, but check text_id uniqueness)
-    text_ids = [t.get("textId") for t in texts]
-    if len(text_ids) != len(set(text_ids)):
-        duplicates = [tid for tid in text_ids if text_ids.count(tid) > 1]
-        errors.append(f"CRITICAL: Duplicate textId values found: {set(duplicates)}")
+    if summary["duplicateTextIds"]:
+        errors.append(f"CRITICAL: Duplicate textId values found: {summary['duplicateTextIds']}")
 
     return len(errors) == 0, errors
 
 
-def validate_warnings(work: Dict[str, Any], texts: List[Dict[str, Any]]) -> List[str]:
+def validate_warnings(work: Dict[str, Any], summary: Dict[str, Any]) -> List[str]:
     """
     Soft validation rules (log but don't fail)
 
     Returns: warnings
     """
     warnings = []
+    total = summary["paragraphs"]
 
     # 1. Missing headings (>50% paragraphs)
-    no_heading = sum(1 for t in texts if not t.get("heading"))
-    if no_heading > len(texts) * 0.5:
-        warnings.append(f"WARNING: {no_heading}/{len(texts)} paragraphs missing headings (>{50}%)")
+    if summary["noHeading"] > total * 0.5:
+        warnings.append(f"WARNING: {summary['noHeading']}/{total} paragraphs missing headings (>{50}%)")
 
     # 2. Very short paragraphs (<10 chars)
-    short_texts = [
-        t for t in texts if t.get("text") and len(t.get("text", "").strip()) < 10
-    ]
-    if short_texts:
-        warnings.append(
-            f"WARNING: {len(short_texts)} very short paragraphs (<10 chars)"
-        )
+    if summary["short"]:
+        warnings.append(f"WARNING: {summary['short']} very short paragraphs (<10 chars)")
 
     # 3. Missing page numbers in sourceMetadata
-    missing_pages = sum(
-        1
-        for t in texts
-        if not t.get("sourceMetadata", {}).get("pdfPage")
-    )
-    if missing_pages > 0:
+    if summary["missingPages"] > 0:
         warnings.append(
-            f"WARNING: {missing_pages}/{len(texts)} paragraphs missing pdfPage in sourceMetadata"
+            f"WARNING: {summary['missingPages']}/{total} paragraphs missing pdfPage in sourceMetadata"
         )
 
     # 4. Check chapter sequence (gaps)
-    chapters = sorted(set(t.get("chapterNumber") for t in texts if t.get("chapterNumber")))
+    chapters = summary["chapters"]
     if chapters:
-        expected = list(range(1, max(chapters) + 1))
-        missing_chapters = set(expected) - set(chapters)
+        missing_chapters = set(range(1, max(chapters) + 1)) - set(chapters)
         if missing_chapters:
             warnings.append(f"WARNING: Missing chapters: {sorted(missing_chapters)}")
 
@@ -166,9 +324,9 @@ def validate_warnings(work: Dict[str, Any], texts: List[Dict[str, Any]]) -> List
             f"WARNING: Work claims {work_total_chapters} chapters, but found {len(chapters)}"
         )
 
-    if len(texts) != work_total_paragraphs:
+    if total != work_total_paragraphs:
         warnings.append(
-            f"WARNING: Work claims {work_total_paragraphs} paragraphs, but found {len(texts)}"
+            f"WARNING: Work claims {work_total_paragraphs} paragraphs, but found {total}"
         )
 
     return warnings
@@ -176,29 +334,15 @@ def validate_warnings(work: Dict[str, Any], texts: List[Dict[str, Any]]) -> List
 
 def generate_validation_report(
     work: Dict[str, Any],
-    texts: List[Dict[str, Any]],
+    summary: Dict[str, Any],
     passed: bool,
     errors: List[str],
     warnings: List[str],
 ) -> Dict[str, Any]:
     """Generate comprehensive validation report"""
-    chapters = sorted(set(t.get("chapterNumber") for t in texts if t.get("chapterNumber")))
-
-    # Calculate average paragraph length
-    text_lengths = [len(t.get("text", "")) for t in texts]
-    avg_length = sum(text_lengths) / len(text_lengths) if text_lengths else 0
-
-    # Count duplicates
-    seen_refs = set()
-    duplicates = 0
-    for text in texts:
-        ref = (text.get("chapterNumber"), text.get("paragraphNumber"))
-        if ref in seen_refs:
-            duplicates += 1
-        seen_refs.add(ref)
-
-    # Count empty texts
-    empty_texts = sum(1 for t in texts if not t.get("text", "").strip())
+    chapters = summary["chapters"]
+    total = summary["paragraphs"]
+    avg_length = summary["totalLength"] / total if total else 0
 
     report = {
         "passed": passed,
@@ -207,16 +351,13 @@ def generate_validation_report(
         "warnings": warnings,
         "stats": {
             "chapters": len(chapters),
-            "paragraphs": len(texts),
+            "paragraphs": total,
             "avgParagraphLength": round(avg_length, 1),
-            "duplicates": duplicates,
-            "emptyTexts": empty_texts,
+            "duplicates": summary["duplicates"],
+            "emptyTexts": summary["emptyTexts"],
         },
         "contentChecks": {
-            "firstParagraphPresent": any(
-                t.get("chapterNumber") == 1 and t.get("paragraphNumber") == 1
-                for t in texts
-            ),
+            "firstParagraphPresent": summary["hasFirst"],
             "firstChapter": min(chapters) if chapters else 0,
             "lastChapter": max(chapters) if chapters else 0,
             "expectedChapters": work.get("totalChapters", 0),
@@ -229,39 +370,16 @@ def generate_validation_report(
     return report
 
 
-def main():
-    parser = argparse.ArgumentParser(description="Validate ministry text Strapi dump")
-    parser.add_argument("--dir", required=True, help="Ingest directory (contains work.json and texts/)")
-    args = parser.parse_args()
-
-    ingest_dir = Path(args.dir)
-
-    if not ingest_dir.exists():
-        print(f"❌ ERROR: Directory not found: {ingest_dir}")
-        sys.exit(1)
+def validate_book(ingest_dir: Path, work: Dict[str, Any], table: TextTable) -> Dict[str, Any]:
+    """Run every rule on one book's table, save and print its report"""
+    print(f"\n🔍 {ingest_dir}")
+    print(f"   Loaded: {work.get('title', 'Unknown')} ({len(table)} paragraphs)")
 
-    print("🔍 Validating ministry text dump...")
-    print(f"   Directory: {ingest_dir}")
-
-    # Load work and texts
-    work_path = ingest_dir / "work.json"
-    texts_dir = ingest_dir / "texts"
+    summary = summarize_table(table)
+    passed, errors = validate_hard_fail(work, summary)
+    warnings_list = validate_warnings(work, summary)
+    report = generate_validation_report(work, summary, passed, errors, warnings_list)
 
-    work = load_work(str(work_path))
-    texts = load_all_texts(str(texts_dir))
-
-    print(f"   Loaded: {work.get('title', 'Unknown')} ({len(texts)} paragraphs)")
-
-    # Run hard fail validation
-    passed, errors = validate_hard_fail(work, texts)
-
-    # Run warning validation
-    warnings_list = validate_warnings(work, texts)
-
-    # Generate report
-    report = generate_validation_report(work, texts, passed, errors, warnings_list)
-
-    # Save report
     report_path = ingest_dir / "validation-report.json"
     with open(report_path, "w", encoding="utf-8") as f:
         json.dump(report, f, ensure_ascii=False, indent=2)
@@ -292,10 +410,82 @@ def main():
         for warning in warnings_list:
             print(f"   {warning}")
 
+    return report
+
+
+def library_ingest_dirs(library_path: Path) -> List[Path]:
+    """Ingest directories of a run-library.py library file (<out>/ingest/v1)"""
+    with open(library_path, "r", encoding="utf-8") as f:
+        books = json.load(f).get("books", [])
+    return [Path(book["out"]) / "ingest" / "v1" for book in books]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate ministry text Strapi dump")
+    parser.add_argument("--dir", action="append", default=[],
+                        help="Ingest directory (contains work.json and texts/); repeatable")
+    parser.add_argument("--library", help="Library JSON (run-library.py format): validate every book")
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                        help="Processes parsing text chunks (default: min(4, CPUs))")
+    args = parser.parse_args()
+
+    ingest_dirs = [Path(d) for d in args.dir]
+    if args.library:
+        ingest_dirs.extend(library_ingest_dirs(Path(args.library)))
+    if not ingest_dirs:
+        parser.error("--dir or --library is required")
+
+    print("🔍 Validating ministry text dump...")
+
+    # Load work.json and list chunks per book; unreadable books are reported as failed
+    works: Dict[Path, Dict[str, Any]] = {}
+    files_by_book: Dict[Path, List[str]] = {}
+    results: Dict[Path, Any] = {}
+    for ingest_dir in ingest_dirs:
+        print(f"   Directory: {ingest_dir}")
+        if not ingest_dir.exists():
+            results[ingest_dir] = BookLoadError(f"Directory not found: {ingest_dir}")
+            continue
+        try:
+            works[ingest_dir] = load_work(str(ingest_dir / "work.json"))
+            files_by_book[ingest_dir] = text_files_for(ingest_dir)
+        except BookLoadError as e:
+            results[ingest_dir] = e
+
+    for ingest_dir, table in load_tables(files_by_book, args.workers).items():
+        if isinstance(table, BookLoadError):
+            results[ingest_dir] = table
+        else:
+            results[ingest_dir] = validate_book(ingest_dir, works[ingest_dir], table)
+
+    failed = 0
+    for ingest_dir in ingest_dirs:
+        result = results[ingest_dir]
+        if isinstance(result, BookLoadError):
+            print(f"\n❌ ERROR: {result}")
+            failed += 1
+        elif not result["passed"]:
+            failed += 1
+
+    if len(ingest_dirs) > 1:
+        print("\n" + "=" * 60)
+        print("LIBRARY SUMMARY")
+        print("=" * 60)
+        for ingest_dir in ingest_dirs:
+            result = results[ingest_dir]
+            if isinstance(result, BookLoadError):
+                print(f"❌ {ingest_dir}: {result}")
+            else:
+                stats = result["stats"]
+                print(f"{'✅' if result['passed'] else '❌'} {ingest_dir}: {stats['chapters']} chapters, "
+                      f"{stats['paragraphs']} paragraphs, {len(result['warnings'])} warning(s)")
+        print(f"Passed: {len(ingest_dirs) - failed}/{len(ingest_dirs)}")
+        print("=" * 60)
+
     print()
 
     # Exit with appropriate code
-    if passed:
+    if not failed:
         print("✅ Validation passed!")
         sys.exit(0)
     else:
@@ -1,43 +1,30 @@
 #!/usr/bin/env python3
-"""Debug script to analyze font sizes in the PDF"""
-import pdfplumber
-from collections import Counter
+"""Debug script to analyze font sizes in the PDF (reads the shared font profile)"""
+import sys
+from pathlib import Path
 
-pdf_path = "../../../scripts/scripture-extraction/input/yahscriptures.pdf"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "unified-extraction"))
+from font_profile import load_or_build_profile
 
-with pdfplumber.open(pdf_path) as pdf:
-    # Analyze a sample page (e.g., page 20 which should be in Genesis)
-    page = pdf.pages[20]
-    chars = page.chars
+pdf_path = sys.argv[1] if len(sys.argv) > 1 else "../../../scripts/scripture-extraction/input/yahscriptures.pdf"
 
-    # Collect all numeric text with their font sizes
-    number_fonts = {}
-    for char in chars:
-        text = char.get('text', '').strip()
-        if text.isdigit():
-            size = char.get('size', 0)
-            if text not in number_fonts:
-                number_fonts[text] = []
-            number_fonts[text].append(size)
+profile = load_or_build_profile(pdf_path)
 
-    # Average and display
-    print("=" * 60)
-    print(f"Font Size Analysis for Page 21 (Genesis)")
-    print("=" * 60)
-    for num in sorted(number_fonts.keys(), key=int):
-        sizes = number_fonts[num]
-        avg_size = sum(sizes) / len(sizes)
-        print(f"Digit '{num}': avg={avg_size:.1f}pt, count={len(sizes)}, all sizes={set([round(s, 1) for s in sizes])}")
+# Analyze a sample page (e.g., page 21 which should be in Genesis)
+print("=" * 60)
+print(f"Font Size Analysis for Page 21 (Genesis)")
+print("=" * 60)
+for size, count in sorted(profile.digit_histogram(21, 21).items(), key=lambda x: float(x[0])):
+    print(f"Digits at {size}pt: count={count}")
 
-    print("\n" + "=" * 60)
-    print("Overall font size distribution:")
-    print("=" * 60)
-    all_sizes = []
-    for char in chars:
-        text = char.get('text', '').strip()
-        if text.isdigit():
-            all_sizes.append(round(char.get('size', 0), 1))
+print("\n" + "=" * 60)
+print("Overall digit font size distribution:")
+print("=" * 60)
+for size, count in profile.digit_histogram().most_common(10):
+    print(f"{size}pt: {count} occurrences")
 
-    size_counts = Counter(all_sizes)
-    for size, count in sorted(size_counts.items(), key=lambda x: x[1], reverse=True)[:10]:
-        print(f"{size}pt: {count} occurrences")
+print(f"\nModal digit size: {profile.modal_digit_size():.1f}pt")
+print(f"Modal body size:  {profile.modal_body_size():.1f}pt")
+print("Heading size clusters:")
+for lo, hi, count in profile.heading_size_clusters():
+    print(f"  {lo:.1f}–{hi:.1f}pt: {count} chars")
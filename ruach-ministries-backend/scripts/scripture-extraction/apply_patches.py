@@ -38,7 +38,9 @@ import json
 import os
 import re
 from datetime import datetime
-from typing import Dict, List, Any, Set, Tuple
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
+
+PatchIndex = Dict[Tuple[str, int, int], List[Dict]]
 
 
 def slugify(s: str) -> str:
@@ -66,11 +68,25 @@ def read_jsonl(path: str):
             yield json.loads(line)
 
 
-def write_jsonl(path: str, rows: List[Dict[str, Any]]):
-    """Write JSONL file."""
-    with open(path, "w", encoding="utf-8") as f:
-        for row in rows:
-            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+def write_jsonl(path: str, rows: Iterable[Dict[str, Any]]) -> int:
+    """
+    Write JSONL file incrementally; returns the row count.
+
+    Rows are streamed to <path>.tmp and renamed into place only once complete, so a
+    failed run never leaves a truncated output behind.
+    """
+    tmp_path = path + ".tmp"
+    count = 0
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+                count += 1
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return count
 
 
 def append_jsonl(path: str, row: Dict[str, Any]):
@@ -79,6 +95,175 @@ def append_jsonl(path: str, row: Dict[str, Any]):
         f.write(json.dumps(row, ensure_ascii=False) + "\n")
 
 
+def build_patch_index(patches: List[Dict]) -> PatchIndex:
+    """Build patch lookup by (book, chapter, verse), skipping invalid patches."""
+    patches_by_ref: PatchIndex = {}
+    for patch in patches:
+        book = patch.get("book", "")
+        chapter = int(patch.get("chapter", 0))
+        verse = int(patch.get("verse", 0))
+
+        if not book or chapter == 0 or verse == 0:
+            print(f"⚠️  Invalid patch (skipping): {patch.get('id', 'unknown')}")
+            continue
+
+        key = (book, chapter, verse)
+        if key not in patches_by_ref:
+            patches_by_ref[key] = []
+        patches_by_ref[key].append(patch)
+    return patches_by_ref
+
+
+def patch_row(row: Dict[str, Any], patch_list: List[Dict], applied: List[Dict]) -> Optional[Dict[str, Any]]:
+    """Apply replace/delete patches to one row; returns None if the row is deleted."""
+    book = row.get("book", "")
+    chapter = int(row.get("chapter", 0))
+    verse = int(row.get("verse", 0))
+
+    for patch in patch_list:
+        patch_type = patch.get("type", "replace")
+
+        if patch_type == "replace":
+            # Replace verse text
+            old_text = row.get("text", "")
+            new_text = patch.get("text", "")
+
+            print(f"🔧 REPLACE: {book} {chapter}:{verse}")
+            print(f"   OLD: {old_text[:60]}...")
+            print(f"   NEW: {new_text[:60]}...")
+
+            row["text"] = new_text
+            applied.append(patch)
+
+        elif patch_type == "delete":
+            # Skip this verse (don't add to output)
+            print(f"🗑️  DELETE: {book} {chapter}:{verse}")
+            applied.append(patch)
+            return None
+
+        elif patch_type != "add":
+            print(f"⚠️  Unknown patch type '{patch_type}' for {book} {chapter}:{verse}")
+
+    return row
+
+
+def added_row(ref_key: Tuple[str, int, int], patch: Dict, book_num: int, testament: str) -> Dict[str, Any]:
+    """Build the verse row for an "add" patch."""
+    book, chapter, verse = ref_key
+    new_verse = {
+        "book_num": book_num,
+        "book": book,
+        "testament": testament,
+        "chapter": chapter,
+        "verse": verse,
+        "text": patch.get("text", ""),
+    }
+
+    print(f"➕ ADD: {book} {chapter}:{verse}")
+    print(f"   TEXT: {new_verse['text'][:60]}...")
+    return new_verse
+
+
+def iter_patched_rows(
+    rows: Iterable[Dict[str, Any]],
+    patches_by_ref: PatchIndex,
+    applied: List[Dict],
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream rows through the patch index.
+
+    Input rows must be in (book, chapter, verse) order, as exported. "add" patches are
+    merge-joined into that order: a book's pending adds are emitted before the first row
+    with a larger (chapter, verse), or after the book's last row. An "add" whose verse
+    already exists is skipped. Adds for books absent from the input come last
+    (book_num 0, testament "unknown").
+    """
+    pending_adds: Dict[str, List[Tuple[Tuple[str, int, int], Dict]]] = {}
+    for ref_key, patch_list in patches_by_ref.items():
+        for patch in patch_list:
+            if patch.get("type") == "add":
+                pending_adds.setdefault(ref_key[0], []).append((ref_key, patch))
+    for adds in pending_adds.values():
+        adds.sort(key=lambda item: (item[0][1], item[0][2]))
+
+    current_book: Optional[str] = None
+    last_ref: Tuple[int, int] = (0, 0)
+    finished_books: Set[str] = set()
+    book_num = 0
+    testament = "unknown"
+
+    def drain(book: str, upto: Optional[Tuple[int, int]]):
+        adds = pending_adds.get(book)
+        while adds and (upto is None or (adds[0][0][1], adds[0][0][2]) <= upto):
+            ref_key, patch = adds.pop(0)
+            if upto is not None and (ref_key[1], ref_key[2]) == upto:
+                continue  # Verse exists in source; "add" does not apply
+            applied.append(patch)
+            yield added_row(ref_key, patch, book_num, testament)
+
+    for row in rows:
+        # Preserve metadata row
+        if "_meta" in row:
+            yield row
+            continue
+
+        book = row.get("book", "")
+        chapter = int(row.get("chapter", 0))
+        verse = int(row.get("verse", 0))
+
+        # The merge-join relies on export order; fail loudly rather than misplace adds
+        if book != current_book:
+            if book in finished_books:
+                raise RuntimeError(f"Input not grouped by book: {book} {chapter}:{verse} after {current_book}")
+            if current_book is not None:
+                yield from drain(current_book, None)
+                finished_books.add(current_book)
+            current_book = book
+            book_num = row.get("book_num", 0)
+            testament = row.get("testament", "unknown")
+        elif (chapter, verse) < last_ref:
+            raise RuntimeError(f"Input not in chapter/verse order: {book} {chapter}:{verse}")
+        last_ref = (chapter, verse)
+
+        yield from drain(book, (chapter, verse))
+
+        patch_list = patches_by_ref.get((book, chapter, verse))
+        if patch_list:
+            row = patch_row(row, patch_list, applied)
+            if row is None:
+                continue
+        yield row
+
+    if current_book is not None:
+        yield from drain(current_book, None)
+
+    # Adds for books not present in the input
+    book_num, testament = 0, "unknown"
+    for book in list(pending_adds):
+        yield from drain(book, None)
+
+
+def log_applied_patches(log_path: str, applied_patches: List[Dict]):
+    """Append applied patches to the patch log (append-only audit trail)."""
+    log_dir = os.path.dirname(log_path)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+
+    for patch in applied_patches:
+        log_entry = {
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "patch_id": patch.get("id", "unknown"),
+            "type": patch.get("type", "unknown"),
+            "book": patch.get("book", ""),
+            "chapter": patch.get("chapter", 0),
+            "verse": patch.get("verse", 0),
+            "reason": patch.get("reason", ""),
+            "author": patch.get("author", ""),
+            "source": patch.get("source", ""),
+        }
+        append_jsonl(log_path, log_entry)
+
+
 def main():
     ap = argparse.ArgumentParser(description="Apply patches to JSONL export")
     ap.add_argument("--in", dest="inp", required=True, help="Input JSONL file")
@@ -112,153 +297,53 @@ def main():
     patches_data = load_json(args.patches)
     patches = patches_data.get("patches", [])
 
+    stats = {"input": 0, "output": 0}
+
+    def count_input(rows):
+        for row in rows:
+            if "_meta" not in row:
+                stats["input"] += 1
+            yield row
+
+    def count_output(rows):
+        for row in rows:
+            if "_meta" not in row:
+                stats["output"] += 1
+            yield row
+
     if not patches:
         print("⚠️  No patches defined, copying input to output unchanged")
         if not args.dry_run:
-            rows = list(read_jsonl(args.inp))
-            write_jsonl(args.out, rows)
+            write_jsonl(args.out, read_jsonl(args.inp))
         print("✅ Done (no patches applied)")
         raise SystemExit(0)
 
     print(f"🔧 Loaded {len(patches)} patch(es) from {args.patches}")
 
     # Build patch lookup by (book, chapter, verse)
-    patches_by_ref: Dict[Tuple[str, int, int], List[Dict]] = {}
-    for patch in patches:
-        book = patch.get("book", "")
-        chapter = int(patch.get("chapter", 0))
-        verse = int(patch.get("verse", 0))
-
-        if not book or chapter == 0 or verse == 0:
-            print(f"⚠️  Invalid patch (skipping): {patch.get('id', 'unknown')}")
-            continue
-
-        key = (book, chapter, verse)
-        if key not in patches_by_ref:
-            patches_by_ref[key] = []
-        patches_by_ref[key].append(patch)
-
-    # Track what we've seen and applied
-    seen_verses: Set[Tuple[str, int, int]] = set()
+    patches_by_ref = build_patch_index(patches)
     applied_patches: List[Dict] = []
-    output_rows: List[Dict[str, Any]] = []
 
-    # Read input JSONL
+    # Stream input → patches → output (constant memory)
     print(f"📖 Reading {args.inp}...")
+    rows = count_output(iter_patched_rows(count_input(read_jsonl(args.inp)), patches_by_ref, applied_patches))
 
-    meta_row = None
-    verse_count = 0
-
-    for row in read_jsonl(args.inp):
-        # Preserve metadata row
-        if "_meta" in row:
-            meta_row = row
-            output_rows.append(row)
-            continue
-
-        book = row.get("book", "")
-        chapter = int(row.get("chapter", 0))
-        verse = int(row.get("verse", 0))
-
-        verse_key = (book, chapter, verse)
-        seen_verses.add(verse_key)
-
-        # Check if this verse has a patch
-        if verse_key in patches_by_ref:
-            for patch in patches_by_ref[verse_key]:
-                patch_type = patch.get("type", "replace")
-
-                if patch_type == "replace":
-                    # Replace verse text
-                    old_text = row.get("text", "")
-                    new_text = patch.get("text", "")
-
-                    print(f"🔧 REPLACE: {book} {chapter}:{verse}")
-                    print(f"   OLD: {old_text[:60]}...")
-                    print(f"   NEW: {new_text[:60]}...")
-
-                    row["text"] = new_text
-                    applied_patches.append(patch)
-
-                elif patch_type == "delete":
-                    # Skip this verse (don't add to output)
-                    print(f"🗑️  DELETE: {book} {chapter}:{verse}")
-                    applied_patches.append(patch)
-                    continue  # Skip adding to output
-
-                else:
-                    print(f"⚠️  Unknown patch type '{patch_type}' for {book} {chapter}:{verse}")
-
-        output_rows.append(row)
-        verse_count += 1
-
-    # Handle "add" patches (verses that don't exist in source)
-    add_patches = []
-    for ref_key, patch_list in patches_by_ref.items():
-        for patch in patch_list:
-            if patch.get("type") == "add" and ref_key not in seen_verses:
-                add_patches.append((ref_key, patch))
-
-    if add_patches:
-        print(f"\n➕ Adding {len(add_patches)} missing verse(s)...")
-
-        for ref_key, patch in add_patches:
-            book, chapter, verse = ref_key
-
-            # Find book_num from existing verses (or use 0)
-            book_num = 0
-            testament = "unknown"
-            for row in output_rows:
-                if "_meta" in row:
-                    continue
-                if row.get("book") == book:
-                    book_num = row.get("book_num", 0)
-                    testament = row.get("testament", "unknown")
-                    break
-
-            new_verse = {
-                "book_num": book_num,
-                "book": book,
-                "testament": testament,
-                "chapter": chapter,
-                "verse": verse,
-                "text": patch.get("text", ""),
-            }
-
-            print(f"➕ ADD: {book} {chapter}:{verse}")
-            print(f"   TEXT: {new_verse['text'][:60]}...")
-
-            output_rows.append(new_verse)
-            applied_patches.append(patch)
-            verse_count += 1
+    if not args.dry_run:
+        print(f"📝 Writing patched output to {args.out}...")
+        written = write_jsonl(args.out, rows)
+    else:
+        written = sum(1 for _ in rows)
 
     # Summary
-    print(f"\n✅ Processed {verse_count} verses")
+    print(f"\n✅ Processed {stats['input']} verses")
     print(f"🔧 Applied {len(applied_patches)} patch(es)")
 
-    # Write output
     if not args.dry_run:
-        print(f"\n📝 Writing patched output to {args.out}...")
-        write_jsonl(args.out, output_rows)
-        print(f"✅ Wrote {len(output_rows)} rows")
+        print(f"✅ Wrote {written} rows")
 
         # Write patch log (append-only audit trail)
         print(f"\n📋 Logging patches to {args.log}...")
-        os.makedirs(os.path.dirname(args.log), exist_ok=True)
-
-        for patch in applied_patches:
-            log_entry = {
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "patch_id": patch.get("id", "unknown"),
-                "type": patch.get("type", "unknown"),
-                "book": patch.get("book", ""),
-                "chapter": patch.get("chapter", 0),
-                "verse": patch.get("verse", 0),
-                "reason": patch.get("reason", ""),
-                "author": patch.get("author", ""),
-                "source": patch.get("source", ""),
-            }
-            append_jsonl(args.log, log_entry)
+        log_applied_patches(args.log, applied_patches)
 
         print(f"✅ Logged {len(applied_patches)} patch(es)")
 
@@ -268,9 +353,9 @@ def main():
     print("\n" + "="*60)
     print("PATCH SUMMARY")
     print("="*60)
-    print(f"Input verses:     {verse_count}")
+    print(f"Input verses:     {stats['input']}")
     print(f"Patches applied:  {len(applied_patches)}")
-    print(f"Output verses:    {len(output_rows) - (1 if meta_row else 0)}")
+    print(f"Output verses:    {stats['output']}")
     print("="*60)
 
     if not args.dry_run:
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Direct .bbli (SQLite) -> Strapi pipeline, in one streaming pass.
+
+Runs the same stages as run_pipeline.sh without intermediate files:
+
+  export-bbli.py        Bible rows, read from the cursor in fetchmany() batches
+  apply_patches.py      patches looked up by (book, chapter, verse); "add" patches
+                        merge-joined in key order
+  jsonl_to_strapi.py    verse chunk files written as each chunk fills
+  validate_strapi_dump  duplicates / Genesis 2:25 / empty text checked per verse
+
+Each row is touched once; memory holds one chunk plus the validation key set.
+Output is the usual ingest directory (works.json, verses/verses.NNNN.json,
+meta.json, validation-report.json) and/or a SQLite staging DB (--staging).
+The individual scripts remain usable as stages.
+
+Usage:
+  python scripts/scripture-extraction/bbli_to_strapi.py \
+    --bbli scripture-pipeline/sources/yah/YSpc1.04.bbli \
+    --patches scripture-pipeline/patches/yah/v1/patches.json \
+    --log scripture-pipeline/patches/yah/v1/patch-log.jsonl \
+    --out scripture-pipeline/ingest/yah/v1 \
+    --canonical scripts/scripture-extraction/canonical-structure.json
+
+Exit codes:
+  0 = Pipeline complete, validation passed
+  1 = Validation failed (or input missing)
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from apply_patches import build_patch_index, iter_patched_rows, load_json, log_applied_patches
+from jsonl_to_strapi import StrapiDumpWriter, print_summary
+from validate_strapi_dump import DumpValidator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "unified-extraction"))
+from export_bbli import iter_export_records, read_details  # noqa: E402
+
+
+class StagingWriter:
+    """
+    SQLite staging DB for the Strapi payloads (works, verses, meta).
+
+    Verses are inserted in executemany() batches inside one transaction; the DB is
+    built at <path>.tmp and renamed into place on close().
+    """
+
+    def __init__(self, path: str, batch_size: int = 2000):
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.batch_size = max(1, batch_size)
+        self.batch: List[tuple] = []
+
+        if os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+        staging_dir = os.path.dirname(path)
+        if staging_dir:
+            os.makedirs(staging_dir, exist_ok=True)
+
+        self.conn = sqlite3.connect(self.tmp_path)
+        self.conn.executescript(
+            """
+            PRAGMA journal_mode = OFF;
+            PRAGMA synchronous = OFF;
+            CREATE TABLE works (
+                slug TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                "order" INTEGER NOT NULL,
+                canon TEXT NOT NULL,
+                testament TEXT NOT NULL,
+                source_version TEXT NOT NULL
+            );
+            CREATE TABLE verses (
+                work_slug TEXT NOT NULL,
+                chapter INTEGER NOT NULL,
+                verse INTEGER NOT NULL,
+                reference TEXT NOT NULL,
+                text TEXT NOT NULL,
+                testament TEXT NOT NULL,
+                source_version TEXT NOT NULL,
+                PRIMARY KEY (work_slug, chapter, verse)
+            );
+            CREATE TABLE meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+
+    def add_verse(self, v: Dict[str, Any]):
+        self.batch.append((
+            v["workSlug"], v["chapter"], v["verse"], v["reference"],
+            v["text"], v["testament"], v["sourceVersion"],
+        ))
+        if len(self.batch) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self.batch:
+            # Duplicates are reported by validation; the staging DB keeps the last row
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO verses VALUES (?, ?, ?, ?, ?, ?, ?)", self.batch
+            )
+            self.batch = []
+
+    def close(self, works: List[Dict[str, Any]], meta: Dict[str, Dict[str, Any]]):
+        self._flush()
+        self.conn.executemany(
+            "INSERT INTO works VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (w["slug"], w["title"], w["order"], w["canon"], w["testament"], w["sourceVersion"])
+                for w in works
+            ],
+        )
+        self.conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [(key, json.dumps(value, ensure_ascii=False)) for key, value in meta.items()],
+        )
+        self.conn.commit()
+        self.conn.close()
+        os.replace(self.tmp_path, self.path)
+        print(f"🗄️  Wrote staging DB to {self.path}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Stream .bbli (SQLite) straight to Strapi-ready output")
+    ap.add_argument("--bbli", required=True, help="Path to .bbli (SQLite) file")
+    ap.add_argument("--patches", help="Patches JSON file (patches.json, optional)")
+    ap.add_argument("--log", help="Patch log file (append-only JSONL; required with --patches)")
+    ap.add_argument("--out", help="Output directory (works.json, verses/, meta.json)")
+    ap.add_argument("--staging", help="SQLite staging DB to write instead of / as well as --out")
+    ap.add_argument("--chunk", type=int, default=2000, help="Verses per chunk file (default: 2000)")
+    ap.add_argument("--batch", type=int, default=1000, help="Rows per cursor fetch (default: 1000)")
+    ap.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                    help="Threads writing chunk files (default: min(4, CPUs))")
+    ap.add_argument("--clean", action="store_true", help="Strip HTML tags (keeps line breaks)")
+    ap.add_argument("--canonical", help="canonical-structure.json (optional)")
+    ap.add_argument("--strict", action="store_true", help="Fail on validation warnings")
+    args = ap.parse_args()
+
+    if not args.out and not args.staging:
+        ap.error("at least one of --out / --staging is required")
+    if args.patches and not args.log:
+        ap.error("--log is required with --patches")
+
+    if not os.path.exists(args.bbli):
+        print(f"❌ File not found: {args.bbli}")
+        raise SystemExit(1)
+
+    # Patches
+    patches_by_ref = {}
+    if args.patches:
+        if not os.path.exists(args.patches):
+            print(f"❌ Patches file not found: {args.patches}")
+            raise SystemExit(1)
+        patches = load_json(args.patches).get("patches", [])
+        patches_by_ref = build_patch_index(patches)
+        print(f"🔧 Loaded {len(patches)} patch(es) from {args.patches}")
+
+    # Read-only: the source .bbli is immutable
+    conn = sqlite3.connect(f"file:{os.path.abspath(args.bbli)}?mode=ro", uri=True)
+    details = read_details(conn)
+    print(f"📖 Streaming {details['title']} ({details['abbreviation']} {details['version']})...")
+
+    writer = StrapiDumpWriter(args.out, args.chunk, input_label=args.bbli, workers=args.workers)
+    staging = StagingWriter(args.staging, args.chunk) if args.staging else None
+    validator = DumpValidator()
+    applied_patches: List[Dict] = []
+
+    rows = iter_export_records(conn, clean=args.clean, batch_size=args.batch)
+    for row_no, row in enumerate(iter_patched_rows(rows, patches_by_ref, applied_patches), start=1):
+        payload = writer.add_row(row_no, row)
+        validator.add(payload)
+        if staging is not None:
+            staging.add_verse(payload)
+    conn.close()
+
+    meta = writer.close()
+    meta["source"] = details
+    meta["patches_applied"] = len(applied_patches)
+    works = writer.works()
+    print_summary(meta)
+
+    if args.patches:
+        print(f"\n📋 Logging {len(applied_patches)} applied patch(es) to {args.log}...")
+        log_applied_patches(args.log, applied_patches)
+
+    report_dir = args.out or os.path.dirname(os.path.abspath(args.staging))
+    exit_code = validator.finish(works, report_dir, args.canonical, args.strict)
+
+    if staging is not None:
+        report_path = os.path.join(report_dir, "validation-report.json")
+        staging.close(works, {"meta": meta, "validation": load_json(report_path)})
+
+    raise SystemExit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,43 +1,30 @@
 #!/usr/bin/env python3
-"""Debug font sizes to understand chapter vs verse markers"""
+"""Debug font sizes to understand chapter vs verse markers (reads the shared font profile)"""
 
-import pdfplumber
-from collections import defaultdict
+import sys
+from pathlib import Path
 
-pdf_path = "../../../scripts/scripture-extraction/input/yahscriptures.pdf"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "unified-extraction"))
+from font_profile import load_or_build_profile
 
-with pdfplumber.open(pdf_path) as pdf:
-    # Check pages 10-50 (Genesis range)
-    for page_num in range(10, 50, 10):  # Pages 10, 20, 30, 40
-        page = pdf.pages[page_num]
-        chars = page.chars
+pdf_path = sys.argv[1] if len(sys.argv) > 1 else "../../../scripts/scripture-extraction/input/yahscriptures.pdf"
 
-        # Collect all standalone numbers with their font sizes
-        number_sizes = defaultdict(list)
+profile = load_or_build_profile(pdf_path)
+threshold = profile.modal_digit_size()
 
-        for char in chars:
-            text = char.get('text', '').strip()
-            if text.isdigit():
-                size = char.get('size', 0)
-                number_sizes[text].append(size)
+# Check pages 11-41 (Genesis range)
+for page_num in range(11, 51, 10):  # Pages 11, 21, 31, 41
+    digit_sizes = profile.digit_histogram(page_num, page_num)
 
-        # Average the sizes
-        avg_sizes = {num: sum(sizes)/len(sizes) for num, sizes in number_sizes.items() if sizes}
+    print(f"\n{'='*60}")
+    print(f"PAGE {page_num}")
+    print(f"{'='*60}")
+    print(f"Digit font sizes (largest first):")
+    for size, count in sorted(digit_sizes.items(), key=lambda x: float(x[0]), reverse=True)[:20]:
+        marker = "  ← chapter" if float(size) > threshold else ""
+        print(f"  {size:>6s}pt: {count:4d} digits{marker}")
 
-        # Sort by size to see distribution
-        sorted_nums = sorted(avg_sizes.items(), key=lambda x: x[1], reverse=True)
-
-        print(f"\n{'='*60}")
-        print(f"PAGE {page_num + 1}")
-        print(f"{'='*60}")
-        print(f"Numbers sorted by font size:")
-        for num, size in sorted_nums[:20]:  # Top 20
-            print(f"  {num:>3s}: {size:6.2f}pt")
-
-        if avg_sizes:
-            all_sizes = list(avg_sizes.values())
-            median = sorted(all_sizes)[len(all_sizes)//2]
-            threshold = median * 1.3
-            print(f"\nMedian size: {median:.2f}pt")
-            print(f"Chapter threshold (1.3x): {threshold:.2f}pt")
-            print(f"Numbers >= threshold: {[num for num, size in avg_sizes.items() if size >= threshold]}")
+print(f"\nDocument modal digit size: {threshold:.2f}pt")
+print(f"Chapter threshold: >{threshold:.2f}pt")
+if profile.book_overrides:
+    print(f"Per-book overrides: {profile.book_overrides}")
@@ -11,6 +11,17 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from collections import defaultdict
 
+# Shared canonical-structure sequence constraints
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "unified-extraction"))
+from sequence_assembly import BookSequenceTracker, CanonicalExpectations, print_book_report  # noqa: E402
+
+# Inline verse segmentation
+VERSE_NUMBER_RE = re.compile(r'\b(\d{1,3})\b')
+MAX_VERSE = 200
+MAX_VERSE_GAP = 5        # Largest jump between consecutive kept verse numbers
+MAX_FIRST_VERSE = 3      # A chapter's first kept marker must be one of 1..3
+GAP_PENALTY = 0.75       # Score lost per skipped verse number
+
 try:
     import pdfplumber
 except ImportError:
@@ -18,6 +29,89 @@ except ImportError:
     sys.exit(1)
 
 
+def segment_inline_verses(chapter_text: str, max_verse: int = MAX_VERSE) -> List[Tuple[int, int, int]]:
+    """Split a chapter's text at inline verse numbers.
+
+    YahScriptures format: verse numbers appear inline, like:
+    "And Elohim said, Let the earth bring forth 24 the living creature..."
+
+    Every isolated 1-3 digit number is a candidate (one finditer over the chapter), but
+    only the best monotonic verse sequence is kept, so numbers inside verse text
+    ("...lived 130 years...") are not treated as markers. Dynamic programming over
+    candidates in text order: best[v] is the best-scoring chain ending at a marker with
+    value v; a marker v extends a chain ending at u when v - MAX_VERSE_GAP <= u < v,
+    scoring +1 minus GAP_PENALTY per skipped verse.
+
+    Args:
+        chapter_text: The chapter's lines joined with spaces
+        max_verse: Highest verse number to consider (the chapter's known last verse)
+
+    Returns:
+        [(verse_num, start, end)] offsets into chapter_text (marker excluded). When the
+        first kept marker is 2, leading text becomes verse 1 (the chapter number doubles
+        as verse 1 in this layout).
+    """
+    candidates = [
+        (int(m.group(1)), m.start(), m.end())
+        for m in VERSE_NUMBER_RE.finditer(chapter_text)
+    ]
+    candidates = [c for c in candidates if 1 <= c[0] <= max_verse]
+    if not candidates:
+        return []
+
+    # best[v] = (score, candidate index); back[i] = predecessor candidate index
+    best: Dict[int, Tuple[float, int]] = {}
+    back: List[int] = [-1] * len(candidates)
+    score_at: List[float] = [float("-inf")] * len(candidates)
+
+    for i, (value, _, _) in enumerate(candidates):
+        score = float("-inf")
+        prev = -1
+        if value <= MAX_FIRST_VERSE:
+            score = 1.0 - GAP_PENALTY * (value - 1)
+        for u in range(max(1, value - MAX_VERSE_GAP), value):
+            entry = best.get(u)
+            if entry is None:
+                continue
+            extended = entry[0] + 1.0 - GAP_PENALTY * (value - u - 1)
+            if extended > score:
+                score, prev = extended, entry[1]
+        if score == float("-inf"):
+            continue
+        score_at[i] = score
+        back[i] = prev
+        current = best.get(value)
+        if current is None or score > current[0]:
+            best[value] = (score, i)
+
+    # Best chain end: highest score, then the later verse number
+    end_idx = max(
+        (i for i in range(len(candidates)) if score_at[i] != float("-inf")),
+        key=lambda i: (score_at[i], candidates[i][0]),
+        default=-1,
+    )
+    if end_idx < 0:
+        return []
+
+    chain: List[int] = []
+    i = end_idx
+    while i >= 0:
+        chain.append(i)
+        i = back[i]
+    chain.reverse()
+
+    spans: List[Tuple[int, int, int]] = []
+    first_value, first_start, _ = candidates[chain[0]]
+    if first_value == 2 and chapter_text[:first_start].strip():
+        spans.append((1, 0, first_start))
+
+    for pos, idx in enumerate(chain):
+        value, _, marker_end = candidates[idx]
+        span_end = candidates[chain[pos + 1]][1] if pos + 1 < len(chain) else len(chapter_text)
+        spans.append((value, marker_end, span_end))
+    return spans
+
+
 class YahScripturesExtractor:
     """
     Extracts and parses YahScriptures PDF content.
@@ -45,9 +139,13 @@ class YahScripturesExtractor:
         self.current_book: Optional[str] = None
         self.current_chapter: int = 0
 
-        # Buffer for accumulating text between verse numbers
-        self.text_buffer = []
-        self.pending_verse = None
+        # Lines of the current chapter; segmented into verses when the chapter ends
+        self.chapter_lines: List[str] = []
+
+        # Canonical chapter/verse expectations, applied as chapters are segmented
+        self.expectations = CanonicalExpectations.load()
+        self.tracker: Optional[BookSequenceTracker] = None
+        self.sequence_reports: List[Dict] = []
 
     def extract(self) -> Tuple[List[Dict], Dict[str, Dict]]:
         """Main extraction method."""
@@ -69,8 +167,9 @@ class YahScripturesExtractor:
             print(f"   Parsing extracted text...")
             self._parse_full_text(full_text)
 
-            # Flush any remaining buffered verse
-            self._flush_verse()
+            # Segment the final chapter
+            self._flush_chapter()
+            self._finish_book()
 
         print(f"\n✅ Extraction complete!")
         print(f"   Books found: {len(self.works)}")
@@ -89,15 +188,19 @@ class YahScripturesExtractor:
 
             # Check for book headers
             book_match = self._detect_book_header(line)
+            if book_match and book_match == self.current_book:
+                continue  # Running head / TOC echo of the current book
             if book_match:
-                # Flush previous verse before switching books
-                self._flush_verse()
+                # Segment the previous chapter before switching books
+                self._flush_chapter()
+                self._finish_book()
 
                 self.current_book = book_match
                 self.current_chapter = 1  # Start at chapter 1
 
                 if book_match not in self.works:
                     self._register_work(book_match)
+                self._start_book(book_match)
 
                 print(f"   Found book: {book_match}")
                 continue
@@ -109,55 +212,61 @@ class YahScripturesExtractor:
             # Check for chapter number on its own line (like "37" for chapter 37)
             if re.match(r'^\d{1,3}$', line):
                 potential_chapter = int(line)
-                if potential_chapter > self.current_chapter and potential_chapter < 200:
+                # Forward and within the book's known chapter count
+                if self.tracker.accepts_chapter(potential_chapter):
                     # Likely a new chapter marker
-                    self._flush_verse()
+                    self._flush_chapter()
+                    self.tracker.start_chapter(potential_chapter)
                     self.current_chapter = potential_chapter
                     continue
 
-            # Extract verse numbers from the line
-            self._extract_verses_from_line(line)
+            self.chapter_lines.append(line)
 
-    def _extract_verses_from_line(self, line: str):
-        """Extract verse numbers and text from a line.
+    def _flush_chapter(self):
+        """Segment the buffered chapter into verses and save them.
 
-        YahScriptures format: verse numbers appear inline, like:
-        "And Elohim said, Let the earth bring forth 24 the living creature..."
+        Verse numbers the sequence tracker rejects stay in the previous verse's text.
         """
-        # Pattern: isolated number (not part of a word) that could be a verse
-        verse_pattern = r'\b(\d{1,3})\b'
-
-        parts = re.split(verse_pattern, line)
-
-        for i, part in enumerate(parts):
-            if not part.strip():
-                continue
-
-            # Check if this part is a number (potential verse number)
-            if re.match(r'^\d{1,3}$', part.strip()):
-                verse_num = int(part.strip())
-
-                # If we have a pending verse, save it
-                if self.pending_verse is not None:
-                    self._flush_verse()
-
-                # Start new verse
-                self.pending_verse = verse_num
-                self.text_buffer = []
-            else:
-                # This is text content
-                self.text_buffer.append(part.strip())
-
-    def _flush_verse(self):
-        """Save the buffered verse."""
-        if self.pending_verse is not None and self.text_buffer and self.current_book:
-            verse_text = " ".join(self.text_buffer).strip()
-
-            if verse_text:  # Only save if there's actual text
-                self._add_verse(self.pending_verse, verse_text)
-
-            self.pending_verse = None
-            self.text_buffer = []
+        if self.chapter_lines and self.current_book:
+            chapter_text = " ".join(self.chapter_lines)
+            max_verse = self.tracker.verse_count() or MAX_VERSE
+            pending: Optional[Tuple[int, int, str]] = None  # (chapter, verse, text)
+
+            for verse_num, start, end in segment_inline_verses(chapter_text, max_verse):
+                verse_text = chapter_text[start:end].strip()
+                placement = self.tracker.place_verse(verse_num)
+                if placement is None:
+                    if pending is not None:
+                        pending = (pending[0], pending[1], f"{pending[2]} {verse_num} {verse_text}".strip())
+                    continue
+                if pending is not None:
+                    self._save_placed_verse(*pending)
+                pending = (placement[0], placement[1], verse_text)
+
+            if pending is not None:
+                self._save_placed_verse(*pending)
+        self.chapter_lines = []
+
+    def _save_placed_verse(self, chapter: int, verse_num: int, verse_text: str):
+        """Save a verse at its tracker placement (rollovers can advance the chapter)."""
+        self.current_chapter = chapter
+        if verse_text:  # Only save if there's actual text
+            self._add_verse(verse_num, verse_text)
+
+    def _start_book(self, book_name: str):
+        """Start sequence tracking for a book (YahScriptures books open at chapter 1)."""
+        meta = self.BOOK_MAPPING.get(book_name, {})
+        self.tracker = BookSequenceTracker(meta.get("shortCode", book_name), self.expectations)
+        self.tracker.start_chapter(1)
+
+    def _finish_book(self):
+        """Record and print the sequence report for the current book."""
+        if self.tracker is None:
+            return
+        report = self.tracker.finish()
+        self.sequence_reports.append(report)
+        print_book_report(report)
+        self.tracker = None
 
     def _detect_book_header(self, line: str) -> Optional[str]:
         """Detect if line is a book header."""
@@ -241,6 +350,12 @@ class YahScripturesExtractor:
                 json.dump(chunk, f, ensure_ascii=False, indent=2)
             print(f"💾 Saved verses chunk {chunk_num} to: {verses_file}")
 
+        # Save per-book sequence report (coverage / confidence vs canonical structure)
+        report_file = output_dir / "sequence-report.json"
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(self.sequence_reports, f, ensure_ascii=False, indent=2)
+        print(f"💾 Saved sequence report to: {report_file}")
+
 
 def main():
     if len(sys.argv) < 2:
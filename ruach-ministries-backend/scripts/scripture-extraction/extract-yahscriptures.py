@@ -7,6 +7,8 @@ Extracts verses from YahScriptures PDF and converts to JSON format for Strapi im
 import json
 import re
 import sys
+from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -16,6 +18,124 @@ except ImportError:
     print("ERROR: pdfplumber not installed. Run: pip install pdfplumber")
     sys.exit(1)
 
+# Shared font profile (document-wide size histograms, cached by source hash)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "unified-extraction"))
+from font_profile import FontProfile, load_or_build_profile  # noqa: E402
+from sequence_assembly import BookSequenceTracker, CanonicalExpectations, print_book_report  # noqa: E402
+
+
+# Char-stream tokenizer tolerances (pdfplumber's extract_text defaults)
+LINE_Y_TOLERANCE = 3.0  # chars whose tops are within this distance share a line
+WORD_X_TOLERANCE = 3.0  # horizontal gap that becomes a space
+
+_by_top_x0 = itemgetter(0, 1)
+_by_x0 = itemgetter(1)
+
+
+@dataclass
+class NumberToken:
+    """Digit run from the char stream, typed by font size"""
+    text: str
+    value: int
+    size: float
+    top: float
+    kind: str  # "chapter" (larger than modal digit size) | "verse"
+
+
+@dataclass
+class PageLine:
+    """Line reconstructed from the char stream, with its numeric tokens"""
+    text: str
+    top: float
+    numbers: List[NumberToken] = field(default_factory=list)
+
+    @property
+    def standalone_number(self) -> Optional[NumberToken]:
+        """The number token when the whole line is a single number (chapter/verse marker)."""
+        if len(self.numbers) == 1 and self.numbers[0].text == self.text:
+            return self.numbers[0]
+        return None
+
+
+def _flush_number(digits: List[Tuple[str, float]], top: float, chapter_threshold: float,
+                  numbers: List[NumberToken]):
+    text = "".join(d for d, _ in digits)
+    sizes = [sz for _, sz in digits if sz > 0]
+    size = sum(sizes) / len(sizes) if sizes else 0.0
+    numbers.append(NumberToken(
+        text=text,
+        value=int(text),
+        size=size,
+        top=top,
+        kind="chapter" if size > chapter_threshold else "verse",
+    ))
+
+
+def tokenize_page_chars(chars: List[Dict], chapter_threshold: float) -> List[PageLine]:
+    """
+    Single pass over one sorted char stream → lines + typed numeric tokens.
+
+    Replaces page.extract_text() plus a second sort of page.chars: line text and digit-run
+    font sizes come from the same chars, so the two views can never disagree.
+    """
+    keyed = [
+        (float(c.get('top', 0.0)), float(c.get('x0', 0.0)), c)
+        for c in chars
+    ]
+    keyed.sort(key=_by_top_x0)
+
+    lines: List[PageLine] = []
+    start = 0
+    n = len(keyed)
+    while start < n:
+        anchor = keyed[start][0]
+        end = start + 1
+        while end < n and keyed[end][0] - anchor <= LINE_Y_TOLERANCE:
+            end += 1
+
+        line_chars = keyed[start:end]
+        line_chars.sort(key=_by_x0)
+
+        parts: List[str] = []
+        numbers: List[NumberToken] = []
+        digits: List[Tuple[str, float]] = []
+        prev_x1: Optional[float] = None
+        pending_space = False
+
+        for _, x0, c in line_chars:
+            ch = c.get('text', '')
+            if not ch or ch.isspace():
+                pending_space = True
+                continue
+            if prev_x1 is not None and x0 - prev_x1 > WORD_X_TOLERANCE:
+                pending_space = True
+            if pending_space and parts:
+                parts.append(' ')
+                if digits:
+                    _flush_number(digits, anchor, chapter_threshold, numbers)
+                    digits = []
+            pending_space = False
+
+            # ASCII only: str.isdigit() also accepts superscripts ('¹') that int() rejects.
+            if ch in "0123456789":
+                digits.append((ch, float(c.get('size', 0.0) or 0.0)))
+            elif digits:
+                _flush_number(digits, anchor, chapter_threshold, numbers)
+                digits = []
+
+            parts.append(ch)
+            prev_x1 = float(c.get('x1', x0) or x0)
+
+        if digits:
+            _flush_number(digits, anchor, chapter_threshold, numbers)
+
+        text = ''.join(parts).strip()
+        if text:
+            lines.append(PageLine(text=text, top=anchor, numbers=numbers))
+        start = end
+
+    return lines
+
 
 class YahScripturesExtractor:
     """
@@ -159,37 +279,22 @@ class YahScripturesExtractor:
         self.current_book: Optional[str] = None
         self.current_chapter: int = 0
         self.common_font_size: Optional[float] = None
+        self.font_profile: Optional[FontProfile] = None
 
-    def _calculate_common_font_size(self, pdf) -> float:
-        """Sample pages to find the most common font size for numbers (verse markers)."""
-        from collections import Counter
-
-        all_sizes = []
-        # Sample every 10th page for first 200 pages to get a good distribution
-        sample_pages = range(10, min(200, len(pdf.pages)), 10)
-
-        print(f"📏 Analyzing font sizes across {len(list(sample_pages))} sample pages...")
-
-        for page_num in sample_pages:
-            page = pdf.pages[page_num]
-            chars = page.chars
+        # Canonical chapter/verse expectations, applied as markers are assembled
+        self.expectations = CanonicalExpectations.load()
+        self.tracker: Optional[BookSequenceTracker] = None
+        self.sequence_reports: List[Dict] = []
 
-            for char in chars:
-                text = char.get('text', '').strip()
-                if text.isdigit():
-                    size = char.get('size', 0)
-                    if size > 0:
-                        all_sizes.append(round(size, 1))  # Round to 0.1pt precision
-
-        if not all_sizes:
-            return 10.5  # Fallback
-
-        # Find the most common size
-        size_counts = Counter(all_sizes)
-        common_size = size_counts.most_common(1)[0][0]
+    def _calculate_common_font_size(self) -> float:
+        """Most common digit font size (verse markers) from the full-document font profile."""
+        self.font_profile = load_or_build_profile(str(self.pdf_path))
+        common_size = self.font_profile.modal_digit_size(default=10.5)
 
         print(f"   Most common number font size: {common_size}pt")
         print(f"   Chapter threshold: >{common_size}pt")
+        if self.font_profile.book_overrides:
+            print(f"   Per-book overrides: {sorted(self.font_profile.book_overrides)}")
 
         return common_size
 
@@ -205,7 +310,7 @@ class YahScripturesExtractor:
             print(f"📄 Total pages: {total_pages}")
 
             # First, determine the common font size for verse numbers
-            self.common_font_size = self._calculate_common_font_size(pdf)
+            self.common_font_size = self._calculate_common_font_size()
 
             for page_num, page in enumerate(pdf.pages, 1):
                 if page_num % 50 == 0:
@@ -213,6 +318,8 @@ class YahScripturesExtractor:
 
                 self._parse_page(page)
 
+        self._finish_book()
+
         print(f"\n✅ Extraction complete!")
         print(f"   Books found: {len(self.works)}")
         print(f"   Verses extracted: {len(self.verses)}")
@@ -220,93 +327,29 @@ class YahScripturesExtractor:
         return self.verses, self.works
 
     def _parse_page(self, page):
-        """Parse a single page using character-level data to detect font sizes.
+        """Parse a single page from one sorted char stream.
 
         Large numbers = Chapter markers
         Small numbers = Verse markers
         """
-        # Extract text normally for book detection
-        text = page.extract_text()
-        if not text:
-            return
+        # Use the common font size as threshold - anything larger is a chapter marker
+        # (a bookOverrides entry in the font profile wins for the current book)
+        chapter_threshold = self.common_font_size if self.common_font_size else 10.5
+        if self.font_profile is not None and self.current_book:
+            chapter_threshold = self.font_profile.chapter_threshold(self.current_book, default=chapter_threshold)
 
-        lines = text.split('\n')
+        lines = tokenize_page_chars(page.chars, chapter_threshold)
+        if not lines:
+            return
 
         # Get page dimensions for header/footer exclusion
         page_height = page.height
 
-        # Get character-level data grouped by position
-        chars = page.chars
-
-        # Group consecutive digit characters into numbers with their collective font size
-        # Key: (text_content, y0_position) -> average font size of those chars
-        number_font_map = {}
-
-        # Sort chars by position (top to bottom, left to right)
-        sorted_chars = sorted(chars, key=lambda c: (round(-c.get('y0', 0), 0), round(c.get('x0', 0), 0)))
-
-        current_number = []
-        current_number_sizes = []
-        last_y = None
-        last_x = None
-
-        for char in sorted_chars:
-            char_text = char.get('text', '').strip()
-            x = char.get('x0', 0)
-            y = char.get('y0', 0)
-            size = char.get('size', 0)
-
-            if not char_text.isdigit():
-                # Save accumulated number if any
-                if current_number and current_number_sizes:
-                    num_text = ''.join(current_number)
-                    avg_size = sum(current_number_sizes) / len(current_number_sizes)
-                    number_font_map[(num_text, round(last_y, 1))] = avg_size
-                current_number = []
-                current_number_sizes = []
-                last_y = None
-                last_x = None
-                continue
-
-            # Check if this digit is part of the current number (same line, consecutive x position)
-            is_continuation = (
-                last_y is not None and
-                abs(y - last_y) < 2 and  # Same horizontal line
-                last_x is not None and
-                x - last_x < 20  # Reasonable horizontal spacing for same number
-            )
-
-            if not is_continuation and current_number:
-                # Save previous number
-                num_text = ''.join(current_number)
-                avg_size = sum(current_number_sizes) / len(current_number_sizes)
-                number_font_map[(num_text, round(last_y, 1))] = avg_size
-                current_number = []
-                current_number_sizes = []
-
-            # Add to current number
-            current_number.append(char_text)
-            current_number_sizes.append(size)
-            last_y = y
-            last_x = x + char.get('width', 0)
-
-        # Save last number if any
-        if current_number and current_number_sizes:
-            num_text = ''.join(current_number)
-            avg_size = sum(current_number_sizes) / len(current_number_sizes)
-            number_font_map[(num_text, round(last_y, 1))] = avg_size
-
-        # Use the common font size as threshold - anything larger is a chapter marker
-        chapter_threshold = self.common_font_size if self.common_font_size else 10.5
-
         verse_buffer = []
         current_verse_num = None
-        chapter_digit_buffer = []  # Accumulate consecutive large-font digits for multi-digit chapters
 
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
+        for page_line in lines:
+            line = page_line.text
 
             # Check for book headers
             book_match = self._detect_book_header(line)
@@ -318,10 +361,12 @@ class YahScripturesExtractor:
                     if current_verse_num and verse_buffer and self.current_book:
                         self._save_verse(current_verse_num, verse_buffer)
 
+                    self._finish_book()
                     self.current_book = book_match
                     self.current_chapter = 0  # Will be set to 1 when first verse 1 is found
                     if book_match not in self.works:
                         self._register_work(book_match)
+                    self._start_book(book_match)
 
                     verse_buffer = []
                     current_verse_num = None
@@ -334,6 +379,10 @@ class YahScripturesExtractor:
             # Check for explicit chapter markers (e.g., "Chapter 1", "Chapter 2", etc.)
             chapter_match = re.match(r'^(?:Chapter|CHAPTER)\s+(\d+)$', line, re.IGNORECASE)
             if chapter_match:
+                # Chapter markers that go backwards or past the book's last chapter are ignored
+                if not self.tracker.start_chapter(int(chapter_match.group(1))):
+                    continue
+
                 # Save any buffered verse before switching chapters
                 if current_verse_num and verse_buffer:
                     self._save_verse(current_verse_num, verse_buffer)
@@ -344,39 +393,32 @@ class YahScripturesExtractor:
                 continue
 
             # Check if line is a standalone number (one or more digits)
-            if re.match(r'^\d+$', line):
-                num = int(line)
-
-                # Find this number in our font map
-                # Try to match by number text and look through all y-positions
-                font_size = 0
-                y_pos = page_height / 2  # Default to middle if not found
-
-                for (num_text, num_y), num_font in number_font_map.items():
-                    if num_text == line:
-                        font_size = num_font
-                        y_pos = num_y
-                        break
-
-                # If not found in map, skip (might be reconstructed text)
-                if font_size == 0:
+            token = page_line.standalone_number
+            if token is not None:
+                # No size information for these chars - treat as text
+                if token.size == 0:
                     verse_buffer.append(line)
                     continue
 
-                # Check if number is in header/footer region (exclude top/bottom 12% of page)
-                in_header = y_pos < page_height * 0.12
-                in_footer = y_pos > page_height * 0.88
+                # Check if number is in header/footer region (exclude top/bottom 12% of page).
+                # Tokens carry pdfplumber's `top` (measured from the page top). The old lookup
+                # used `y0` (measured from the bottom), so its "header" test actually caught the
+                # footer and vice versa; their union (the band excluded) is unchanged, up to
+                # the glyph height between a char's top and its baseline.
+                in_header = token.top < page_height * 0.12
+                in_footer = token.top > page_height * 0.88
                 in_header_footer = in_header or in_footer
 
-                is_large = font_size > chapter_threshold
-
-                if is_large and not in_header_footer:
+                if token.kind == "chapter" and not in_header_footer:
                     # This is a CHAPTER marker (large font number not in header/footer)
+                    if not self.tracker.start_chapter(token.value):
+                        continue
+
                     # Save any buffered verse before switching chapters
                     if current_verse_num and verse_buffer:
                         self._save_verse(current_verse_num, verse_buffer)
 
-                    self.current_chapter = num
+                    self.current_chapter = token.value
                     current_verse_num = None
                     verse_buffer = []
                 else:
@@ -385,18 +427,22 @@ class YahScripturesExtractor:
                     if in_header_footer:
                         continue
 
+                    # Out-of-sequence numbers stay part of the current verse
+                    # (chapter 1 is assumed if no chapter is set yet; verse 1 at a
+                    # chapter's known last verse rolls over to the next chapter)
+                    placement = self.tracker.place_verse(token.value)
+                    if placement is None:
+                        verse_buffer.append(line)
+                        continue
+
                     # Save previous verse
                     if current_verse_num and verse_buffer:
                         self._save_verse(current_verse_num, verse_buffer)
 
                     # Start new verse
-                    current_verse_num = num
+                    self.current_chapter, current_verse_num = placement
                     verse_buffer = []
 
-                    # If no chapter set yet, assume chapter 1
-                    if self.current_chapter == 0:
-                        self.current_chapter = 1
-
                 continue
 
             # This is content text - add to buffer
@@ -415,6 +461,20 @@ class YahScripturesExtractor:
         if verse_text:
             self._add_verse(verse_num, verse_text)
 
+    def _start_book(self, book_name: str):
+        """Start sequence tracking for a book."""
+        meta = self.BOOK_MAPPING.get(book_name, {})
+        self.tracker = BookSequenceTracker(meta.get("shortCode", book_name), self.expectations)
+
+    def _finish_book(self):
+        """Record and print the sequence report for the current book."""
+        if self.tracker is None:
+            return
+        report = self.tracker.finish()
+        self.sequence_reports.append(report)
+        print_book_report(report)
+        self.tracker = None
+
     def _detect_book_header(self, line: str) -> Optional[str]:
         """Detect if line is a book header."""
         for book_name in self.BOOK_MAPPING.keys():
@@ -499,6 +559,12 @@ class YahScripturesExtractor:
                 json.dump(chunk, f, ensure_ascii=False, indent=2)
             print(f"💾 Saved verses chunk {chunk_num} to: {verses_file}")
 
+        # Save per-book sequence report (coverage / confidence vs canonical structure)
+        report_file = output_dir / "sequence-report.json"
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(self.sequence_reports, f, ensure_ascii=False, indent=2)
+        print(f"💾 Saved sequence report to: {report_file}")
+
 
 def main():
     if len(sys.argv) < 2:
@@ -17,11 +17,15 @@ Outputs:
   - out/verses/verses.0001.json ...     (chunked verse batches)
   - out/meta.json                       (counts + validation stats)
 
+Chunk files are serialized and written on a thread pool (--workers) while rows are
+still being read, using orjson when it is installed (stdlib json otherwise; both emit
+the same compact JSON). Every file is written to a .tmp sibling and renamed into place.
+
 Usage:
   python scripts/scripture-extraction/jsonl_to_strapi.py \
     --in scripture-pipeline/exports/yah/v1/yahscriptures-full.jsonl \
     --out scripture-pipeline/ingest/yah/v1 \
-    --chunk 2000
+    --chunk 2000 [--workers 4] [--benchmark]
 """
 
 from __future__ import annotations
@@ -29,11 +33,46 @@ import argparse
 import json
 import os
 import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Any
-from collections import defaultdict
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
+from collections import defaultdict, deque
+
+try:
+    import orjson
+except ImportError:  # optional fast encoder
+    orjson = None
+
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def dumps_bytes(data: Any) -> bytes:
+    """Compact UTF-8 JSON (orjson if available)."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
 
+def loads(line: str) -> Any:
+    return orjson.loads(line) if orjson is not None else json.loads(line)
 
+
+def write_bytes_atomic(path: str, payload: bytes):
+    """Buffered write to <path>.tmp, then rename into place."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
+def write_json_file(path: str, data: Any):
+    """Serialize and atomically write one JSON file (thread-pool task)."""
+    write_bytes_atomic(path, dumps_bytes(data))
+
+
+@lru_cache(maxsize=None)
 def slugify(s: str) -> str:
     """Convert book name to URL-safe slug."""
     s = s.strip().lower()
@@ -51,7 +90,7 @@ def read_jsonl(path: str):
             if not line:
                 continue
             try:
-                obj = json.loads(line)
+                obj = loads(line)
                 # Skip metadata lines (first line has _meta key)
                 if "_meta" in obj:
                     continue
@@ -90,37 +129,61 @@ def infer_canon(testament: str, book_title: str) -> str:
     return "canonical"
 
 
-def main():
-    ap = argparse.ArgumentParser(description="Convert JSONL to Strapi-ready JSON")
-    ap.add_argument("--in", dest="inp", required=True, help="Input JSONL file")
-    ap.add_argument("--out", dest="out", required=True, help="Output directory")
-    ap.add_argument("--chunk", dest="chunk", type=int, default=2000,
-                    help="Verses per chunk file (default: 2000)")
-    args = ap.parse_args()
+def work_payload(w: Work) -> Dict[str, Any]:
+    """works.json entry for a work."""
+    return {
+        "slug": w.key,
+        "title": w.title,
+        "order": w.order,
+        "canon": w.canon,
+        "testament": w.testament,
+        "sourceVersion": "YAH_Scriptures",
+    }
 
-    # Create output directories
-    os.makedirs(args.out, exist_ok=True)
-    verses_dir = os.path.join(args.out, "verses")
-    os.makedirs(verses_dir, exist_ok=True)
 
-    works_by_slug: Dict[str, Work] = {}
-    verse_rows: List[Dict[str, Any]] = []
+class StrapiDumpWriter:
+    """
+    Streaming JSONL-row → Strapi dump writer.
 
-    # Track stats
-    total_verses = 0
-    first_ref = None
-    last_ref = None
+    Rows are converted one at a time; each verse chunk file is written as soon as it
+    fills, so only one chunk is held in memory. works.json and meta.json are written
+    by close(). With out_dir=None nothing is written (stats and works only).
+    """
 
-    # Track duplicates and missing verses
-    seen_refs = set()
-    duplicate_count = 0
+    def __init__(self, out_dir: Optional[str], chunk_size: int = 2000, input_label: str = "",
+                 workers: int = 1):
+        self.out_dir = out_dir
+        self.chunk_size = max(1, chunk_size)
+        self.input_label = input_label
 
-    # Testament counts
-    testament_counts = defaultdict(int)
+        # Chunk serialization/writes run on a pool; at most 2×workers chunks in flight
+        self.workers = max(1, workers)
+        self.pool = ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 and out_dir else None
+        self.pending: deque = deque()
 
-    print("📖 Processing JSONL...")
+        # Create output directories
+        if out_dir is not None:
+            self.verses_dir = os.path.join(out_dir, "verses")
+            os.makedirs(self.verses_dir, exist_ok=True)
 
-    for line_no, row in read_jsonl(args.inp):
+        self.works_by_slug: Dict[str, Work] = {}
+        self.chunk: List[Dict[str, Any]] = []
+        self.chunk_count = 0
+
+        # Track stats
+        self.total_verses = 0
+        self.first_ref = None
+        self.last_ref = None
+
+        # Track duplicates and missing verses
+        self.seen_refs = set()
+        self.duplicate_count = 0
+
+        # Testament counts
+        self.testament_counts = defaultdict(int)
+
+    def add_row(self, line_no: int, row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert one export row; returns the Strapi verse payload."""
         # Extract fields from JSONL
         book_num = int(row.get("book_num", 0))
         book = str(row.get("book", "")).strip()
@@ -141,8 +204,8 @@ def main():
         wslug = slugify(book)
 
         # Register work if first time seeing it
-        if wslug not in works_by_slug:
-            works_by_slug[wslug] = Work(
+        if wslug not in self.works_by_slug:
+            self.works_by_slug[wslug] = Work(
                 key=wslug,
                 title=book,
                 order=book_num,
@@ -153,18 +216,18 @@ def main():
 
         # Check for duplicates
         ref_key = (wslug, chapter, verse)
-        if ref_key in seen_refs:
-            duplicate_count += 1
+        if ref_key in self.seen_refs:
+            self.duplicate_count += 1
             print(f"⚠️  Duplicate found: {book} {chapter}:{verse}")
         else:
-            seen_refs.add(ref_key)
+            self.seen_refs.add(ref_key)
 
         # Track testament counts
-        testament_counts[testament] += 1
+        self.testament_counts[testament] += 1
 
         # Create Strapi-ready verse payload
         reference = f"{book} {chapter}:{verse}"
-        verse_rows.append({
+        payload = {
             "workSlug": wslug,
             "book": book,
             "chapter": chapter,
@@ -173,88 +236,133 @@ def main():
             "text": text,
             "testament": testament,
             "sourceVersion": "YAH_Scriptures",
-        })
-
-        total_verses += 1
-
-        if first_ref is None:
-            first_ref = reference
-        last_ref = reference
-
-    print(f"✅ Processed {total_verses} verses from {len(works_by_slug)} books")
-
-    # Write works.json (sorted by book_num/order)
-    works_out = [
-        {
-            "slug": w.key,
-            "title": w.title,
-            "order": w.order,
-            "canon": w.canon,
-            "testament": w.testament,
-            "sourceVersion": "YAH_Scriptures",
         }
-        for w in sorted(works_by_slug.values(), key=lambda x: x.order)
-    ]
-
-    works_path = os.path.join(args.out, "works.json")
-    with open(works_path, "w", encoding="utf-8") as f:
-        json.dump(works_out, f, ensure_ascii=False, indent=2)
-
-    print(f"📚 Wrote {len(works_out)} works to {works_path}")
-
-    # Chunk verses into separate files
-    chunk_size = max(1, args.chunk)
-    chunk_count = 0
-
-    for i in range(0, len(verse_rows), chunk_size):
-        chunk_count += 1
-        chunk_data = verse_rows[i : i + chunk_size]
-        chunk_file = os.path.join(verses_dir, f"verses.{chunk_count:04d}.json")
-
-        with open(chunk_file, "w", encoding="utf-8") as f:
-            json.dump(chunk_data, f, ensure_ascii=False)
-
-    print(f"📝 Wrote {chunk_count} verse chunk files ({chunk_size} verses/chunk)")
-
-    # Write metadata
-    meta = {
-        "input": args.inp,
-        "output": args.out,
-        "works_total": len(works_out),
-        "verses_total": total_verses,
-        "verses_unique": len(seen_refs),
-        "duplicates_detected": duplicate_count,
-        "chunks_created": chunk_count,
-        "chunk_size": chunk_size,
-        "testament_counts": dict(testament_counts),
-        "first_reference": first_ref,
-        "last_reference": last_ref,
-    }
+        self.chunk.append(payload)
+        if len(self.chunk) >= self.chunk_size:
+            self._write_chunk()
+
+        self.total_verses += 1
+
+        if self.first_ref is None:
+            self.first_ref = reference
+        self.last_ref = reference
+        return payload
+
+    def _write_chunk(self):
+        if not self.chunk:
+            return
+        self.chunk_count += 1
+        if self.out_dir is None:
+            self.chunk = []
+            return
+        chunk_file = os.path.join(self.verses_dir, f"verses.{self.chunk_count:04d}.json")
+        if self.pool is None:
+            write_json_file(chunk_file, self.chunk)
+        else:
+            while len(self.pending) >= 2 * self.workers:
+                self.pending.popleft().result()
+            self.pending.append(self.pool.submit(write_json_file, chunk_file, self.chunk))
+        self.chunk = []
+
+    def _drain(self):
+        """Wait for in-flight chunk writes (re-raises the first failure)."""
+        while self.pending:
+            future: Future = self.pending.popleft()
+            future.result()
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def works(self) -> List[Dict[str, Any]]:
+        """works.json payload (sorted by book_num/order)."""
+        return [work_payload(w) for w in sorted(self.works_by_slug.values(), key=lambda x: x.order)]
+
+    def close(self) -> Dict[str, Any]:
+        """Flush the last chunk, write works.json and meta.json; returns the meta dict."""
+        self._write_chunk()
+        self._drain()
+        print(f"✅ Processed {self.total_verses} verses from {len(self.works_by_slug)} books")
+
+        works_out = self.works()
+        if self.out_dir is not None:
+            works_path = os.path.join(self.out_dir, "works.json")
+            write_bytes_atomic(works_path, json.dumps(works_out, ensure_ascii=False, indent=2).encode("utf-8"))
+
+            print(f"📚 Wrote {len(works_out)} works to {works_path}")
+            print(f"📝 Wrote {self.chunk_count} verse chunk files ({self.chunk_size} verses/chunk)")
+
+        # Write metadata
+        meta = {
+            "input": self.input_label,
+            "output": self.out_dir,
+            "works_total": len(works_out),
+            "verses_total": self.total_verses,
+            "verses_unique": len(self.seen_refs),
+            "duplicates_detected": self.duplicate_count,
+            "chunks_created": self.chunk_count,
+            "chunk_size": self.chunk_size,
+            "testament_counts": dict(self.testament_counts),
+            "first_reference": self.first_ref,
+            "last_reference": self.last_ref,
+        }
+
+        if self.out_dir is not None:
+            meta_path = os.path.join(self.out_dir, "meta.json")
+            write_bytes_atomic(meta_path, json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8"))
 
-    meta_path = os.path.join(args.out, "meta.json")
-    with open(meta_path, "w", encoding="utf-8") as f:
-        json.dump(meta, f, ensure_ascii=False, indent=2)
+            print(f"📊 Wrote metadata to {meta_path}")
+        return meta
 
-    print(f"📊 Wrote metadata to {meta_path}")
 
-    # Print summary
+def print_summary(meta: Dict[str, Any]):
+    """Print the conversion summary."""
     print("\n" + "="*60)
     print("CONVERSION SUMMARY")
     print("="*60)
-    print(f"Works:           {len(works_out)}")
-    print(f"Verses (total):  {total_verses}")
-    print(f"Verses (unique): {len(seen_refs)}")
-    print(f"Duplicates:      {duplicate_count}")
-    print(f"Chunks:          {chunk_count}")
+    print(f"Works:           {meta['works_total']}")
+    print(f"Verses (total):  {meta['verses_total']}")
+    print(f"Verses (unique): {meta['verses_unique']}")
+    print(f"Duplicates:      {meta['duplicates_detected']}")
+    print(f"Chunks:          {meta['chunks_created']}")
     print(f"\nTestament breakdown:")
-    for testament, count in sorted(testament_counts.items()):
+    for testament, count in sorted(meta["testament_counts"].items()):
         print(f"  {testament:12} {count:>6} verses")
     print("="*60)
 
-    if duplicate_count > 0:
-        print(f"\n⚠️  WARNING: {duplicate_count} duplicate verses detected")
+    if meta["duplicates_detected"] > 0:
+        print(f"\n⚠️  WARNING: {meta['duplicates_detected']} duplicate verses detected")
         print("   These will be filtered during validation.")
 
 
+def main():
+    ap = argparse.ArgumentParser(description="Convert JSONL to Strapi-ready JSON")
+    ap.add_argument("--in", dest="inp", required=True, help="Input JSONL file")
+    ap.add_argument("--out", dest="out", required=True, help="Output directory")
+    ap.add_argument("--chunk", dest="chunk", type=int, default=2000,
+                    help="Verses per chunk file (default: 2000)")
+    ap.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1),
+                    help="Threads serializing/writing chunk files (default: min(4, CPUs))")
+    ap.add_argument("--benchmark", action="store_true",
+                    help="Report conversion throughput (rows/s)")
+    args = ap.parse_args()
+
+    started = time.perf_counter()
+    writer = StrapiDumpWriter(args.out, args.chunk, input_label=args.inp, workers=args.workers)
+
+    print(f"📖 Processing JSONL (encoder: {'orjson' if orjson is not None else 'json'}, "
+          f"workers: {writer.workers})...")
+
+    for line_no, row in read_jsonl(args.inp):
+        writer.add_row(line_no, row)
+
+    meta = writer.close()
+    elapsed = time.perf_counter() - started
+    print_summary(meta)
+
+    if args.benchmark:
+        rate = meta["verses_total"] / elapsed if elapsed > 0 else 0.0
+        print(f"\n⏱️  {meta['verses_total']} rows in {elapsed:.2f}s → {rate:,.0f} rows/s")
+
+
 if __name__ == "__main__":
     main()
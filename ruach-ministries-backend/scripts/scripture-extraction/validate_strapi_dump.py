@@ -8,10 +8,17 @@ Checks:
 - Optional: Compare counts against canonical-structure.json
 - Optional: Check for empty verse text
 
+--compact mode (large / multi-translation dumps): chunk files are streamed with ijson
+when it is installed (json.load per chunk otherwise), each verse key is packed into one
+int (work index, chapter, verse) in a sorted array, and only the first few duplicate /
+empty references are kept. Chunk files are scanned in parallel (--workers) and the
+per-file results merged; duplicates across files are found by merging the sorted keys.
+
 Usage:
   python scripts/scripture-extraction/validate_strapi_dump.py \
     --dir scripture-pipeline/ingest/yah/v1 \
-    --canonical scripts/scripture-extraction/canonical-structure.json
+    --canonical scripts/scripture-extraction/canonical-structure.json \
+    [--compact] [--workers 4]
 
 Exit codes:
   0 = All validation passed
@@ -20,12 +27,25 @@ Exit codes:
 
 from __future__ import annotations
 import argparse
+import heapq
 import json
 import os
 import glob
 import re
+from array import array
 from collections import defaultdict
-from typing import Dict, List, Tuple, Set
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Set
+
+try:
+    import ijson
+except ImportError:  # optional incremental parser
+    ijson = None
+
+# Packed verse key: work index | chapter (12 bits) | verse (12 bits)
+CHAPTER_BITS = 12
+VERSE_BITS = 12
+SAMPLE_LIMIT = 10
 
 
 def load_json(path: str):
@@ -39,6 +59,409 @@ def norm(s: str) -> str:
     return re.sub(r"\s+", " ", s.strip().lower())
 
 
+GENESIS_TITLES = ("genesis", "bereshith", "berĕshith")
+
+
+def is_genesis(slug: str, title: str) -> bool:
+    """Whether a work is Genesis (by slug or normalized title)."""
+    return "genesis" in slug or norm(title) in GENESIS_TITLES
+
+
+class DumpValidator:
+    """
+    Incremental dump validation.
+
+    Verses are checked one at a time via add(), so the same checks run over chunk
+    files (this script) or over payloads as they are produced (bbli_to_strapi.py).
+    Without a work list, testament and Genesis detection fall back to the payload's
+    own "testament" / "book" fields.
+    """
+
+    def __init__(self, works: Optional[List[Dict]] = None):
+        # Build work lookup
+        self.testament_by_slug = {w["slug"]: w.get("testament", "unknown") for w in works or []}
+        self.genesis_slugs = {w["slug"] for w in works or [] if is_genesis(w["slug"], w["title"])}
+
+        # Validation tracking
+        self.seen_refs: Set[Tuple[str, int, int]] = set()
+        self.duplicates: List[str] = []
+        self.verse_counts = defaultdict(int)
+        self.empty_verses: List[str] = []
+
+        # Critical check: Genesis 2:25
+        self.genesis_225_found = False
+
+        # Testament totals
+        self.testament_totals = defaultdict(int)
+        self.total_verses = 0
+
+    @property
+    def unique_count(self) -> int:
+        return len(self.seen_refs)
+
+    @property
+    def duplicate_count(self) -> int:
+        return len(self.duplicates)
+
+    @property
+    def empty_count(self) -> int:
+        return len(self.empty_verses)
+
+    def _testament(self, work_slug: str, v: Dict) -> str:
+        if self.testament_by_slug:
+            return self.testament_by_slug.get(work_slug, "unknown")
+        return v.get("testament", "unknown")
+
+    def _is_genesis(self, work_slug: str, v: Dict) -> bool:
+        if self.genesis_slugs:
+            return work_slug in self.genesis_slugs
+        return is_genesis(work_slug, str(v.get("book", "")))
+
+    def add(self, v: Dict):
+        """Check one verse payload."""
+        work_slug = v.get("workSlug", "")
+        chapter = int(v.get("chapter", 0))
+        verse = int(v.get("verse", 0))
+        text = str(v.get("text", "")).strip()
+        reference = v.get("reference", f"{work_slug} {chapter}:{verse}")
+
+        # Check for duplicates
+        ref_key = (work_slug, chapter, verse)
+        if ref_key in self.seen_refs:
+            self.duplicates.append(reference)
+        else:
+            self.seen_refs.add(ref_key)
+
+        # Count verses per work
+        self.verse_counts[work_slug] += 1
+
+        # Track testament totals
+        self.testament_totals[self._testament(work_slug, v)] += 1
+
+        # Check for empty verse text
+        if not text:
+            self.empty_verses.append(reference)
+
+        # Critical check: Genesis 2:25
+        if chapter == 2 and verse == 25 and text and self._is_genesis(work_slug, v):
+            self.genesis_225_found = True
+
+        self.total_verses += 1
+
+    def finish(self, works: List[Dict], out_dir: str, canonical: Optional[str] = None,
+               strict: bool = False) -> int:
+        """Report issues, write validation-report.json, and return the exit code."""
+        title_by_slug = {w["slug"]: w["title"] for w in works}
+        unique_count = self.unique_count
+        duplicates = self.duplicates
+        duplicate_count = self.duplicate_count
+        verse_counts = self.verse_counts
+        empty_verses = self.empty_verses
+        empty_count = self.empty_count
+        genesis_225_found = self.genesis_225_found
+        testament_totals = self.testament_totals
+        total_verses = self.total_verses
+
+        print(f"✅ Processed {total_verses} total verses")
+        print(f"✅ Found {unique_count} unique verses")
+        # Report issues
+        issues: List[str] = []
+        warnings: List[str] = []
+
+        # Critical: Duplicates
+        if duplicate_count:
+            issues.append(f"Duplicates detected: {duplicate_count}")
+            print(f"\n❌ CRITICAL: {duplicate_count} duplicate verses found:")
+            for dup in duplicates[:10]:  # Show first 10
+                print(f"   - {dup}")
+            if duplicate_count > 10:
+                print(f"   ... and {duplicate_count - 10} more")
+
+        # Critical: Genesis 2:25
+        if not genesis_225_found:
+            issues.append("Missing Genesis 2:25 (critical)")
+            print("\n❌ CRITICAL: Genesis 2:25 not found or empty")
+            print("   This is a known source anomaly that must be patched")
+
+        # Warning: Empty verses
+        if empty_count:
+            warnings.append(f"Empty verse text: {empty_count}")
+            print(f"\n⚠️  WARNING: {empty_count} verses with empty text:")
+            for ref in empty_verses[:10]:
+                print(f"   - {ref}")
+            if empty_count > 10:
+                print(f"   ... and {empty_count - 10} more")
+
+        # Optional: Canonical structure validation
+        canonical_mismatches: List[Tuple[str, int, int]] = []
+        if canonical and os.path.exists(canonical):
+            print(f"\n📋 Validating against {canonical}...")
+
+            try:
+                canon = load_json(canonical)
+                canon_books = canon.get("books", [])
+
+                for book in canon_books:
+                    slug = book.get("slug", "")
+                    chapters = book.get("chapters", {})
+
+                    # Calculate expected verse count
+                    expected = sum(int(v) for v in chapters.values())
+                    actual = verse_counts.get(slug, 0)
+
+                    if actual != expected:
+                        canonical_mismatches.append((slug, expected, actual))
+
+                if canonical_mismatches:
+                    warnings.append(
+                        f"Canonical structure mismatches: {len(canonical_mismatches)}"
+                    )
+                    print(f"\n⚠️  WARNING: {len(canonical_mismatches)} books differ from canonical structure:")
+                    for slug, exp, act in canonical_mismatches[:10]:
+                        title = title_by_slug.get(slug, slug)
+                        diff = act - exp
+                        sign = "+" if diff > 0 else ""
+                        print(f"   - {title:30} expected {exp:>5}, got {act:>5} ({sign}{diff})")
+                    if len(canonical_mismatches) > 10:
+                        print(f"   ... and {len(canonical_mismatches) - 10} more")
+
+            except Exception as e:
+                print(f"⚠️  Could not validate canonical structure: {e}")
+
+        # Print summary
+        print("\n" + "="*60)
+        print("VALIDATION SUMMARY")
+        print("="*60)
+        print(f"Works:              {len(works)}")
+        print(f"Verses (total):     {total_verses}")
+        print(f"Verses (unique):    {unique_count}")
+        print(f"Duplicates:         {duplicate_count}")
+        print(f"Empty verses:       {empty_count}")
+        print(f"Genesis 2:25:       {'✅ FOUND' if genesis_225_found else '❌ MISSING'}")
+
+        print(f"\nTestament breakdown:")
+        for testament, count in sorted(testament_totals.items()):
+            print(f"  {testament:12} {count:>6} verses")
+
+        if canonical_mismatches:
+            print(f"\nCanonical mismatches: {len(canonical_mismatches)}")
+
+        print("="*60)
+
+        # Build report
+        report = {
+            "works": len(works),
+            "verses_total": total_verses,
+            "verses_unique": unique_count,
+            "duplicates": duplicate_count,
+            "empty_verses": empty_count,
+            "genesis_2_25_present": genesis_225_found,
+            "canonical_mismatches": len(canonical_mismatches),
+            "testament_totals": dict(testament_totals),
+            "issues": issues,
+            "warnings": warnings,
+        }
+
+        # Write validation report
+        report_path = os.path.join(out_dir, "validation-report.json")
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        print(f"\n📊 Validation report written to {report_path}")
+
+        # Exit with appropriate code
+        if issues:
+            print(f"\n❌ VALIDATION FAILED: {len(issues)} critical issue(s)")
+            for issue in issues:
+                print(f"   - {issue}")
+            return 1
+
+        if warnings and strict:
+            print(f"\n⚠️  VALIDATION FAILED (strict mode): {len(warnings)} warning(s)")
+            for warning in warnings:
+                print(f"   - {warning}")
+            return 1
+
+        if warnings:
+            print(f"\n⚠️  {len(warnings)} warning(s) found, but validation passed")
+            print("   Use --strict to fail on warnings")
+
+        print("\n✅ VALIDATION PASSED")
+        return 0
+
+
+class CompactDumpValidator(DumpValidator):
+    """
+    Memory-bounded variant of DumpValidator.
+
+    Verse keys are packed ints (see pack_key) appended to an array and sorted in
+    result(); duplicate / empty references keep only SAMPLE_LIMIT samples plus counts.
+    One instance scans a chunk file (scan_chunk_file); the parent instance merge()s the
+    per-file results and finds duplicates by merging the sorted key runs in finish().
+    """
+
+    def __init__(self, works: Optional[List[Dict]] = None):
+        super().__init__(works)
+        self.slugs: List[str] = [w["slug"] for w in works or []]
+        self.slug_index = {slug: i for i, slug in enumerate(self.slugs)}
+        self.title_by_slug = {w["slug"]: w["title"] for w in works or []}
+        self.keys = array("q")
+        self.runs: List[array] = []
+        self._empty_count = 0
+        self._unique_count = 0
+        self._duplicate_count = 0
+
+    @property
+    def unique_count(self) -> int:
+        return self._unique_count
+
+    @property
+    def duplicate_count(self) -> int:
+        return self._duplicate_count
+
+    @property
+    def empty_count(self) -> int:
+        return self._empty_count
+
+    def _work_index(self, work_slug: str) -> int:
+        index = self.slug_index.get(work_slug)
+        if index is None:
+            index = self.slug_index[work_slug] = len(self.slugs)
+            self.slugs.append(work_slug)
+        return index
+
+    def add(self, v: Dict):
+        """Check one verse payload (packed key, sampled references)."""
+        work_slug = v.get("workSlug", "")
+        chapter = int(v.get("chapter", 0))
+        verse = int(v.get("verse", 0))
+        text = str(v.get("text", "")).strip()
+
+        self.keys.append(pack_key(self._work_index(work_slug), chapter, verse))
+        self.verse_counts[work_slug] += 1
+        self.testament_totals[self._testament(work_slug, v)] += 1
+
+        if not text:
+            self._empty_count += 1
+            if len(self.empty_verses) < SAMPLE_LIMIT:
+                self.empty_verses.append(v.get("reference", f"{work_slug} {chapter}:{verse}"))
+
+        if chapter == 2 and verse == 25 and text and self._is_genesis(work_slug, v):
+            self.genesis_225_found = True
+
+        self.total_verses += 1
+
+    def result(self) -> Dict[str, Any]:
+        """Picklable per-file result (sorted packed keys + counters)."""
+        return {
+            "keys": array("q", sorted(self.keys)).tobytes(),
+            "slugs": self.slugs,
+            "verse_counts": dict(self.verse_counts),
+            "testament_totals": dict(self.testament_totals),
+            "empty_count": self._empty_count,
+            "empty_sample": self.empty_verses,
+            "genesis_225_found": self.genesis_225_found,
+            "total_verses": self.total_verses,
+        }
+
+    def merge(self, result: Dict[str, Any]):
+        """Fold one scan_chunk_file() result into this validator."""
+        keys = array("q")
+        keys.frombytes(result["keys"])
+
+        # Slugs the file saw that are not in works.json get indices local to that scan
+        remap = {
+            i: self._work_index(slug)
+            for i, slug in enumerate(result["slugs"])
+            if self.slug_index.get(slug) != i
+        }
+        if remap:
+            shift = CHAPTER_BITS + VERSE_BITS
+            low = (1 << shift) - 1
+            keys = array("q", sorted((remap.get(k >> shift, k >> shift) << shift) | (k & low) for k in keys))
+        self.runs.append(keys)
+
+        for slug, count in result["verse_counts"].items():
+            self.verse_counts[slug] += count
+        for testament, count in result["testament_totals"].items():
+            self.testament_totals[testament] += count
+        self._empty_count += result["empty_count"]
+        room = SAMPLE_LIMIT - len(self.empty_verses)
+        self.empty_verses.extend(result["empty_sample"][:max(room, 0)])
+        self.genesis_225_found = self.genesis_225_found or result["genesis_225_found"]
+        self.total_verses += result["total_verses"]
+
+    def _count_keys(self):
+        """k-way merge of the sorted runs: unique count, duplicate count and sample."""
+        if self.keys:
+            self.runs.append(array("q", sorted(self.keys)))
+            self.keys = array("q")
+        previous = None
+        for key in heapq.merge(*self.runs):
+            if key == previous:
+                self._duplicate_count += 1
+                if len(self.duplicates) < SAMPLE_LIMIT:
+                    work_index, chapter, verse = unpack_key(key)
+                    slug = self.slugs[work_index]
+                    self.duplicates.append(f"{self.title_by_slug.get(slug, slug)} {chapter}:{verse}")
+            else:
+                self._unique_count += 1
+                previous = key
+        self.runs = []
+
+    def finish(self, works: List[Dict], out_dir: str, canonical: Optional[str] = None,
+               strict: bool = False) -> int:
+        self._count_keys()
+        return super().finish(works, out_dir, canonical, strict)
+
+
+def pack_key(work_index: int, chapter: int, verse: int) -> int:
+    """(work index, chapter, verse) → one int; chapter/verse must fit 12 bits each."""
+    if not (0 <= chapter < (1 << CHAPTER_BITS) and 0 <= verse < (1 << VERSE_BITS)):
+        raise ValueError(f"chapter/verse out of range for packed key: {chapter}:{verse}")
+    return (work_index << (CHAPTER_BITS + VERSE_BITS)) | (chapter << VERSE_BITS) | verse
+
+
+def unpack_key(key: int) -> Tuple[int, int, int]:
+    return (
+        key >> (CHAPTER_BITS + VERSE_BITS),
+        (key >> VERSE_BITS) & ((1 << CHAPTER_BITS) - 1),
+        key & ((1 << VERSE_BITS) - 1),
+    )
+
+
+def iter_chunk(path: str) -> Iterator[Dict]:
+    """Verses of one chunk file; incremental with ijson, whole-file json.load otherwise."""
+    if ijson is None:
+        yield from load_json(path)
+        return
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "item")
+
+
+def scan_chunk_file(path: str, works: List[Dict]) -> Dict[str, Any]:
+    """Worker: validate one chunk file, return CompactDumpValidator.result()."""
+    validator = CompactDumpValidator(works)
+    for v in iter_chunk(path):
+        validator.add(v)
+    return validator.result()
+
+
+def validate_compact(verse_files: List[str], works: List[Dict], workers: int) -> CompactDumpValidator:
+    """Scan chunk files (in parallel when workers > 1) and merge the per-file results."""
+    validator = CompactDumpValidator(works)
+    if workers <= 1 or len(verse_files) <= 1:
+        for vf in verse_files:
+            validator.merge(scan_chunk_file(vf, works))
+        return validator
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(scan_chunk_file, vf, works) for vf in verse_files]
+        for future in futures:
+            validator.merge(future.result())
+    return validator
+
+
 def main():
     ap = argparse.ArgumentParser(description="Validate Strapi dump")
     ap.add_argument("--dir", required=True, help="Output dir from jsonl_to_strapi.py")
@@ -52,6 +475,17 @@ def main():
         action="store_true",
         help="Fail on warnings (empty verses, etc.)",
     )
+    ap.add_argument(
+        "--compact",
+        action="store_true",
+        help="Memory-bounded mode: streamed chunks, packed verse keys, parallel per-file scans",
+    )
+    ap.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for --compact (default: CPU count)",
+    )
     args = ap.parse_args()
 
     print("🔍 Validating Strapi dump...")
@@ -73,191 +507,25 @@ def main():
 
     print(f"✅ Found {len(verse_files)} verse chunk files")
 
-    # Build work lookup
-    title_by_slug = {w["slug"]: w["title"] for w in works}
-    testament_by_slug = {w["slug"]: w.get("testament", "unknown") for w in works}
-
-    # Validation tracking
-    seen_refs: Set[Tuple[str, int, int]] = set()
-    duplicates: List[str] = []
-    verse_counts = defaultdict(int)
-    empty_verses: List[str] = []
-
-    # Critical check: Genesis 2:25
-    genesis_225_found = False
-    genesis_slugs = [
-        w["slug"]
-        for w in works
-        if "genesis" in w["slug"] or norm(w["title"]) in ("genesis", "bereshith", "berĕshith")
-    ]
+    if args.compact:
+        print(f"\n📖 Processing verses (compact, {'ijson' if ijson is not None else 'json'}, "
+              f"{args.workers} worker(s))...")
+        try:
+            validator = validate_compact(verse_files, works, args.workers)
+        except ValueError as e:
+            print(f"❌ {e}")
+            raise SystemExit(1)
+        raise SystemExit(validator.finish(works, args.dir, args.canonical, args.strict))
 
-    # Testament totals
-    testament_totals = defaultdict(int)
+    validator = DumpValidator(works)
 
     print("\n📖 Processing verses...")
 
-    total_verses = 0
     for vf in verse_files:
-        arr = load_json(vf)
-        for v in arr:
-            work_slug = v.get("workSlug", "")
-            chapter = int(v.get("chapter", 0))
-            verse = int(v.get("verse", 0))
-            text = str(v.get("text", "")).strip()
-            reference = v.get("reference", f"{work_slug} {chapter}:{verse}")
-
-            # Check for duplicates
-            ref_key = (work_slug, chapter, verse)
-            if ref_key in seen_refs:
-                duplicates.append(reference)
-            else:
-                seen_refs.add(ref_key)
-
-            # Count verses per work
-            verse_counts[work_slug] += 1
-
-            # Track testament totals
-            testament = testament_by_slug.get(work_slug, "unknown")
-            testament_totals[testament] += 1
-
-            # Check for empty verse text
-            if not text:
-                empty_verses.append(reference)
-
-            # Critical check: Genesis 2:25
-            if work_slug in genesis_slugs and chapter == 2 and verse == 25:
-                if text:
-                    genesis_225_found = True
-
-            total_verses += 1
-
-    print(f"✅ Processed {total_verses} total verses")
-    print(f"✅ Found {len(seen_refs)} unique verses")
-
-    # Report issues
-    issues: List[str] = []
-    warnings: List[str] = []
-
-    # Critical: Duplicates
-    if duplicates:
-        issues.append(f"Duplicates detected: {len(duplicates)}")
-        print(f"\n❌ CRITICAL: {len(duplicates)} duplicate verses found:")
-        for dup in duplicates[:10]:  # Show first 10
-            print(f"   - {dup}")
-        if len(duplicates) > 10:
-            print(f"   ... and {len(duplicates) - 10} more")
-
-    # Critical: Genesis 2:25
-    if not genesis_225_found:
-        issues.append("Missing Genesis 2:25 (critical)")
-        print("\n❌ CRITICAL: Genesis 2:25 not found or empty")
-        print("   This is a known source anomaly that must be patched")
-
-    # Warning: Empty verses
-    if empty_verses:
-        warnings.append(f"Empty verse text: {len(empty_verses)}")
-        print(f"\n⚠️  WARNING: {len(empty_verses)} verses with empty text:")
-        for ref in empty_verses[:10]:
-            print(f"   - {ref}")
-        if len(empty_verses) > 10:
-            print(f"   ... and {len(empty_verses) - 10} more")
-
-    # Optional: Canonical structure validation
-    canonical_mismatches: List[Tuple[str, int, int]] = []
-    if args.canonical and os.path.exists(args.canonical):
-        print(f"\n📋 Validating against {args.canonical}...")
-
-        try:
-            canon = load_json(args.canonical)
-            canon_books = canon.get("books", [])
-
-            for book in canon_books:
-                slug = book.get("slug", "")
-                chapters = book.get("chapters", {})
-
-                # Calculate expected verse count
-                expected = sum(int(v) for v in chapters.values())
-                actual = verse_counts.get(slug, 0)
-
-                if actual != expected:
-                    canonical_mismatches.append((slug, expected, actual))
-
-            if canonical_mismatches:
-                warnings.append(
-                    f"Canonical structure mismatches: {len(canonical_mismatches)}"
-                )
-                print(f"\n⚠️  WARNING: {len(canonical_mismatches)} books differ from canonical structure:")
-                for slug, exp, act in canonical_mismatches[:10]:
-                    title = title_by_slug.get(slug, slug)
-                    diff = act - exp
-                    sign = "+" if diff > 0 else ""
-                    print(f"   - {title:30} expected {exp:>5}, got {act:>5} ({sign}{diff})")
-                if len(canonical_mismatches) > 10:
-                    print(f"   ... and {len(canonical_mismatches) - 10} more")
-
-        except Exception as e:
-            print(f"⚠️  Could not validate canonical structure: {e}")
-
-    # Print summary
-    print("\n" + "="*60)
-    print("VALIDATION SUMMARY")
-    print("="*60)
-    print(f"Works:              {len(works)}")
-    print(f"Verses (total):     {total_verses}")
-    print(f"Verses (unique):    {len(seen_refs)}")
-    print(f"Duplicates:         {len(duplicates)}")
-    print(f"Empty verses:       {len(empty_verses)}")
-    print(f"Genesis 2:25:       {'✅ FOUND' if genesis_225_found else '❌ MISSING'}")
-
-    print(f"\nTestament breakdown:")
-    for testament, count in sorted(testament_totals.items()):
-        print(f"  {testament:12} {count:>6} verses")
-
-    if canonical_mismatches:
-        print(f"\nCanonical mismatches: {len(canonical_mismatches)}")
-
-    print("="*60)
-
-    # Build report
-    report = {
-        "works": len(works),
-        "verses_total": total_verses,
-        "verses_unique": len(seen_refs),
-        "duplicates": len(duplicates),
-        "empty_verses": len(empty_verses),
-        "genesis_2_25_present": genesis_225_found,
-        "canonical_mismatches": len(canonical_mismatches),
-        "testament_totals": dict(testament_totals),
-        "issues": issues,
-        "warnings": warnings,
-    }
-
-    # Write validation report
-    report_path = os.path.join(args.dir, "validation-report.json")
-    with open(report_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, ensure_ascii=False, indent=2)
-
-    print(f"\n📊 Validation report written to {report_path}")
-
-    # Exit with appropriate code
-    if issues:
-        print(f"\n❌ VALIDATION FAILED: {len(issues)} critical issue(s)")
-        for issue in issues:
-            print(f"   - {issue}")
-        raise SystemExit(1)
-
-    if warnings and args.strict:
-        print(f"\n⚠️  VALIDATION FAILED (strict mode): {len(warnings)} warning(s)")
-        for warning in warnings:
-            print(f"   - {warning}")
-        raise SystemExit(1)
-
-    if warnings:
-        print(f"\n⚠️  {len(warnings)} warning(s) found, but validation passed")
-        print("   Use --strict to fail on warnings")
+        for v in load_json(vf):
+            validator.add(v)
 
-    print("\n✅ VALIDATION PASSED")
-    raise SystemExit(0)
+    raise SystemExit(validator.finish(works, args.dir, args.canonical, args.strict))
 
 
 if __name__ == "__main__":
@@ -20,7 +20,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Literal, Optional, Tuple
 
 # Content types
 ContentType = Literal["scripture", "canon", "library"]
@@ -50,6 +50,7 @@ class LayoutAwareBlock:
     font_name: str  # Font family
     zone: str  # HEADER | FOOTER | MARGIN | BODY
     page: int  # Page number
+    x1: Optional[float] = None  # Right coordinate (optional for older callers)
 
 
 @dataclass(frozen=True)
@@ -143,18 +144,48 @@ class BaseExtractor(ABC):
             List of LayoutAwareBlock objects with zone metadata
         """
         blocks: List[LayoutAwareBlock] = []
+        for _, page_blocks in self.iter_layout_pages(pdf):
+            blocks.extend(page_blocks)
 
-        total_pages = len(pdf.pages)
-        print(f"   → Extracting layout-aware blocks from {total_pages} pages")
+        print(f"   → Extracted {len(blocks)} layout-aware blocks")
+
+        # Count blocks by zone for debugging
+        zone_counts = {'HEADER': 0, 'FOOTER': 0, 'MARGIN': 0, 'BODY': 0}
+        for block in blocks:
+            zone_counts[block.zone] += 1
+
+        print(f"   → Zone distribution: {zone_counts}")
+
+        return blocks
+
+    def iter_layout_pages(
+        self, pdf, page_numbers: Optional[Iterable[int]] = None
+    ) -> Iterator[Tuple[int, List[LayoutAwareBlock]]]:
+        """
+        Yield (page_num, blocks) one page at a time
 
-        for page_num, page in enumerate(pdf.pages, 1):
-            if page_num % 100 == 0:
+        Same blocks as extract_blocks_with_layout(), without holding the whole
+        document; streaming extractors consume pages as they are read.
+        `page_numbers` (1-indexed) restricts the pass to a sample of pages.
+        """
+        total_pages = len(pdf.pages)
+        if page_numbers is None:
+            print(f"   → Extracting layout-aware blocks from {total_pages} pages")
+            selected = range(1, total_pages + 1)
+        else:
+            selected = [n for n in page_numbers if 1 <= n <= total_pages]
+
+        for page_num in selected:
+            page = pdf.pages[page_num - 1]
+            if page_num % 100 == 0 and page_numbers is None:
                 print(f"      Page {page_num}/{total_pages}...")
 
             page_width = page.width
             page_height = page.height
 
-            # Extract words with full metadata
+            # Extract words with full metadata. The page is closed once its
+            # words are read: pdfplumber otherwise keeps every page's parsed
+            # objects alive on the PDF, and memory grows with the book.
             try:
                 words = page.extract_words(
                     use_text_flow=True,
@@ -164,12 +195,15 @@ class BaseExtractor(ABC):
             except Exception as e:
                 self.warnings.append(f"Page {page_num}: Failed to extract words - {e}")
                 continue
+            finally:
+                page.close()
 
+            page_blocks: List[LayoutAwareBlock] = []
             for word in words:
                 # Classify zone based on position
                 zone = classify_zone(word, page_width, page_height)
 
-                blocks.append(LayoutAwareBlock(
+                page_blocks.append(LayoutAwareBlock(
                     text=word.get('text', ''),
                     x0=word.get('x0', 0),
                     top=word.get('top', 0),
@@ -177,19 +211,10 @@ class BaseExtractor(ABC):
                     font_size=word.get('height', 0),  # height = font size
                     font_name=word.get('fontname', ''),
                     zone=zone,
-                    page=page_num
+                    page=page_num,
+                    x1=word.get('x1'),
                 ))
-
-        print(f"   → Extracted {len(blocks)} layout-aware blocks")
-
-        # Count blocks by zone for debugging
-        zone_counts = {'HEADER': 0, 'FOOTER': 0, 'MARGIN': 0, 'BODY': 0}
-        for block in blocks:
-            zone_counts[block.zone] += 1
-
-        print(f"   → Zone distribution: {zone_counts}")
-
-        return blocks
+            yield page_num, page_blocks
 
     @abstractmethod
     def parse_structure(self, blocks: List[RawBlock]) -> Any:
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Embedding Store - Shared float32 embedding matrix with an id → row index
+
+On disk (two files per store, `<base>` = e.g. ingest/v1/embeddings/embeddings):
+    <base>.npy          NPY 1.0, little-endian float32 [count, dimensions], 128-byte header
+    <base>.index.json   {"format", "version", "file", "dtype", "model", "dimensions",
+                         "count", "ids": [row 0 id, row 1 id, ...]}
+
+The index is the commit point: rows are appended to the .npy first and the index is
+rewritten (atomically) on flush(), so a crash mid-append leaves the previous store intact.
+Queued rows only enter `ids`/`rows` once their bytes are written.
+Reads are zero-copy: the matrix is memory-mapped and vectors are memoryview slices
+(or one numpy array over the mapping when numpy is installed). Views stay valid across
+later appends: a mapping that still has views is left for them, and the next read maps
+the grown file afresh. DB loaders stream rows
+into PostgreSQL with binary COPY (pgvector's binary format) instead of JSON float text.
+
+Writers: ministry-extraction/jsonl-to-strapi.py, library-parser/ruach_library_parser.py
+(and the TS twin embedding-store.ts for canon-parser/ingest-vectors-to-db.ts and
+ministry-extraction/import-to-strapi.ts).
+
+Usage:
+    python embedding-store.py <base> [--show 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: zero-copy ndarray view
+    np = None
+
+STORE_FORMAT = "ruach-embeddings"
+STORE_VERSION = 1
+NPY_HEADER_SIZE = 128  # Fixed, so the shape can be rewritten in place
+ROW_DTYPE = "<f4"
+
+
+def npy_header(rows: int, dimensions: int) -> bytes:
+    """NPY 1.0 header for a C-order little-endian float32 [rows, dimensions] matrix"""
+    header = f"{{'descr': '{ROW_DTYPE}', 'fortran_order': False, 'shape': ({rows}, {dimensions}), }}"
+    header = header.ljust(NPY_HEADER_SIZE - 10 - 1) + "\n"
+    return b"\x93NUMPY\x01\x00" + len(header).to_bytes(2, "little") + header.encode("latin1")
+
+
+def _float32_bytes(vector: Sequence[float]) -> bytes:
+    row = array("f", vector)
+    if sys.byteorder != "little":
+        row.byteswap()
+    return row.tobytes()
+
+
+class EmbeddingStore:
+    """Append / zero-copy read API over one store"""
+
+    def __init__(self, base: Path, index: Dict[str, Any]):
+        self.base = Path(base)
+        self.index = index
+        self.ids: List[str] = index.get("ids", [])
+        self.rows: Dict[str, int] = {id_: row for row, id_ in enumerate(self.ids)}
+        # Queued (id, row bytes), not yet in ids/rows; _pending_rows guards duplicate ids
+        self._pending: List[Tuple[str, bytes]] = []
+        self._pending_rows: Dict[str, int] = {}
+        self._mmap: Optional[mmap.mmap] = None
+        self._file = None
+
+    # -- paths / header -------------------------------------------------------------
+
+    @staticmethod
+    def paths(base: Path) -> Tuple[Path, Path]:
+        base = Path(base)
+        return base.with_name(base.name + ".npy"), base.with_name(base.name + ".index.json")
+
+    @property
+    def npy_path(self) -> Path:
+        return self.paths(self.base)[0]
+
+    @property
+    def index_path(self) -> Path:
+        return self.paths(self.base)[1]
+
+    @property
+    def model(self) -> Optional[str]:
+        return self.index.get("model")
+
+    @property
+    def dimensions(self) -> int:
+        return int(self.index["dimensions"])
+
+    @property
+    def count(self) -> int:
+        """Rows written plus rows queued"""
+        return len(self.ids) + len(self._pending)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, id_: str) -> bool:
+        return id_ in self.rows or id_ in self._pending_rows
+
+    # -- open / create --------------------------------------------------------------
+
+    @classmethod
+    def exists(cls, base: Path) -> bool:
+        npy_path, index_path = cls.paths(base)
+        return npy_path.exists() and index_path.exists()
+
+    @classmethod
+    def create(cls, base: Path, model: Optional[str], dimensions: int) -> "EmbeddingStore":
+        """New empty store (replaces an existing one at `base`)"""
+        npy_path, _ = cls.paths(base)
+        npy_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(npy_path, "wb") as f:
+            f.write(npy_header(0, dimensions))
+        store = cls(base, {
+            "format": STORE_FORMAT,
+            "version": STORE_VERSION,
+            "file": npy_path.name,
+            "dtype": "float32",
+            "model": model,
+            "dimensions": dimensions,
+            "count": 0,
+            "ids": [],
+        })
+        store._write_index()
+        return store
+
+    @classmethod
+    def open(cls, base: Path) -> "EmbeddingStore":
+        _, index_path = cls.paths(base)
+        with open(index_path, "r", encoding="utf-8") as f:
+            index = json.load(f)
+        if index.get("dtype", "float32") != "float32":
+            raise ValueError(f"{index_path}: unsupported dtype {index.get('dtype')}")
+        return cls(base, index)
+
+    @classmethod
+    def open_or_create(cls, base: Path, model: Optional[str], dimensions: int) -> "EmbeddingStore":
+        """Open the store at `base`, or create it; model/dimensions must match an existing store"""
+        if not cls.exists(base):
+            return cls.create(base, model, dimensions)
+        store = cls.open(base)
+        if store.dimensions != dimensions or store.model != model:
+            raise ValueError(
+                f"{store.index_path} holds {store.model} [{store.dimensions}], "
+                f"not {model} [{dimensions}]"
+            )
+        return store
+
+    # -- append ---------------------------------------------------------------------
+
+    def append(self, id_: str, vector: Sequence[float]) -> int:
+        """Queue one vector (committed by flush()/close()); returns its row"""
+        if id_ in self:
+            raise ValueError(f"Embedding store already has id {id_!r}")
+        if len(vector) != self.dimensions:
+            raise ValueError(f"Vector for {id_!r} has {len(vector)} dimensions, expected {self.dimensions}")
+        row = self.count
+        self._pending.append((id_, _float32_bytes(vector)))
+        self._pending_rows[id_] = row
+        if len(self._pending) >= 1024:
+            self._write_pending()
+        return row
+
+    def extend(self, items: Iterable[Tuple[str, Sequence[float]]]) -> int:
+        added = 0
+        for id_, vector in items:
+            self.append(id_, vector)
+            added += 1
+        return added
+
+    def _write_pending(self):
+        if not self._pending:
+            return
+        if self._file is None:
+            self._release_map()
+            self._file = open(self.npy_path, "r+b")
+            # Drop rows of an interrupted append (past the committed count)
+            committed = NPY_HEADER_SIZE + self.index.get("count", 0) * self.dimensions * 4
+            self._file.truncate(committed)
+            self._file.seek(committed)
+        start = self._file.tell()
+        try:
+            self._file.write(b"".join(data for _, data in self._pending))
+            self._file.flush()
+        except BaseException:
+            # Keep the file at the rows ids/rows know about; the queue is kept for a retry
+            self._file.seek(start)
+            self._file.truncate()
+            raise
+        for id_, _ in self._pending:
+            self.rows[id_] = len(self.ids)
+            self.ids.append(id_)
+        self._pending = []
+        self._pending_rows = {}
+
+    def flush(self):
+        """Commit queued rows: data, .npy shape, then the index"""
+        self._write_pending()
+        if self._file is not None:
+            self._file.seek(0)
+            self._file.write(npy_header(len(self.ids), self.dimensions))
+            self._file.close()
+            self._file = None
+        if self.index.get("count") != len(self.ids):
+            self._write_index()
+
+    def _write_index(self):
+        self.index["count"] = len(self.ids)
+        self.index["ids"] = self.ids
+        tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def close(self):
+        self.flush()
+        self._release_map()
+
+    def __enter__(self) -> "EmbeddingStore":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # -- zero-copy reads ------------------------------------------------------------
+
+    def _release_map(self):
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # vector()/matrix()/as_numpy() views still use it; it is unmapped once they
+                # are garbage-collected. Their rows are committed, so appends never change them.
+                pass
+            self._mmap = None
+
+    def _map(self) -> mmap.mmap:
+        if self._pending or self._file is not None:
+            self.flush()
+        if self._mmap is None:
+            with open(self.npy_path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    def matrix(self) -> memoryview:
+        """Flat float32 view of all committed rows (row r = [r*dims, (r+1)*dims))"""
+        if sys.byteorder != "little":
+            raise RuntimeError("Zero-copy float32 views need a little-endian host")
+        size = self.count * self.dimensions * 4
+        return memoryview(self._map())[NPY_HEADER_SIZE:NPY_HEADER_SIZE + size].cast("f")
+
+    def vector(self, id_: str) -> memoryview:
+        """Zero-copy float32 view of one vector"""
+        row = self.rows[id_]
+        d = self.dimensions
+        return self.matrix()[row * d:(row + 1) * d]
+
+    def iter_vectors(self) -> Iterator[Tuple[str, memoryview]]:
+        flat, d = self.matrix(), self.dimensions
+        for row, id_ in enumerate(self.ids):
+            yield id_, flat[row * d:(row + 1) * d]
+
+    def as_numpy(self):
+        """[count, dimensions] float32 ndarray over the mapping (requires numpy)"""
+        if np is None:
+            raise RuntimeError("numpy is not installed (pip install numpy)")
+        return np.frombuffer(self._map(), dtype=ROW_DTYPE, count=self.count * self.dimensions,
+                             offset=NPY_HEADER_SIZE).reshape(self.count, self.dimensions)
+
+
+# -- PostgreSQL binary COPY -------------------------------------------------------------
+
+PG_COPY_SIGNATURE = b"PGCOPY\n\xff\r\n\x00" + struct.pack("!ii", 0, 0)
+
+
+def pg_int4(value: int) -> bytes:
+    return struct.pack("!ii", 4, value)
+
+
+def pg_text(value: Optional[str]) -> bytes:
+    if value is None:
+        return struct.pack("!i", -1)
+    data = value.encode("utf-8")
+    return struct.pack("!i", len(data)) + data
+
+
+def pg_vector(vector: Sequence[float]) -> bytes:
+    """pgvector binary send format: int16 dim, int16 unused, float4[dim] (big-endian)"""
+    row = array("f", vector)
+    if sys.byteorder == "little":
+        row.byteswap()
+    return struct.pack("!ihh", 4 + 4 * len(row), len(row), 0) + row.tobytes()
+
+
+class PgCopyStream:
+    """
+    File-like binary COPY payload for cursor.copy_expert(); rows are encoded lazily
+
+    Each record is a sequence of already-encoded fields (pg_int4 / pg_text / pg_vector).
+    """
+
+    def __init__(self, records: Iterable[Sequence[bytes]]):
+        self._records = iter(records)
+        self._buffer = bytearray(PG_COPY_SIGNATURE)
+        self._done = False
+
+    def read(self, size: int = -1) -> bytes:
+        while not self._done and (size < 0 or len(self._buffer) < size):
+            record = next(self._records, None)
+            if record is None:
+                self._buffer += struct.pack("!h", -1)
+                self._done = True
+                break
+            self._buffer += struct.pack("!h", len(record))
+            for field in record:
+                self._buffer += field
+        if size < 0:
+            size = len(self._buffer)
+        chunk = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return chunk
+
+    readline = read
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect an embedding store")
+    parser.add_argument("base", help="Store base path (without .npy / .index.json)")
+    parser.add_argument("--show", type=int, default=0, help="Print the first N ids with vector heads")
+    args = parser.parse_args()
+
+    if not EmbeddingStore.exists(Path(args.base)):
+        print(f"ERROR: no embedding store at {args.base}")
+        sys.exit(1)
+
+    store = EmbeddingStore.open(Path(args.base))
+    size_mb = store.npy_path.stat().st_size / (1 << 20)
+    print(f"🧮 {store.base}: {store.count} vectors × {store.dimensions} ({store.model}), {size_mb:.1f} MB")
+    for id_, vector in list(store.iter_vectors())[:args.show]:
+        head = ", ".join(f"{x:.4f}" for x in vector[:4])
+        print(f"   {id_}: [{head}, ...]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+/**
+ * Embedding Store (TypeScript) - reader/appender for the store format of embedding-store.py
+ *
+ *   <base>.npy          NPY 1.0, little-endian float32 [count, dimensions], 128-byte header
+ *   <base>.index.json   { format, version, file, dtype, model, dimensions, count, ids }
+ *
+ * Reads are zero-copy: the matrix is a Float32Array over the file buffer and vectors are
+ * subarrays of it. Appends write the rows, then the .npy shape, then the index (the commit
+ * point), matching the Python writer.
+ *
+ * Used by:
+ * - canon-parser/ingest-vectors-to-db.ts (embedding cache, --store)
+ * - ministry-extraction/import-to-strapi.ts (attaches vectors to text payloads)
+ */
+
+import { open, readFile, rename, writeFile, mkdir } from 'node:fs/promises';
+import { basename, dirname } from 'node:path';
+
+const STORE_FORMAT = 'ruach-embeddings';
+const STORE_VERSION = 1;
+const NPY_HEADER_SIZE = 128;
+
+export interface EmbeddingIndex {
+  format?: string;
+  version?: number;
+  file: string;
+  dtype: 'float32';
+  model: string | null;
+  dimensions: number;
+  count: number;
+  ids: string[];
+}
+
+export interface EmbeddingStore {
+  base: string;
+  index: EmbeddingIndex;
+  matrix: Float32Array;
+  rows: Map<string, number>;
+  /** Zero-copy view of one row */
+  row(row: number): Float32Array;
+  /** Zero-copy view of one vector, or undefined when the id is not stored */
+  vector(id: string): Float32Array | undefined;
+}
+
+export function storePaths(base: string): { npy: string; index: string } {
+  return { npy: `${base}.npy`, index: `${base}.index.json` };
+}
+
+function npyHeader(rows: number, dimensions: number): Buffer {
+  let header = `{'descr': '<f4', 'fortran_order': False, 'shape': (${rows}, ${dimensions}), }`;
+  header = header.padEnd(NPY_HEADER_SIZE - 10 - 1) + '\n';
+  const prefix = Buffer.from([0x93, 0x4e, 0x55, 0x4d, 0x50, 0x59, 0x01, 0x00, 0, 0]);
+  prefix.writeUInt16LE(header.length, 8);
+  return Buffer.concat([prefix, Buffer.from(header, 'latin1')]);
+}
+
+/** Open a store; returns null when it does not exist */
+export async function openEmbeddingStore(base: string): Promise<EmbeddingStore | null> {
+  const paths = storePaths(base);
+  let index: EmbeddingIndex;
+  try {
+    index = JSON.parse(await readFile(paths.index, 'utf-8'));
+  } catch {
+    return null;
+  }
+
+  // NPY 1.0: magic (6) + version (2) + header length (uint16 LE) + header, then float32 rows
+  const npy = await readFile(paths.npy);
+  const dataOffset = npy.byteOffset + 10 + npy.readUInt16LE(8);
+  const dims = index.dimensions;
+  const length = index.count * dims;
+  // Zero-copy when the rows are 4-byte aligned in the underlying buffer (always for fresh reads)
+  const matrix =
+    dataOffset % 4 === 0
+      ? new Float32Array(npy.buffer, dataOffset, length)
+      : new Float32Array(npy.buffer.slice(dataOffset, dataOffset + length * 4));
+
+  const rows = new Map<string, number>();
+  index.ids.forEach((id, row) => rows.set(id, row));
+
+  const row = (r: number) => matrix.subarray(r * dims, (r + 1) * dims);
+  return {
+    base,
+    index,
+    matrix,
+    rows,
+    row,
+    vector: (id: string) => {
+      const r = rows.get(id);
+      return r === undefined ? undefined : row(r);
+    },
+  };
+}
+
+/**
+ * Append vectors (creating the store if needed); ids must be new and model/dimensions
+ * must match an existing store. Returns the new row count.
+ */
+export async function appendEmbeddings(
+  base: string,
+  model: string | null,
+  dimensions: number,
+  items: Array<[string, ArrayLike<number>]>
+): Promise<number> {
+  const paths = storePaths(base);
+  let index: EmbeddingIndex;
+  try {
+    index = JSON.parse(await readFile(paths.index, 'utf-8'));
+  } catch {
+    index = {
+      format: STORE_FORMAT,
+      version: STORE_VERSION,
+      file: basename(paths.npy),
+      dtype: 'float32',
+      model,
+      dimensions,
+      count: 0,
+      ids: [],
+    };
+    await mkdir(dirname(paths.npy), { recursive: true });
+    await writeFile(paths.npy, npyHeader(0, dimensions));
+  }
+  if (index.dimensions !== dimensions || index.model !== model) {
+    throw new Error(
+      `${paths.index} holds ${index.model} [${index.dimensions}], not ${model} [${dimensions}]`
+    );
+  }
+  if (items.length === 0) return index.count;
+
+  const known = new Set(index.ids);
+  const data = Buffer.alloc(items.length * dimensions * 4);
+  items.forEach(([id, vector], i) => {
+    if (known.has(id)) throw new Error(`Embedding store already has id ${id}`);
+    if (vector.length !== dimensions) {
+      throw new Error(`Vector for ${id} has ${vector.length} dimensions, expected ${dimensions}`);
+    }
+    known.add(id);
+    for (let d = 0; d < dimensions; d++) {
+      data.writeFloatLE(vector[d], (i * dimensions + d) * 4);
+    }
+  });
+
+  // Rows past the committed count (an interrupted append) are overwritten
+  const file = await open(paths.npy, 'r+');
+  try {
+    const committed = NPY_HEADER_SIZE + index.count * dimensions * 4;
+    await file.truncate(committed);
+    await file.write(data, 0, data.length, committed);
+    index.ids.push(...items.map(([id]) => id));
+    index.count = index.ids.length;
+    await file.write(npyHeader(index.count, dimensions), 0, NPY_HEADER_SIZE, 0);
+  } finally {
+    await file.close();
+  }
+
+  await writeFile(`${paths.index}.tmp`, JSON.stringify(index));
+  await rename(`${paths.index}.tmp`, paths.index);
+  return index.count;
+}
+
+/** pgvector text literal, e.g. '[0.1,0.2]' */
+export function toPgVector(vector: ArrayLike<number>): string {
+  return `[${Array.prototype.join.call(vector, ',')}]`;
+}
@@ -0,0 +1 @@
+embedding-store.py
\ No newline at end of file
@@ -4,13 +4,25 @@ Export YAH Scriptures .bbli (SQLite) to JSONL format
 
 Usage:
     python3 export-bbli.py /path/to/YSpc1.04.bbli --out yahscriptures.jsonl --clean
+    python3 export-bbli.py /path/to/YSpc1.04.bbli --out yahscriptures.jsonl --clean --bulk --workers 4
+
+--bulk: books are split into contiguous ranges (balanced by verse count) exported by
+worker processes to part files, concatenated in book order. HTML is stripped a batch
+at a time with precompiled patterns. Each export records the .bbli SHA256 in
+<out>.manifest.json; a re-run with the same source and options is skipped (--force
+re-exports). The JSONL output is byte-identical to the default mode.
 """
 
 import sqlite3
+import hashlib
 import json
+import os
 import re
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 # Canonical book mapping (Books 1-66)
 CANONICAL_BOOKS = {
@@ -47,18 +59,37 @@ APOCRYPHA_BOOKS = {
     78: "Prayer of Manasseh",
 }
 
+MANIFEST_VERSION = 1
+BATCH_SEPARATOR = "\x00"  # joins a batch of verses for one regex pass
+
+BR_RE = re.compile(r"<br />|<br/>|<br>")
+TAG_RE = re.compile(r"</?[^>\x00]+>")
+SPACE_RE = re.compile(r"[ \t]+")
+
+JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+
 def strip_html_keep_breaks(s: str) -> str:
     """Remove HTML tags but preserve line breaks"""
     if s is None:
         return ""
     # Keep explicit line breaks
-    s = s.replace("<br />", "\n").replace("<br/>", "\n").replace("<br>", "\n")
+    s = BR_RE.sub("\n", s)
     # Remove tags but keep inner text
-    s = re.sub(r"</?[^>]+>", "", s)
+    s = TAG_RE.sub("", s)
     # Normalize whitespace
-    s = re.sub(r"[ \t]+", " ", s).strip()
+    s = SPACE_RE.sub(" ", s).strip()
     return s
 
+
+def strip_html_batch(texts: List[Optional[str]]) -> List[str]:
+    """strip_html_keep_breaks over a batch: one pass of each pattern on the joined text"""
+    joined = BATCH_SEPARATOR.join(t or "" for t in texts)
+    if joined.count(BATCH_SEPARATOR) != max(len(texts) - 1, 0):
+        return [strip_html_keep_breaks(t) for t in texts]  # separator occurs in the data
+    joined = SPACE_RE.sub(" ", TAG_RE.sub("", BR_RE.sub("\n", joined)))
+    return [part.strip() for part in joined.split(BATCH_SEPARATOR)] if texts else []
+
 def book_name(book_num: int) -> str:
     """Get book name from number"""
     if book_num in CANONICAL_BOOKS:
@@ -77,11 +108,170 @@ def book_testament(book_num: int) -> str:
         return "apocrypha"
     return "unknown"
 
+def read_details(conn: sqlite3.Connection) -> dict:
+    """Read the Details row (module metadata)"""
+    meta_row = conn.execute(
+        "SELECT Title, Abbreviation, Version, OldTestament, NewTestament, Apocrypha FROM Details"
+    ).fetchone()
+
+    return {
+        "title": meta_row[0],
+        "abbreviation": meta_row[1],
+        "version": meta_row[2],
+        "old_testament": bool(meta_row[3]),
+        "new_testament": bool(meta_row[4]),
+        "apocrypha": bool(meta_row[5]),
+    }
+
+
+def iter_export_records(conn: sqlite3.Connection, clean: bool = False, batch_size: int = 1000,
+                        book_range: Optional[Tuple[int, int]] = None):
+    """
+    Stream Bible rows as export records, in (Book, Chapter, Verse) order
+
+    Rows are pulled from the cursor in fetchmany() batches (HTML stripped per batch);
+    nothing is materialized. book_range limits the export to books lo..hi (inclusive).
+    """
+    if book_range is None:
+        cur = conn.execute(
+            "SELECT Book, Chapter, Verse, Scripture FROM Bible ORDER BY Book, Chapter, Verse"
+        )
+    else:
+        cur = conn.execute(
+            "SELECT Book, Chapter, Verse, Scripture FROM Bible WHERE Book BETWEEN ? AND ? "
+            "ORDER BY Book, Chapter, Verse",
+            book_range,
+        )
+    while True:
+        batch = cur.fetchmany(batch_size)
+        if not batch:
+            break
+        texts = strip_html_batch([row[3] for row in batch]) if clean else [row[3] or "" for row in batch]
+        for (book, ch, vs, _), text in zip(batch, texts):
+            yield {
+                "book_num": book,
+                "book": book_name(book),
+                "testament": book_testament(book),
+                "chapter": ch,
+                "verse": vs,
+                "text": text,
+            }
+
+
+def sha256_file(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def manifest_path(out_path: Path) -> Path:
+    return out_path.with_name(out_path.name + ".manifest.json")
+
+
+def load_manifest(out_path: Path) -> dict:
+    path = manifest_path(out_path)
+    if not path.exists():
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def book_ranges(conn: sqlite3.Connection, parts: int) -> List[Tuple[int, int]]:
+    """Split the books into up to `parts` contiguous ranges of roughly equal verse counts"""
+    counts = conn.execute("SELECT Book, COUNT(*) FROM Bible GROUP BY Book ORDER BY Book").fetchall()
+    if not counts:
+        return []
+    target = sum(count for _, count in counts) / max(parts, 1)
+
+    ranges: List[Tuple[int, int]] = []
+    start, filled = counts[0][0], 0
+    for i, (book, count) in enumerate(counts):
+        filled += count
+        last = i == len(counts) - 1
+        if last or (filled >= target and len(ranges) < parts - 1):
+            ranges.append((start, book))
+            if not last:
+                start, filled = counts[i + 1][0], 0
+    return ranges
+
+
+def export_book_range(bbli: str, book_range: Tuple[int, int], part_path: str,
+                      clean: bool, batch_size: int) -> Dict[str, int]:
+    """Worker: export one book range to a part file; returns verse counts by testament"""
+    counts: Dict[str, int] = {}
+    conn = sqlite3.connect(f"file:{os.path.abspath(bbli)}?mode=ro", uri=True)
+    try:
+        records = iter_export_records(conn, clean=clean, batch_size=batch_size, book_range=book_range)
+        with open(part_path, "w", encoding="utf-8") as f:
+            lines: List[str] = []
+            for rec in records:
+                counts[rec["testament"]] = counts.get(rec["testament"], 0) + 1
+                lines.append(JSON_ENCODER.encode(rec))
+                if len(lines) >= batch_size:
+                    f.write("\n".join(lines) + "\n")
+                    lines = []
+            if lines:
+                f.write("\n".join(lines) + "\n")
+    finally:
+        conn.close()
+    return counts
+
+
+def bulk_export(bbli: str, out_path: Path, metadata: dict, clean: bool,
+                workers: int, batch_size: int) -> Dict[str, int]:
+    """Parallel export by book range; part files are concatenated into <out> atomically"""
+    conn = sqlite3.connect(f"file:{os.path.abspath(bbli)}?mode=ro", uri=True)
+    ranges = book_ranges(conn, workers)
+    conn.close()
+
+    parts = [f"{out_path}.part{i:02d}" for i in range(len(ranges))]
+    verse_counts: Dict[str, int] = {}
+    try:
+        if workers <= 1 or len(ranges) <= 1:
+            results = [export_book_range(bbli, r, p, clean, batch_size) for r, p in zip(ranges, parts)]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(export_book_range, bbli, r, p, clean, batch_size)
+                           for r, p in zip(ranges, parts)]
+                results = [future.result() for future in futures]
+        for counts in results:
+            for testament, count in counts.items():
+                verse_counts[testament] = verse_counts.get(testament, 0) + count
+
+        tmp_path = f"{out_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as out:
+            out.write(json.dumps({"_meta": metadata}, ensure_ascii=False) + "\n")
+            for part in parts:
+                with open(part, "r", encoding="utf-8") as f:
+                    while True:
+                        block = f.read(1 << 20)
+                        if not block:
+                            break
+                        out.write(block)
+        os.replace(tmp_path, out_path)
+    finally:
+        for part in parts:
+            if os.path.exists(part):
+                os.remove(part)
+    return verse_counts
+
+
 def main():
     ap = argparse.ArgumentParser(description="Export YAH Scriptures .bbli to JSONL")
     ap.add_argument("bbli", help="Path to .bbli (SQLite) file")
     ap.add_argument("--out", default="yahscriptures.jsonl", help="Output JSONL path")
     ap.add_argument("--clean", action="store_true", help="Strip HTML tags (keeps line breaks)")
+    ap.add_argument("--bulk", action="store_true",
+                    help="Parallel export by book range, skipped when the manifest's source hash matches")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                    help="Worker processes for --bulk (default: CPU count)")
+    ap.add_argument("--batch", type=int, default=5000, help="Rows per fetch/strip batch in --bulk (default: 5000)")
+    ap.add_argument("--force", action="store_true", help="Re-export even if the manifest matches")
     args = ap.parse_args()
 
     bbli_path = Path(args.bbli)
@@ -89,22 +279,13 @@ def main():
         print(f"❌ File not found: {bbli_path}")
         return 1
 
+    if args.bulk:
+        return main_bulk(args, bbli_path)
+
     conn = sqlite3.connect(args.bbli)
-    cur = conn.cursor()
 
     # Read metadata
-    meta_row = cur.execute(
-        "SELECT Title, Abbreviation, Version, OldTestament, NewTestament, Apocrypha FROM Details"
-    ).fetchone()
-    
-    metadata = {
-        "title": meta_row[0],
-        "abbreviation": meta_row[1],
-        "version": meta_row[2],
-        "old_testament": bool(meta_row[3]),
-        "new_testament": bool(meta_row[4]),
-        "apocrypha": bool(meta_row[5]),
-    }
+    metadata = read_details(conn)
 
     # Count verses by testament
     verse_counts = {
@@ -118,23 +299,8 @@ def main():
         f.write(json.dumps({"_meta": metadata}, ensure_ascii=False) + "\n")
 
         # Export verses
-        for book, ch, vs, text in cur.execute(
-            "SELECT Book, Chapter, Verse, Scripture FROM Bible ORDER BY Book, Chapter, Verse"
-        ):
-            raw = text or ""
-            out_text = strip_html_keep_breaks(raw) if args.clean else raw
-            
-            testament = book_testament(book)
-            verse_counts[testament] += 1
-            
-            rec = {
-                "book_num": book,
-                "book": book_name(book),
-                "testament": testament,
-                "chapter": ch,
-                "verse": vs,
-                "text": out_text,
-            }
+        for rec in iter_export_records(conn, clean=args.clean):
+            verse_counts[rec["testament"]] += 1
             f.write(json.dumps(rec, ensure_ascii=False) + "\n")
 
     print(f"✅ Exported to: {args.out}")
@@ -146,5 +312,50 @@ def main():
     conn.close()
     return 0
 
+
+def main_bulk(args, bbli_path: Path) -> int:
+    out_path = Path(args.out)
+    source_sha256 = sha256_file(bbli_path)
+
+    previous = load_manifest(out_path)
+    if (not args.force and out_path.exists()
+            and previous.get("version") == MANIFEST_VERSION
+            and previous.get("sourceSha256") == source_sha256
+            and previous.get("clean") == args.clean
+            and previous.get("outputBytes") == out_path.stat().st_size):
+        print(f"✅ Up to date: {args.out} (source SHA256 matches {manifest_path(out_path).name})")
+        return 0
+
+    conn = sqlite3.connect(f"file:{bbli_path.resolve()}?mode=ro", uri=True)
+    metadata = read_details(conn)
+    conn.close()
+
+    verse_counts = bulk_export(str(bbli_path), out_path, metadata, args.clean,
+                               max(1, args.workers), max(1, args.batch))
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "source": str(bbli_path),
+        "sourceSha256": source_sha256,
+        "clean": args.clean,
+        "output": str(out_path),
+        "outputBytes": out_path.stat().st_size,
+        "verseCounts": verse_counts,
+        "exportedAt": datetime.now(timezone.utc).isoformat(),
+    }
+    tmp_manifest = f"{manifest_path(out_path)}.tmp"
+    with open(tmp_manifest, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_manifest, manifest_path(out_path))
+
+    print(f"✅ Exported to: {args.out}")
+    print(f"   Old Testament: {verse_counts.get('old', 0):,} verses")
+    print(f"   New Testament: {verse_counts.get('new', 0):,} verses")
+    print(f"   Apocrypha: {verse_counts.get('apocrypha', 0):,} verses")
+    print(f"   Total: {sum(verse_counts.values()):,} verses")
+    print(f"   Manifest: {manifest_path(out_path)}")
+    return 0
+
+
 if __name__ == "__main__":
     exit(main())
@@ -0,0 +1 @@
+export-bbli.py
\ No newline at end of file
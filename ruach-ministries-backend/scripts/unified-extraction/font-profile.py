@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Font Profile - Document-wide font statistics, built once per source PDF
+
+One parallel pass over every page records:
+- char font-size histogram (all chars, rounded to 0.1pt)
+- digit font-size histogram (verse/chapter marker candidates)
+- font-name histogram (by char count)
+
+The profile is persisted next to the PDF (`<pdf>.font-profile.json`) together with the
+source SHA256, and reused until the PDF changes. Extractors and debug scripts read
+modal sizes / heading clusters / per-book overrides from it instead of re-scanning pages.
+
+Usage:
+    python font-profile.py /path/to/book.pdf [--out profile.json] [--workers 8] [--force]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+PROFILE_VERSION = 1
+PAGES_PER_TASK = 25
+
+
+def _sha256_file(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def _size_key(size: float) -> str:
+    return f"{round(float(size), 1):.1f}"
+
+
+def _profile_page_range(pdf_path: str, start: int, end: int) -> List[Dict[str, Any]]:
+    """Worker: histogram pages [start, end) (0-indexed). Each worker opens its own PDF handle."""
+    import pdfplumber
+
+    pages: List[Dict[str, Any]] = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for idx in range(start, min(end, len(pdf.pages))):
+            sizes: Counter = Counter()
+            digit_sizes: Counter = Counter()
+            fonts: Counter = Counter()
+            page = pdf.pages[idx]
+            for char in page.chars:
+                text = (char.get("text") or "").strip()
+                if not text:
+                    continue
+                size = char.get("size", 0) or 0
+                if size > 0:
+                    key = _size_key(size)
+                    sizes[key] += 1
+                    if text.isdigit():
+                        digit_sizes[key] += 1
+                fontname = char.get("fontname")
+                if fontname:
+                    fonts[fontname] += 1
+            page.close()
+            pages.append({
+                "page": idx + 1,
+                "sizes": dict(sizes),
+                "digitSizes": dict(digit_sizes),
+                "fonts": dict(fonts),
+            })
+    return pages
+
+
+def _mode(counter: Counter, default: float) -> float:
+    if not counter:
+        return default
+    # Ties resolve to the smaller size so the result is deterministic.
+    size, _ = max(counter.items(), key=lambda kv: (kv[1], -float(kv[0])))
+    return float(size)
+
+
+class FontProfile:
+    """Read API over a persisted font profile"""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.pages: List[Dict[str, Any]] = data.get("pages", [])
+        self.book_overrides: Dict[str, Dict[str, Any]] = data.get("bookOverrides", {})
+        # Whole-document histograms, summed once on first use; callers such as
+        # the scripture extractor ask for them on every page.
+        self._totals: Dict[str, Counter] = {}
+
+    @property
+    def source_sha256(self) -> str:
+        return self.data.get("sourceSha256", "")
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    def _select(self, start_page: Optional[int], end_page: Optional[int]) -> List[Dict[str, Any]]:
+        if start_page is None and end_page is None:
+            return self.pages
+        lo = start_page or 1
+        hi = end_page or self.page_count
+        return [p for p in self.pages if lo <= p["page"] <= hi]
+
+    def _histogram(self, key: str, start_page: Optional[int] = None, end_page: Optional[int] = None) -> Counter:
+        whole = start_page is None and end_page is None
+        if whole and key in self._totals:
+            return Counter(self._totals[key])
+        total: Counter = Counter()
+        for page in self._select(start_page, end_page):
+            total.update(page.get(key, {}))
+        if whole:
+            self._totals[key] = Counter(total)
+        return total
+
+    def size_histogram(self, start_page: Optional[int] = None, end_page: Optional[int] = None) -> Counter:
+        """Char font-size histogram ("10.5" → count), optionally for a 1-indexed page range"""
+        return self._histogram("sizes", start_page, end_page)
+
+    def digit_histogram(self, start_page: Optional[int] = None, end_page: Optional[int] = None) -> Counter:
+        """Digit font-size histogram ("10.5" → count), optionally for a 1-indexed page range"""
+        return self._histogram("digitSizes", start_page, end_page)
+
+    def font_histogram(self, start_page: Optional[int] = None, end_page: Optional[int] = None) -> Counter:
+        """Font-name histogram (by char count)"""
+        return self._histogram("fonts", start_page, end_page)
+
+    def modal_body_size(self, start_page: Optional[int] = None, end_page: Optional[int] = None,
+                        default: float = 11.0) -> float:
+        """Most common char size (body text)"""
+        return _mode(self.size_histogram(start_page, end_page), default)
+
+    def modal_digit_size(self, start_page: Optional[int] = None, end_page: Optional[int] = None,
+                         default: float = 10.5) -> float:
+        """Most common digit size (verse markers in scripture PDFs)"""
+        return _mode(self.digit_histogram(start_page, end_page), default)
+
+    def heading_size_clusters(self, ratio: float = 1.15, gap: float = 0.5,
+                              min_count: int = 3) -> List[Tuple[float, float, int]]:
+        """
+        Sizes at least `ratio` × body size, grouped into clusters of neighbouring sizes
+
+        Returns:
+            [(min_size, max_size, char_count)] largest cluster first
+        """
+        body = self.modal_body_size()
+        sizes = sorted(
+            (float(size), count)
+            for size, count in self.size_histogram().items()
+            if float(size) >= body * ratio and count >= min_count
+        )
+
+        clusters: List[Tuple[float, float, int]] = []
+        for size, count in sizes:
+            if clusters and size - clusters[-1][1] <= gap:
+                lo, _, total = clusters[-1]
+                clusters[-1] = (lo, size, total + count)
+            else:
+                clusters.append((size, size, count))
+        return sorted(clusters, key=lambda c: c[0], reverse=True)
+
+    def chapter_threshold(self, book: Optional[str] = None, default: float = 10.5) -> float:
+        """Digit size above which a number is a chapter marker (per-book override wins)"""
+        override = self.book_overrides.get(book or "", {}).get("chapterThreshold")
+        if override is not None:
+            return float(override)
+        return self.modal_digit_size(default=default)
+
+    def save(self, path: Path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False)
+
+
+def default_profile_path(pdf_path: Path) -> Path:
+    return pdf_path.with_name(pdf_path.name + ".font-profile.json")
+
+
+def build_font_profile(pdf_path: Path, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Histogram every page in parallel (page ranges across a process pool)"""
+    import pdfplumber
+
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        page_count = len(pdf.pages)
+
+    ranges = [(start, start + PAGES_PER_TASK) for start in range(0, page_count, PAGES_PER_TASK)]
+    workers = workers or min(len(ranges), os.cpu_count() or 1) or 1
+
+    pages: List[Dict[str, Any]] = []
+    if workers <= 1 or len(ranges) <= 1:
+        for start, end in ranges:
+            pages.extend(_profile_page_range(str(pdf_path), start, end))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_profile_page_range, str(pdf_path), start, end) for start, end in ranges]
+            for future in futures:
+                pages.extend(future.result())
+
+    return {
+        "version": PROFILE_VERSION,
+        "sourceFile": str(pdf_path),
+        "pageCount": page_count,
+        "pages": pages,
+        "bookOverrides": {},
+    }
+
+
+def load_or_build_profile(
+    pdf_path: str,
+    profile_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> FontProfile:
+    """
+    Load the persisted profile if its sourceSha256 matches the PDF; otherwise rebuild it.
+    Hand-edited `bookOverrides` are carried over on rebuild.
+    """
+    source = Path(pdf_path)
+    target = Path(profile_path) if profile_path else default_profile_path(source)
+    source_sha256 = _sha256_file(source)
+
+    previous: Dict[str, Any] = {}
+    if target.exists():
+        try:
+            with open(target, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = {}
+
+    if (not force and previous.get("sourceSha256") == source_sha256
+            and previous.get("version") == PROFILE_VERSION):
+        return FontProfile(previous)
+
+    print(f"📏 Building font profile for {source.name}...")
+    data = build_font_profile(source, workers=workers)
+    data["sourceSha256"] = source_sha256
+    data["bookOverrides"] = previous.get("bookOverrides", {})
+
+    profile = FontProfile(data)
+    profile.save(target)
+    print(f"   → {profile.page_count} pages profiled → {target}")
+    return profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or inspect a PDF font profile")
+    parser.add_argument("pdf_path", help="Path to PDF file")
+    parser.add_argument("--out", help="Profile path (default: <pdf>.font-profile.json)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if the source hash matches")
+    args = parser.parse_args()
+
+    if not Path(args.pdf_path).exists():
+        print(f"ERROR: PDF not found: {args.pdf_path}")
+        sys.exit(1)
+
+    profile = load_or_build_profile(args.pdf_path, args.out, workers=args.workers, force=args.force)
+
+    print(f"\n📄 Pages: {profile.page_count}")
+    print(f"   Modal body size:  {profile.modal_body_size():.1f}pt")
+    print(f"   Modal digit size: {profile.modal_digit_size():.1f}pt")
+    print("   Top fonts:")
+    for name, count in profile.font_histogram().most_common(5):
+        print(f"      {name}: {count} chars")
+    print("   Heading size clusters:")
+    for lo, hi, count in profile.heading_size_clusters():
+        print(f"      {lo:.1f}–{hi:.1f}pt: {count} chars")
+    if profile.book_overrides:
+        print(f"   Book overrides: {profile.book_overrides}")
+
+
+if __name__ == "__main__":
+    main()
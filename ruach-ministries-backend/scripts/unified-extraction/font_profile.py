@@ -0,0 +1 @@
+font-profile.py
\ No newline at end of file
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Layout Calibration - Per-document paragraph-break and heading thresholds
+
+Fits the thresholds the line/paragraph segmenters otherwise hard-code from a sample
+of BODY-zone pages:
+
+- line tolerance   max vertical offset of a word from its line anchor
+                   (95th percentile of in-line top spread, plus slack)
+- paragraph gap    two-cluster split of vertical gaps between consecutive lines
+                   (leading vs. paragraph spacing)
+- indent           two-cluster split of line x0 offsets from the page's text margin
+                   (flush vs. first-line indent)
+- heading ratio    two-cluster split of line font size / body size
+                   (body text vs. headings)
+
+A threshold is only fitted when its two clusters are well separated; otherwise the
+default is kept and `fitted` records which values came from the document. Results are
+stored in the book's run manifest (`<out>/run-manifest.json`, see
+ministry-extraction/run-library.py) under "calibration" together with the source
+SHA256, and reused until the PDF changes.
+
+Used by:
+- ministry-extraction/pdf-extractor.py (MinistryPDFExtractor)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
+
+from line_assembly import AssembledLine, assemble_page_lines
+
+CALIBRATION_VERSION = 1
+DEFAULT_SAMPLE_PAGES = 40
+
+# Defaults (the extractor's historical constants)
+DEFAULT_LINE_TOLERANCE = 3.0
+DEFAULT_GAP_RATIO = 1.2 * 1.5  # gap > 1.5x line height (1.2x body size)
+DEFAULT_INDENT = 15.0
+DEFAULT_HEADING_RATIO = 1.3
+
+MIN_CLUSTER_SHARE = 0.02  # Smaller "clusters" are treated as outliers
+
+
+class ClusterSplit(NamedTuple):
+    """Best two-cluster (1-D k-means, k=2) split of a sample"""
+    threshold: float  # Midpoint between the clusters' facing edges
+    low_mean: float
+    high_mean: float
+    low_max: float
+    high_min: float
+    high_share: float  # Fraction of values in the high cluster
+
+
+def two_cluster_split(values: Sequence[float]) -> Optional[ClusterSplit]:
+    """
+    Split sorted values into the two groups with the largest between-cluster variance
+
+    One pass over prefix sums (Otsu / Jenks with two classes). Returns None when the
+    sample has fewer than two distinct values.
+    """
+    ordered = sorted(values)
+    n = len(ordered)
+    if n < 2 or ordered[0] == ordered[-1]:
+        return None
+
+    total = sum(ordered)
+    best_score = -1.0
+    best_index = 0
+    running = 0.0
+    for i in range(1, n):
+        running += ordered[i - 1]
+        if ordered[i] == ordered[i - 1]:
+            continue  # Never split between equal values
+        score = running * running / i + (total - running) ** 2 / (n - i)
+        if score > best_score:
+            best_score = score
+            best_index = i
+
+    low, high = ordered[:best_index], ordered[best_index:]
+    return ClusterSplit(
+        threshold=(low[-1] + high[0]) / 2,
+        low_mean=sum(low) / len(low),
+        high_mean=sum(high) / len(high),
+        low_max=low[-1],
+        high_min=high[0],
+        high_share=len(high) / n,
+    )
+
+
+def lowest_split(values: Sequence[float], accept: Callable[[ClusterSplit], bool]) -> Optional[ClusterSplit]:
+    """
+    Lowest accepted split: keep splitting the lower cluster while the result is accepted
+
+    With more than two modes (leading / paragraph spacing / section breaks) the widest
+    split separates the top mode; the boundary wanted is the first one above the base.
+    """
+    split = two_cluster_split(values)
+    if split is None or not accept(split):
+        return None
+    while True:
+        lower = [v for v in values if v < split.threshold]
+        candidate = two_cluster_split(lower) if len(lower) >= 20 else None
+        if candidate is None or not accept(candidate):
+            return split
+        split = candidate
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def _clamp(value: float, lo: float, hi: float) -> float:
+    return max(lo, min(hi, value))
+
+
+@dataclass
+class LayoutThresholds:
+    """Segmentation thresholds (points / ratio to body size) and their provenance"""
+    body_font_size: float
+    line_tolerance: float = DEFAULT_LINE_TOLERANCE
+    paragraph_gap: float = 0.0  # Points; 0 → DEFAULT_GAP_RATIO × body size
+    indent: float = DEFAULT_INDENT
+    heading_ratio: float = DEFAULT_HEADING_RATIO
+    fitted: Dict[str, bool] = field(default_factory=dict)
+    samples: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if not self.paragraph_gap:
+            self.paragraph_gap = self.body_font_size * DEFAULT_GAP_RATIO
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "bodyFontSize": round(self.body_font_size, 2),
+            "lineTolerance": round(self.line_tolerance, 2),
+            "paragraphGap": round(self.paragraph_gap, 2),
+            "indent": round(self.indent, 2),
+            "headingRatio": round(self.heading_ratio, 3),
+            "fitted": self.fitted,
+            "samples": self.samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LayoutThresholds":
+        return cls(
+            body_font_size=float(data["bodyFontSize"]),
+            line_tolerance=float(data.get("lineTolerance", DEFAULT_LINE_TOLERANCE)),
+            paragraph_gap=float(data.get("paragraphGap", 0.0)),
+            indent=float(data.get("indent", DEFAULT_INDENT)),
+            heading_ratio=float(data.get("headingRatio", DEFAULT_HEADING_RATIO)),
+            fitted=dict(data.get("fitted", {})),
+            samples=dict(data.get("samples", {})),
+        )
+
+
+def sample_page_numbers(page_count: int, sample_pages: int = DEFAULT_SAMPLE_PAGES) -> List[int]:
+    """Evenly spaced 1-indexed page numbers (all pages for short documents)"""
+    if page_count <= sample_pages:
+        return list(range(1, page_count + 1))
+    step = page_count / sample_pages
+    return sorted({int(i * step) + 1 for i in range(sample_pages)})
+
+
+def _fit_line_tolerance(pages: List[Sequence[Any]], body: float) -> Optional[float]:
+    """95th percentile of in-line top spread, from lines assembled with a generous tolerance"""
+    spreads: List[float] = []
+    for words in pages:
+        for line in assemble_page_lines(words, tolerance=body * 0.5):
+            if len(line.words) > 1:
+                tops = [w.top for w in line.words]
+                spreads.append(max(tops) - min(tops))
+    if len(spreads) < 20:
+        return None
+    return _clamp(_percentile(spreads, 0.95) + 0.5, 1.0, body * 0.5)
+
+
+def _line_metrics(lines_by_page: List[List[AssembledLine]]) -> Dict[str, List[float]]:
+    gaps: List[float] = []
+    offsets: List[float] = []
+    sizes: List[float] = []
+    for lines in lines_by_page:
+        if not lines:
+            continue
+        # Text margin: the most common (rounded) line start on the page
+        margin = Counter(round(line.x0) for line in lines).most_common(1)[0][0]
+        for prev, curr in zip(lines, lines[1:]):
+            gaps.append(curr.top - prev.bottom)
+        offsets.extend(line.x0 - margin for line in lines)
+        sizes.extend(line.font_size for line in lines if line.font_size > 0)
+    return {"gaps": gaps, "offsets": offsets, "sizes": sizes}
+
+
+def calibrate_layout(pages: Iterable[Sequence[Any]], body_font_size: float) -> LayoutThresholds:
+    """
+    Fit thresholds from sampled pages
+
+    Args:
+        pages: BODY-zone words (LayoutAwareBlock-like) of each sampled page
+        body_font_size: Modal body size (font profile)
+    """
+    body = body_font_size
+    pages = [list(words) for words in pages]
+    thresholds = LayoutThresholds(body_font_size=body)
+    fitted = {"lineTolerance": False, "paragraphGap": False, "indent": False, "headingRatio": False}
+
+    tolerance = _fit_line_tolerance(pages, body)
+    if tolerance is not None:
+        thresholds.line_tolerance = tolerance
+        fitted["lineTolerance"] = True
+
+    lines_by_page = [assemble_page_lines(words, tolerance=thresholds.line_tolerance) for words in pages]
+    metrics = _line_metrics(lines_by_page)
+    line_height = body * 1.2
+
+    # Paragraph gap: leading vs. paragraph spacing (section breaks form a higher mode)
+    gaps = [_clamp(g, -line_height, line_height * 4) for g in metrics["gaps"]]
+    split = lowest_split(gaps, lambda c: (
+        MIN_CLUSTER_SHARE <= c.high_share <= 0.5 and c.high_mean - c.low_mean >= body * 0.5
+    )) if len(gaps) >= 20 else None
+    if split:
+        thresholds.paragraph_gap = split.threshold
+        fitted["paragraphGap"] = True
+
+    # Indent: flush lines vs. first-line indents (centered lines stay in the upper cluster)
+    offsets = [_clamp(o, 0.0, body * 10) for o in metrics["offsets"]]
+    split = two_cluster_split(offsets) if len(offsets) >= 20 else None
+    if (split and MIN_CLUSTER_SHARE <= split.high_share <= 0.5
+            and split.high_min - split.low_max >= body * 0.3):
+        thresholds.indent = split.threshold
+        fitted["indent"] = True
+
+    # Heading ratio: body-size lines vs. larger headings
+    ratios = [_clamp(size / body, 0.5, 3.0) for size in metrics["sizes"]]
+    split = two_cluster_split(ratios) if len(ratios) >= 20 else None
+    if (split and split.high_share <= 0.2 and split.high_min >= 1.1
+            and split.high_mean - split.low_mean >= 0.15):
+        thresholds.heading_ratio = _clamp(split.threshold, 1.1, 2.0)
+        fitted["headingRatio"] = True
+
+    thresholds.fitted = fitted
+    thresholds.samples = {
+        "pages": len(pages),
+        "lines": sum(len(lines) for lines in lines_by_page),
+        "gaps": len(gaps),
+    }
+    return thresholds
+
+
+def load_calibration(manifest_path: Path, source_sha256: str) -> Optional[LayoutThresholds]:
+    """Thresholds stored in a run manifest, if they were fitted on this exact PDF"""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            calibration = json.load(f).get("calibration") or {}
+    except (OSError, ValueError):
+        return None
+    if calibration.get("version") != CALIBRATION_VERSION or calibration.get("sourceSha256") != source_sha256:
+        return None
+    return LayoutThresholds.from_dict(calibration)
+
+
+def save_calibration(manifest_path: Path, source_sha256: str, thresholds: LayoutThresholds,
+                     sample_pages: List[int]):
+    """Store thresholds under "calibration", keeping the rest of the manifest"""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+
+    manifest["calibration"] = {
+        "version": CALIBRATION_VERSION,
+        "sourceSha256": source_sha256,
+        "samplePages": sample_pages,
+        **thresholds.to_dict(),
+    }
+
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, manifest_path)
@@ -0,0 +1 @@
+layout-calibration.py
\ No newline at end of file
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Line Assembly - Shared word → line engine for PDF extractors
+
+Used by:
+- canon-parser/ruach_canon_parser.py (PdfAdapter, pdfplumber word dicts)
+- ministry-extraction/pdf-extractor.py (MinistryPDFExtractor, LayoutAwareBlock words)
+- unified-extraction/scripture-extractor.py (ScriptureExtractor, LayoutAwareBlock words)
+
+Algorithm (per page):
+1. Read each word's geometry once into a tuple
+2. Sort the page once by (top, x0)
+3. Sweep down the page: a word joins the current line while its top is within
+   `tolerance` of the line's anchor (first/highest top), otherwise it starts a new line
+4. Order each line by x0 and emit text + bounding box + font statistics
+
+Anchoring on the first top (instead of exact-match buckets or the previous word's top)
+keeps words with slightly different baselines on one line without letting a line
+"drift" down the page through a chain of small offsets.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# (top, x0, x1, bottom, font_size, font_name, text, source_word)
+_WordGeometry = Tuple[float, float, float, float, float, str, str, Any]
+
+DEFAULT_LINE_TOLERANCE = 2.0  # points
+
+_by_position = itemgetter(0, 1)
+_by_x0 = itemgetter(1)
+
+
+@dataclass(frozen=True)
+class AssembledLine:
+    """Line of words with bounding box and font statistics"""
+    text: str
+    page: Optional[int]
+    x0: float
+    x1: float
+    top: float
+    bottom: float
+    font_size: float  # Mean word font size (0.0 if unknown)
+    max_font_size: float
+    font_name: str  # Dominant font (by character count)
+    words: Tuple[Any, ...]  # Source words, left → right
+
+    @property
+    def height(self) -> float:
+        return self.bottom - self.top
+
+
+def word_geometry(word: Any) -> _WordGeometry:
+    """
+    Normalize a pdfplumber word dict or a LayoutAwareBlock-like object
+
+    Dicts use pdfplumber keys (x0/x1/top/bottom/size|height/fontname/text);
+    objects use LayoutAwareBlock attributes (x0/x1/top/bottom/font_size/font_name/text).
+    """
+    if isinstance(word, dict):
+        x0 = float(word.get("x0", 0.0) or 0.0)
+        size = word.get("size")
+        if size is None:
+            size = word.get("height", 0.0)
+        return (
+            float(word.get("top", 0.0) or 0.0),
+            x0,
+            float(word.get("x1", x0) or x0),
+            float(word.get("bottom", 0.0) or 0.0),
+            float(size or 0.0),
+            str(word.get("fontname", "") or ""),
+            str(word.get("text", "")),
+            word,
+        )
+
+    x0 = float(getattr(word, "x0", 0.0) or 0.0)
+    x1 = getattr(word, "x1", None)
+    return (
+        float(getattr(word, "top", 0.0) or 0.0),
+        x0,
+        float(x1) if x1 is not None else x0,
+        float(getattr(word, "bottom", 0.0) or 0.0),
+        float(getattr(word, "font_size", 0.0) or 0.0),
+        str(getattr(word, "font_name", "") or ""),
+        str(getattr(word, "text", "")),
+        word,
+    )
+
+
+def _build_line(geoms: List[_WordGeometry], page: Optional[int]) -> AssembledLine:
+    geoms.sort(key=_by_x0)
+
+    texts = [g[6].strip() for g in geoms]
+    sizes = [g[4] for g in geoms if g[4] > 0]
+
+    font_chars: Dict[str, int] = defaultdict(int)
+    for g in geoms:
+        if g[5]:
+            font_chars[g[5]] += len(g[6])
+    font_name = max(font_chars.items(), key=itemgetter(1))[0] if font_chars else ""
+
+    return AssembledLine(
+        text=" ".join(t for t in texts if t),
+        page=page,
+        x0=min(g[1] for g in geoms),
+        x1=max(g[2] for g in geoms),
+        top=min(g[0] for g in geoms),
+        bottom=max(g[3] for g in geoms),
+        font_size=sum(sizes) / len(sizes) if sizes else 0.0,
+        max_font_size=max(sizes) if sizes else 0.0,
+        font_name=font_name,
+        words=tuple(g[7] for g in geoms),
+    )
+
+
+def assemble_page_lines(
+    words: Iterable[Any],
+    page: Optional[int] = None,
+    tolerance: float = DEFAULT_LINE_TOLERANCE,
+) -> List[AssembledLine]:
+    """
+    Assemble one page's words into lines (top → bottom)
+
+    Args:
+        words: pdfplumber word dicts or LayoutAwareBlock-like objects from a single page
+        page: Page number recorded on each line
+        tolerance: Max vertical distance (points) from the line anchor to join the line
+
+    Returns:
+        List of AssembledLine objects in reading order
+    """
+    geoms = [word_geometry(w) for w in words]
+    if not geoms:
+        return []
+    geoms.sort(key=_by_position)
+
+    lines: List[AssembledLine] = []
+    current: List[_WordGeometry] = []
+    anchor = 0.0
+
+    for g in geoms:
+        if current and g[0] - anchor > tolerance:
+            lines.append(_build_line(current, page))
+            current = []
+        if not current:
+            anchor = g[0]
+        current.append(g)
+
+    if current:
+        lines.append(_build_line(current, page))
+
+    return lines
+
+
+def assemble_lines_by_page(
+    words: Sequence[Any],
+    tolerance: float = DEFAULT_LINE_TOLERANCE,
+) -> List[AssembledLine]:
+    """
+    Assemble words spanning several pages (objects with a `page` attribute)
+
+    Pages are emitted in ascending order; lines never cross a page boundary.
+    """
+    pages: Dict[Optional[int], List[Any]] = defaultdict(list)
+    for w in words:
+        pages[getattr(w, "page", None)].append(w)
+
+    lines: List[AssembledLine] = []
+    for page_num in sorted(pages, key=lambda p: (p is None, p or 0)):
+        lines.extend(assemble_page_lines(pages[page_num], page=page_num, tolerance=tolerance))
+    return lines
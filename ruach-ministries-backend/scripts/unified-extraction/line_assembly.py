@@ -0,0 +1 @@
+line-assembly.py
\ No newline at end of file
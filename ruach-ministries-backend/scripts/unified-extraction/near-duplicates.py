@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Near-Duplicates - Cross-book near-duplicate paragraph detection (shingling + MinHash + LSH)
+
+Exact text hashes (compute_text_hash, textHash) only catch identical paragraphs; books
+quoting each other differ by punctuation, a word, an ellipsis. This module:
+
+1. Shingles each paragraph (4-word windows over lowercased, punctuation-free words)
+2. MinHashes the shingle set (128 permutations; Jaccard ≈ fraction of equal slots)
+3. Buckets signatures with LSH banding (32 bands × 4 rows → candidates from ~0.4 Jaccard)
+4. Verifies candidates against the bucket's first member and links them (union-find)
+5. Splits each linked group into clusters whose members are verified against the
+   cluster's canonical text itself (links chain: A≈B and B≈C does not make C ≈ A)
+
+Each paragraph is compared to a handful of bucket representatives, so the whole corpus
+is processed in near-linear time. Within a linked group, paragraphs are taken in corpus
+order (sources in the order given, paragraphs in source order): each one joins the
+canonical it is most similar to (≥ threshold), or becomes a canonical text itself.
+
+Signatures are persisted per source and only recomputed when the source file changes:
+    <corpus>.minhash.json   params + sources [{name, path, sha256, offset, count, ids}]
+    <corpus>.minhash.bin    uint32 little-endian signatures [paragraphs, numPerm]
+
+Results (see write_reports):
+    <corpus>.duplicates.json                  clusters across the corpus
+    <ingest dir>/duplicates.json (per source) {"duplicateOf": {textId: {source, id, similarity}}}
+used by ministry-extraction/generate-embeddings.ts (--duplicates: not embedded) and
+import-to-strapi.ts (embedding points at the canonical text instead of a second vector).
+
+Usage:
+    python near-duplicates.py --corpus ministry-pipeline/library \\
+        --source MOH=ministry-pipeline/egw/ministry-of-healing/exports/v1/paragraphs.jsonl \\
+        --source WRT=ministry-pipeline/library/why-revival-tarries/exports/v1/paragraphs.jsonl \\
+        [--threshold 0.7]
+
+Used by:
+- ministry-extraction/run-library.py (corpus stage after all books)
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: vectorized signatures
+    np = None
+
+CORPUS_VERSION = 1
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+DEFAULT_NUM_PERM = 128
+DEFAULT_BANDS = 32
+DEFAULT_SHINGLE = 4
+DEFAULT_MIN_WORDS = 8  # Shorter paragraphs ("Amen.", headings) are not compared
+DEFAULT_THRESHOLD = 0.7  # A changed word costs 4 shingles; quotes with edits stay ≥ 0.7
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def shingle_hashes(text: str, size: int = DEFAULT_SHINGLE) -> List[int]:
+    """32-bit hashes of the word shingles of a paragraph (set semantics)"""
+    words = WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return [zlib.crc32(" ".join(words).encode("utf-8"))]
+    return list({
+        zlib.crc32(" ".join(words[i:i + size]).encode("utf-8"))
+        for i in range(len(words) - size + 1)
+    })
+
+
+def word_count(text: str) -> int:
+    return len(WORD_RE.findall(text.lower()))
+
+
+class MinHasher:
+    """MinHash over 32-bit shingle hashes: h_i(x) = ((a_i·x + b_i) mod p) & 0xffffffff"""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1):
+        rng = random.Random(seed)
+        # a, b < 2^31 keep a·x + b < 2^63 for 32-bit x (no uint64 overflow in numpy)
+        self.a = [rng.randrange(1, 1 << 31) for _ in range(num_perm)]
+        self.b = [rng.randrange(0, 1 << 31) for _ in range(num_perm)]
+        self.num_perm = num_perm
+        if np is not None:
+            self._a = np.array(self.a, dtype=np.uint64)[:, None]
+            self._b = np.array(self.b, dtype=np.uint64)[:, None]
+
+    def signature(self, hashes: Sequence[int]) -> array:
+        if np is not None:
+            x = np.array(hashes, dtype=np.uint64)[None, :]
+            values = ((self._a * x + self._b) % MERSENNE_PRIME) & MAX_HASH
+            return array("I", values.min(axis=1).astype(np.uint32).tobytes())
+        return array("I", [
+            min(((a * x + b) % MERSENNE_PRIME) & MAX_HASH for x in hashes)
+            for a, b in zip(self.a, self.b)
+        ])
+
+
+def similarity(sig_a: Sequence[int], sig_b: Sequence[int]) -> float:
+    """Estimated Jaccard similarity (fraction of equal MinHash slots)"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def sha256_file(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+def iter_jsonl_paragraphs(path: Path) -> Iterator[Tuple[str, str]]:
+    """(textId, text) from a ministry paragraphs.jsonl (textId rule of jsonl-to-strapi.py)"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            row = json.loads(line)
+            chapter = int(row.get("chapter", 0))
+            if chapter == 0:
+                continue
+            yield f"{row.get('book', '')}-{chapter}-{int(row.get('paragraph', 0))}", str(row.get("text", "")).strip()
+
+
+@dataclass
+class CorpusSource:
+    """One book (or other paragraph source) in the corpus"""
+    name: str
+    path: str
+    sha256: str
+    ids: List[str]
+    offset: int = 0  # First signature row
+    skipped: int = 0  # Paragraphs under min_words (not signed)
+
+    @property
+    def count(self) -> int:
+        return len(self.ids)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "path": self.path, "sha256": self.sha256,
+                "offset": self.offset, "count": self.count, "skipped": self.skipped, "ids": self.ids}
+
+
+@dataclass
+class DuplicateCluster:
+    canonical: Tuple[str, str]  # (source, id)
+    members: List[Tuple[str, str, float]] = field(default_factory=list)  # (source, id, similarity)
+
+
+class MinHashCorpus:
+    """Persisted per-source MinHash signatures"""
+
+    def __init__(self, base: Path, num_perm: int = DEFAULT_NUM_PERM, bands: int = DEFAULT_BANDS,
+                 shingle: int = DEFAULT_SHINGLE, min_words: int = DEFAULT_MIN_WORDS, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be a multiple of bands ({bands})")
+        self.base = Path(base)
+        self.params = {"numPerm": num_perm, "bands": bands, "shingle": shingle,
+                       "minWords": min_words, "seed": seed}
+        self.hasher = MinHasher(num_perm, seed)
+        self.sources: List[CorpusSource] = []
+        self.signatures: Dict[str, array] = {}  # source name → flat uint32 signatures
+
+    @property
+    def json_path(self) -> Path:
+        return self.base.with_name(self.base.name + ".minhash.json")
+
+    @property
+    def bin_path(self) -> Path:
+        return self.base.with_name(self.base.name + ".minhash.bin")
+
+    @property
+    def num_perm(self) -> int:
+        return self.params["numPerm"]
+
+    # -- persistence ------------------------------------------------------------------
+
+    def load(self) -> "MinHashCorpus":
+        """Load cached signatures (silently ignored when missing or built with other params)"""
+        try:
+            with open(self.json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            with open(self.bin_path, "rb") as f:
+                raw = f.read()
+            flat = array("I")
+            flat.frombytes(raw)
+        except (OSError, ValueError):
+            return self
+        if data.get("version") != CORPUS_VERSION or data.get("params") != self.params:
+            return self
+        # The .bin is replaced before the manifest; an interrupted save leaves the old
+        # manifest's offsets over new signatures, so both must describe the same bytes.
+        expected = sum(len(entry["ids"]) for entry in data.get("sources", []))
+        if (len(flat) != expected * self.num_perm
+                or data.get("binSha256") != hashlib.sha256(raw).hexdigest()):
+            print(f"⚠️  {self.bin_path} does not match {self.json_path.name} - re-signing all sources")
+            return self
+        if sys.byteorder != "little":
+            flat.byteswap()
+        n = self.num_perm
+        for entry in data.get("sources", []):
+            source = CorpusSource(entry["name"], entry["path"], entry["sha256"], entry["ids"],
+                                  entry["offset"], entry.get("skipped", 0))
+            self.sources.append(source)
+            self.signatures[source.name] = flat[source.offset * n:(source.offset + source.count) * n]
+        return self
+
+    def save(self):
+        n = self.num_perm
+        offset = 0
+        flat = array("I")
+        for source in self.sources:
+            source.offset = offset
+            flat.extend(self.signatures[source.name])
+            offset += source.count
+        if sys.byteorder != "little":
+            flat.byteswap()
+
+        self.json_path.parent.mkdir(parents=True, exist_ok=True)
+        raw = flat.tobytes()
+        tmp_bin = self.bin_path.with_name(self.bin_path.name + ".tmp")
+        with open(tmp_bin, "wb") as f:
+            f.write(raw)
+        os.replace(tmp_bin, self.bin_path)
+        # Manifest last: it records the .bin it describes, so load() can tell a torn save
+        tmp_json = self.json_path.with_name(self.json_path.name + ".tmp")
+        with open(tmp_json, "w", encoding="utf-8") as f:
+            json.dump({
+                "version": CORPUS_VERSION,
+                "params": self.params,
+                "paragraphs": offset,
+                "binBytes": len(raw),
+                "binSha256": hashlib.sha256(raw).hexdigest(),
+                "sources": [source.to_dict() for source in self.sources],
+            }, f, ensure_ascii=False)
+        os.replace(tmp_json, self.json_path)
+
+    # -- sources ----------------------------------------------------------------------
+
+    def update_source(self, name: str, path: Path,
+                      paragraphs: Optional[Iterable[Tuple[str, str]]] = None) -> bool:
+        """
+        Sign a source's paragraphs unless its file is unchanged; returns True when (re)signed
+
+        The corpus order follows the order of update_source() calls for new sources.
+        """
+        sha = sha256_file(path)
+        existing = next((s for s in self.sources if s.name == name), None)
+        if existing is not None and existing.sha256 == sha:
+            return False
+
+        min_words = self.params["minWords"]
+        ids: List[str] = []
+        flat = array("I")
+        skipped = 0
+        for text_id, text in (paragraphs if paragraphs is not None else iter_jsonl_paragraphs(path)):
+            if word_count(text) < min_words:
+                skipped += 1
+                continue
+            ids.append(text_id)
+            flat.extend(self.hasher.signature(shingle_hashes(text, self.params["shingle"])))
+
+        source = CorpusSource(name, str(path), sha, ids, skipped=skipped)
+        if existing is not None:
+            self.sources[self.sources.index(existing)] = source
+        else:
+            self.sources.append(source)
+        self.signatures[name] = flat
+        return True
+
+    def retain(self, names: Iterable[str]):
+        """Drop sources no longer in the corpus"""
+        keep = set(names)
+        self.sources = [s for s in self.sources if s.name in keep]
+        self.signatures = {name: sig for name, sig in self.signatures.items() if name in keep}
+
+    def order(self, names: Sequence[str]):
+        """Put sources in corpus order (earlier sources hold canonical texts)"""
+        rank = {name: i for i, name in enumerate(names)}
+        self.sources.sort(key=lambda s: rank.get(s.name, len(rank)))
+
+    # -- detection --------------------------------------------------------------------
+
+    def find_duplicates(self, threshold: float = DEFAULT_THRESHOLD) -> List[DuplicateCluster]:
+        """
+        Clusters of paragraphs with estimated Jaccard ≥ threshold to the cluster's canonical;
+        a member's similarity is its score against that canonical
+        """
+        n = self.num_perm
+        rows_per_band = n // self.params["bands"]
+        entries: List[Tuple[str, str]] = []
+        signatures: List[memoryview] = []
+        for source in self.sources:
+            flat = memoryview(self.signatures[source.name])
+            for i, text_id in enumerate(source.ids):
+                entries.append((source.name, text_id))
+                signatures.append(flat[i * n:(i + 1) * n])
+
+        parent = list(range(len(entries)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        buckets: List[Dict[bytes, int]] = [{} for _ in range(self.params["bands"])]
+        for index, sig in enumerate(signatures):
+            checked = set()
+            for band, bucket in enumerate(buckets):
+                key = sig[band * rows_per_band:(band + 1) * rows_per_band].tobytes()
+                first = bucket.setdefault(key, index)
+                if first == index or first in checked:
+                    continue
+                checked.add(first)
+                score = similarity(signatures[first], sig)
+                if score >= threshold:
+                    root_a, root_b = find(first), find(index)
+                    if root_a != root_b:
+                        parent[max(root_a, root_b)] = min(root_a, root_b)
+
+        groups: Dict[int, List[int]] = {}
+        for index in range(len(entries)):
+            groups.setdefault(find(index), []).append(index)
+
+        clusters: List[DuplicateCluster] = []
+        for members in groups.values():
+            if len(members) < 2:
+                continue
+            # Lower index = earlier in corpus order = canonical
+            canonicals: List[Tuple[int, DuplicateCluster]] = []
+            for index in members:
+                score, cluster = max(
+                    ((similarity(signatures[c], signatures[index]), cluster) for c, cluster in canonicals),
+                    key=lambda item: item[0], default=(0.0, None),
+                )
+                if cluster is not None and score >= threshold:
+                    cluster.members.append((*entries[index], round(score, 4)))
+                else:
+                    canonicals.append((index, DuplicateCluster(canonical=entries[index])))
+            clusters.extend(cluster for _, cluster in canonicals if cluster.members)
+        return clusters
+
+
+def write_reports(corpus: MinHashCorpus, clusters: List[DuplicateCluster], threshold: float,
+                  ingest_dirs: Optional[Dict[str, Path]] = None) -> Path:
+    """
+    Write <corpus>.duplicates.json and, per source with an ingest dir, duplicates.json
+
+    A source's duplicates.json lists its non-canonical paragraphs (all sources get one, so
+    a stale file never survives a run in which the book had no duplicates).
+    """
+    generated_at = datetime.now(timezone.utc).isoformat()
+    per_source: Dict[str, Dict[str, Any]] = {source.name: {} for source in corpus.sources}
+    for cluster in clusters:
+        canonical_source, canonical_id = cluster.canonical
+        for source, text_id, score in cluster.members:
+            per_source[source][text_id] = {"source": canonical_source, "id": canonical_id, "similarity": score}
+
+    report_path = corpus.base.with_name(corpus.base.name + ".duplicates.json")
+    report = {
+        "generatedAt": generated_at,
+        "threshold": threshold,
+        "params": corpus.params,
+        "sources": [{"name": s.name, "paragraphs": s.count, "skipped": s.skipped,
+                     "duplicates": len(per_source[s.name])} for s in corpus.sources],
+        "clusters": [
+            {"canonical": {"source": c.canonical[0], "id": c.canonical[1]},
+             "members": [{"source": s, "id": i, "similarity": score} for s, i, score in c.members]}
+            for c in clusters
+        ],
+    }
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    for name, ingest_dir in (ingest_dirs or {}).items():
+        if name not in per_source or not ingest_dir.exists():
+            continue
+        with open(ingest_dir / "duplicates.json", "w", encoding="utf-8") as f:
+            json.dump({"generatedAt": generated_at, "threshold": threshold,
+                       "duplicateOf": per_source[name]}, f, ensure_ascii=False, indent=2)
+    return report_path
+
+
+def detect_corpus_duplicates(corpus_base: Path, sources: List[Tuple[str, Path]],
+                             threshold: float = DEFAULT_THRESHOLD,
+                             ingest_dirs: Optional[Dict[str, Path]] = None) -> Dict[str, Any]:
+    """Update the corpus for `sources` (in corpus order), detect, and write reports"""
+    corpus = MinHashCorpus(corpus_base).load()
+    names = [name for name, _ in sources]
+    corpus.retain(names)
+    signed = [name for name, path in sources if corpus.update_source(name, path)]
+    corpus.order(names)
+    corpus.save()
+
+    clusters = corpus.find_duplicates(threshold)
+    report_path = write_reports(corpus, clusters, threshold, ingest_dirs)
+    return {
+        "sources": len(sources),
+        "signed": signed,
+        "paragraphs": sum(s.count for s in corpus.sources),
+        "clusters": len(clusters),
+        "duplicates": sum(len(c.members) for c in clusters),
+        "crossSource": sum(1 for c in clusters for s, _, _ in c.members if s != c.canonical[0]),
+        "report": str(report_path),
+    }
+
+
+def parse_source_arg(value: str) -> Tuple[str, Path]:
+    name, sep, path = value.partition("=")
+    if not sep or not name:
+        raise argparse.ArgumentTypeError(f"expected NAME=PARAGRAPHS_JSONL, got {value!r}")
+    return name, Path(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-book near-duplicate paragraph detection (MinHash/LSH)")
+    parser.add_argument("--corpus", required=True, help="Corpus base path (signatures + report)")
+    parser.add_argument("--source", action="append", type=parse_source_arg, required=True,
+                        help="NAME=paragraphs.jsonl, in corpus order (repeatable)")
+    parser.add_argument("--ingest", action="append", type=parse_source_arg, default=[],
+                        help="NAME=ingest dir to receive duplicates.json (repeatable)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Estimated Jaccard for a near-duplicate (default: {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+
+    for name, path in args.source:
+        if not path.exists():
+            print(f"❌ {name}: {path} not found")
+            sys.exit(1)
+
+    print(f"🔍 Detecting near-duplicates across {len(args.source)} source(s)...")
+    result = detect_corpus_duplicates(Path(args.corpus), args.source, args.threshold, dict(args.ingest))
+    print(f"   Signed: {', '.join(result['signed']) or '(all cached)'}")
+    print(f"✅ {result['paragraphs']} paragraphs, {result['clusters']} clusters, "
+          f"{result['duplicates']} near-duplicates ({result['crossSource']} across sources)")
+    print(f"📊 Report written to {result['report']}")
+
+
+if __name__ == "__main__":
+    main()
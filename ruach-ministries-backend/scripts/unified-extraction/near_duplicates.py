@@ -0,0 +1 @@
+near-duplicates.py
\ No newline at end of file
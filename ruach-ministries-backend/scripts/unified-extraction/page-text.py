@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Page Text - pdfplumber extract_text() for every page, built once per source PDF
+
+Pages are extracted in parallel (page ranges across a process pool, one PDF handle per
+worker) and persisted next to the PDF (`<pdf>.page-text.json`) together with the source
+SHA256. Line-oriented extractors (ministry-extraction/profile-extractor.py) read page
+text from the cache instead of re-running extract_text() on every run.
+
+Usage:
+    python page-text.py /path/to/book.pdf [--out pages.json] [--workers 8] [--force]
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CACHE_VERSION = 1
+PAGES_PER_TASK = 25
+
+
+def _sha256_file(path: Path) -> str:
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+
+# The worker process's PDF handle, opened once by the pool initializer
+_worker_pdf = None
+
+
+def _open_worker_pdf(pdf_path: str):
+    """Pool initializer: open the PDF once per worker process (released when the worker exits)"""
+    global _worker_pdf
+    import pdfplumber
+
+    _worker_pdf = pdfplumber.open(pdf_path)
+
+
+def _extract_pages(pdf, start: int, end: int) -> List[str]:
+    """extract_text() for pages [start, end) (0-indexed); empty pages → "". Pages are closed
+    after extraction so the shared handle does not cache every page it has seen."""
+    texts: List[str] = []
+    for idx in range(start, min(end, len(pdf.pages))):
+        page = pdf.pages[idx]
+        try:
+            texts.append(page.extract_text() or "")
+        finally:
+            page.close()
+    return texts
+
+
+def _extract_page_range(start: int, end: int) -> List[str]:
+    """Worker task: pages [start, end) from the worker's PDF handle"""
+    return _extract_pages(_worker_pdf, start, end)
+
+
+class PageText:
+    """Read API over persisted page text"""
+
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+        self.pages: List[str] = data.get("pages", [])
+
+    @property
+    def source_sha256(self) -> str:
+        return self.data.get("sourceSha256", "")
+
+    @property
+    def page_count(self) -> int:
+        return len(self.pages)
+
+    def page(self, page_num: int) -> str:
+        """Text of a 1-indexed page"""
+        return self.pages[page_num - 1]
+
+    def save(self, path: Path):
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+
+def default_cache_path(pdf_path: Path) -> Path:
+    return pdf_path.with_name(pdf_path.name + ".page-text.json")
+
+
+def build_page_text(pdf_path: Path, workers: Optional[int] = None) -> Dict[str, Any]:
+    """Extract every page in parallel (page ranges across a process pool)"""
+    import pdfplumber
+
+    pages: List[str] = []
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        page_count = len(pdf.pages)
+        ranges = [(start, start + PAGES_PER_TASK) for start in range(0, page_count, PAGES_PER_TASK)]
+        workers = workers or min(len(ranges), os.cpu_count() or 1) or 1
+        serial = workers <= 1 or len(ranges) <= 1
+        if serial:
+            pages = _extract_pages(pdf, 0, page_count)
+
+    if not serial:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_open_worker_pdf,
+                                 initargs=(str(pdf_path),)) as pool:
+            futures = [pool.submit(_extract_page_range, start, end) for start, end in ranges]
+            for future in futures:
+                pages.extend(future.result())
+
+    return {
+        "version": CACHE_VERSION,
+        "sourceFile": str(pdf_path),
+        "pageCount": page_count,
+        "pages": pages,
+    }
+
+
+def load_or_extract_page_text(
+    pdf_path: str,
+    cache_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    force: bool = False,
+) -> PageText:
+    """Load the cached page text if its sourceSha256 matches the PDF; otherwise re-extract it."""
+    source = Path(pdf_path)
+    target = Path(cache_path) if cache_path else default_cache_path(source)
+    source_sha256 = _sha256_file(source)
+
+    if not force and target.exists():
+        try:
+            with open(target, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, ValueError):
+            previous = {}
+        if previous.get("sourceSha256") == source_sha256 and previous.get("version") == CACHE_VERSION:
+            return PageText(previous)
+
+    print(f"📄 Extracting page text for {source.name}...")
+    data = build_page_text(source, workers=workers)
+    data["sourceSha256"] = source_sha256
+
+    page_text = PageText(data)
+    page_text.save(target)
+    print(f"   → {page_text.page_count} pages extracted → {target}")
+    return page_text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build or inspect the cached page text of a PDF")
+    parser.add_argument("pdf_path", help="Path to PDF file")
+    parser.add_argument("--out", help="Cache path (default: <pdf>.page-text.json)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="Re-extract even if the source hash matches")
+    args = parser.parse_args()
+
+    if not Path(args.pdf_path).exists():
+        print(f"ERROR: PDF not found: {args.pdf_path}")
+        sys.exit(1)
+
+    page_text = load_or_extract_page_text(args.pdf_path, args.out, workers=args.workers, force=args.force)
+    empty = sum(1 for text in page_text.pages if not text.strip())
+    print(f"\n📄 Pages: {page_text.page_count} ({empty} without text)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+page-text.py
\ No newline at end of file
@@ -39,6 +39,7 @@ from base_extractor import (
     ExtractionResult,
     ContentType,
 )
+from sequence_assembly import BookSequenceTracker, CanonicalExpectations, print_book_report
 
 
 @dataclass
@@ -140,9 +141,14 @@ class ScriptureExtractor(BaseExtractor):
         # NOTE: Add remaining books as needed
     }
 
-    def __init__(self, source_path: str):
+    def __init__(self, source_path: str, canonical_path: Optional[str] = None):
         super().__init__(source_path, content_type="scripture")
 
+        # Canonical chapter/verse expectations, used as pass 2 constraints
+        self.expectations = CanonicalExpectations.load(canonical_path)
+        self.tracker: Optional[BookSequenceTracker] = None
+        self.sequence_reports: List[Dict] = []
+
         # Pass 1 state
         self.tokens: List[Token] = []
         self.verse_candidates: Dict[str, VerseCandidate] = {}  # key: "chapter:verse"
@@ -350,13 +356,18 @@ class ScriptureExtractor(BaseExtractor):
 
         for token in self.tokens:
             if token.type == TokenType.BOOK_HEADER:
+                if token.value == self.current_book:
+                    continue  # Running head / TOC echo of the current book
+
                 # Flush any pending verse
                 if text_buffer and self.current_chapter > 0 and last_verse_num > 0:
                     self._flush_verse(text_buffer, last_verse_num)
+                self._finish_book()
 
                 # Start new book
                 book_name = token.value
                 self._register_work(book_name)
+                self._start_book(book_name)
                 self.current_book = book_name
                 self.current_chapter = 0
                 last_verse_num = 0
@@ -369,6 +380,11 @@ class ScriptureExtractor(BaseExtractor):
                 continue  # Skip until we find a book
 
             if token.type == TokenType.CHAPTER_MARKER:
+                # Ignore chapter markers that go backwards or past the book's last chapter
+                if not self.tracker.start_chapter(token.value):
+                    self._log_decision("chapter_rejected", token.text, token.value, 0.3, "Out of canonical sequence")
+                    continue
+
                 # Flush pending verse
                 if text_buffer and last_verse_num > 0:
                     self._flush_verse(text_buffer, last_verse_num)
@@ -382,11 +398,7 @@ class ScriptureExtractor(BaseExtractor):
                 continue
 
             if token.type == TokenType.VERSE_MARKER:
-                # Flush previous verse
-                if text_buffer and last_verse_num > 0:
-                    self._flush_verse(text_buffer, last_verse_num)
-
-                # Start new verse - extract text after verse number
+                # Extract text after verse number
                 verse_num = token.value
                 verse_match = self.has_verse_marker(token.text)
                 if verse_match:
@@ -394,28 +406,18 @@ class ScriptureExtractor(BaseExtractor):
                 else:
                     verse_text = token.text  # Fallback
 
-                # CRITICAL FIX: If chapter is 0 and we see verse 1, set chapter to 1
-                # Only if we have book context (conservative)
-                if self.current_book and self.current_chapter == 0 and verse_num == 1:
-                    self.current_chapter = 1
-                    print(f"      Chapter 1 (inferred from first verse)")
-
-                # CHAPTER INFERENCE FALLBACK (conservative)
-                # Only infer if:
-                # 1. We're in scripture mode (have a book)
-                # 2. Verse resets to 1
-                # 3. Previous verse was substantial (>= 20)
-                # 4. We're far from last chapter marker (> 50 lines)
-                # 5. Inference is consistent (would be next sequential chapter)
-                elif (self.current_book and 
-                      verse_num == 1 and 
-                      last_verse_num >= 20 and 
-                      lines_since_chapter > 50):
-                    expected_next_chapter = self.current_chapter + 1
-                    if expected_next_chapter <= 200:  # Reasonable upper bound
-                        self.current_chapter = expected_next_chapter
-                        print(f"      Chapter {self.current_chapter} (inferred from verse reset)")
-                    lines_since_chapter = 0  # Reset counter
+                chapter = self._resolve_verse_chapter(verse_num, last_verse_num, lines_since_chapter)
+                if chapter is None:
+                    # Out of canonical sequence: the line continues the current verse
+                    if last_verse_num > 0:
+                        text_buffer.append(token.text)
+                        lines_since_chapter += 1
+                    continue
+
+                # Flush previous verse
+                if text_buffer and last_verse_num > 0:
+                    self._flush_verse(text_buffer, last_verse_num)
+                self.current_chapter = chapter
 
                 # Update state
                 last_verse_num = verse_num
@@ -426,31 +428,18 @@ class ScriptureExtractor(BaseExtractor):
             if token.type == TokenType.TEXT:
                 # Check for inline verse markers in text
                 verse_match = self.has_verse_marker(token.text)
+                chapter = None
                 if verse_match:
+                    chapter = self._resolve_verse_chapter(verse_match[0], last_verse_num, lines_since_chapter)
+
+                if chapter is not None:
                     # Flush previous
                     if text_buffer and last_verse_num > 0:
                         self._flush_verse(text_buffer, last_verse_num)
+                    self.current_chapter = chapter
 
                     # Start new verse
                     verse_num, verse_text = verse_match
-
-                    # CRITICAL FIX: If chapter is 0 and we see verse 1, set chapter to 1
-                    # Only if we have book context
-                    if self.current_book and self.current_chapter == 0 and verse_num == 1:
-                        self.current_chapter = 1
-                        print(f"      Chapter 1 (inferred from first verse)")
-
-                    # Chapter inference (same conservative logic)
-                    elif (self.current_book and 
-                          verse_num == 1 and 
-                          last_verse_num >= 20 and 
-                          lines_since_chapter > 50):
-                        expected_next_chapter = self.current_chapter + 1
-                        if expected_next_chapter <= 200:
-                            self.current_chapter = expected_next_chapter
-                            print(f"      Chapter {self.current_chapter} (inferred)")
-                        lines_since_chapter = 0
-
                     last_verse_num = verse_num
                     text_buffer = [verse_text]
                     lines_since_chapter = 0
@@ -463,6 +452,70 @@ class ScriptureExtractor(BaseExtractor):
         # Flush final verse
         if text_buffer and last_verse_num > 0:
             self._flush_verse(text_buffer, last_verse_num)
+        self._finish_book()
+
+    def _resolve_verse_chapter(self, verse_num: int, last_verse_num: int, lines_since_chapter: int) -> Optional[int]:
+        """
+        Chapter a verse marker belongs to, or None when it is out of sequence
+
+        With canonical expectations the book's sequence tracker decides (expected next
+        verse, rollover to the next chapter at the known last verse). Books without
+        expectations fall back to verse-reset chapter inference.
+        """
+        if self.tracker.has_expectations:
+            placement = self.tracker.place_verse(verse_num)
+            if placement is None:
+                self._log_decision("verse_rejected", f"{verse_num}", verse_num, 0.3, "Out of canonical sequence")
+                return None
+            chapter = placement[0]
+            if chapter != self.current_chapter:
+                print(f"      Chapter {chapter} (inferred from canonical sequence)")
+            return chapter
+
+        chapter = self.current_chapter
+
+        # CRITICAL FIX: If chapter is 0 and we see verse 1, set chapter to 1
+        # Only if we have book context (conservative)
+        if self.current_book and chapter == 0 and verse_num == 1:
+            chapter = 1
+            print(f"      Chapter 1 (inferred from first verse)")
+
+        # CHAPTER INFERENCE FALLBACK (conservative)
+        # Only infer if:
+        # 1. We're in scripture mode (have a book)
+        # 2. Verse resets to 1
+        # 3. Previous verse was substantial (>= 20)
+        # 4. We're far from last chapter marker (> 50 lines)
+        # 5. Inference is consistent (would be next sequential chapter)
+        elif (self.current_book and
+              verse_num == 1 and
+              last_verse_num >= 20 and
+              lines_since_chapter > 50):
+            expected_next_chapter = chapter + 1
+            if expected_next_chapter <= 200:  # Reasonable upper bound
+                chapter = expected_next_chapter
+                print(f"      Chapter {chapter} (inferred from verse reset)")
+
+        # Keep the (pass-through) tracker in step for the sequence report
+        if chapter > 0:
+            if chapter > self.tracker.chapter:
+                self.tracker.start_chapter(chapter)
+            self.tracker.place_verse(verse_num)
+        return chapter
+
+    def _start_book(self, book_name: str):
+        """Start sequence tracking for a book"""
+        meta = self.BOOK_MAPPING.get(book_name, {})
+        self.tracker = BookSequenceTracker(meta.get("shortCode", book_name), self.expectations)
+
+    def _finish_book(self):
+        """Record and print the sequence report for the current book"""
+        if self.tracker is None:
+            return
+        report = self.tracker.finish()
+        self.sequence_reports.append(report)
+        print_book_report(report)
+        self.tracker = None
 
     def _flush_verse(self, text_buffer: List[str], verse_num: int):
         """Flush verse buffer to output with deduplication"""
@@ -735,6 +788,12 @@ class ScriptureExtractor(BaseExtractor):
                 json.dump(quality_report, f, indent=2)
             print(f"   - validation-gate-report.json")
 
+        if self.sequence_reports:
+            sequence_file = output_path / "sequence-report.json"
+            with open(sequence_file, "w") as f:
+                json.dump(self.sequence_reports, f, indent=2)
+            print(f"   - sequence-report.json ({len(self.sequence_reports)} books)")
+
         if self.decision_log:
             log_file = output_path / "extraction-log.json"
             with open(log_file, "w") as f:
@@ -769,9 +828,10 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Extract scripture from PDF (v3)")
     parser.add_argument("pdf_path", help="Path to PDF file")
     parser.add_argument("output_dir", help="Output directory")
+    parser.add_argument("--canonical", help="canonical-structure.json (default: scripture-extraction/canonical-structure.json)")
     args = parser.parse_args()
 
-    extractor = ScriptureExtractor(args.pdf_path)
+    extractor = ScriptureExtractor(args.pdf_path, canonical_path=args.canonical)
     result = extractor.extract()
 
     extractor.save_json(args.output_dir, result)
@@ -38,6 +38,7 @@ from base_extractor import (
     ExtractionResult,
     ContentType,
 )
+from line_assembly import assemble_lines_by_page
 from toc_parser import parse_toc
 
 
@@ -233,7 +234,8 @@ class ScriptureExtractor(BaseExtractor):
                 font_size=word.get('height', 0),
                 font_name=word.get('fontname', ''),
                 zone=zone,
-                page=page_num
+                page=page_num,
+                x1=word.get('x1'),
             ))
 
         return blocks
@@ -242,8 +244,8 @@ class ScriptureExtractor(BaseExtractor):
         """
         Assemble word-level blocks into line-level blocks
 
-        Groups consecutive words that share the same vertical position (line)
-        into a single block with combined text.
+        Delegates to the shared line-assembly engine (sorted baseline sweep per page),
+        then wraps each line as a LayoutAwareBlock for the verse grammar.
 
         Args:
             word_blocks: List of word-level LayoutAwareBlock objects
@@ -251,72 +253,24 @@ class ScriptureExtractor(BaseExtractor):
         Returns:
             List of line-level LayoutAwareBlock objects
         """
-        if not word_blocks:
-            return []
-
         lines: List[LayoutAwareBlock] = []
-        current_line_words = []
-        current_line_y = None
-
-        # Tolerance for Y-coordinate matching (points)
-        Y_TOLERANCE = 2.0
-
-        for block in word_blocks:
-            # Start a new line if:
-            # 1. This is the first word, OR
-            # 2. Y coordinate differs significantly (new line), OR
-            # 3. Page changed
-            if (current_line_y is None or
-                abs(block.top - current_line_y) > Y_TOLERANCE or
-                (current_line_words and block.page != current_line_words[0].page)):
-
-                # Save previous line
-                if current_line_words:
-                    lines.append(self._merge_words_into_line(current_line_words))
-
-                # Start new line
-                current_line_words = [block]
-                current_line_y = block.top
-            else:
-                # Continue current line
-                current_line_words.append(block)
-
-        # Save final line
-        if current_line_words:
-            lines.append(self._merge_words_into_line(current_line_words))
-
+        for line in assemble_lines_by_page(word_blocks, tolerance=2.0):
+            # Lead word metadata is kept as representative: the verse grammar checks the
+            # font size of a standalone chapter number, not the line average.
+            first = line.words[0]
+            lines.append(LayoutAwareBlock(
+                text=line.text,
+                x0=line.x0,
+                top=line.top,
+                bottom=line.bottom,
+                font_size=first.font_size,
+                font_name=first.font_name,
+                zone=first.zone,
+                page=first.page,
+                x1=line.x1,
+            ))
         return lines
 
-    def _merge_words_into_line(self, words: List[LayoutAwareBlock]) -> LayoutAwareBlock:
-        """
-        Merge multiple word blocks into a single line block
-
-        Args:
-            words: List of word blocks on the same line
-
-        Returns:
-            Single LayoutAwareBlock representing the complete line
-        """
-        if not words:
-            raise ValueError("Cannot merge empty word list")
-
-        # Combine text with spaces
-        line_text = ' '.join(w.text for w in words)
-
-        # Use first word's metadata as representative
-        first = words[0]
-
-        return LayoutAwareBlock(
-            text=line_text,
-            x0=first.x0,
-            top=first.top,
-            bottom=first.bottom,
-            font_size=first.font_size,
-            font_name=first.font_name,
-            zone=first.zone,
-            page=first.page
-        )
-
     def _parse_verses_from_blocks(self, blocks: List[LayoutAwareBlock]):
         """
         Parse verses from BODY-zone blocks using deterministic grammar
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Sequence Assembly - Canonical-structure constraints applied while verses are assembled
+
+Used by:
+- scripture-extraction/extract-yahscriptures.py (v1, font-size markers)
+- scripture-extraction/extract-yahscriptures-v2.py (v2, inline markers)
+- unified-extraction/scripture-extractor-v3.py (v3, pass 2)
+
+canonical-structure.json (chapters per book, verses per chapter) is loaded once, up
+front. Each book gets a BookSequenceTracker that every verse/chapter marker goes through:
+- The expected next verse is accepted; small forward gaps (≤ MAX_VERSE_GAP) are accepted
+  and recorded as missing
+- Verse 1 rolls over to the next chapter only at (or near) the chapter's known last verse
+- Duplicate/backward markers, numbers past the chapter's last verse and chapter markers
+  that go backwards or past the book's last chapter are rejected
+- Two consecutive rejected markers that form a sequence (e.g. 1, 2 after a lost chapter
+  marker) resynchronise the tracker
+
+Extractor shortCodes that differ from the canonical-structure.json keys are mapped
+through CODE_ALIASES. Books still missing get a pass-through tracker (extractor's own
+heuristics apply) and a warning. finish() returns the per-book report, including a confidence score.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+DEFAULT_CANONICAL_PATH = (
+    Path(__file__).resolve().parent.parent / "scripture-extraction" / "canonical-structure.json"
+)
+
+MAX_CHAPTER = 200        # Upper bound when a book has no expectations
+MAX_VERSE_GAP = 5        # Largest forward jump accepted without resync
+ROLLOVER_SLACK = 2       # Verse 1 rolls over if within this many verses of the known last verse
+MISSING_SAMPLE = 20      # Missing references listed in the report
+
+# Extractor shortCode → canonical-structure.json key
+CODE_ALIASES = {
+    "1KI": "1KG",
+    "2KI": "2KG",
+    "MRK": "MAR",
+    "JHN": "JOH",
+    "1JN": "1JO",
+    "2JN": "2JO",
+    "3JN": "3JO",
+    "AZA": "PAZ",
+}
+
+
+class CanonicalExpectations:
+    """Chapter/verse counts from canonical-structure.json"""
+
+    def __init__(self, structure: Dict[str, Any]):
+        self.structure = {
+            code: book for code, book in structure.items()
+            if not code.startswith("_") and isinstance(book, dict)
+        }
+
+    @classmethod
+    def load(cls, canonical_path: Optional[str] = None) -> Optional["CanonicalExpectations"]:
+        """Load expectations; returns None (with a warning) when the file is missing"""
+        path = Path(canonical_path) if canonical_path else DEFAULT_CANONICAL_PATH
+        if not path.exists():
+            print(f"⚠️  canonical-structure.json not found ({path}) - sequence checks disabled")
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def _book(self, book_code: str) -> Optional[Dict[str, Any]]:
+        return self.structure.get(CODE_ALIASES.get(book_code, book_code))
+
+    def has_book(self, book_code: str) -> bool:
+        return self._book(book_code) is not None
+
+    def chapter_count(self, book_code: str) -> Optional[int]:
+        book = self._book(book_code)
+        return int(book["chapters"]) if book else None
+
+    def verse_count(self, book_code: str, chapter: int) -> Optional[int]:
+        book = self._book(book_code)
+        if not book:
+            return None
+        count = book.get("verses", {}).get(str(chapter))
+        return int(count) if count is not None else None
+
+    def total_verses(self, book_code: str) -> Optional[int]:
+        book = self._book(book_code)
+        return int(book["totalVerses"]) if book else None
+
+    def tracker(self, book_code: str) -> "BookSequenceTracker":
+        return BookSequenceTracker(book_code, self)
+
+
+class BookSequenceTracker:
+    """Per-book verse sequence state; the single source of truth for chapter/verse placement"""
+
+    def __init__(self, book_code: str, expectations: Optional[CanonicalExpectations] = None):
+        self.book_code = book_code
+        self.expectations = (
+            expectations if expectations is not None and expectations.has_book(book_code) else None
+        )
+        if expectations is not None and self.expectations is None:
+            print(f"   ⚠️  {book_code}: not in canonical-structure.json - sequence checks off for this book")
+        self.chapter = 0
+        self.last_verse = 0
+
+        self.seen: Set[Tuple[int, int]] = set()
+        self.in_sequence = 0
+        self.gap_accepts = 0
+        self.rollovers = 0
+        self.resyncs = 0
+        self.rejected = 0
+        self.rejected_chapters = 0
+        self._rejected_run: List[int] = []
+
+    @property
+    def has_expectations(self) -> bool:
+        return self.expectations is not None
+
+    def verse_count(self, chapter: Optional[int] = None) -> Optional[int]:
+        """Known last verse of `chapter` (default: current chapter)"""
+        if self.expectations is None:
+            return None
+        return self.expectations.verse_count(self.book_code, chapter if chapter is not None else self.chapter)
+
+    def _max_chapter(self) -> int:
+        if self.expectations is None:
+            return MAX_CHAPTER
+        return self.expectations.chapter_count(self.book_code) or MAX_CHAPTER
+
+    def accepts_chapter(self, chapter: int) -> bool:
+        """Whether an explicit chapter marker continues the book (forward, within range)"""
+        return self.chapter < chapter <= self._max_chapter()
+
+    def start_chapter(self, chapter: int) -> bool:
+        """Apply an explicit chapter marker; returns False (and ignores it) when out of sequence"""
+        if not self.accepts_chapter(chapter):
+            self.rejected_chapters += 1
+            return False
+        self.chapter = chapter
+        self.last_verse = 0
+        self._rejected_run = []
+        return True
+
+    def place_verse(self, verse: int) -> Optional[Tuple[int, int]]:
+        """
+        Place a verse marker in the book sequence
+
+        Returns:
+            (chapter, verse) to emit, or None when the marker is out of sequence
+            (callers treat the marker as part of the current verse's text)
+        """
+        if self.chapter == 0:
+            self.chapter = 1  # First verse before any chapter marker
+
+        if self.expectations is None:
+            return self._accept(verse, in_sequence=verse == self.last_verse + 1)
+
+        last_in_chapter = self.verse_count() or 0
+
+        if verse == self.last_verse + 1 and verse <= last_in_chapter:
+            return self._accept(verse, in_sequence=True)
+
+        if (verse == 1 and self.last_verse > 0 and self.chapter < self._max_chapter()
+                and self.last_verse >= last_in_chapter - ROLLOVER_SLACK):
+            in_sequence = self.last_verse == last_in_chapter
+            self.rollovers += 1
+            self.chapter += 1
+            return self._accept(verse, in_sequence=in_sequence)
+
+        if self.last_verse + 1 < verse <= min(last_in_chapter, self.last_verse + MAX_VERSE_GAP):
+            self.gap_accepts += 1
+            return self._accept(verse, in_sequence=False)
+
+        return self._reject(verse)
+
+    def _accept(self, verse: int, in_sequence: bool) -> Tuple[int, int]:
+        self.last_verse = verse
+        self._rejected_run = []
+        self.seen.add((self.chapter, verse))
+        if in_sequence:
+            self.in_sequence += 1
+        return (self.chapter, verse)
+
+    def _reject(self, verse: int) -> Optional[Tuple[int, int]]:
+        run = self._rejected_run
+        if run and verse == run[-1] + 1:
+            run.append(verse)
+            start = run[0]
+            # Lost chapter marker: 1, 2, ... mid-chapter → next chapter
+            if start == 1 and self.chapter < self._max_chapter():
+                self.resyncs += 1
+                self.chapter += 1
+                self.last_verse = 0
+                return self._accept(verse, in_sequence=False)
+            # Lost verses: a consistent run beyond the gap limit
+            if start > self.last_verse and verse <= (self.verse_count() or 0):
+                self.resyncs += 1
+                return self._accept(verse, in_sequence=False)
+        else:
+            self._rejected_run = [verse]
+        self.rejected += 1
+        return None
+
+    def missing(self) -> List[Tuple[int, int]]:
+        """Expected (chapter, verse) references not placed so far"""
+        if self.expectations is None:
+            return []
+        chapters = self.expectations.chapter_count(self.book_code) or 0
+        return [
+            (ch, vs)
+            for ch in range(1, chapters + 1)
+            for vs in range(1, (self.verse_count(ch) or 0) + 1)
+            if (ch, vs) not in self.seen
+        ]
+
+    def confidence(self) -> Optional[float]:
+        """
+        In-sequence share of all markers × coverage of the expected verses (0.0–1.0);
+        None without expectations
+        """
+        if self.expectations is None:
+            return None
+        markers = len(self.seen) + self.rejected
+        expected = self.expectations.total_verses(self.book_code) or 0
+        if markers == 0 or expected == 0:
+            return 0.0
+        coverage = min(len(self.seen) / expected, 1.0)
+        return round((self.in_sequence / markers) * coverage, 4)
+
+    def finish(self) -> Dict[str, Any]:
+        """Per-book sequence report"""
+        missing = self.missing()
+        return {
+            "book": self.book_code,
+            "hasExpectations": self.has_expectations,
+            "expectedChapters": self.expectations.chapter_count(self.book_code) if self.expectations else None,
+            "expectedVerses": self.expectations.total_verses(self.book_code) if self.expectations else None,
+            "placedVerses": len(self.seen),
+            "inSequence": self.in_sequence,
+            "gapAccepts": self.gap_accepts,
+            "rollovers": self.rollovers,
+            "resyncs": self.resyncs,
+            "rejectedVerseMarkers": self.rejected,
+            "rejectedChapterMarkers": self.rejected_chapters,
+            "missingVerses": len(missing),
+            "missingSample": [f"{ch}:{vs}" for ch, vs in missing[:MISSING_SAMPLE]],
+            "confidence": self.confidence(),
+        }
+
+
+def print_book_report(report: Dict[str, Any]):
+    """One-line progress summary for a finished book"""
+    if not report["hasExpectations"]:
+        print(f"   📏 {report['book']}: {report['placedVerses']} verses (no canonical expectations)")
+        return
+    print(
+        f"   📏 {report['book']}: {report['placedVerses']}/{report['expectedVerses']} verses, "
+        f"missing {report['missingVerses']}, rejected {report['rejectedVerseMarkers']}, "
+        f"confidence {report['confidence']:.3f}"
+    )
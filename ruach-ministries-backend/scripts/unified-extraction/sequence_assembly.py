@@ -0,0 +1 @@
+sequence-assembly.py
\ No newline at end of file
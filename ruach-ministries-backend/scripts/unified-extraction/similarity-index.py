@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+"""
+Similarity Index - Offline nearest-neighbour search over embedding stores
+
+Builds a cosine-similarity index over one or more embedding stores (embedding-store.py:
+library-parser chunks, canon-parser ingest vectors, ministry paragraphs) and answers
+k-NN queries without a database:
+
+- exact   brute force, batched NumPy matrix multiplies over the memory-mapped stores
+- ivf     inverted file: spherical k-means centroids, each query scans the --nprobe
+          closest lists only (approximate; recall rises with nprobe)
+
+Persisted next to the first store (or --index):
+    <index>.nn.json   manifest: mode, model, dimensions, stores (label, path, count,
+                      .npy size and mtime)
+    <index>.nn.npz    inverse norms per store; IVF centroids and inverted lists
+
+Vectors are not copied into the index; it is stale (and refuses to load) once a store
+gains rows or its .npy file is rewritten. Entries are addressed as "<label>:<id>".
+
+Usage:
+    # Build (exact, or --ivf [--nlist 256])
+    python similarity-index.py --store lib=/tmp/v1.embeddings --store canon=out/moh.embeddings \\
+        --index out/library --ivf
+
+    # Nearest neighbours of one entry
+    python similarity-index.py --index out/library --query canon:moh-3-12 --k 10
+
+    # Match a new store against the index: near-duplicates (pre-ingest) and, with
+    # --min-score, regressions (entries with no close match, e.g. after parser changes)
+    python similarity-index.py --index out/library --match new=/tmp/v2.embeddings \\
+        --threshold 0.95 --min-score 0.90 --report match-report.json
+
+Exit codes (--match):
+    0 = every entry has a neighbour ≥ --min-score (or no --min-score)
+    1 = at least one entry below --min-score
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:
+    print(f"❌ Missing dependency: {e}", file=sys.stderr)
+    print("Run: pip install numpy", file=sys.stderr)
+    sys.exit(1)
+
+from embedding_store import EmbeddingStore
+
+INDEX_VERSION = 2
+BLOCK_ROWS = 65536  # Database rows scored per matrix multiply
+QUERY_BATCH = 1024
+KMEANS_ITERATIONS = 12
+KMEANS_SAMPLE_PER_LIST = 64
+
+
+def store_stamp(store: EmbeddingStore) -> Dict[str, int]:
+    """Size and mtime of a store's .npy, recorded in the manifest to detect rewrites"""
+    stat = store.npy_path.stat()
+    return {"npyBytes": stat.st_size, "npyMtimeNs": stat.st_mtime_ns}
+
+
+def index_paths(base: Path) -> Tuple[Path, Path]:
+    base = Path(base)
+    return base.with_name(base.name + ".nn.json"), base.with_name(base.name + ".nn.npz")
+
+
+def inverse_norms(matrix: np.ndarray) -> np.ndarray:
+    """1 / ||row|| per row, in blocks (zero vectors score 0)"""
+    out = np.empty(len(matrix), dtype=np.float32)
+    for start in range(0, len(matrix), BLOCK_ROWS):
+        block = np.asarray(matrix[start:start + BLOCK_ROWS], dtype=np.float32)
+        norms = np.sqrt(np.einsum("ij,ij->i", block, block))
+        out[start:start + len(block)] = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    return out
+
+
+def merge_top_k(best_scores: np.ndarray, best_rows: np.ndarray, scores: np.ndarray,
+                rows: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep the k highest scores per query row from (best, new) candidates"""
+    all_scores = np.concatenate([best_scores, scores], axis=1)
+    all_rows = np.concatenate([best_rows, np.broadcast_to(rows, scores.shape)], axis=1)
+    if all_scores.shape[1] > k:
+        keep = np.argpartition(-all_scores, k - 1, axis=1)[:, :k]
+        all_scores = np.take_along_axis(all_scores, keep, axis=1)
+        all_rows = np.take_along_axis(all_rows, keep, axis=1)
+    return all_scores, all_rows
+
+
+class SimilarityIndex:
+    """Cosine k-NN over the rows of several embedding stores"""
+
+    def __init__(self, manifest: Dict[str, Any], stores: List[EmbeddingStore],
+                 arrays: Dict[str, np.ndarray]):
+        self.manifest = manifest
+        self.stores = stores
+        self.labels: List[str] = [s["label"] for s in manifest["stores"]]
+        self.matrices = [store.as_numpy() for store in stores]
+        self.inv_norms = [arrays[f"inv_norms_{i}"] for i in range(len(stores))]
+        self.offsets = np.cumsum([0] + [len(store) for store in stores])
+        self.centroids: Optional[np.ndarray] = arrays.get("centroids")
+        self.list_rows: Optional[np.ndarray] = arrays.get("list_rows")
+        self.list_offsets: Optional[np.ndarray] = arrays.get("list_offsets")
+
+    @property
+    def mode(self) -> str:
+        return self.manifest["mode"]
+
+    @property
+    def size(self) -> int:
+        return int(self.offsets[-1])
+
+    # -- build / load ---------------------------------------------------------------
+
+    @classmethod
+    def build(cls, stores: List[Tuple[str, Path]], mode: str = "exact",
+              nlist: Optional[int] = None, seed: int = 0) -> "SimilarityIndex":
+        opened = [EmbeddingStore.open(path) for _, path in stores]
+        models = {(store.model, store.dimensions) for store in opened}
+        if len(models) > 1:
+            raise ValueError(f"Stores hold different embeddings: {sorted(models, key=str)}")
+        model, dimensions = next(iter(models))
+
+        arrays: Dict[str, np.ndarray] = {}
+        for i, store in enumerate(opened):
+            arrays[f"inv_norms_{i}"] = inverse_norms(store.as_numpy())
+
+        manifest: Dict[str, Any] = {
+            "version": INDEX_VERSION,
+            "mode": mode,
+            "metric": "cosine",
+            "model": model,
+            "dimensions": dimensions,
+            "stores": [
+                {"label": label, "path": str(path), "count": len(store), **store_stamp(store)}
+                for (label, path), store in zip(stores, opened)
+            ],
+            "builtAt": datetime.now(timezone.utc).isoformat(),
+        }
+        index = cls(manifest, opened, arrays)
+        if mode == "ivf":
+            index._train_ivf(nlist or max(1, int(4 * np.sqrt(index.size))), seed)
+            manifest["nlist"] = len(index.centroids)
+        return index
+
+    @classmethod
+    def load(cls, base: Path) -> "SimilarityIndex":
+        manifest_path, arrays_path = index_paths(base)
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        stores = []
+        for entry in manifest["stores"]:
+            store = EmbeddingStore.open(Path(entry["path"]))
+            if len(store) != entry["count"]:
+                raise ValueError(
+                    f"Index {manifest_path} is stale: store {entry['label']} has {len(store)} rows, "
+                    f"indexed {entry['count']} (rebuild with --store)"
+                )
+            stamp = store_stamp(store)
+            if any(entry.get(key) != value for key, value in stamp.items()):
+                raise ValueError(
+                    f"Index {manifest_path} is stale: store {entry['label']} was rewritten since it "
+                    f"was indexed (rebuild with --store)"
+                )
+            stores.append(store)
+        with np.load(arrays_path) as data:
+            arrays = {name: data[name] for name in data.files}
+        return cls(manifest, stores, arrays)
+
+    def save(self, base: Path):
+        manifest_path, arrays_path = index_paths(base)
+        manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {f"inv_norms_{i}": norms for i, norms in enumerate(self.inv_norms)}
+        if self.mode == "ivf":
+            arrays.update(centroids=self.centroids, list_rows=self.list_rows, list_offsets=self.list_offsets)
+        tmp_arrays = arrays_path.with_name(arrays_path.name + ".tmp.npz")
+        np.savez(tmp_arrays, **arrays)
+        os.replace(tmp_arrays, arrays_path)
+        tmp_manifest = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(tmp_manifest, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_manifest, manifest_path)
+
+    # -- rows -----------------------------------------------------------------------
+
+    def iter_blocks(self) -> Iterator[Tuple[int, np.ndarray]]:
+        """(first global row, L2-normalized float32 block) over all stores"""
+        for i, matrix in enumerate(self.matrices):
+            for start in range(0, len(matrix), BLOCK_ROWS):
+                block = np.asarray(matrix[start:start + BLOCK_ROWS], dtype=np.float32)
+                yield int(self.offsets[i]) + start, block * self.inv_norms[i][start:start + len(block), None]
+
+    def gather(self, rows: np.ndarray) -> np.ndarray:
+        """Normalized vectors for global rows (any order)"""
+        out = np.empty((len(rows), self.manifest["dimensions"]), dtype=np.float32)
+        store_of = np.searchsorted(self.offsets, rows, side="right") - 1
+        for i in np.unique(store_of):
+            mask = store_of == i
+            local = rows[mask] - self.offsets[i]
+            out[mask] = self.matrices[i][local] * self.inv_norms[i][local, None]
+        return out
+
+    def entry_id(self, row: int) -> str:
+        i = int(np.searchsorted(self.offsets, row, side="right") - 1)
+        return f"{self.labels[i]}:{self.stores[i].ids[row - self.offsets[i]]}"
+
+    def row_of(self, entry_id: str) -> int:
+        label, _, id_ = entry_id.partition(":")
+        if label not in self.labels:
+            raise KeyError(f"Unknown store label {label!r} (have: {', '.join(self.labels)})")
+        i = self.labels.index(label)
+        return int(self.offsets[i]) + self.stores[i].rows[id_]
+
+    # -- IVF --------------------------------------------------------------------------
+
+    def _assign(self, block: np.ndarray) -> np.ndarray:
+        return np.argmax(block @ self.centroids.T, axis=1)
+
+    def _train_ivf(self, nlist: int, seed: int):
+        """Spherical k-means on a row sample, then assign every row to its closest centroid"""
+        rng = np.random.default_rng(seed)
+        nlist = min(nlist, self.size)
+        sample_size = min(self.size, nlist * KMEANS_SAMPLE_PER_LIST)
+        sample = self.gather(np.sort(rng.choice(self.size, size=sample_size, replace=False)))
+
+        self.centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            labels = self._assign(sample)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, labels, sample)
+            norms = np.linalg.norm(sums, axis=1)
+            empty = norms == 0  # Re-seed empty lists from random sample rows
+            sums[empty] = sample[rng.choice(sample_size, size=int(empty.sum()))]
+            self.centroids = sums / np.where(empty, 1.0, norms)[:, None]
+
+        assignments = np.empty(self.size, dtype=np.int32)
+        for start, block in self.iter_blocks():
+            assignments[start:start + len(block)] = self._assign(block)
+        self.list_rows = np.argsort(assignments, kind="stable").astype(np.int64)
+        self.list_offsets = np.concatenate([[0], np.cumsum(np.bincount(assignments, minlength=nlist))])
+
+    # -- search -----------------------------------------------------------------------
+
+    def search(self, queries: np.ndarray, k: int = 10,
+               nprobe: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-k cosine neighbours of each query row
+
+        Returns (scores, global rows), both [queries, k], best first; missing slots
+        (fewer candidates than k) have score -inf and row -1.
+        """
+        queries = np.asarray(queries, dtype=np.float32)
+        norms = np.linalg.norm(queries, axis=1, keepdims=True)
+        queries = queries / np.where(norms > 0, norms, 1.0)
+        k = min(k, self.size)
+
+        best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+        best_rows = np.full((len(queries), 0), -1, dtype=np.int64)
+        if self.mode == "ivf":
+            best_scores, best_rows = self._search_ivf(queries, k, nprobe)
+        else:
+            for start, block in self.iter_blocks():
+                rows = np.arange(start, start + len(block), dtype=np.int64)
+                best_scores, best_rows = merge_top_k(best_scores, best_rows, queries @ block.T, rows, k)
+
+        order = np.argsort(-best_scores, axis=1)
+        scores = np.take_along_axis(best_scores, order, axis=1)
+        rows = np.take_along_axis(best_rows, order, axis=1)
+        if scores.shape[1] < k:  # IVF probes can hold fewer than k rows
+            pad = k - scores.shape[1]
+            scores = np.pad(scores, ((0, 0), (0, pad)), constant_values=-np.inf)
+            rows = np.pad(rows, ((0, 0), (0, pad)), constant_values=-1)
+        return scores, rows
+
+    def _search_ivf(self, queries: np.ndarray, k: int, nprobe: int) -> Tuple[np.ndarray, np.ndarray]:
+        nprobe = min(nprobe, len(self.centroids))
+        probes = np.argpartition(-(queries @ self.centroids.T), nprobe - 1, axis=1)[:, :nprobe]
+        scores_out = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        rows_out = np.full((len(queries), k), -1, dtype=np.int64)
+        # Queries probing the same lists share one candidate matrix
+        groups: Dict[Tuple[int, ...], List[int]] = {}
+        for q, lists in enumerate(probes):
+            groups.setdefault(tuple(sorted(lists.tolist())), []).append(q)
+        for lists, members in groups.items():
+            rows = np.concatenate([
+                self.list_rows[self.list_offsets[l]:self.list_offsets[l + 1]] for l in lists
+            ])
+            if not len(rows):
+                continue
+            scores = queries[members] @ self.gather(rows).T
+            top = min(k, len(rows))
+            keep = np.argpartition(-scores, top - 1, axis=1)[:, :top]
+            scores_out[members, :top] = np.take_along_axis(scores, keep, axis=1)
+            rows_out[members, :top] = rows[keep]
+        return scores_out, rows_out
+
+
+def parse_store_arg(value: str) -> Tuple[str, Path]:
+    label, sep, path = value.partition("=")
+    if not sep or not label or ":" in label:
+        raise argparse.ArgumentTypeError(f"expected LABEL=PATH (label without ':'), got {value!r}")
+    return label, Path(path)
+
+
+def indexed_offset(index: SimilarityIndex, store: EmbeddingStore) -> Optional[int]:
+    """First global row of `store` when the index holds that very store file, else None"""
+    for i, indexed in enumerate(index.stores):
+        try:
+            same = indexed.npy_path.samefile(store.npy_path)
+        except OSError:
+            same = False
+        if same and len(indexed) == len(store):
+            return int(index.offsets[i])
+    return None
+
+
+def match_store(index: SimilarityIndex, label: str, store: EmbeddingStore, threshold: float,
+                min_score: Optional[float], nprobe: int = 8) -> Dict[str, Any]:
+    """
+    Nearest index entry for every row of `store`. Self-matches are skipped only when the
+    store is itself indexed (same file); the label only names the entries in the report.
+    """
+    self_offset = indexed_offset(index, store)
+    matrix = store.as_numpy()
+    duplicates: List[Dict[str, Any]] = []
+    below: List[Dict[str, Any]] = []
+    best: List[float] = []
+
+    for start in range(0, len(store), QUERY_BATCH):
+        scores, rows = index.search(matrix[start:start + QUERY_BATCH], k=2, nprobe=nprobe)
+        for offset in range(len(scores)):
+            local = start + offset
+            candidates = [
+                (float(s), int(r)) for s, r in zip(scores[offset], rows[offset])
+                if r >= 0 and (self_offset is None or r != self_offset + local)
+            ]
+            score, row = candidates[0] if candidates else (float("-inf"), -1)
+            best.append(score)
+            entry = {"id": f"{label}:{store.ids[local]}", "match": index.entry_id(row) if row >= 0 else None,
+                     "score": round(score, 4)}
+            if score >= threshold:
+                duplicates.append(entry)
+            if min_score is not None and score < min_score:
+                below.append(entry)
+
+    duplicates.sort(key=lambda e: -e["score"])
+    below.sort(key=lambda e: e["score"])
+    finite = sorted(s for s in best if s != float("-inf"))
+    return {
+        "store": label,
+        "entries": len(store),
+        "threshold": threshold,
+        "minScore": min_score,
+        "medianBestScore": round(finite[len(finite) // 2], 4) if finite else None,
+        "nearDuplicates": duplicates,
+        "belowMinScore": below,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline nearest-neighbour index over embedding stores")
+    parser.add_argument("--index", help="Index base path (default: first --store path)")
+    parser.add_argument("--store", action="append", type=parse_store_arg, default=[],
+                        help="LABEL=STORE_BASE to index (repeatable); builds the index")
+    parser.add_argument("--ivf", action="store_true", help="Build an approximate IVF index")
+    parser.add_argument("--nlist", type=int, help="IVF lists (default: 4·√rows)")
+    parser.add_argument("--nprobe", type=int, default=8, help="IVF lists scanned per query (default: 8)")
+    parser.add_argument("--query", action="append", default=[], help="Entry id LABEL:ID to look up (repeatable)")
+    parser.add_argument("--k", type=int, default=10, help="Neighbours per query (default: 10)")
+    parser.add_argument("--match", type=parse_store_arg, help="LABEL=STORE_BASE to match against the index")
+    parser.add_argument("--threshold", type=float, default=0.95,
+                        help="Cosine score reported as near-duplicate (default: 0.95)")
+    parser.add_argument("--min-score", type=float,
+                        help="Fail when an entry's best match scores below this (regression check)")
+    parser.add_argument("--report", help="Write the --match report as JSON")
+    args = parser.parse_args()
+
+    if not args.index and not args.store:
+        parser.error("--index or --store is required")
+    index_base = Path(args.index) if args.index else args.store[0][1]
+
+    if args.store:
+        mode = "ivf" if args.ivf else "exact"
+        print(f"🧮 Building {mode} index over {', '.join(label for label, _ in args.store)}...")
+        started = time.perf_counter()
+        index = SimilarityIndex.build(args.store, mode=mode, nlist=args.nlist)
+        index.save(index_base)
+        print(f"✅ Indexed {index.size} vectors × {index.manifest['dimensions']} ({index.manifest['model']}) "
+              f"in {time.perf_counter() - started:.1f}s → {index_paths(index_base)[0]}")
+    else:
+        try:
+            index = SimilarityIndex.load(index_base)
+        except (OSError, ValueError) as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+
+    for entry_id in args.query:
+        try:
+            row = index.row_of(entry_id)
+        except KeyError as e:
+            print(f"❌ {e.args[0] if e.args else entry_id}")
+            continue
+        scores, rows = index.search(index.gather(np.array([row])), k=args.k + 1, nprobe=args.nprobe)
+        print(f"\n🔍 {entry_id}")
+        for score, neighbour in zip(scores[0], rows[0]):
+            if neighbour >= 0 and neighbour != row:
+                print(f"   {score:.4f}  {index.entry_id(int(neighbour))}")
+
+    if args.match:
+        label, path = args.match
+        store = EmbeddingStore.open(path)
+        if (store.model, store.dimensions) != (index.manifest["model"], index.manifest["dimensions"]):
+            print(f"❌ {path} holds {store.model} [{store.dimensions}], index is "
+                  f"{index.manifest['model']} [{index.manifest['dimensions']}]")
+            sys.exit(1)
+        started = time.perf_counter()
+        report = match_store(index, label, store, args.threshold, args.min_score, nprobe=args.nprobe)
+        report["seconds"] = round(time.perf_counter() - started, 3)
+        report["index"] = {"path": str(index_base), "mode": index.mode, "size": index.size}
+
+        print(f"\n📊 Matched {report['entries']} entries of {label} in {report['seconds']}s "
+              f"(median best score {report['medianBestScore']})")
+        print(f"   Near-duplicates (≥ {args.threshold}): {len(report['nearDuplicates'])}")
+        for entry in report["nearDuplicates"][:10]:
+            print(f"   {entry['score']:.4f}  {entry['id']} ≈ {entry['match']}")
+        if args.min_score is not None:
+            print(f"   Below min score (< {args.min_score}): {len(report['belowMinScore'])}")
+            for entry in report["belowMinScore"][:10]:
+                print(f"   ⚠️  {entry['score']:.4f}  {entry['id']} (closest: {entry['match']})")
+
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"💾 Report written to {args.report}")
+
+        sys.exit(1 if report["belowMinScore"] else 0)
+
+
+if __name__ == "__main__":
+    main()
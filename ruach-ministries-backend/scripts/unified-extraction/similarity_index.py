@@ -0,0 +1 @@
+similarity-index.py
\ No newline at end of file
@@ -22,23 +22,202 @@ Patch File Format (patches/genesis-missing.json):
     }
   ]
 }
+
+A patch file may cover several books: each patch's work is its "work" field, else the
+prefix of its verseId (yah-gen-001-001 → yah-gen), else the work_id argument.
+
+Engine:
+- A (work, chapter, verse) → (chunk file, offset) index is built once and cached in
+  <verses_dir>/patches/verse-index.json; chunks whose size/mtime changed are re-indexed
+- Only chunk files touched by a patch are loaded and rewritten (atomically, tmp + rename)
+- Missing verses are inserted next to their neighbours in the same work; the lookups are
+  patched in place per insert (only the target chunk's later offsets shift)
+- <verses_dir>/patches/journal.jsonl records every applied patch; re-running the same
+  patch set skips entries whose chunk is unchanged since they were applied
 """
 
+import bisect
+import hashlib
 import json
+import os
+import re
 import sys
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+
+INDEX_VERSION = 1
+VERSE_ID_RE = re.compile(r"^(?P<work>.+)-\d{3}-\d{3}$")
+
+VerseKey = Tuple[str, int, int]  # (work, chapter, verse)
+
+
+def _atomic_write_json(path: Path, data: Any, indent: Optional[int] = 2):
+    """Write JSON to <path>.tmp, then rename over path."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=indent, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def _chunk_signature(path: Path) -> List[int]:
+    stat = path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _patch_fingerprint(patch: Dict) -> str:
+    return hashlib.sha256(json.dumps(patch, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def patch_work(patch: Dict, default_work: Optional[str]) -> Optional[str]:
+    """Work a patch targets: explicit "work", else the verseId prefix, else the default."""
+    if patch.get('work'):
+        return patch['work']
+    match = VERSE_ID_RE.match(patch.get('verseId', ''))
+    if match:
+        return match.group('work')
+    return default_work
+
+
+class VerseIndex:
+    """(work, chapter, verse) → (chunk file, offset), cached next to the chunks"""
+
+    def __init__(self, verses_path: Path):
+        self.verses_path = verses_path
+        self.index_file = verses_path / "patches" / "verse-index.json"
+        self.chunk_files: List[Path] = sorted(verses_path.glob('verses_chunk_*.json'))
+
+        # chunk name → [[work, chapter, verse, verseId], ...] in file order
+        self.entries: Dict[str, List[List[Any]]] = {}
+        self.signatures: Dict[str, List[int]] = {}
+        self.locations: Dict[VerseKey, Tuple[str, int]] = {}
+        self.keys_by_work: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+
+    def load_or_build(self) -> int:
+        """Load the cached index and re-index stale chunks; returns the number re-indexed."""
+        cached: Dict[str, Any] = {}
+        if self.index_file.exists():
+            try:
+                with open(self.index_file, 'r') as f:
+                    cached = json.load(f)
+            except (OSError, ValueError):
+                cached = {}
+        if cached.get('version') != INDEX_VERSION:
+            cached = {}
+
+        cached_chunks = cached.get('chunks', {})
+        rebuilt = 0
+        for vf in self.chunk_files:
+            signature = _chunk_signature(vf)
+            entry = cached_chunks.get(vf.name)
+            if entry and entry.get('signature') == signature:
+                self.entries[vf.name] = entry['verses']
+                self.signatures[vf.name] = signature
+            else:
+                with open(vf, 'r') as f:
+                    self.refresh_chunk(vf.name, json.load(f), signature)
+                rebuilt += 1
+
+        self._rebuild_lookups()
+        return rebuilt
+
+    def refresh_chunk(self, name: str, verses: List[Dict], signature: List[int]):
+        """Re-index one chunk from its (possibly modified) verse list."""
+        self.entries[name] = [
+            [v.get('work'), v.get('chapter'), v.get('verse'), v.get('verseId')] for v in verses
+        ]
+        self.signatures[name] = signature
+
+    def _rebuild_lookups(self):
+        self.locations = {}
+        self.keys_by_work = defaultdict(list)
+        for vf in self.chunk_files:
+            for offset, (work, chapter, verse, _) in enumerate(self.entries.get(vf.name, [])):
+                self.locations[(work, chapter, verse)] = (vf.name, offset)
+                self.keys_by_work[work].append((chapter, verse))
+        for keys in self.keys_by_work.values():
+            keys.sort()
+
+    def insert_verse(self, name: str, position: int, verse: Dict):
+        """
+        Record a verse inserted at `position` of chunk `name`.
+
+        Only that chunk's later offsets shift, so the lookups are patched in place
+        rather than rebuilt across every chunk for each insert.
+        """
+        entries = self.entries[name]
+        key = (verse.get('work'), verse.get('chapter'), verse.get('verse'))
+        entries.insert(position, [key[0], key[1], key[2], verse.get('verseId')])
+        for offset in range(position + 1, len(entries)):
+            work, chapter, verse_num, _ = entries[offset]
+            if self.locations.get((work, chapter, verse_num)) == (name, offset - 1):
+                self.locations[(work, chapter, verse_num)] = (name, offset)
+        self.locations[key] = (name, position)
+        bisect.insort(self.keys_by_work[key[0]], (key[1], key[2]))
+
+    def insertion_point(self, work: str, chapter: int, verse: int) -> Tuple[str, Optional[VerseKey], bool]:
+        """
+        Chunk (and neighbour) for a missing verse
+
+        Returns:
+            (chunk name, neighbour key, insert_after) - the neighbour is the work's nearest
+            preceding verse (insert after it) or, failing that, its nearest following verse
+            (insert before it); (first chunk, None, False) when the work has no verses yet
+        """
+        keys = self.keys_by_work.get(work, [])
+        pos = bisect.bisect_left(keys, (chapter, verse))
+        if pos > 0:
+            neighbour = (work,) + keys[pos - 1]
+            return self.locations[neighbour][0], neighbour, True
+        if pos < len(keys):
+            neighbour = (work,) + keys[pos]
+            return self.locations[neighbour][0], neighbour, False
+        return self.chunk_files[0].name, None, False
+
+    def save(self):
+        self.index_file.parent.mkdir(exist_ok=True)
+        _atomic_write_json(self.index_file, {
+            'version': INDEX_VERSION,
+            'chunks': {
+                name: {'signature': self.signatures[name], 'verses': self.entries[name]}
+                for name in self.entries
+            },
+        }, indent=None)
+
+
+def _load_journal(journal_file: Path) -> Dict[str, Dict]:
+    """fingerprint → last journal entry"""
+    journal: Dict[str, Dict] = {}
+    if journal_file.exists():
+        with open(journal_file, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    journal[entry['fingerprint']] = entry
+    return journal
+
+
+def _patch_metadata(patch: Dict, with_reviewer: bool) -> Dict:
+    meta = {
+        'source': patch.get('source'),
+        'reason': patch.get('reason'),
+        'timestamp': patch.get('timestamp'),
+    }
+    if with_reviewer:
+        meta['verified_by'] = patch.get('verified_by')
+    return meta
 
 
-def apply_patches(patches_file: str, verses_dir: str, work_id: str = "yah-gen", require_flag: bool = True):
+def apply_patches(patches_file: str, verses_dir: str, work_id: Optional[str] = "yah-gen", require_flag: bool = True):
     """
     Apply patches to verse extraction output
-    
+
     Args:
         patches_file: Path to patches JSON file
         verses_dir: Directory containing verses_chunk_*.json files
-        work_id: Work ID to patch (default: yah-gen for Genesis)
+        work_id: Default work ID for patches whose work cannot be inferred
     """
     patches_path = Path(patches_file)
     verses_path = Path(verses_dir)
@@ -58,146 +237,171 @@ def apply_patches(patches_file: str, verses_dir: str, work_id: str = "yah-gen",
 
     print(f"📝 Applying {len(patches)} patches...")
 
-    # Load all verse files
-    verse_files = sorted(verses_path.glob('verses_chunk_*.json'))
-    all_verses = []
-    for vf in verse_files:
-        with open(vf, 'r') as f:
-            all_verses.extend(json.load(f))
+    index = VerseIndex(verses_path)
+    if not index.chunk_files:
+        print("❌ No verse chunk files found")
+        return False
+
+    rebuilt = index.load_or_build()
+    print(f"   Index: {len(index.locations)} verses in {len(index.chunk_files)} chunks ({rebuilt} re-indexed)")
 
-    # Track which verses exist
-    verses_by_key = {(v.get('chapter'), v.get('verse')): (i, vf_idx, v)
-                     for vf_idx, vf in enumerate(verse_files)
-                     for i, v in enumerate(json.load(open(vf, 'r')))
-                     if v.get('work') == work_id}
+    journal_file = verses_path / "patches" / "journal.jsonl"
+    journal = _load_journal(journal_file)
 
     applied = 0
     skipped = 0
+    touched_works = set()
+    loaded: Dict[str, List[Dict]] = {}  # chunk name → verses (only chunks we touch)
+    dirty: set = set()
+    journal_entries: List[Dict] = []
+
+    def chunk_verses(name: str) -> List[Dict]:
+        if name not in loaded:
+            with open(verses_path / name, 'r') as f:
+                loaded[name] = json.load(f)
+        return loaded[name]
 
     for patch in patches:
         verse_id = patch.get('verseId', '')
         chapter = patch.get('chapter')
         verse = patch.get('verse')
         text = patch.get('text')
+        work = patch_work(patch, work_id)
 
-        if not all([verse_id, chapter, verse, text]):
+        if not all([verse_id, chapter, verse, text, work]):
             print(f"⚠️  Skipping invalid patch: {patch}")
             skipped += 1
             continue
 
-        key = (chapter, verse)
+        # Journal: applied before, and the chunk has not changed since
+        fingerprint = _patch_fingerprint(patch)
+        previous = journal.get(fingerprint)
+        if previous and previous.get('chunk') not in dirty:
+            chunk_name = previous.get('chunk')
+            if index.signatures.get(chunk_name) == previous.get('chunkSignature'):
+                print(f"   ✓ {verse_id} already applied (journal)")
+                skipped += 1
+                continue
+
+        key = (work, chapter, verse)
 
-        if key in verses_by_key:
+        if key in index.locations:
             # Verse exists - check if patch is different/better
-            idx, vf_idx, existing = verses_by_key[key]
+            chunk_name, offset = index.locations[key]
+            verses = chunk_verses(chunk_name)
+            existing = verses[offset]
             if existing.get('text') == text:
                 print(f"   ✓ {verse_id} already correct")
                 skipped += 1
                 continue
 
             # Update existing verse
-            vf = verse_files[vf_idx]
-            verses = json.load(open(vf, 'r'))
-            verses[idx]['text'] = text
-            verses[idx]['paleoHebrewDivineNames'] = patch.get('paleoHebrewDivineNames', True)
-            verses[idx]['_patch_applied'] = {
-                'source': patch.get('source'),
-                'reason': patch.get('reason'),
-                'timestamp': patch.get('timestamp'),
-            }
-
-            with open(vf, 'w') as f:
-                json.dump(verses, f, indent=2, ensure_ascii=False)
-
+            existing['text'] = text
+            existing['paleoHebrewDivineNames'] = patch.get('paleoHebrewDivineNames', True)
+            existing['_patch_applied'] = _patch_metadata(patch, with_reviewer=False)
+            action = 'update'
             print(f"   ✏️  Updated {verse_id}")
-            applied += 1
         else:
-            # Verse missing - add to first chunk file
-            if not verse_files:
-                print("❌ No verse chunk files found")
-                return False
-
-            vf = verse_files[0]
-            verses = json.load(open(vf, 'r'))
+            # Verse missing - insert next to its neighbours in the same work
+            chunk_name, neighbour, after = index.insertion_point(work, chapter, verse)
+            verses = chunk_verses(chunk_name)
 
             new_verse = {
                 'verseId': verse_id,
-                'work': work_id,
+                'work': work,
                 'chapter': chapter,
                 'verse': verse,
                 'text': text,
                 'paleoHebrewDivineNames': patch.get('paleoHebrewDivineNames', True),
                 'hasFootnotes': False,
                 'footnotes': None,
-                '_patch_applied': {
-                    'source': patch.get('source'),
-                    'reason': patch.get('reason'),
-                    'timestamp': patch.get('timestamp'),
-                    'verified_by': patch.get('verified_by'),
-                },
+                '_patch_applied': _patch_metadata(patch, with_reviewer=True),
             }
 
-            # Insert in correct position (sorted by chapter:verse)
-            inserted = False
-            for i, v in enumerate(verses):
-                v_ch = v.get('chapter', 0)
-                v_vs = v.get('verse', 0)
-                if (v_ch > chapter) or (v_ch == chapter and v_vs > verse):
-                    verses.insert(i, new_verse)
-                    inserted = True
-                    break
-
-            if not inserted:
-                verses.append(new_verse)
-
-            with open(vf, 'w') as f:
-                json.dump(verses, f, indent=2, ensure_ascii=False)
-
+            if neighbour is None:
+                position = len(verses)
+            else:
+                position = index.locations[neighbour][1] + (1 if after else 0)
+            verses.insert(position, new_verse)
+            index.insert_verse(chunk_name, position, new_verse)
+            action = 'add'
             print(f"   ➕ Added {verse_id}")
-            applied += 1
+
+        dirty.add(chunk_name)
+        touched_works.add(work)
+        journal_entries.append({
+            'fingerprint': fingerprint,
+            'verseId': verse_id,
+            'work': work,
+            'chapter': chapter,
+            'verse': verse,
+            'action': action,
+            'chunk': chunk_name,
+        })
+        applied += 1
+
+    # Rewrite only the chunks that changed
+    for chunk_name in sorted(dirty):
+        vf = verses_path / chunk_name
+        _atomic_write_json(vf, loaded[chunk_name])
+        index.refresh_chunk(chunk_name, loaded[chunk_name], _chunk_signature(vf))
+    if dirty:
+        print(f"   💾 Rewrote {len(dirty)} of {len(index.chunk_files)} chunk files")
+    index.save()
+
+    # Journal (append-only): signature of each chunk as written
+    if journal_entries:
+        journal_file.parent.mkdir(exist_ok=True)
+        now = datetime.now().isoformat()
+        with open(journal_file, 'a') as f:
+            for entry in journal_entries:
+                entry['chunkSignature'] = index.signatures[entry['chunk']]
+                entry['appliedAt'] = now
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
 
     print(f"\n✅ Patch application complete:")
     print(f"   Applied: {applied}")
     print(f"   Skipped: {skipped}")
 
-    # Update works.json verse count
+    # Update works.json verse counts (from the index, no chunk re-read)
     works_file = verses_path / 'works.json'
-    if works_file.exists():
+    if works_file.exists() and touched_works:
         with open(works_file, 'r') as f:
             works = json.load(f)
 
-        for work in works:
-            if work.get('workId') == work_id:
-                # Recalculate verse count
-                all_verses_after = []
-                for vf in verse_files:
-                    with open(vf, 'r') as f2:
-                        all_verses_after.extend(json.load(f2))
+        verse_ids: Dict[str, List[str]] = defaultdict(list)
+        for vf in index.chunk_files:
+            for entry_work, _, _, entry_verse_id in index.entries[vf.name]:
+                if entry_work in touched_works:
+                    verse_ids[entry_work].append(entry_verse_id)
 
-                work_verses = [v for v in all_verses_after if v.get('work') == work_id]
-                work['totalVerses'] = len(work_verses)
-                work['verses'] = [v.get('verseId') for v in work_verses]
+        for work in works:
+            if work.get('workId') in touched_works:
+                work['totalVerses'] = len(verse_ids[work['workId']])
+                work['verses'] = verse_ids[work['workId']]
 
-        with open(works_file, 'w') as f:
-            json.dump(works, f, indent=2, ensure_ascii=False)
+        _atomic_write_json(works_file, works)
 
-        print(f"   Updated works.json")
+        print(f"   Updated works.json ({len(touched_works)} works)")
 
     return True
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 4:
-        print("Usage: apply-patches.py <patches.json> <verses_dir> <work_id> --apply-patches")
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) < 2:
+        print("Usage: apply-patches.py <patches.json> <verses_dir> [default_work_id] --apply-patches")
         print("\n⚠️  PATCHING REQUIRES EXPLICIT FLAG: --apply-patches")
         print("\nExample:")
         print("  python3 apply-patches.py patches/genesis-missing.json output/main/ yah-gen --apply-patches")
+        print("\nThe work of each patch comes from its \"work\" field or verseId prefix;")
+        print("default_work_id is only used when neither is present.")
         print("\nThis ensures patches are only applied intentionally, not accidentally.")
         sys.exit(1)
 
-    patches_file = sys.argv[1]
-    verses_dir = sys.argv[2]
-    work_id = sys.argv[3]
+    patches_file = args[0]
+    verses_dir = args[1]
+    work_id = args[2] if len(args) > 2 else None
     apply_flag = "--apply-patches" in sys.argv
 
     if not apply_flag:
@@ -207,26 +411,27 @@ if __name__ == "__main__":
 
     print("⚠️  APPLYING PATCHES - This modifies extraction output")
     print(f"   Patches: {patches_file}")
-    print(f"   Work ID: {work_id}")
-    
+    print(f"   Default work ID: {work_id or '(from verseId)'}")
+
     # Record patch application at run level
     verses_path = Path(verses_dir)
     patch_metadata = {
         "patched_at": datetime.now().isoformat(),
         "patches_file": patches_file,
         "work_id": work_id,
+        "journal": str(verses_path / "patches" / "journal.jsonl"),
         "requires_reviewer_acknowledgment": True,
     }
-    
+
     patches_meta_file = verses_path / "patches" / "patches_applied.json"
     patches_meta_file.parent.mkdir(exist_ok=True)
     with open(patches_meta_file, 'w') as f:
         json.dump(patch_metadata, f, indent=2)
-    
+
     success = apply_patches(patches_file, verses_dir, work_id, require_flag=False)
-    
+
     if success:
         print("\n✅ Patches applied successfully")
         print("⚠️  IMPORTANT: Reviewer must acknowledge patches before import/publish")
-    
+
     sys.exit(0 if success else 1)